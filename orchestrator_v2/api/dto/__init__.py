@@ -14,6 +14,7 @@ from orchestrator_v2.api.dto.runs import (
     MetricsSummary,
     AdvanceRunRequest,
     AdvanceRunResponse,
+    RunJobResponse,
 )
 
 # Common DTOs (RSC + legacy)
@@ -59,6 +60,7 @@ __all__ = [
     "MetricsSummary",
     "AdvanceRunRequest",
     "AdvanceRunResponse",
+    "RunJobResponse",
     # Common DTOs
     "ProjectDTO",
     "ProjectTemplateDTO",
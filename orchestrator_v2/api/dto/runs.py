@@ -115,6 +115,19 @@ class AdvanceRunResponse(BaseModel):
     message: str
 
 
+class RunJobResponse(BaseModel):
+    """Status of a background job for a run."""
+    job_id: str
+    run_id: str
+    kind: str
+    status: str  # queued, running, succeeded, failed, cancelled
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+
+
 class ListRunsResponse(BaseModel):
     """Response for list runs endpoint."""
     runs: list[RunSummary] = Field(default_factory=list)
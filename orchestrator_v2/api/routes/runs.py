@@ -5,9 +5,9 @@ Endpoints for orchestrator run management, execution, and artifact tracking.
 """
 
 import logging
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header, Response
 
 from orchestrator_v2.api.dto.runs import (
     CreateRunRequest,
@@ -18,6 +18,14 @@ from orchestrator_v2.api.dto.runs import (
     AdvanceRunRequest,
     AdvanceRunResponse,
     ListRunsResponse,
+    RunJobResponse,
+)
+from orchestrator_v2.services.job_queue import (
+    Job,
+    JobQueue,
+    QueueFullError,
+    RunBusyError,
+    get_job_queue,
 )
 from orchestrator_v2.services.orchestrator_service import OrchestratorService
 from orchestrator_v2.user.models import UserProfile
@@ -54,10 +62,100 @@ async def get_current_user(
     return user
 
 
+# Application-scoped orchestrator service
+_orchestrator_service: OrchestratorService | None = None
+
+
 # Dependency for orchestrator service
 def get_orchestrator_service() -> OrchestratorService:
-    """Get orchestrator service instance."""
-    return OrchestratorService()
+    """Get the shared orchestrator service instance."""
+    global _orchestrator_service
+    if _orchestrator_service is None:
+        _orchestrator_service = OrchestratorService()
+    return _orchestrator_service
+
+
+async def shutdown_orchestrator_service() -> None:
+    """Close the shared orchestrator service (application shutdown)."""
+    global _orchestrator_service
+    if _orchestrator_service is not None:
+        await _orchestrator_service.close()
+        _orchestrator_service = None
+
+
+# Background job kind for POST /runs/{run_id}/next
+ADVANCE_JOB = "advance"
+
+
+async def _run_advance_job(job: Job) -> dict[str, Any]:
+    """Execute a queued advance job."""
+    user = await FileSystemUserRepository().get_by_id(job.user_id)
+    if user is None:
+        raise KeyError(f"User not found: {job.user_id}")
+
+    detail = await get_orchestrator_service().advance_run(
+        run_id=job.run_id,
+        user=user,
+        skip_validation=job.params.get("skip_validation", False),
+    )
+    previous_phase = job.params.get("previous_phase")
+    return {
+        "previous_phase": previous_phase,
+        "current_phase": detail.current_phase,
+        "status": detail.status,
+        "message": f"Advanced from {previous_phase} to {detail.current_phase}",
+    }
+
+
+# Dependency for the background job queue
+def get_run_job_queue() -> JobQueue:
+    """Get the job queue with the run handlers registered."""
+    queue = get_job_queue()
+    if ADVANCE_JOB not in queue.handlers:
+        queue.register_handler(ADVANCE_JOB, _run_advance_job)
+    return queue
+
+
+async def _can_access_run(
+    run_id: str, user: UserProfile, service: OrchestratorService
+) -> bool:
+    """Whether the user owns the run or has been granted access to it."""
+    if user.has_project_access(run_id):
+        return True
+    try:
+        return await service.get_run_owner(run_id) == user.user_id
+    except KeyError:
+        return False
+
+
+async def _get_authorized_job(
+    run_id: str,
+    job_id: str,
+    user: UserProfile,
+    service: OrchestratorService,
+    queue: JobQueue,
+) -> Job:
+    """Load a run's job, rejecting callers who neither submitted it nor can access the run."""
+    job = queue.get(job_id)
+    if job is None or job.run_id != run_id:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    if job.user_id != user.user_id and not await _can_access_run(run_id, user, service):
+        raise HTTPException(status_code=403, detail="Not authorized to access this job")
+    return job
+
+
+def _job_to_response(job: Job) -> RunJobResponse:
+    return RunJobResponse(
+        job_id=job.job_id,
+        run_id=job.run_id,
+        kind=job.kind,
+        status=job.status.value,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        result=job.result,
+        error=job.error,
+    )
 
 
 # -----------------------------------------------------------------------------
@@ -193,26 +291,41 @@ async def create_run(
 # Endpoint 2: POST /runs/{run_id}/next - Advance to next phase
 # -----------------------------------------------------------------------------
 
-@router.post("/{run_id}/next", response_model=AdvanceRunResponse)
+@router.post(
+    "/{run_id}/next",
+    response_model=RunJobResponse | AdvanceRunResponse,
+    status_code=202,
+)
 async def advance_run(
     run_id: str,
+    response: Response,
     request: AdvanceRunRequest | None = None,
+    wait: bool = False,
     user: UserProfile = Depends(get_current_user),
     service: OrchestratorService = Depends(get_orchestrator_service),
-) -> AdvanceRunResponse:
+    queue: JobQueue = Depends(get_run_job_queue),
+) -> RunJobResponse | AdvanceRunResponse:
     """
     Advance a run to the next phase.
 
-    Executes the current phase and advances to the next phase in the workflow.
+    Queues a background job that executes the current phase and advances
+    to the next phase in the workflow. Poll `GET /runs/{run_id}/jobs/{job_id}`
+    or follow the run's event stream for progress.
 
     **Path Parameters:**
     - run_id: Run identifier
 
+    **Query Parameters:**
+    - wait: Execute inline and return AdvanceRunResponse (200) instead
+      of queuing (default: false)
+
     **Request Body (optional):**
     - skip_validation: Skip governance validation (default: false)
 
     **Returns:**
-    - AdvanceRunResponse with status and phase information
+    - 202 RunJobResponse with the queued job
+    - 409 if the run already has a queued or running job
+    - 503 if the job queue is full
 
     **Example:**
     ```json
@@ -231,6 +344,18 @@ async def advance_run(
         current_detail = await service.get_run(run_id)
         previous_phase = current_detail.current_phase
 
+        if not wait:
+            job = await queue.submit(
+                run_id=run_id,
+                kind=ADVANCE_JOB,
+                user_id=user.user_id,
+                params={
+                    "skip_validation": request.skip_validation,
+                    "previous_phase": previous_phase,
+                },
+            )
+            return _job_to_response(job)
+
         # Advance the run
         updated_detail = await service.advance_run(
             run_id=run_id,
@@ -238,7 +363,8 @@ async def advance_run(
             skip_validation=request.skip_validation,
         )
 
-        response = AdvanceRunResponse(
+        response.status_code = 200
+        result = AdvanceRunResponse(
             run_id=run_id,
             previous_phase=previous_phase,
             current_phase=updated_detail.current_phase,
@@ -247,15 +373,61 @@ async def advance_run(
         )
 
         logger.info(f"Advanced run {run_id} to phase {updated_detail.current_phase}")
-        return response
+        return result
 
     except KeyError:
         raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
+    except RunBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to advance run {run_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to advance run: {str(e)}")
 
 
+@router.get("/{run_id}/jobs", response_model=list[RunJobResponse])
+async def list_run_jobs(
+    run_id: str,
+    limit: int = 50,
+    user: UserProfile = Depends(get_current_user),
+    service: OrchestratorService = Depends(get_orchestrator_service),
+    queue: JobQueue = Depends(get_run_job_queue),
+) -> list[RunJobResponse]:
+    """List background jobs for a run, newest first."""
+    if not await _can_access_run(run_id, user, service):
+        raise HTTPException(status_code=403, detail="Not authorized to access this run")
+    return [_job_to_response(job) for job in queue.list_for_run(run_id, limit)]
+
+
+@router.get("/{run_id}/jobs/{job_id}", response_model=RunJobResponse)
+async def get_run_job(
+    run_id: str,
+    job_id: str,
+    user: UserProfile = Depends(get_current_user),
+    service: OrchestratorService = Depends(get_orchestrator_service),
+    queue: JobQueue = Depends(get_run_job_queue),
+) -> RunJobResponse:
+    """Get the status of a background job."""
+    job = await _get_authorized_job(run_id, job_id, user, service, queue)
+    return _job_to_response(job)
+
+
+@router.delete("/{run_id}/jobs/{job_id}", response_model=RunJobResponse)
+async def cancel_run_job(
+    run_id: str,
+    job_id: str,
+    user: UserProfile = Depends(get_current_user),
+    service: OrchestratorService = Depends(get_orchestrator_service),
+    queue: JobQueue = Depends(get_run_job_queue),
+) -> RunJobResponse:
+    """Cancel a queued or running job. Finished jobs are returned unchanged."""
+    await _get_authorized_job(run_id, job_id, user, service, queue)
+    job = await queue.cancel(job_id)
+    logger.info(f"Cancel requested for job {job_id} on run {run_id}: {job.status.value}")
+    return _job_to_response(job)
+
+
 # -----------------------------------------------------------------------------
 # Endpoint 3: GET /runs/{run_id} - Get run status and phases
 # -----------------------------------------------------------------------------
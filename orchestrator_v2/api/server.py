@@ -3,12 +3,14 @@
 Provides REST API endpoints for RSC workflow orchestration.
 """
 
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Header, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
@@ -41,6 +43,8 @@ from orchestrator_v2.config.templates import (
     TEMPLATES,
     get_template_by_id,
 )
+from orchestrator_v2.telemetry.event_bus import get_event_bus
+from orchestrator_v2.telemetry.events import OrchestratorEvent
 from orchestrator_v2.telemetry.events_repository import get_event_repository
 from orchestrator_v2.rsg.service import RscService, RscServiceError, RsgService, RsgServiceError
 from orchestrator_v2.workspace.manager import WorkspaceManager
@@ -70,7 +74,7 @@ from orchestrator_v2.user.models import (
 )
 from orchestrator_v2.api.routes import runs, intake
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pathlib import Path
 
 
@@ -117,6 +121,9 @@ rsc_service = RscService(
     workspace_manager=workspace_manager,
 )
 
+# Idle interval between keep-alive messages on event streams
+EVENT_STREAM_HEARTBEAT_SECONDS = 15.0
+
 # Track active engines per project
 _engines: dict[str, WorkflowEngine] = {}
 
@@ -144,11 +151,23 @@ def get_cors_origins() -> list[str]:
     return origins
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared services at startup and release them at shutdown."""
+    runs.get_orchestrator_service()
+    job_queue = runs.get_run_job_queue()
+    await job_queue.start()
+    yield
+    await job_queue.stop()
+    await runs.shutdown_orchestrator_service()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Ready-Set-Code Orchestrator API",
     description="HTTP API for Ready-Set-Code workflow orchestration",
     version="2.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS - allow Railway subdomains via regex
@@ -262,10 +281,13 @@ async def test_provider(
 
 
 @app.get("/users")
-async def list_users(user: UserProfile = Depends(require_role(UserRole.ADMIN))):
-    """List all users (admin only)."""
+async def list_users(
+    tenant_id: str | None = None,
+    user: UserProfile = Depends(require_role(UserRole.ADMIN)),
+):
+    """List all users, optionally filtered by tenant (admin only)."""
     user_repo = get_user_repository()
-    users = await user_repo.list_users()
+    users = await user_repo.list_users(tenant_id=tenant_id)
     result = []
     for u in users:
         u_dict = u.model_dump()
@@ -637,9 +659,7 @@ async def get_checkpoints(project_id: str):
 @app.get("/projects/{project_id}/events", response_model=list[EventDTO])
 async def get_project_events(project_id: str, limit: int = 50, event_type: str | None = None):
     """Get events for a project."""
-    try:
-        await project_repo.load(project_id)
-    except KeyError:
+    if not await project_repo.exists(project_id):
         raise HTTPException(status_code=404, detail=f"Project not found: {project_id}")
 
     event_repo = get_event_repository()
@@ -653,19 +673,102 @@ async def get_project_events(project_id: str, limit: int = 50, event_type: str |
             raise HTTPException(status_code=400, detail=f"Invalid event type: {event_type}")
 
     events = event_repo.get_events(project_id=project_id, event_type=type_filter, limit=limit)
-    return [
-        EventDTO(
-            id=e.id,
-            event_type=e.event_type.value,
-            timestamp=e.timestamp,
-            project_id=e.project_id,
-            phase=e.phase,
-            agent_id=e.agent_id,
-            message=e.message,
-            data=e.data,
-        )
-        for e in events
-    ]
+    return [_event_to_dto(e) for e in events]
+
+
+def _event_to_dto(event: OrchestratorEvent) -> EventDTO:
+    """Convert an orchestrator event to its API representation."""
+    return EventDTO(
+        id=event.id,
+        event_type=event.event_type.value,
+        timestamp=event.timestamp,
+        project_id=event.project_id,
+        phase=event.phase,
+        agent_id=event.agent_id,
+        message=event.message,
+        data=event.data,
+    )
+
+
+@app.get("/projects/{project_id}/events/stream")
+async def stream_project_events(
+    project_id: str,
+    request: Request,
+    last_event_id: str | None = None,
+    last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
+):
+    """Stream live project events as Server-Sent Events.
+
+    Resumes after `Last-Event-ID` (header or query parameter) when the
+    event is still buffered. Sends a comment line every
+    EVENT_STREAM_HEARTBEAT_SECONDS while idle.
+    """
+    if not await project_repo.exists(project_id):
+        raise HTTPException(status_code=404, detail=f"Project not found: {project_id}")
+
+    subscription = get_event_bus().subscribe(project_id, last_event_id or last_event_id_header)
+
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event = await subscription.get(timeout=EVENT_STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": heartbeat\n\n"
+                    continue
+                if event is None:
+                    break
+                dto = _event_to_dto(event)
+                yield f"id: {dto.id}\nevent: {dto.event_type}\ndata: {dto.model_dump_json()}\n\n"
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/projects/{project_id}/events/ws")
+async def project_events_websocket(
+    websocket: WebSocket,
+    project_id: str,
+    last_event_id: str | None = None,
+):
+    """Stream live project events over a WebSocket.
+
+    Messages are {"type": "event", "event": EventDTO} or
+    {"type": "heartbeat"}. The server closes with code 1013 when the
+    client falls too far behind; reconnect with `last_event_id`.
+    """
+    if not await project_repo.exists(project_id):
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    subscription = get_event_bus().subscribe(project_id, last_event_id)
+    try:
+        while True:
+            try:
+                event = await subscription.get(timeout=EVENT_STREAM_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                await websocket.send_json({"type": "heartbeat"})
+                continue
+            if event is None:
+                await websocket.close(code=1013 if subscription.overflowed else 1000)
+                break
+            await websocket.send_json({
+                "type": "event",
+                "event": _event_to_dto(event).model_dump(mode="json"),
+            })
+    except WebSocketDisconnect:
+        pass
+    finally:
+        subscription.close()
 
 
 @app.post("/projects/{project_id}/rollback/{checkpoint_id}")
@@ -9,7 +9,9 @@ See docs/orchestrator-v2-architecture.md for architecture overview.
 """
 
 import asyncio
+import hashlib
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Mapping
@@ -292,12 +294,17 @@ class WorkflowEngine:
         This runs a complete phase by:
         1. Creating PRE checkpoint
         2. Resolving phase definition and agents
-        3. Executing each agent through its lifecycle
+        3. Executing each agent through its lifecycle, with the phase
+           executor generating artifacts as soon as its declared input
+           agents (PhaseDefinition.executor_inputs) have finished
         4. Collecting artifacts and token usage
         5. Evaluating governance gates
         6. Creating POST checkpoint
         7. Advancing to next phase
 
+        Per-phase timings, including the critical path, are stored in
+        PhaseState.timings and sent with the PHASE_COMPLETED event.
+
         See ADR-001 for agent lifecycle.
         See ADR-002 for phase execution model.
 
@@ -336,6 +343,12 @@ class WorkflowEngine:
             agents=phase_def.responsible_agents,
         )
 
+        phase_clock = time.perf_counter()
+        timings: dict[str, float] = {}
+        artifact_task: asyncio.Task | None = None
+        # The executor writes its artifacts only once every agent succeeded
+        agents_succeeded = asyncio.Event()
+
         try:
             # Execute agents in parallel
             logger.info(
@@ -343,7 +356,19 @@ class WorkflowEngine:
                 f"{phase_def.responsible_agents}"
             )
 
-            agent_states = await self._run_agents_for_phase(phase_def, user)
+            agent_tasks = self._start_agents(phase_def, user, phase_clock, timings)
+
+            # Generate artifacts using PhaseExecutionService as soon as its
+            # declared inputs are done, overlapping the remaining agents
+            if user:
+                artifact_task = asyncio.create_task(
+                    self._generate_phase_artifacts(
+                        phase_def, user, agent_tasks, agents_succeeded, phase_clock, timings
+                    )
+                )
+
+            agent_states = await self._run_agents_for_phase(phase_def, user, tasks=agent_tasks)
+            agents_succeeded.set()
 
             # Store results and track usage
             for agent_id, agent_state in agent_states.items():
@@ -356,43 +381,21 @@ class WorkflowEngine:
                     agent_id=agent_id,
                     input_tokens=agent_state.token_usage.input_tokens,
                     output_tokens=agent_state.token_usage.output_tokens,
+                    model_name=agent_state.model_used,
+                    provider=agent_state.provider_used,
                 )
 
-                # Record usage for budget tracking
-                if user and agent_state.token_usage:
-                    await self._budget_enforcer.record_usage(
-                        user=user,
-                        project_id=self.state.project_id,
-                        agent_role=agent_id,
-                        model=agent_state.model_used or "unknown",
-                        input_tokens=agent_state.token_usage.input_tokens,
-                        output_tokens=agent_state.token_usage.output_tokens,
-                    )
-
-            logger.info(f"Phase {phase.value} agents completed successfully")
-
-            # Generate artifacts using PhaseExecutionService
+            # Budget usage was recorded per agent; persist it at the phase boundary
             if user:
-                try:
-                    logger.info(f"Generating artifacts for phase {phase.value}")
-                    artifact_result = await self._phase_execution_service.execute_phase(
-                        phase=phase,
-                        project_state=self.state,
-                        user=user,
-                    )
+                await self._budget_enforcer.flush()
 
-                    # Store artifacts in phase state
-                    if artifact_result.get("artifacts"):
-                        for artifact_path in artifact_result["artifacts"]:
-                            phase_state.artifacts[artifact_path] = ArtifactInfo(
-                                path=artifact_path,
-                                agent_id="phase_executor",
-                                created_at=datetime.utcnow(),
-                            )
+            logger.info(f"Phase {phase.value} agents completed successfully")
 
-                    logger.info(f"Generated {len(artifact_result.get('artifacts', []))} artifacts")
-                except Exception as e:
-                    logger.warning(f"Artifact generation failed for {phase.value}: {e}")
+            # Store artifacts in phase state
+            if artifact_task is not None:
+                for artifact in await artifact_task:
+                    phase_state.artifacts[artifact.path] = artifact
+            concurrent_done = time.perf_counter()
 
             # Evaluate governance gates
             governance_results = await self.evaluate_governance(phase)
@@ -437,11 +440,20 @@ class WorkflowEngine:
 
             self.state.updated_at = datetime.utcnow()
 
+            phase_state.timings = self._phase_timings(
+                phase_def, timings, phase_clock, concurrent_done, time.perf_counter()
+            )
+            logger.info(
+                f"Phase {phase.value} wall time {phase_state.timings['wall']:.2f}s, "
+                f"critical path {phase_state.timings['critical_path']:.2f}s"
+            )
+
             # Emit phase completed event
             self._emit_event(
                 EventType.PHASE_COMPLETED,
                 f"Phase {phase.value} completed successfully",
                 phase=phase.value,
+                timings=phase_state.timings,
             )
 
         except Exception as e:
@@ -458,6 +470,11 @@ class WorkflowEngine:
                 )
             raise
 
+        finally:
+            # An executor still waiting for the agents has written nothing yet
+            if artifact_task is not None and not artifact_task.done():
+                artifact_task.cancel()
+
         return phase_state
 
     def _build_agent_context(
@@ -684,10 +701,40 @@ class WorkflowEngine:
 
         return agent_state
 
+    def _start_agents(
+        self,
+        phase_def: Any,  # PhaseDefinition
+        user: UserProfile | None = None,
+        phase_clock: float | None = None,
+        timings: dict[str, float] | None = None,
+    ) -> dict[str, asyncio.Task]:
+        """
+        Start all responsible agents for a phase as concurrent tasks.
+
+        Args:
+            phase_def: Phase definition with responsible agents.
+            user: User profile for BYOK and entitlements.
+            phase_clock: perf_counter() at phase start, for timings.
+            timings: Receives each agent's finish time as "agent:<id>".
+
+        Returns:
+            Mapping of agent_id to its running task.
+        """
+        tasks: dict[str, asyncio.Task] = {}
+        for agent_id in phase_def.responsible_agents:
+            task = asyncio.create_task(self._execute_agent_with_budget(agent_id, phase_def.name, user))
+            if timings is not None and phase_clock is not None:
+                task.add_done_callback(
+                    lambda _, key=f"agent:{agent_id}": timings.__setitem__(key, time.perf_counter() - phase_clock)
+                )
+            tasks[agent_id] = task
+        return tasks
+
     async def _run_agents_for_phase(
         self,
         phase_def: Any,  # PhaseDefinition
         user: UserProfile | None = None,
+        tasks: dict[str, asyncio.Task] | None = None,
     ) -> dict[str, AgentState]:
         """
         Execute all responsible agents for a phase, possibly in parallel.
@@ -698,25 +745,22 @@ class WorkflowEngine:
         Args:
             phase_def: Phase definition with responsible agents.
             user: User profile for BYOK and entitlements.
+            tasks: Agent tasks already started by _start_agents.
 
         Returns:
             Mapping of agent_id to AgentState results.
         """
-        from orchestrator_v2.engine.state_models import PhaseDefinition
-
         agent_ids = phase_def.responsible_agents
         if not agent_ids:
             return {}
 
         logger.info(f"Starting parallel execution of {len(agent_ids)} agents")
 
-        # Create tasks for all agents
-        tasks = []
-        for agent_id in agent_ids:
-            tasks.append(self._execute_agent_with_budget(agent_id, phase_def.name, user))
+        if tasks is None:
+            tasks = self._start_agents(phase_def, user)
 
-        # Execute all agents in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Wait for all agents
+        results = await asyncio.gather(*(tasks[agent_id] for agent_id in agent_ids), return_exceptions=True)
 
         # Process results
         agent_states: dict[str, AgentState] = {}
@@ -748,6 +792,108 @@ class WorkflowEngine:
         logger.info(f"Parallel execution complete: {len(agent_states)} agents succeeded")
         return agent_states
 
+    async def _generate_phase_artifacts(
+        self,
+        phase_def: Any,  # PhaseDefinition
+        user: UserProfile,
+        agent_tasks: dict[str, asyncio.Task],
+        agents_succeeded: asyncio.Event,
+        phase_clock: float,
+        timings: dict[str, float],
+    ) -> list[ArtifactInfo]:
+        """
+        Run the phase executor once its declared input agents have finished.
+
+        The executor generates concurrently with the remaining agents but
+        writes its artifacts only after all of them succeeded; if any fails,
+        run_phase cancels it before anything reaches disk.
+
+        Args:
+            phase_def: Phase definition; executor_inputs lists the agents it waits for.
+            user: User profile with LLM credentials.
+            agent_tasks: Running agent tasks of the phase.
+            agents_succeeded: Set by run_phase once every agent succeeded.
+            phase_clock: perf_counter() at phase start.
+            timings: Receives phase_executor_start and phase_executor_end.
+
+        Returns:
+            The generated artifacts (empty if generation failed).
+        """
+        inputs = [agent_tasks[a] for a in phase_def.executor_inputs if a in agent_tasks]
+        if inputs:
+            await asyncio.wait(inputs)
+            if any(task.cancelled() or task.exception() is not None for task in inputs):
+                # The phase fails on the agent error; nothing to generate
+                return []
+
+        timings["phase_executor_start"] = time.perf_counter() - phase_clock
+        try:
+            logger.info(f"Generating artifacts for phase {phase_def.name.value}")
+            artifact_result = await self._phase_execution_service.execute_phase(
+                phase=phase_def.name,
+                project_state=self.state,
+                user=user,
+                write_after=agents_succeeded,
+            )
+            artifacts = await asyncio.to_thread(self._describe_artifacts, artifact_result.get("artifacts", []))
+            logger.info(f"Generated {len(artifacts)} artifacts")
+            return artifacts
+        except Exception as e:
+            logger.warning(f"Artifact generation failed for {phase_def.name.value}: {e}")
+            return []
+        finally:
+            timings["phase_executor_end"] = time.perf_counter() - phase_clock
+
+    @staticmethod
+    def _describe_artifacts(paths: list[str]) -> list[ArtifactInfo]:
+        """Hash and size generated artifact files (runs in a worker thread)."""
+        artifacts = []
+        for path in paths:
+            try:
+                data = Path(path).read_bytes()
+            except OSError as e:
+                logger.warning(f"Generated artifact {path} is unreadable: {e}")
+                continue
+            artifacts.append(
+                ArtifactInfo(path=path, hash=hashlib.sha256(data).hexdigest(), size_bytes=len(data))
+            )
+        return artifacts
+
+    @staticmethod
+    def _phase_timings(
+        phase_def: Any,  # PhaseDefinition
+        timings: dict[str, float],
+        phase_clock: float,
+        concurrent_done: float,
+        phase_done: float,
+    ) -> dict[str, float]:
+        """
+        Summarize phase timings and its critical path.
+
+        Agents all start at phase start, so each agent's chain is its own
+        duration; the phase executor's chain is its latest input agent plus
+        its own duration (which includes waiting for the remaining agents
+        before writing). The critical path is the longest chain plus the
+        serial finalize step (governance gates and POST checkpoint).
+
+        Returns:
+            Seconds per agent, phase_executor (and when it started), finalize,
+            critical_path and wall.
+        """
+        summary = {key: value for key, value in timings.items() if key.startswith("agent:")}
+        chains = list(summary.values())
+        if "phase_executor_start" in timings:
+            executor = timings["phase_executor_end"] - timings["phase_executor_start"]
+            ready = max((timings.get(f"agent:{a}", 0.0) for a in phase_def.executor_inputs), default=0.0)
+            summary["phase_executor_start"] = timings["phase_executor_start"]
+            summary["phase_executor"] = executor
+            chains.append(ready + executor)
+
+        summary["finalize"] = phase_done - concurrent_done
+        summary["critical_path"] = max(chains, default=0.0) + summary["finalize"]
+        summary["wall"] = phase_done - phase_clock
+        return {key: round(value, 3) for key, value in summary.items()}
+
     async def _execute_agent_with_budget(
         self,
         agent_id: str,
@@ -776,21 +922,27 @@ class WorkflowEngine:
             f"Selected model for {agent_id}: {model_config.provider}:{model_config.model}"
         )
 
-        # Check budget before execution
+        # Check budget and reserve estimated tokens before execution
+        reservation = None
         if user:
             estimated_tokens = estimate_tokens_for_agent(agent_id)
             try:
-                await self._budget_enforcer.check_and_reserve(
+                reservation = await self._budget_enforcer.check_and_reserve(
                     user=user,
                     project_id=self.state.project_id,
                     estimated_tokens=estimated_tokens,
                 )
             except BudgetError as e:
                 logger.error(f"Budget exceeded for {agent_id}: {e}")
-                raise BudgetExceededError(str(e))
+                raise BudgetExceededError(
+                    str(e),
+                    budget_type=e.limit_type,
+                    limit=e.limit,
+                    actual=e.current,
+                )
 
-        # Execute the agent with user and model config (with retry for LLM errors)
         try:
+            # Execute the agent with user and model config (with retry for LLM errors)
             agent_state = await retry_async(
                 self._execute_agent,
                 agent_id,
@@ -799,16 +951,26 @@ class WorkflowEngine:
                 model_config,
                 config=AGENT_RETRY_CONFIG,
             )
-        except LLMRetryError:
-            # Re-raise as-is for specific handling
-            raise
-        except Exception as e:
-            # Other errors don't get retried
-            raise
 
-        # Update state with model info
-        agent_state.model_used = model_config.model
-        agent_state.provider_used = model_config.provider
+            # Update state with model info
+            agent_state.model_used = model_config.model
+            agent_state.provider_used = model_config.provider
+
+            # Convert the reservation into actual usage as soon as the agent is done
+            if user and agent_state.token_usage:
+                await self._budget_enforcer.record_usage(
+                    user=user,
+                    project_id=self.state.project_id,
+                    agent_role=agent_id,
+                    model=agent_state.model_used or "unknown",
+                    input_tokens=agent_state.token_usage.input_tokens,
+                    output_tokens=agent_state.token_usage.output_tokens,
+                    reservation=reservation,
+                )
+        finally:
+            # No-op once usage was recorded; otherwise (errors, including
+            # LLMRetryError, or cancellation) the held tokens are returned
+            self._budget_enforcer.release(reservation)
 
         return agent_state
 
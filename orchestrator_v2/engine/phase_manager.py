@@ -41,12 +41,16 @@ def get_default_workflow() -> WorkflowDefinition:
         name="analytics_workflow",
         description="Standard analytics project workflow",
         project_type="analytics",
+        # executor_inputs: every phase executor works from the intake and
+        # earlier phases' artifacts, not from its agents' results, so all of
+        # them run alongside their agents (writes still wait for the agents)
         phases=[
             PhaseDefinition(
                 name=PhaseType.PLANNING,
                 order=0,
                 responsible_agents=["architect"],
                 inputs=["intake.yaml"],
+                executor_inputs=[],
                 outputs=["project_plan.md", "requirements.md"],
                 quality_gates=["plan_completeness"],
                 description="Analyze requirements and plan project approach",
@@ -56,6 +60,7 @@ def get_default_workflow() -> WorkflowDefinition:
                 order=1,
                 responsible_agents=["architect"],
                 inputs=["project_plan.md", "requirements.md"],
+                executor_inputs=[],
                 outputs=["architecture.md", "data_model.md"],
                 quality_gates=["architecture_review"],
                 description="Design system architecture and data models",
@@ -65,6 +70,7 @@ def get_default_workflow() -> WorkflowDefinition:
                 order=2,
                 responsible_agents=["data"],
                 inputs=["architecture.md", "data_model.md"],
+                executor_inputs=[],
                 outputs=["data/processed/", "models/", "metrics.json"],
                 quality_gates=["data_quality", "model_performance"],
                 description="Build data pipelines and train models",
@@ -75,6 +81,7 @@ def get_default_workflow() -> WorkflowDefinition:
                 order=3,
                 responsible_agents=["developer"],
                 inputs=["architecture.md"],
+                executor_inputs=[],
                 outputs=["src/", "tests/"],
                 quality_gates=["test_coverage", "code_quality"],
                 description="Implement features and write tests",
@@ -84,6 +91,7 @@ def get_default_workflow() -> WorkflowDefinition:
                 order=4,
                 responsible_agents=["qa"],
                 inputs=["src/", "tests/"],
+                executor_inputs=[],
                 outputs=["test_report.md", "coverage.json"],
                 quality_gates=["test_pass_rate", "security_scan"],
                 description="Execute tests and validate quality",
@@ -93,6 +101,7 @@ def get_default_workflow() -> WorkflowDefinition:
                 order=5,
                 responsible_agents=["documentarian"],
                 inputs=["src/", "architecture.md"],
+                executor_inputs=[],
                 outputs=["docs/", "README.md"],
                 quality_gates=["doc_completeness"],
                 description="Create technical and user documentation",
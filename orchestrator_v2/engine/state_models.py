@@ -243,6 +243,8 @@ class PhaseState(BaseModel):
     agent_ids: list[str] = Field(default_factory=list)
     artifacts: dict[str, ArtifactInfo] = Field(default_factory=dict)
     error_message: str | None = None
+    # Seconds per agent ("agent:<id>"), phase executor, finalize, critical_path and wall
+    timings: dict[str, float] = Field(default_factory=dict)
 
 
 # -----------------------------------------------------------------------------
@@ -440,6 +442,9 @@ class PhaseDefinition(BaseModel):
     responsible_agents: list[str] = Field(default_factory=list)
     inputs: list[str] = Field(default_factory=list)
     outputs: list[str] = Field(default_factory=list)
+    # Responsible agents whose results the phase executor consumes; it
+    # starts as soon as these finish, concurrently with the other agents
+    executor_inputs: list[str] = Field(default_factory=list)
     quality_gates: list[str] = Field(default_factory=list)
     description: str = ""
     optional: bool = False
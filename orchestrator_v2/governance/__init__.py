@@ -7,17 +7,24 @@ requirements, and brand constraints.
 See ADR-004 for governance architecture.
 """
 
+from orchestrator_v2.governance.audit_store import (
+    GovernanceAuditStore,
+    get_governance_audit_store,
+)
 from orchestrator_v2.governance.governance_engine import GovernanceEngine
 from orchestrator_v2.governance.policy_models import (
     Gate,
     GateConfig,
     GovernancePolicy,
 )
-from orchestrator_v2.governance.policy_loader import PolicyLoader
+from orchestrator_v2.governance.policy_loader import CompiledPolicy, PolicyLoader
 
 __all__ = [
     "GovernanceEngine",
+    "GovernanceAuditStore",
+    "get_governance_audit_store",
     "PolicyLoader",
+    "CompiledPolicy",
     "GovernancePolicy",
     "Gate",
     "GateConfig",
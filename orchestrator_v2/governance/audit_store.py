@@ -0,0 +1,187 @@
+"""
+Append-only store for the governance audit trail.
+
+Audit records live outside ProjectState, one JSONL file per project and
+phase, under the orchestrator data directory (ORCHESTRATOR_DATA_DIR):
+
+    <data_dir>/governance_audit/<project_id>/<phase>.jsonl
+
+Each file keeps at most `max_records_per_phase` records. Appends are
+O(1); once a file holds twice the limit it is compacted to the newest
+records, so retention costs amortized O(1) per append.
+
+See ADR-004 for governance architecture.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from orchestrator_v2.config.env import get_settings
+from orchestrator_v2.governance.policy_models import AuditEntry
+
+
+class GovernanceAuditStore:
+    """Append-only, retention-bounded governance audit store."""
+
+    def __init__(
+        self,
+        base_dir: Path | None = None,
+        max_records_per_phase: int = 1000,
+    ):
+        """Initialize the store.
+
+        Args:
+            base_dir: Base directory. Defaults to governance_audit under the
+                orchestrator data directory.
+            max_records_per_phase: Records retained per project and phase.
+        """
+        self.base_dir = base_dir or get_settings().get_data_dir_path() / "governance_audit"
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.max_records_per_phase = max_records_per_phase
+        self._lock = threading.Lock()
+        # Line counts per file, loaded lazily on first append
+        self._counts: dict[Path, int] = {}
+
+    @staticmethod
+    def _safe(name: str) -> str:
+        return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+
+    def _project_dir(self, project_id: str) -> Path:
+        return self.base_dir / self._safe(project_id)
+
+    def _phase_path(self, project_id: str, phase: str) -> Path:
+        return self._project_dir(project_id) / f"{self._safe(phase)}.jsonl"
+
+    def append(self, project_id: str, phase: str, record: dict[str, Any]) -> None:
+        """Append an audit record for a project phase."""
+        path = self._phase_path(project_id, phase)
+        line = json.dumps(record, default=str) + "\n"
+
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path not in self._counts:
+                self._counts[path] = self._count_lines(path)
+
+            with open(path, "a") as f:
+                f.write(line)
+            self._counts[path] += 1
+
+            if self._counts[path] >= 2 * self.max_records_per_phase:
+                self._compact(path)
+
+    def append_entry(self, project_id: str, entry: AuditEntry) -> None:
+        """Append a per-gate audit entry."""
+        record = {"kind": "gate", **entry.model_dump(mode="json")}
+        self.append(project_id, entry.phase, record)
+
+    def read(
+        self,
+        project_id: str,
+        phase: str | None = None,
+        kind: str | None = None,
+        limit: int | None = None,
+        workflow_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Read audit records for a project, oldest first.
+
+        Args:
+            project_id: Project identifier.
+            phase: Only read this phase's file.
+            kind: Filter by record kind ("evaluation" or "gate").
+            limit: Return only the newest `limit` records.
+            workflow_id: Only records of this workflow run.
+        """
+        # Lines of other runs are skipped before they are parsed
+        marker = f'"workflow_id": {json.dumps(workflow_id)}' if workflow_id is not None else None
+
+        if phase is not None:
+            paths = [self._phase_path(project_id, phase)]
+        else:
+            project_dir = self._project_dir(project_id)
+            paths = sorted(project_dir.glob("*.jsonl")) if project_dir.exists() else []
+
+        records: list[dict[str, Any]] = []
+        for path in paths:
+            if not path.exists():
+                continue
+            with open(path) as f:
+                for line in f:
+                    if marker is not None and marker not in line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if kind is not None and record.get("kind") != kind:
+                        continue
+                    if workflow_id is not None and record.get("workflow_id") != workflow_id:
+                        continue
+                    records.append(record)
+
+        if phase is None and len(paths) > 1:
+            records.sort(key=lambda r: r.get("timestamp", ""))
+        if limit is not None:
+            records = records[-limit:]
+        return records
+
+    def read_entries(
+        self,
+        project_id: str,
+        phase: str | None = None,
+        workflow_id: str | None = None,
+    ) -> list[AuditEntry]:
+        """Read per-gate audit entries as AuditEntry models."""
+        entries = []
+        for record in self.read(project_id, phase=phase, kind="gate", workflow_id=workflow_id):
+            record.pop("kind", None)
+            entries.append(AuditEntry(**record))
+        return entries
+
+    def delete_project(self, project_id: str) -> None:
+        """Remove all audit records for a project."""
+        project_dir = self._project_dir(project_id)
+        if not project_dir.exists():
+            return
+        with self._lock:
+            for path in project_dir.glob("*.jsonl"):
+                self._counts.pop(path, None)
+                path.unlink()
+            project_dir.rmdir()
+
+    def _count_lines(self, path: Path) -> int:
+        if not path.exists():
+            return 0
+        with open(path, "rb") as f:
+            return sum(1 for _ in f)
+
+    def _compact(self, path: Path) -> None:
+        """Keep only the newest records in a phase file."""
+        with open(path) as f:
+            lines = f.readlines()
+        keep = lines[-self.max_records_per_phase:]
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text("".join(keep))
+        temp_path.replace(path)
+        self._counts[path] = len(keep)
+
+
+# Global store instance
+_audit_store: GovernanceAuditStore | None = None
+
+
+def get_governance_audit_store(base_dir: Path | None = None) -> GovernanceAuditStore:
+    """Get the global governance audit store instance.
+
+    Args:
+        base_dir: Base directory (only used on first call).
+
+    Returns:
+        GovernanceAuditStore instance.
+    """
+    global _audit_store
+    if _audit_store is None:
+        _audit_store = GovernanceAuditStore(base_dir)
+    return _audit_store
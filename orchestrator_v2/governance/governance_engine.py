@@ -3,6 +3,12 @@ Governance engine for Orchestrator v2.
 
 Central engine for enforcing quality gates and compliance.
 
+Gate checks come precompiled from the PolicyLoader, so evaluating a
+phase transition does no policy parsing or file I/O.
+
+Audit records go to a GovernanceAuditStore; ProjectState only carries a
+fixed-size summary under metadata["governance_audit"].
+
 See ADR-004 for governance architecture.
 """
 
@@ -17,7 +23,11 @@ from orchestrator_v2.engine.state_models import (
     PhaseType,
     ProjectState,
 )
-from orchestrator_v2.governance.policy_loader import PolicyLoader
+from orchestrator_v2.governance.audit_store import (
+    GovernanceAuditStore,
+    get_governance_audit_store,
+)
+from orchestrator_v2.governance.policy_loader import CompiledPolicy, PolicyLoader
 from orchestrator_v2.governance.policy_models import (
     AuditEntry,
     GovernancePolicy,
@@ -27,15 +37,21 @@ from orchestrator_v2.governance.policy_models import (
 class GovernanceEngine:
     """Central governance enforcement engine."""
 
-    def __init__(self, policy_loader: PolicyLoader | None = None):
+    def __init__(
+        self,
+        policy_loader: PolicyLoader | None = None,
+        audit_store: GovernanceAuditStore | None = None,
+    ):
         """Initialize the governance engine."""
         self.policy_loader = policy_loader or PolicyLoader()
+        self.audit_store = audit_store or get_governance_audit_store()
         self._policy: GovernancePolicy | None = None
-        self._audit_log: list[AuditEntry] = []
+        self._compiled: CompiledPolicy | None = None
 
-    def load_policy(self, client: str) -> GovernancePolicy:
+    def load_policy(self, client: str, project: str | None = None) -> GovernancePolicy:
         """Load governance policy for a client."""
-        self._policy = self.policy_loader.load_policies(client)
+        self._compiled = self.policy_loader.compile(client, project)
+        self._policy = self._compiled.policy
         return self._policy
 
     async def evaluate_phase_transition(
@@ -57,8 +73,9 @@ class GovernanceEngine:
         # from_phase is accepted for backward compatibility but not currently used
         # Future: could use for transition-specific governance rules
         _ = from_phase  # Acknowledge parameter to avoid unused warning
-        if self._policy is None:
-            self.load_policy(project_state.client)
+
+        # Cached by the loader; only recompiled when a policy file changes
+        self.load_policy(project_state.client, project_state.project_id)
 
         results = GovernanceResults()
 
@@ -91,76 +108,22 @@ class GovernanceEngine:
         state: ProjectState,
     ) -> list[GateResult]:
         """Evaluate quality gates for a phase."""
-        results: list[GateResult] = []
-
-        if self._policy is None:
-            return results
-
-        # Test coverage gate
-        if phase in [PhaseType.DEVELOPMENT, PhaseType.QA]:
-            coverage = state.metadata.get("test_coverage", 85)
-            threshold = self._policy.quality_gates.min_test_coverage
-
-            status = GateStatus.PASSED if coverage >= threshold else GateStatus.BLOCKED
-            results.append(GateResult(
-                gate_id="test_coverage",
-                status=status,
-                threshold=threshold,
-                actual=coverage,
-                message=f"Test coverage {coverage}% {'meets' if coverage >= threshold else 'below'} required {threshold}%",
-            ))
-
-        # Security scan gate
-        if phase in [PhaseType.DEVELOPMENT, PhaseType.QA]:
-            # Check if security scan artifact exists and has no FAIL
-            security_passed = state.metadata.get("security_scan_passed", True)
-
-            if self._policy.quality_gates.security_scan_required:
-                status = GateStatus.PASSED if security_passed else GateStatus.BLOCKED
-                results.append(GateResult(
-                    gate_id="security_scan",
-                    status=status,
-                    threshold=0,
-                    actual=0 if security_passed else 1,
-                    message="Security scan " + ("passed" if security_passed else "FAILED - vulnerabilities found"),
-                ))
-
-        # Documentation gate
-        if phase == PhaseType.DOCUMENTATION:
-            has_docs = state.metadata.get("has_documentation", True)
-
-            if self._policy.quality_gates.require_documentation:
-                status = GateStatus.PASSED if has_docs else GateStatus.BLOCKED
-                results.append(GateResult(
-                    gate_id="documentation",
-                    status=status,
-                    threshold=1,
-                    actual=1 if has_docs else 0,
-                    message="Documentation " + ("present" if has_docs else "missing"),
-                ))
-
-        return results
+        if self._compiled is None:
+            return []
+        return [check(state) for check in self._compiled.checks_for(phase)]
 
     async def _evaluate_compliance(
         self,
         state: ProjectState,
     ) -> list[Any]:
         """Evaluate compliance requirements."""
+        if self._compiled is None:
+            return []
         results = []
-
-        if self._policy is None:
-            return results
-
-        # GDPR compliance check
-        if self._policy.compliance.gdpr:
-            pii_in_repo = state.metadata.get("pii_in_repo", False)
-            if pii_in_repo:
-                results.append({
-                    "check": "gdpr_pii",
-                    "status": "failed",
-                    "message": "PII detected in repository",
-                })
-
+        for check in self._compiled.compliance_checks:
+            result = check(state)
+            if result is not None:
+                results.append(result)
         return results
 
     def _log_governance_evaluation(
@@ -170,11 +133,8 @@ class GovernanceEngine:
         results: GovernanceResults,
     ) -> None:
         """Log governance evaluation to audit trail."""
-        # Add to project state metadata
-        if "governance_audit" not in state.metadata:
-            state.metadata["governance_audit"] = []
-
         audit_record = {
+            "kind": "evaluation",
             "timestamp": datetime.utcnow().isoformat(),
             "phase": phase.value,
             "passed": results.passed,
@@ -183,9 +143,10 @@ class GovernanceEngine:
             "gates_blocked": sum(1 for g in results.quality_gates if g.status == GateStatus.BLOCKED),
             "failed_rules": results.failed_rules,
         }
-        state.metadata["governance_audit"].append(audit_record)
+        self._migrate_legacy_audit(state)
+        self.audit_store.append(state.project_id, phase.value, audit_record)
 
-        # Also log to internal audit log
+        # Per-gate entries
         for gate in results.quality_gates:
             self.audit_log(
                 gate_id=gate.gate_id,
@@ -198,6 +159,32 @@ class GovernanceEngine:
                 },
             )
 
+        # Keep only a constant-size pointer in project state
+        summary = state.metadata.get("governance_audit") or {}
+        state.metadata["governance_audit"] = {
+            "store": str(self.audit_store.base_dir),
+            "evaluations": summary.get("evaluations", 0) + 1,
+            "last": {
+                "timestamp": audit_record["timestamp"],
+                "phase": audit_record["phase"],
+                "passed": audit_record["passed"],
+                "failed_rules": audit_record["failed_rules"],
+            },
+        }
+
+    def _migrate_legacy_audit(self, state: ProjectState) -> None:
+        """Move an audit list stored in state metadata into the audit store."""
+        legacy = state.metadata.get("governance_audit")
+        if not isinstance(legacy, list):
+            return
+        for record in legacy:
+            self.audit_store.append(
+                state.project_id,
+                record.get("phase", "unknown"),
+                {"kind": "evaluation", **record},
+            )
+        state.metadata["governance_audit"] = {"evaluations": len(legacy)}
+
     def get_constraints(
         self,
         phase: PhaseType,
@@ -232,11 +219,20 @@ class GovernanceEngine:
             },
             context=context,
         )
-        self._audit_log.append(entry)
-
-    def get_audit_trail(self, workflow_id: str) -> list[AuditEntry]:
-        """Get audit trail for a workflow."""
-        return [
-            e for e in self._audit_log
-            if e.workflow_id == workflow_id
-        ]
+        project_id = context.get("project_id") or entry.workflow_id
+        self.audit_store.append_entry(project_id, entry)
+
+    def get_audit_trail(
+        self,
+        workflow_id: str,
+        phase: str | None = None,
+        project_id: str | None = None,
+    ) -> list[AuditEntry]:
+        """Get audit trail for a workflow.
+
+        Records are stored per project; project_id defaults to the workflow
+        ID, as projects are keyed by run ID.
+        """
+        return self.audit_store.read_entries(
+            project_id or workflow_id, phase=phase, workflow_id=workflow_id
+        )
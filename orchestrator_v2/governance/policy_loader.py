@@ -3,80 +3,190 @@ Policy loader for Orchestrator v2.
 
 Handles loading and composing governance policies.
 
+Policies are read from YAML, deep-merged across the hierarchy, and
+compiled into a CompiledPolicy whose gate thresholds are bound into
+per-phase check functions. Compiled policies are cached per
+(client, project) and only rebuilt when one of their source files
+changes, so evaluating gates does no file I/O.
+
 See ADR-004 for policy hierarchy.
 """
 
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+import yaml
+
+from orchestrator_v2.engine.state_models import (
+    GateResult,
+    GateStatus,
+    PhaseType,
+    ProjectState,
+)
+from orchestrator_v2.governance.policy_models import Gate, GateConfig, GovernancePolicy
+
+GateCheck = Callable[[ProjectState], GateResult]
+ComplianceCheck = Callable[[ProjectState], dict[str, Any] | None]
+
+# Organization-wide defaults live alongside client configs
+ORGANIZATION_CLIENT = "kearney-default"
 
-from orchestrator_v2.governance.policy_models import GovernancePolicy
+# YAML field names that differ from the policy model
+_QUALITY_GATE_ALIASES = {"require_security_scan": "security_scan_required"}
+_BRAND_ALIASES = {"forbid_terms": "forbidden_terms"}
+_DEPLOYMENT_ALIASES = {"require_approval": "approval_required"}
+_NOTIFICATION_LISTS = ("checkpoint_completion", "quality_gate_failure", "deployment_notifications")
+
+
+@dataclass
+class CompiledPolicy:
+    """A merged policy with precomputed gate checks."""
+    policy: GovernancePolicy
+    sources: tuple[Path, ...]
+    signature: tuple[tuple[str, int | None], ...]
+    gate_checks: dict[PhaseType, tuple[GateCheck, ...]] = field(default_factory=dict)
+    compliance_checks: tuple[ComplianceCheck, ...] = ()
+    checked_at: float = field(default_factory=time.monotonic)
+
+    def checks_for(self, phase: PhaseType) -> tuple[GateCheck, ...]:
+        """Gate checks that apply to a phase."""
+        return self.gate_checks.get(phase, ())
 
 
 class PolicyLoader:
     """Load and compose governance policies.
 
-    Policies compose from three levels (most specific wins):
-    1. Universal defaults
-    2. Kearney firm-wide standards
-    3. Client-specific requirements
+    Policies compose from four levels (most specific wins):
+    1. Universal defaults (governance/universal.yaml, optional)
+    2. Kearney firm-wide standards (clients/kearney-default/governance.yaml)
+    3. Client-specific requirements (clients/{client}/governance.yaml)
+    4. Project overrides (clients/{client}/projects/{project}/governance.yaml)
 
     See ADR-004 for policy composition.
     """
 
-    def __init__(self, base_path: Path | None = None):
+    def __init__(self, base_path: Path | None = None, check_interval: float = 2.0):
         """Initialize the policy loader.
 
         Args:
             base_path: Base path for policy files.
+            check_interval: Seconds between source-file change checks for
+                a cached policy. 0 checks on every lookup.
         """
         self.base_path = base_path or Path.cwd()
+        self.check_interval = check_interval
+        self._cache: dict[tuple[str, str | None], CompiledPolicy] = {}
+        self._lock = threading.Lock()
 
-    def load_policies(self, client: str) -> GovernancePolicy:
+    def load_policies(self, client: str, project: str | None = None) -> GovernancePolicy:
         """Load and compose policies for a client.
 
         Args:
             client: Client identifier.
+            project: Optional project identifier for project overrides.
 
         Returns:
             Composed governance policy.
-
-        TODO: Implement policy loading
-        TODO: Load universal, firm, client policies
-        TODO: Compose with precedence rules
         """
-        return self._compose_policies(client)
+        return self.compile(client, project).policy
 
-    def _compose_policies(self, client: str) -> GovernancePolicy:
-        """Compose policies from hierarchy.
+    def compile(self, client: str, project: str | None = None) -> CompiledPolicy:
+        """Get the compiled policy for (client, project), rebuilding if stale."""
+        key = (client, project)
+        compiled = self._cache.get(key)
+        now = time.monotonic()
 
-        Order: universal -> kearney-default -> client
+        if compiled is not None:
+            if now - compiled.checked_at < self.check_interval:
+                return compiled
+            if self._signature(compiled.sources) == compiled.signature:
+                compiled.checked_at = now
+                return compiled
 
-        TODO: Implement policy composition
-        TODO: Merge with overrides
-        """
-        # TODO: Load and merge policies
-        return GovernancePolicy()
+        with self._lock:
+            compiled = self._compile(client, project)
+            self._cache[key] = compiled
+            return compiled
 
-    def _load_universal(self) -> dict[str, Any]:
-        """Load universal defaults.
+    def invalidate(self, client: str | None = None) -> None:
+        """Drop cached policies (all, or one client's)."""
+        with self._lock:
+            if client is None:
+                self._cache.clear()
+            else:
+                for key in [k for k in self._cache if k[0] == client]:
+                    del self._cache[key]
 
-        TODO: Load from governance/universal.yaml
-        """
-        return {}
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
 
-    def _load_kearney_default(self) -> dict[str, Any]:
-        """Load Kearney defaults.
+    def _source_paths(self, client: str, project: str | None) -> tuple[Path, ...]:
+        """Policy files for a (client, project), least specific first."""
+        clients_dir = self.base_path / "clients"
+        paths = [
+            self.base_path / "governance" / "universal.yaml",
+            clients_dir / ORGANIZATION_CLIENT / "governance.yaml",
+        ]
+        if client and client != ORGANIZATION_CLIENT:
+            paths.append(clients_dir / client / "governance.yaml")
+        if project:
+            paths.append(clients_dir / client / "projects" / project / "governance.yaml")
+        return tuple(paths)
 
-        TODO: Load from governance/kearney-default.yaml
-        """
-        return {}
+    @staticmethod
+    def _signature(paths: tuple[Path, ...]) -> tuple[tuple[str, int | None], ...]:
+        """mtime signature of the source files (None for missing files)."""
+        signature = []
+        for path in paths:
+            try:
+                signature.append((str(path), path.stat().st_mtime_ns))
+            except FileNotFoundError:
+                signature.append((str(path), None))
+        return tuple(signature)
+
+    def _compile(self, client: str, project: str | None) -> CompiledPolicy:
+        """Load, merge, and compile the policy hierarchy."""
+        sources = self._source_paths(client, project)
+        signature = self._signature(sources)
+
+        merged = self._compose_policies(sources)
+        policy = GovernancePolicy.model_validate(self._normalize(merged))
+        errors = self.validate_policy(policy)
+        if errors:
+            raise ValueError(f"Invalid governance policy for {client}: {errors}")
 
-    def _load_client(self, client: str) -> dict[str, Any]:
-        """Load client-specific policy.
+        return CompiledPolicy(
+            policy=policy,
+            sources=sources,
+            signature=signature,
+            gate_checks=self._compile_gate_checks(policy),
+            compliance_checks=self._compile_compliance_checks(policy),
+        )
 
-        TODO: Load from clients/{client}/governance.yaml
+    def _compose_policies(self, sources: tuple[Path, ...]) -> dict[str, Any]:
+        """Compose policies from hierarchy.
+
+        Order: universal -> kearney-default -> client -> project
         """
-        return {}
+        merged: dict[str, Any] = {}
+        for path in sources:
+            merged = self._merge_policies(merged, self._load_yaml(path))
+        return merged
+
+    @staticmethod
+    def _load_yaml(path: Path) -> dict[str, Any]:
+        """Load a policy file, or {} if it does not exist."""
+        if not path.exists():
+            return {}
+        with open(path) as f:
+            data = yaml.safe_load(f) or {}
+        if not isinstance(data, dict):
+            raise ValueError(f"Governance policy must be a mapping: {path}")
+        return data
 
     def _merge_policies(
         self,
@@ -85,12 +195,138 @@ class PolicyLoader:
     ) -> dict[str, Any]:
         """Merge policies with override precedence.
 
-        TODO: Implement deep merge
+        Nested mappings merge field by field; lists and scalars replace.
         """
         result = base.copy()
-        result.update(override)
+        for key, value in override.items():
+            if isinstance(value, dict) and isinstance(result.get(key), dict):
+                result[key] = self._merge_policies(result[key], value)
+            else:
+                result[key] = value
         return result
 
+    @staticmethod
+    def _normalize(raw: dict[str, Any]) -> dict[str, Any]:
+        """Map the YAML governance schema onto GovernancePolicy fields."""
+
+        def rename(section: dict[str, Any], aliases: dict[str, str]) -> dict[str, Any]:
+            return {aliases.get(k, k): v for k, v in (section or {}).items()}
+
+        policy: dict[str, Any] = {
+            "quality_gates": rename(raw.get("quality_gates", {}), _QUALITY_GATE_ALIASES),
+            "brand_constraints": rename(raw.get("brand_constraints", {}), _BRAND_ALIASES),
+        }
+
+        compliance = dict(raw.get("compliance") or {})
+        frameworks = [str(f).lower() for f in compliance.pop("frameworks", None) or []]
+        policy["compliance"] = {
+            name: dict(compliance) for name in ("gdpr", "hipaa", "soc2") if name in frameworks
+        }
+
+        deployment = rename(raw.get("deployment", {}), _DEPLOYMENT_ALIASES)
+        window = deployment.pop("deployment_window", None)
+        if window and "deployment_windows" not in deployment:
+            if isinstance(window, dict):
+                days = ",".join(window.get("days") or [])
+                window = f"{days} {window.get('hours_utc', '')}".strip()
+            deployment["deployment_windows"] = [window]
+        policy["deployment"] = deployment
+
+        notifications = dict(raw.get("notifications") or {})
+        emails: list[str] = list(notifications.get("email", []))
+        for name in _NOTIFICATION_LISTS:
+            emails.extend(e for e in notifications.pop(name, None) or [] if e not in emails)
+        policy["notifications"] = {
+            "slack_webhook": notifications.get("slack_webhook") or None,
+            "email": emails,
+        }
+
+        policy["custom_gates"] = [
+            Gate(config=GateConfig(
+                id=rule["rule_id"],
+                gate_type=rule.get("check_type", "validator"),
+                description=rule.get("description", ""),
+                checks=[{"pattern": rule["pattern"]}] if rule.get("pattern") else [],
+                on_failure_action="block" if rule.get("severity") == "error" else "warn",
+            ))
+            for rule in raw.get("custom_rules") or []
+            if "rule_id" in rule
+        ]
+        return policy
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _compile_gate_checks(
+        policy: GovernancePolicy,
+    ) -> dict[PhaseType, tuple[GateCheck, ...]]:
+        """Bind gate thresholds into per-phase check functions."""
+        gates = policy.quality_gates
+        checks: dict[PhaseType, list[GateCheck]] = {}
+
+        threshold = gates.min_test_coverage
+
+        def test_coverage(state: ProjectState) -> GateResult:
+            coverage = state.metadata.get("test_coverage", 85)
+            passed = coverage >= threshold
+            return GateResult(
+                gate_id="test_coverage",
+                status=GateStatus.PASSED if passed else GateStatus.BLOCKED,
+                threshold=threshold,
+                actual=coverage,
+                message=f"Test coverage {coverage}% {'meets' if passed else 'below'} required {threshold}%",
+            )
+
+        def security_scan(state: ProjectState) -> GateResult:
+            security_passed = state.metadata.get("security_scan_passed", True)
+            return GateResult(
+                gate_id="security_scan",
+                status=GateStatus.PASSED if security_passed else GateStatus.BLOCKED,
+                threshold=0,
+                actual=0 if security_passed else 1,
+                message="Security scan " + ("passed" if security_passed else "FAILED - vulnerabilities found"),
+            )
+
+        def documentation(state: ProjectState) -> GateResult:
+            has_docs = state.metadata.get("has_documentation", True)
+            return GateResult(
+                gate_id="documentation",
+                status=GateStatus.PASSED if has_docs else GateStatus.BLOCKED,
+                threshold=1,
+                actual=1 if has_docs else 0,
+                message="Documentation " + ("present" if has_docs else "missing"),
+            )
+
+        for phase in (PhaseType.DEVELOPMENT, PhaseType.QA):
+            checks.setdefault(phase, []).append(test_coverage)
+            if gates.security_scan_required:
+                checks[phase].append(security_scan)
+        if gates.require_documentation:
+            checks.setdefault(PhaseType.DOCUMENTATION, []).append(documentation)
+
+        return {phase: tuple(fns) for phase, fns in checks.items()}
+
+    @staticmethod
+    def _compile_compliance_checks(policy: GovernancePolicy) -> tuple[ComplianceCheck, ...]:
+        """Bind compliance requirements into check functions."""
+        checks: list[ComplianceCheck] = []
+
+        if policy.compliance.gdpr:
+            def gdpr_pii(state: ProjectState) -> dict[str, Any] | None:
+                if state.metadata.get("pii_in_repo", False):
+                    return {
+                        "check": "gdpr_pii",
+                        "status": "failed",
+                        "message": "PII detected in repository",
+                    }
+                return None
+
+            checks.append(gdpr_pii)
+
+        return tuple(checks)
+
     def validate_policy(self, policy: GovernancePolicy) -> list[str]:
         """Validate a governance policy.
 
@@ -99,9 +335,13 @@ class PolicyLoader:
 
         Returns:
             List of validation errors.
-
-        TODO: Implement policy validation
-        TODO: Check required fields
-        TODO: Validate gate configurations
         """
-        return []
+        errors = []
+        if not 0 <= policy.quality_gates.min_test_coverage <= 100:
+            errors.append("quality_gates.min_test_coverage must be between 0 and 100")
+        if policy.quality_gates.max_complexity <= 0:
+            errors.append("quality_gates.max_complexity must be positive")
+        gate_ids = [g.config.id for g in policy.custom_gates]
+        if len(gate_ids) != len(set(gate_ids)):
+            errors.append("custom gate ids must be unique")
+        return errors
@@ -8,6 +8,8 @@ See ADR-002 for persistence architecture.
 """
 
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -22,7 +24,13 @@ from orchestrator_v2.engine.state_models import (
 
 
 class FileSystemProjectRepository:
-    """FileSystem implementation of ProjectRepository."""
+    """FileSystem implementation of ProjectRepository.
+
+    Parsed project states are cached per file (mtime, size), so repeated
+    loads of an unchanged project skip JSON parsing and validation.
+    Callers always receive their own copy. Saves are atomic, so a
+    concurrent reader never sees a partially written file.
+    """
 
     def __init__(self, base_dir: Path | None = None):
         """Initialize the repository.
@@ -32,25 +40,55 @@ class FileSystemProjectRepository:
         """
         self.base_dir = base_dir or Path(".claude/orchestrator/projects")
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._cache: dict[str, tuple[tuple[int, int], ProjectState]] = {}
 
     def _project_path(self, project_id: str) -> Path:
         """Get path for a project file."""
         return self.base_dir / f"{project_id}.json"
 
+    def signature(self, project_id: str) -> tuple[int, int] | None:
+        """(mtime_ns, size) of a project file, or None if it does not exist.
+
+        Changes whenever the project is saved; callers can use it to
+        cache values derived from the project state.
+        """
+        try:
+            stat = self._project_path(project_id).stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     async def save(self, project: ProjectState) -> None:
         """Save project state to filesystem."""
         path = self._project_path(project.project_id)
         data = project.model_dump(mode="json")
-        path.write_text(json.dumps(data, indent=2, default=str))
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(json.dumps(data, indent=2, default=str))
+        temp_path.replace(path)
+
+        signature = self.signature(project.project_id)
+        if signature is not None:
+            with self._lock:
+                self._cache[project.project_id] = (signature, project.model_copy(deep=True))
 
     async def load(self, project_id: str) -> ProjectState:
         """Load project state from filesystem."""
-        path = self._project_path(project_id)
-        if not path.exists():
+        signature = self.signature(project_id)
+        if signature is None:
             raise KeyError(f"Project not found: {project_id}")
 
+        with self._lock:
+            cached = self._cache.get(project_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1].model_copy(deep=True)
+
+        path = self._project_path(project_id)
         data = json.loads(path.read_text())
-        return ProjectState.model_validate(data)
+        state = ProjectState.model_validate(data)
+        with self._lock:
+            self._cache[project_id] = (signature, state)
+        return state.model_copy(deep=True)
 
     async def list_projects(self) -> list[str]:
         """List all project IDs."""
@@ -61,6 +99,8 @@ class FileSystemProjectRepository:
     async def delete(self, project_id: str) -> None:
         """Delete a project."""
         path = self._project_path(project_id)
+        with self._lock:
+            self._cache.pop(project_id, None)
         if path.exists():
             path.unlink()
 
@@ -68,6 +108,11 @@ class FileSystemProjectRepository:
         """Check if project exists."""
         return self._project_path(project_id).exists()
 
+    def clear_cache(self) -> None:
+        """Drop all cached project states."""
+        with self._lock:
+            self._cache.clear()
+
 
 class FileSystemCheckpointRepository:
     """FileSystem implementation of CheckpointRepository."""
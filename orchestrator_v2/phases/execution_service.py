@@ -10,6 +10,7 @@ Provides real agent execution for all phases:
 Uses LLM provider registry with Sonnet 4.5 (default) or Haiku 4.5 (fallback).
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime
@@ -39,6 +40,7 @@ class PhaseExecutionService:
         phase: PhaseType,
         project_state: ProjectState,
         user: UserProfile,
+        write_after: asyncio.Event | None = None,
     ) -> dict[str, Any]:
         """Execute a specific phase.
 
@@ -46,6 +48,8 @@ class PhaseExecutionService:
             phase: Phase to execute.
             project_state: Current project state.
             user: User profile with LLM credentials.
+            write_after: If given, artifacts are only written once this is
+                set; cancelling the call before then leaves nothing on disk.
 
         Returns:
             Dict containing artifact paths and metadata.
@@ -68,17 +72,17 @@ class PhaseExecutionService:
 
         # Route to appropriate phase handler
         if phase == PhaseType.PLANNING:
-            return await self._execute_planning_phase(project_state, context)
+            return await self._execute_planning_phase(project_state, context, write_after)
         elif phase == PhaseType.ARCHITECTURE:
-            return await self._execute_architecture_phase(project_state, context)
+            return await self._execute_architecture_phase(project_state, context, write_after)
         elif phase == PhaseType.DATA:
-            return await self._execute_data_phase(project_state, context)
+            return await self._execute_data_phase(project_state, context, write_after)
         elif phase == PhaseType.DEVELOPMENT:
-            return await self._execute_development_phase(project_state, context)
+            return await self._execute_development_phase(project_state, context, write_after)
         elif phase == PhaseType.QA:
-            return await self._execute_qa_phase(project_state, context)
+            return await self._execute_qa_phase(project_state, context, write_after)
         elif phase == PhaseType.DOCUMENTATION:
-            return await self._execute_documentation_phase(project_state, context)
+            return await self._execute_documentation_phase(project_state, context, write_after)
         else:
             return {
                 "artifacts": [],
@@ -90,6 +94,7 @@ class PhaseExecutionService:
         self,
         project_state: ProjectState,
         context: AgentContext,
+        write_after: asyncio.Event | None = None,
     ) -> dict[str, Any]:
         """Execute PLANNING phase - generate PRD and requirements."""
         logger.info("Executing PLANNING phase")
@@ -148,31 +153,27 @@ Output ONLY valid JSON with these three keys."""
 
             output = json.loads(text)
 
-            # Save artifacts
+            # Collect artifacts, written together off the event loop
             artifacts_dir = self._get_artifacts_dir(project_state, "planning")
-            saved_paths = []
+            files: dict[str, str] = {}
 
             # Save PRD
-            prd_path = artifacts_dir / "PRD.md"
             prd_content = output.get("prd", "")
             if isinstance(prd_content, dict):
                 prd_content = json.dumps(prd_content, indent=2)
-            prd_path.write_text(f"# Product Requirements Document\n\n{prd_content}")
-            saved_paths.append(str(prd_path))
+            files["PRD.md"] = f"# Product Requirements Document\n\n{prd_content}"
 
             # Save requirements
-            req_path = artifacts_dir / "requirements.md"
             req_content = output.get("requirements", "")
             if isinstance(req_content, dict):
                 req_content = json.dumps(req_content, indent=2)
-            req_path.write_text(f"# Technical Requirements\n\n{req_content}")
-            saved_paths.append(str(req_path))
+            files["requirements.md"] = f"# Technical Requirements\n\n{req_content}"
 
             # Save features list
-            features_path = artifacts_dir / "features.json"
             features_content = output.get("features", [])
-            features_path.write_text(json.dumps(features_content, indent=2))
-            saved_paths.append(str(features_path))
+            files["features.json"] = json.dumps(features_content, indent=2)
+
+            saved_paths = await self._write_artifacts(artifacts_dir, files, write_after)
 
             return {
                 "artifacts": saved_paths,
@@ -192,6 +193,7 @@ Output ONLY valid JSON with these three keys."""
         self,
         project_state: ProjectState,
         context: AgentContext,
+        write_after: asyncio.Event | None = None,
     ) -> dict[str, Any]:
         """Execute ARCHITECTURE phase - generate system design."""
         logger.info("Executing ARCHITECTURE phase")
@@ -247,31 +249,27 @@ Output ONLY valid JSON with these three keys."""
 
             output = json.loads(text)
 
-            # Save artifacts
+            # Collect artifacts, written together off the event loop
             artifacts_dir = self._get_artifacts_dir(project_state, "architecture")
-            saved_paths = []
+            files: dict[str, str] = {}
 
             # Save architecture doc
-            arch_path = artifacts_dir / "architecture.md"
             arch_content = output.get("architecture", "")
             if isinstance(arch_content, dict):
                 arch_content = json.dumps(arch_content, indent=2)
-            arch_path.write_text(f"# System Architecture\n\n{arch_content}")
-            saved_paths.append(str(arch_path))
+            files["architecture.md"] = f"# System Architecture\n\n{arch_content}"
 
             # Save data model
-            dm_path = artifacts_dir / "data_model.md"
             dm_content = output.get("data_model", "")
             if isinstance(dm_content, dict):
                 dm_content = json.dumps(dm_content, indent=2)
-            dm_path.write_text(f"# Data Model\n\n{dm_content}")
-            saved_paths.append(str(dm_path))
+            files["data_model.md"] = f"# Data Model\n\n{dm_content}"
 
             # Save ADRs
-            adrs_path = artifacts_dir / "adrs.json"
             adrs_content = output.get("adrs", [])
-            adrs_path.write_text(json.dumps(adrs_content, indent=2))
-            saved_paths.append(str(adrs_path))
+            files["adrs.json"] = json.dumps(adrs_content, indent=2)
+
+            saved_paths = await self._write_artifacts(artifacts_dir, files, write_after)
 
             return {
                 "artifacts": saved_paths,
@@ -291,6 +289,7 @@ Output ONLY valid JSON with these three keys."""
         self,
         project_state: ProjectState,
         context: AgentContext,
+        write_after: asyncio.Event | None = None,
     ) -> dict[str, Any]:
         """Execute DATA phase - profiling, schema, analytics prep."""
         logger.info("Executing DATA phase")
@@ -344,31 +343,27 @@ Output ONLY valid JSON with these three keys."""
 
             output = json.loads(text)
 
-            # Save artifacts
+            # Collect artifacts, written together off the event loop
             artifacts_dir = self._get_artifacts_dir(project_state, "data")
-            saved_paths = []
+            files: dict[str, str] = {}
 
             # Save data overview
-            overview_path = artifacts_dir / "data_overview.md"
             overview_content = output.get("data_overview", "")
             if isinstance(overview_content, dict):
                 overview_content = json.dumps(overview_content, indent=2)
-            overview_path.write_text(f"# Data Overview\n\n{overview_content}")
-            saved_paths.append(str(overview_path))
+            files["data_overview.md"] = f"# Data Overview\n\n{overview_content}"
 
             # Save schema
-            schema_path = artifacts_dir / "schema.json"
             schema_content = output.get("schema", {})
-            schema_path.write_text(json.dumps(schema_content, indent=2))
-            saved_paths.append(str(schema_path))
+            files["schema.json"] = json.dumps(schema_content, indent=2)
 
             # Save profile report
-            profile_path = artifacts_dir / "profile_report.md"
             profile_content = output.get("profile_report", "")
             if isinstance(profile_content, dict):
                 profile_content = json.dumps(profile_content, indent=2)
-            profile_path.write_text(f"# Data Profiling Report\n\n{profile_content}")
-            saved_paths.append(str(profile_path))
+            files["profile_report.md"] = f"# Data Profiling Report\n\n{profile_content}"
+
+            saved_paths = await self._write_artifacts(artifacts_dir, files, write_after)
 
             return {
                 "artifacts": saved_paths,
@@ -388,6 +383,7 @@ Output ONLY valid JSON with these three keys."""
         self,
         project_state: ProjectState,
         context: AgentContext,
+        write_after: asyncio.Event | None = None,
     ) -> dict[str, Any]:
         """Execute DEVELOPMENT phase - code scaffolding and implementation."""
         logger.info("Executing DEVELOPMENT phase")
@@ -447,27 +443,25 @@ Output ONLY valid JSON."""
 
             output = json.loads(text)
 
-            # Save artifacts
+            # Collect artifacts, written together off the event loop
             artifacts_dir = self._get_artifacts_dir(project_state, "development")
-            saved_paths = []
+            files: dict[str, str] = {}
 
             # Save dev summary
-            summary_path = artifacts_dir / "dev_summary.md"
             summary_content = output.get("dev_summary", "Development summary")
             if isinstance(summary_content, dict):
                 summary_content = json.dumps(summary_content, indent=2)
-            summary_path.write_text(f"# Development Summary\n\n{summary_content}")
-            saved_paths.append(str(summary_path))
+            files["dev_summary.md"] = f"# Development Summary\n\n{summary_content}"
 
             # Save file change log
-            changelog_path = artifacts_dir / "file_change_log.json"
             file_changes = output.get("file_changes", [])
-            changelog_path.write_text(json.dumps({
+            files["file_change_log.json"] = json.dumps({
                 "changes": file_changes,
                 "timestamp": datetime.utcnow().isoformat(),
                 "capabilities": capabilities,
-            }, indent=2))
-            saved_paths.append(str(changelog_path))
+            }, indent=2)
+
+            saved_paths = await self._write_artifacts(artifacts_dir, files, write_after)
 
             return {
                 "artifacts": saved_paths,
@@ -487,6 +481,7 @@ Output ONLY valid JSON."""
         self,
         project_state: ProjectState,
         context: AgentContext,
+        write_after: asyncio.Event | None = None,
     ) -> dict[str, Any]:
         """Execute QA phase - test generation and quality gates."""
         logger.info("Executing QA phase")
@@ -534,23 +529,21 @@ Output ONLY valid JSON."""
 
             output = json.loads(text)
 
-            # Save artifacts
+            # Collect artifacts, written together off the event loop
             artifacts_dir = self._get_artifacts_dir(project_state, "qa")
-            saved_paths = []
+            files: dict[str, str] = {}
 
             # Save QA results
-            results_path = artifacts_dir / "qa_results.json"
             qa_results = output.get("qa_results", {"status": "planned"})
-            results_path.write_text(json.dumps(qa_results, indent=2))
-            saved_paths.append(str(results_path))
+            files["qa_results.json"] = json.dumps(qa_results, indent=2)
 
             # Save quality gate report
-            gate_path = artifacts_dir / "quality_gate_report.md"
             gate_content = output.get("quality_gate_report", "Quality gates to be evaluated")
             if isinstance(gate_content, dict):
                 gate_content = json.dumps(gate_content, indent=2)
-            gate_path.write_text(f"# Quality Gate Report\n\n{gate_content}")
-            saved_paths.append(str(gate_path))
+            files["quality_gate_report.md"] = f"# Quality Gate Report\n\n{gate_content}"
+
+            saved_paths = await self._write_artifacts(artifacts_dir, files, write_after)
 
             return {
                 "artifacts": saved_paths,
@@ -570,6 +563,7 @@ Output ONLY valid JSON."""
         self,
         project_state: ProjectState,
         context: AgentContext,
+        write_after: asyncio.Event | None = None,
     ) -> dict[str, Any]:
         """Execute DOCUMENTATION phase - final docs generation."""
         logger.info("Executing DOCUMENTATION phase")
@@ -583,7 +577,7 @@ Output ONLY valid JSON."""
         if workspace:
             prd_path = Path(workspace) / "artifacts" / "planning" / "PRD.md"
             if prd_path.exists():
-                prd_content = prd_path.read_text()[:2000]
+                prd_content = (await asyncio.to_thread(prd_path.read_text))[:2000]
 
         prompt = f"""You are a technical writer. Generate documentation for this project.
 
@@ -641,41 +635,35 @@ Output ONLY valid JSON."""
 
             output = json.loads(text)
 
-            # Save artifacts
+            # Collect artifacts, written together off the event loop
             artifacts_dir = self._get_artifacts_dir(project_state, "documentation")
-            saved_paths = []
+            files: dict[str, str] = {}
 
             # Save system overview
-            overview_path = artifacts_dir / "system_overview.md"
             content = output.get("system_overview", "System overview")
             if isinstance(content, dict):
                 content = json.dumps(content, indent=2)
-            overview_path.write_text(content)
-            saved_paths.append(str(overview_path))
+            files["system_overview.md"] = content
 
             # Save how to run
-            run_path = artifacts_dir / "how_to_run.md"
             content = output.get("how_to_run", "How to run guide")
             if isinstance(content, dict):
                 content = json.dumps(content, indent=2)
-            run_path.write_text(content)
-            saved_paths.append(str(run_path))
+            files["how_to_run.md"] = content
 
             # Save API reference
-            api_path = artifacts_dir / "api_reference.md"
             content = output.get("api_reference", "API reference")
             if isinstance(content, dict):
                 content = json.dumps(content, indent=2)
-            api_path.write_text(content)
-            saved_paths.append(str(api_path))
+            files["api_reference.md"] = content
 
             # Save release notes
-            notes_path = artifacts_dir / "release_notes.md"
             content = output.get("release_notes", "Release notes")
             if isinstance(content, dict):
                 content = json.dumps(content, indent=2)
-            notes_path.write_text(content)
-            saved_paths.append(str(notes_path))
+            files["release_notes.md"] = content
+
+            saved_paths = await self._write_artifacts(artifacts_dir, files, write_after)
 
             return {
                 "artifacts": saved_paths,
@@ -692,14 +680,46 @@ Output ONLY valid JSON."""
             }
 
     def _get_artifacts_dir(self, project_state: ProjectState, phase: str) -> Path:
-        """Get artifacts directory for a phase, creating if needed."""
+        """Get artifacts directory for a phase (created when artifacts are written)."""
         workspace = project_state.workspace_path
         if not workspace:
             workspace = f"/home/user/.orchestrator/workspaces/{project_state.project_id}"
 
-        artifacts_dir = Path(workspace) / "artifacts" / phase
-        artifacts_dir.mkdir(parents=True, exist_ok=True)
-        return artifacts_dir
+        return Path(workspace) / "artifacts" / phase
+
+    async def _write_artifacts(
+        self,
+        artifacts_dir: Path,
+        files: dict[str, str],
+        write_after: asyncio.Event | None = None,
+    ) -> list[str]:
+        """Write a phase's artifact files in a worker thread.
+
+        Phase artifacts are generated while other agents of the phase are
+        still running on the event loop, so the blocking writes (including
+        creating the directory) happen off it, and only once the agents have
+        succeeded.
+
+        Args:
+            artifacts_dir: Phase artifacts directory.
+            files: Mapping of file name to content, in output order.
+            write_after: Event to wait for before writing anything.
+
+        Returns:
+            Paths of the written files.
+        """
+        def write() -> list[str]:
+            artifacts_dir.mkdir(parents=True, exist_ok=True)
+            paths = []
+            for name, content in files.items():
+                path = artifacts_dir / name
+                path.write_text(content)
+                paths.append(str(path))
+            return paths
+
+        if write_after is not None:
+            await write_after.wait()
+        return await asyncio.to_thread(write)
 
 
 # Singleton instance
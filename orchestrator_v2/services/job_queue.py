@@ -0,0 +1,370 @@
+"""
+Local background job queue for long-running run operations.
+
+Advancing a run executes a whole phase of LLM calls, which can take
+minutes. Instead of holding an HTTP request open, the API submits a job
+here and returns immediately; a bounded pool of in-process workers runs
+the jobs.
+
+- Jobs are persisted in SQLite, so queued work survives a restart.
+  Jobs found "running" at startup were interrupted and are re-queued.
+- At most one job per run is active (queued or running) at a time.
+- The number of queued jobs is capped; submissions beyond the cap are
+  rejected with QueueFullError.
+- Queued jobs can be cancelled; running jobs are cancelled by
+  cancelling their handler task.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a background job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+ACTIVE_STATUSES = (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+class Job(BaseModel):
+    """A unit of background work for a run."""
+    job_id: str = Field(default_factory=lambda: f"job-{uuid4().hex[:12]}")
+    run_id: str
+    kind: str
+    user_id: str
+    params: dict[str, Any] = Field(default_factory=dict)
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class JobQueueError(Exception):
+    """Base error for job submission."""
+
+
+class QueueFullError(JobQueueError):
+    """Raised when the queue is at its depth limit."""
+
+
+class RunBusyError(JobQueueError):
+    """Raised when a run already has an active job."""
+
+    def __init__(self, job: Job):
+        self.job = job
+        super().__init__(f"Run {job.run_id} already has active job {job.job_id}")
+
+
+JobHandler = Callable[[Job], Awaitable[dict[str, Any] | None]]
+
+
+class SQLiteJobStore:
+    """SQLite persistence for jobs."""
+
+    def __init__(self, db_path: Path | str | None = None):
+        """Initialize the store.
+
+        Args:
+            db_path: SQLite file path, or ":memory:".
+                Defaults to .claude/orchestrator/jobs/jobs.db
+        """
+        if db_path is None:
+            db_path = Path(".claude/orchestrator/jobs/jobs.db")
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        if str(db_path) != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                run_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                body TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_run ON jobs (run_id, created_at);
+            CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at);
+            """
+        )
+
+    def save(self, job: Job) -> None:
+        """Insert or update a job."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, run_id, status, created_at, body) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (job_id) DO UPDATE SET status = excluded.status, body = excluded.body",
+                (job.job_id, job.run_id, job.status.value, job.created_at.isoformat(), job.model_dump_json()),
+            )
+
+    def get(self, job_id: str) -> Job | None:
+        """Load a job by ID."""
+        with self._lock:
+            row = self._conn.execute("SELECT body FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return Job.model_validate_json(row[0]) if row else None
+
+    def list_for_run(self, run_id: str, limit: int = 50) -> list[Job]:
+        """Jobs for a run, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT body FROM jobs WHERE run_id = ? ORDER BY created_at DESC LIMIT ?",
+                (run_id, limit),
+            ).fetchall()
+        return [Job.model_validate_json(r[0]) for r in rows]
+
+    def list_by_status(self, statuses: tuple[JobStatus, ...]) -> list[Job]:
+        """Jobs in any of the given states, oldest first."""
+        placeholders = ", ".join("?" for _ in statuses)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT body FROM jobs WHERE status IN ({placeholders}) ORDER BY created_at",
+                [s.value for s in statuses],
+            ).fetchall()
+        return [Job.model_validate_json(r[0]) for r in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class JobQueue:
+    """Bounded in-process worker pool backed by a persistent job store."""
+
+    def __init__(
+        self,
+        store: SQLiteJobStore | None = None,
+        handlers: dict[str, JobHandler] | None = None,
+        workers: int = 2,
+        max_queue_depth: int = 100,
+    ):
+        """Initialize the queue.
+
+        Args:
+            store: Job store. Defaults to SQLiteJobStore().
+            handlers: Coroutine per job kind; its return value becomes
+                the job result.
+            workers: Number of concurrent workers.
+            max_queue_depth: Maximum number of queued (not yet running) jobs.
+        """
+        self.store = store or SQLiteJobStore()
+        self.handlers: dict[str, JobHandler] = dict(handlers or {})
+        self.workers = workers
+        self.max_queue_depth = max_queue_depth
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: asyncio.Queue[str] | None = None
+        self._worker_tasks: list[asyncio.Task] = []
+        self._running: dict[str, asyncio.Task] = {}
+        # Active (queued or running) job per run
+        self._active_by_run: dict[str, str] = {}
+        self._queued: set[str] = set()
+        # Set by stop() so workers tell their own cancellation from a job's
+        self._stopping = False
+
+    def register_handler(self, kind: str, handler: JobHandler) -> None:
+        """Register the coroutine that runs jobs of `kind`."""
+        self.handlers[kind] = handler
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of queued jobs."""
+        return len(self._queued)
+
+    def _ensure_started(self) -> None:
+        """Start workers on the running loop, resuming persisted jobs."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and not loop.is_closed():
+            return
+
+        self._loop = loop
+        self._stopping = False
+        self._pending = asyncio.Queue()
+        self._running.clear()
+        self._active_by_run.clear()
+        self._queued.clear()
+
+        for job in self.store.list_by_status(ACTIVE_STATUSES):
+            if job.status == JobStatus.RUNNING:
+                logger.warning(f"Re-queuing interrupted job {job.job_id} for run {job.run_id}")
+                job.status = JobStatus.QUEUED
+                job.started_at = None
+                self.store.save(job)
+            self._enqueue(job)
+
+        self._worker_tasks = [
+            loop.create_task(self._worker(i)) for i in range(self.workers)
+        ]
+        logger.info(f"JobQueue started with {self.workers} workers")
+
+    def _enqueue(self, job: Job) -> None:
+        self._active_by_run[job.run_id] = job.job_id
+        self._queued.add(job.job_id)
+        self._pending.put_nowait(job.job_id)
+
+    async def start(self) -> None:
+        """Start workers explicitly (otherwise started on first submit)."""
+        self._ensure_started()
+
+    async def submit(
+        self,
+        run_id: str,
+        kind: str,
+        user_id: str,
+        params: dict[str, Any] | None = None,
+    ) -> Job:
+        """Queue a job.
+
+        Raises:
+            RunBusyError: The run already has a queued or running job.
+            QueueFullError: The queue is at max_queue_depth.
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"No handler registered for job kind: {kind}")
+        self._ensure_started()
+
+        active_id = self._active_by_run.get(run_id)
+        if active_id is not None:
+            active = self.store.get(active_id)
+            if active is not None:
+                raise RunBusyError(active)
+        if len(self._queued) >= self.max_queue_depth:
+            raise QueueFullError(f"Job queue is full ({self.max_queue_depth} queued)")
+
+        job = Job(run_id=run_id, kind=kind, user_id=user_id, params=params or {})
+        self.store.save(job)
+        self._enqueue(job)
+        logger.info(f"Queued {kind} job {job.job_id} for run {run_id}")
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Look up a job."""
+        return self.store.get(job_id)
+
+    def list_for_run(self, run_id: str, limit: int = 50) -> list[Job]:
+        """Jobs for a run, newest first."""
+        return self.store.list_for_run(run_id, limit)
+
+    async def cancel(self, job_id: str) -> Job | None:
+        """Cancel a queued or running job.
+
+        Returns the updated job, or None if it does not exist. Jobs that
+        already finished are returned unchanged.
+        """
+        job = self.store.get(job_id)
+        if job is None or job.status not in ACTIVE_STATUSES:
+            return job
+
+        task = self._running.get(job_id)
+        if task is not None:
+            if task.cancel():
+                self._release(job)
+                self._finish(job, JobStatus.CANCELLED)
+            return self.store.get(job_id)
+
+        # Still queued: the worker skips it when dequeued
+        self._queued.discard(job_id)
+        self._release(job)
+        self._finish(job, JobStatus.CANCELLED)
+        return job
+
+    async def stop(self) -> None:
+        """Stop workers. Running jobs are interrupted and re-queued on next start."""
+        self._stopping = True
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._loop = None
+
+    def _release(self, job: Job) -> None:
+        if self._active_by_run.get(job.run_id) == job.job_id:
+            del self._active_by_run[job.run_id]
+
+    def _finish(
+        self,
+        job: Job,
+        status: JobStatus,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        job.status = status
+        job.finished_at = datetime.utcnow()
+        job.result = result
+        job.error = error
+        self.store.save(job)
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job_id = await self._pending.get()
+            if job_id not in self._queued:
+                continue  # cancelled while queued
+            self._queued.discard(job_id)
+
+            job = self.store.get(job_id)
+            if job is None or job.status != JobStatus.QUEUED:
+                continue
+
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.utcnow()
+            self.store.save(job)
+
+            try:
+                handler = self.handlers.get(job.kind)
+                if handler is None:
+                    # e.g. a persisted job whose kind is no longer registered
+                    raise ValueError(f"No handler registered for job kind: {job.kind}")
+                task = asyncio.ensure_future(handler(job))
+                self._running[job_id] = task
+                result = await task
+            except asyncio.CancelledError:
+                if self._stopping:
+                    # Worker is stopping; the job stays "running" and is
+                    # re-queued on the next start
+                    raise
+                # cancel() already recorded the cancellation
+            except Exception as e:
+                logger.error(f"Job {job_id} for run {job.run_id} failed: {e}")
+                self._finish(job, JobStatus.FAILED, error=str(e))
+            else:
+                self._finish(job, JobStatus.SUCCEEDED, result=result)
+            finally:
+                self._running.pop(job_id, None)
+                self._release(job)
+
+
+# Global queue instance
+_job_queue: JobQueue | None = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get the global job queue instance.
+
+    Returns:
+        JobQueue instance.
+    """
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
@@ -5,7 +5,10 @@ Provides high-level business logic for managing orchestrator runs,
 coordinating between the engine, persistence, and API layers.
 """
 
+import asyncio
 import logging
+import os
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -23,6 +26,7 @@ from orchestrator_v2.api.dto.runs import (
 from orchestrator_v2.engine.engine import WorkflowEngine
 from orchestrator_v2.engine.state_models import ProjectState, PhaseType, PhaseState
 from orchestrator_v2.persistence.fs_repository import FileSystemProjectRepository
+from orchestrator_v2.telemetry.token_store import SQLiteTokenStore, get_token_store
 from orchestrator_v2.user.models import UserProfile
 from orchestrator_v2.workspace.manager import WorkspaceManager
 
@@ -34,19 +38,53 @@ class OrchestratorService:
     Service layer for orchestrator operations.
 
     Manages run lifecycle, state persistence, and artifact tracking.
+
+    One instance is shared by all API requests for the lifetime of the
+    application (see api.routes.runs.get_orchestrator_service), so
+    repositories, cached engines and cached run details survive across
+    requests. Mutating operations on a run are serialized by a per-run
+    lock.
     """
 
     def __init__(
         self,
         project_repo: FileSystemProjectRepository | None = None,
         workspace_manager: WorkspaceManager | None = None,
+        token_store: SQLiteTokenStore | None = None,
     ):
         """Initialize the orchestrator service."""
         self._project_repo = project_repo or FileSystemProjectRepository()
         self._workspace_manager = workspace_manager or WorkspaceManager()
+        self._token_store = token_store or get_token_store()
         self._engines: dict[str, WorkflowEngine] = {}
+        # Held only while a run is being advanced (or waited on), so idle
+        # runs do not keep a lock around
+        self._run_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        # RunDetail per run, keyed by the project file signature
+        self._details: dict[str, tuple[tuple[int, int], RunDetail]] = {}
+        # ArtifactsResponse per run, keyed by the project file signature
+        # and the mtimes of the phase artifact directories
+        self._artifact_listings: dict[str, tuple[tuple, ArtifactsResponse]] = {}
         logger.info("OrchestratorService initialized")
 
+    def _run_lock(self, run_id: str) -> asyncio.Lock:
+        """Lock serializing state changes for one run."""
+        lock = self._run_locks.get(run_id)
+        if lock is None:
+            lock = self._run_locks[run_id] = asyncio.Lock()
+        return lock
+
+    async def close(self) -> None:
+        """Release cached engines and state."""
+        self._engines.clear()
+        self._details.clear()
+        self._artifact_listings.clear()
+        self._run_locks.clear()
+        self._project_repo.clear_cache()
+        logger.info("OrchestratorService closed")
+
     async def create_run(
         self,
         profile: str,
@@ -119,6 +157,11 @@ class OrchestratorService:
         Returns:
             RunDetail with full run information
         """
+        signature = self._project_repo.signature(run_id)
+        cached = self._details.get(run_id)
+        if signature is not None and cached is not None and cached[0] == signature:
+            return cached[1].model_copy(update={"updated_at": datetime.utcnow()}, deep=True)
+
         state = await self._project_repo.load(run_id)
 
         # Build phase information
@@ -152,7 +195,7 @@ class OrchestratorService:
             if last_phase:
                 completed_at = last_phase.completed_at
 
-        return RunDetail(
+        detail = RunDetail(
             run_id=run_id,
             profile=state.template_id or state.project_type,
             intake=state.metadata.get("intake"),
@@ -166,6 +209,9 @@ class OrchestratorService:
             total_duration_seconds=self._calculate_total_duration(state),
             metadata=state.metadata,
         )
+        if signature is not None:
+            self._details[run_id] = (signature, detail.model_copy(deep=True))
+        return detail
 
     async def list_runs(
         self,
@@ -262,33 +308,45 @@ class OrchestratorService:
         Returns:
             Updated RunDetail
         """
-        state = await self._project_repo.load(run_id)
+        async with self._run_lock(run_id):
+            state = await self._project_repo.load(run_id)
 
-        # Get or create engine for this run
-        if run_id not in self._engines:
-            engine = WorkflowEngine()
+            # Reuse the run's engine, pointed at the freshly loaded state
+            engine = self._engines.get(run_id)
+            if engine is None:
+                engine = self._engines[run_id] = WorkflowEngine()
             engine._state = state
-            self._engines[run_id] = engine
-        else:
-            engine = self._engines[run_id]
 
-        # Execute current phase
-        try:
-            await engine.run_phase(state.current_phase, user=user)
+            # Execute current phase
+            try:
+                await engine.run_phase(state.current_phase, user=user)
 
-            # Advance to next phase
-            next_phase = self._get_next_phase(state.current_phase)
-            if next_phase:
-                state.current_phase = next_phase
-                await self._project_repo.save(state)
+                # Advance to next phase
+                next_phase = self._get_next_phase(state.current_phase)
+                if next_phase:
+                    state.current_phase = next_phase
+                    await self._project_repo.save(state)
 
-            logger.info(f"Advanced run {run_id} to phase {next_phase}")
-        except Exception as e:
-            logger.error(f"Failed to advance run {run_id}: {e}")
-            raise
+                logger.info(f"Advanced run {run_id} to phase {next_phase}")
+            except Exception as e:
+                logger.error(f"Failed to advance run {run_id}: {e}")
+                raise
 
         return await self.get_run(run_id)
 
+    async def get_run_owner(self, run_id: str) -> str | None:
+        """
+        Get the user who created a run.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Owning user ID, or None for runs created without one
+        """
+        state = await self._project_repo.load(run_id)
+        return state.user_id
+
     async def list_artifacts(self, run_id: str) -> ArtifactsResponse:
         """
         List all artifacts for a run, grouped by phase.
@@ -301,50 +359,69 @@ class OrchestratorService:
         """
         state = await self._project_repo.load(run_id)
 
+        artifacts_dir = Path(state.workspace_path) / "artifacts" if state.workspace_path else None
+        phase_dirs = self._phase_dir_mtimes(artifacts_dir) if artifacts_dir else ()
+
+        # Adding or removing a file changes its phase directory's mtime, and
+        # in-place rewrites happen during phase runs, which save the project.
+        signature = self._project_repo.signature(run_id)
+        key = (signature, phase_dirs)
+        cached = self._artifact_listings.get(run_id)
+        if signature is not None and cached is not None and cached[0] == key:
+            return cached[1].model_copy(deep=True)
+
         artifacts_by_phase: dict[str, list[ArtifactSummary]] = {}
         total_count = 0
 
-        # Scan workspace for artifacts
-        if state.workspace_path:
-            workspace_path = Path(state.workspace_path)
-            artifacts_dir = workspace_path / "artifacts"
-
-            if artifacts_dir.exists():
-                for phase_dir in artifacts_dir.iterdir():
-                    if not phase_dir.is_dir():
-                        continue
-
-                    phase_name = phase_dir.name
-                    phase_artifacts = []
-
-                    for artifact_file in phase_dir.iterdir():
-                        if not artifact_file.is_file() or artifact_file.name.startswith("_"):
-                            continue
-
-                        stat = artifact_file.stat()
-                        artifact_type = self._determine_artifact_type(artifact_file)
-
-                        artifact = ArtifactSummary(
-                            artifact_id=f"{phase_name}_{artifact_file.name}",
-                            phase=phase_name,
-                            path=str(artifact_file),
-                            name=artifact_file.name,
-                            description=f"{artifact_type.upper()} artifact for {phase_name}",
-                            artifact_type=artifact_type,
-                            size_bytes=stat.st_size,
-                            created_at=datetime.fromtimestamp(stat.st_ctime),
-                        )
-                        phase_artifacts.append(artifact)
-                        total_count += 1
-
-                    if phase_artifacts:
-                        artifacts_by_phase[phase_name] = phase_artifacts
-
-        return ArtifactsResponse(
+        # Scan only the phase directories found above
+        for phase_name, _ in phase_dirs:
+            phase_dir = artifacts_dir / phase_name
+            phase_artifacts = []
+
+            for artifact_file in phase_dir.iterdir():
+                if not artifact_file.is_file() or artifact_file.name.startswith("_"):
+                    continue
+
+                stat = artifact_file.stat()
+                artifact_type = self._determine_artifact_type(artifact_file)
+
+                artifact = ArtifactSummary(
+                    artifact_id=f"{phase_name}_{artifact_file.name}",
+                    phase=phase_name,
+                    path=str(artifact_file),
+                    name=artifact_file.name,
+                    description=f"{artifact_type.upper()} artifact for {phase_name}",
+                    artifact_type=artifact_type,
+                    size_bytes=stat.st_size,
+                    created_at=datetime.fromtimestamp(stat.st_ctime),
+                )
+                phase_artifacts.append(artifact)
+                total_count += 1
+
+            if phase_artifacts:
+                artifacts_by_phase[phase_name] = phase_artifacts
+
+        response = ArtifactsResponse(
             run_id=run_id,
             artifacts_by_phase=artifacts_by_phase,
             total_count=total_count,
         )
+        if signature is not None:
+            self._artifact_listings[run_id] = (key, response.model_copy(deep=True))
+        return response
+
+    @staticmethod
+    def _phase_dir_mtimes(artifacts_dir: Path) -> tuple[tuple[str, int], ...]:
+        """(name, mtime_ns) of each phase directory under a workspace's artifacts/."""
+        try:
+            with os.scandir(artifacts_dir) as entries:
+                return tuple(sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in entries
+                    if entry.is_dir()
+                ))
+        except FileNotFoundError:
+            return ()
 
     async def get_metrics(self, run_id: str) -> MetricsSummary:
         """
@@ -358,6 +435,12 @@ class OrchestratorService:
         """
         state = await self._project_repo.load(run_id)
 
+        # Per-phase token and cost rollups maintained by the token store
+        tracked = {
+            row["phase"]: row
+            for row in self._token_store.aggregate(group_by=["phase"], workflow_id=run_id)
+        }
+
         phases_metrics = []
         total_tokens = {"input": 0, "output": 0}
         total_cost = 0.0
@@ -380,14 +463,20 @@ class OrchestratorService:
             elif hasattr(phase_state, 'agent_ids'):
                 agents_executed = phase_state.agent_ids
 
+            if phase_name in tracked:
+                row = tracked[phase_name]
+                phase_tokens = {"input": row["input_tokens"], "output": row["output_tokens"]}
+                phase_cost = float(row["cost_usd"])
+            else:
+                # Untracked run (e.g. pre-dates the token store): rough estimate
+                # at $0.003/1K input, $0.015/1K output
+                phase_cost = (
+                    (phase_tokens["input"] / 1000) * 0.003 +
+                    (phase_tokens["output"] / 1000) * 0.015
+                )
+
             total_tokens["input"] += phase_tokens["input"]
             total_tokens["output"] += phase_tokens["output"]
-
-            # Calculate cost (rough estimate: $0.003/1K input, $0.015/1K output)
-            phase_cost = (
-                (phase_tokens["input"] / 1000) * 0.003 +
-                (phase_tokens["output"] / 1000) * 0.015
-            )
             total_cost += phase_cost
 
             artifacts_count = len(phase_state.artifacts)
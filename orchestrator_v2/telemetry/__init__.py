@@ -7,7 +7,9 @@ See ADR-005 for token efficiency architecture.
 """
 
 from orchestrator_v2.telemetry.token_tracking import TokenTracker
+from orchestrator_v2.telemetry.token_store import SQLiteTokenStore, get_token_store
 from orchestrator_v2.telemetry.events import EventEmitter, EventType, OrchestratorEvent
+from orchestrator_v2.telemetry.event_bus import EventBus, EventSubscription, get_event_bus
 from orchestrator_v2.telemetry.events_repository import (
     EventRepository,
     get_event_repository,
@@ -18,16 +20,24 @@ from orchestrator_v2.telemetry.budget_enforcer import (
     BudgetEnforcer,
     BudgetExceededError,
 )
+from orchestrator_v2.telemetry.usage_ledger import UsageLedger, get_usage_ledger
 
 __all__ = [
     "TokenTracker",
+    "SQLiteTokenStore",
+    "get_token_store",
     "EventEmitter",
     "EventType",
     "OrchestratorEvent",
     "EventRepository",
     "get_event_repository",
     "emit_event",
+    "EventBus",
+    "EventSubscription",
+    "get_event_bus",
     "TracingManager",
     "BudgetEnforcer",
     "BudgetExceededError",
+    "UsageLedger",
+    "get_usage_ledger",
 ]
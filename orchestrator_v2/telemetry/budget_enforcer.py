@@ -6,9 +6,15 @@ agent execution.
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Protocol
 
+from orchestrator_v2.telemetry.usage_ledger import (
+    Reservation,
+    UsageLedger,
+    UsageRecord,
+    get_usage_ledger,
+)
 from orchestrator_v2.user.models import UserProfile
 from orchestrator_v2.user.repository import FileSystemUserRepository
 
@@ -57,12 +63,16 @@ class BudgetEnforcer:
     Enforces token budget limits for users and projects.
 
     Checks budgets before agent execution and records usage after.
+    Daily and project usage come from the in-memory rollups of a
+    UsageLedger; usage is written to disk in batches, and profile
+    counters are synced once per flush rather than per agent.
     """
 
     def __init__(
         self,
         user_repo: FileSystemUserRepository,
         token_tracker: TokenTracker | None = None,
+        ledger: UsageLedger | None = None,
     ):
         """
         Initialize budget enforcer.
@@ -70,90 +80,75 @@ class BudgetEnforcer:
         Args:
             user_repo: Repository for user profiles
             token_tracker: Optional tracker for detailed usage
+            ledger: Usage ledger (defaults to the process-wide ledger)
         """
         self._user_repo = user_repo
         self._token_tracker = token_tracker
+        self._ledger = ledger or get_usage_ledger()
 
     async def check_and_reserve(
         self,
         user: UserProfile,
         project_id: str,
         estimated_tokens: int,
-    ) -> None:
+    ) -> Reservation | None:
         """
         Check if user has sufficient budget and reserve tokens.
 
+        The check and the reservation happen atomically, so concurrent
+        agents for the same user cannot jointly exceed a limit.
+
         Raises BudgetExceededError if budget would be exceeded.
 
         Args:
             user: User profile with limits and usage
             project_id: Project ID for project-level limits
             estimated_tokens: Estimated tokens for this operation
-        """
-        # Check daily limit
-        if "daily" in user.token_limits:
-            daily_limit = user.token_limits["daily"]
-            daily_usage = await self._get_daily_usage(user)
-
-            if daily_usage + estimated_tokens > daily_limit:
-                logger.warning(
-                    f"Budget check FAILED: user={user.user_id}, "
-                    f"daily_usage={daily_usage}, estimated={estimated_tokens}, "
-                    f"limit={daily_limit}"
-                )
-                raise BudgetExceededError(
-                    f"Daily token limit exceeded. Current: {daily_usage}, "
-                    f"Requested: {estimated_tokens}, Limit: {daily_limit}",
-                    limit_type="daily",
-                    current=daily_usage,
-                    limit=daily_limit,
-                    requested=estimated_tokens,
-                )
-
-        # Check project limit
-        if "project" in user.token_limits:
-            project_limit = user.token_limits["project"]
-            project_usage = await self._get_project_usage(user, project_id)
 
-            if project_usage + estimated_tokens > project_limit:
-                logger.warning(
-                    f"Budget check FAILED: user={user.user_id}, "
-                    f"project={project_id}, usage={project_usage}, "
-                    f"estimated={estimated_tokens}, limit={project_limit}"
-                )
-                raise BudgetExceededError(
-                    f"Project token limit exceeded. Current: {project_usage}, "
-                    f"Requested: {estimated_tokens}, Limit: {project_limit}",
-                    limit_type="project",
-                    current=project_usage,
-                    limit=project_limit,
-                    requested=estimated_tokens,
-                )
-
-        # Check total limit
-        if "total" in user.token_limits:
-            total_limit = user.token_limits["total"]
-            total_usage = user.token_usage.total_input_tokens + user.token_usage.total_output_tokens
+        Returns:
+            Reservation to pass to record_usage() or release(), or None if
+            the user has no limits.
+        """
+        limits = {
+            k: v for k, v in user.token_limits.items()
+            if k in ("daily", "project", "total")
+        }
+        if not limits:
+            return None
+
+        reservation, limit_type, current = self._ledger.try_reserve(
+            user_id=user.user_id,
+            project_id=project_id,
+            tokens=estimated_tokens,
+            limits=limits,
+            lifetime_usage=user.token_usage.total_input_tokens + user.token_usage.total_output_tokens,
+        )
 
-            if total_usage + estimated_tokens > total_limit:
-                logger.warning(
-                    f"Budget check FAILED: user={user.user_id}, "
-                    f"total_usage={total_usage}, estimated={estimated_tokens}, "
-                    f"limit={total_limit}"
-                )
-                raise BudgetExceededError(
-                    f"Total token limit exceeded. Current: {total_usage}, "
-                    f"Requested: {estimated_tokens}, Limit: {total_limit}",
-                    limit_type="total",
-                    current=total_usage,
-                    limit=total_limit,
-                    requested=estimated_tokens,
-                )
+        if reservation is None:
+            limit = limits[limit_type]
+            logger.warning(
+                f"Budget check FAILED: user={user.user_id}, "
+                f"project={project_id}, {limit_type}_usage={current}, "
+                f"estimated={estimated_tokens}, limit={limit}"
+            )
+            raise BudgetExceededError(
+                f"{limit_type.capitalize()} token limit exceeded. Current: {current}, "
+                f"Requested: {estimated_tokens}, Limit: {limit}",
+                limit_type=limit_type,
+                current=current,
+                limit=limit,
+                requested=estimated_tokens,
+            )
 
         logger.info(
             f"Budget check PASSED: user={user.user_id}, "
             f"project={project_id}, estimated={estimated_tokens}"
         )
+        return reservation
+
+    def release(self, reservation: Reservation | None) -> None:
+        """Release a reservation for an agent that did not complete."""
+        self._ledger.release(reservation)
 
     async def record_usage(
         self,
@@ -163,11 +158,13 @@ class BudgetEnforcer:
         model: str,
         input_tokens: int,
         output_tokens: int,
+        reservation: Reservation | None = None,
     ) -> None:
         """
         Record actual token usage after agent execution.
 
-        Updates user profile and persists to repository.
+        Appends to the usage ledger and updates the in-memory profile
+        counters; the profile itself is persisted on the next flush.
 
         Args:
             user: User profile to update
@@ -176,20 +173,29 @@ class BudgetEnforcer:
             model: Model that was used
             input_tokens: Input tokens consumed
             output_tokens: Output tokens generated
+            reservation: Reservation from check_and_reserve(), if any
         """
         total_tokens = input_tokens + output_tokens
 
-        # Update user profile
+        self._ledger.record(
+            UsageRecord(
+                user_id=user.user_id,
+                project_id=project_id,
+                agent_role=agent_role,
+                model=model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+            ),
+            reservation=reservation,
+        )
+
+        # Keep the caller's profile current for the "total" limit
         user.token_usage.total_input_tokens += input_tokens
         user.token_usage.total_output_tokens += output_tokens
         user.token_usage.total_requests += 1
 
-        # Save updated profile
-        await self._user_repo.save(user)
-
-        # TODO: Record in token tracker when protocol is fully implemented
-        # if self._token_tracker:
-        #     await self._token_tracker.record_usage(...)
+        if self._ledger.should_flush():
+            await self.flush()
 
         logger.info(
             f"Token usage recorded: user={user.user_id}, "
@@ -197,41 +203,24 @@ class BudgetEnforcer:
             f"model={model}, tokens={total_tokens}"
         )
 
-    async def _get_daily_usage(self, user: UserProfile) -> int:
-        """Get token usage for today."""
-        # Simple implementation: use total usage
-        # In production, track per-day usage
-        if self._token_tracker:
-            today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-            return await self._token_tracker.get_usage_for_period(
-                user_id=user.user_id,
-                project_id=None,
-                period_start=today,
+    async def flush(self) -> None:
+        """Write buffered usage to the ledger and sync profile counters."""
+        deltas = self._ledger.flush()
+        for user_id, delta in deltas.items():
+            await self._user_repo.update_token_usage(
+                user_id,
+                input_tokens=delta["input_tokens"],
+                output_tokens=delta["output_tokens"],
+                requests=delta["requests"],
             )
 
-        # Fallback: check if usage was reset today
-        last_reset = user.token_usage.last_reset
-        today = datetime.utcnow().date()
-
-        if last_reset.date() < today:
-            # Reset daily counters
-            return 0
-
-        return user.token_usage.total_input_tokens + user.token_usage.total_output_tokens
+    async def _get_daily_usage(self, user: UserProfile) -> int:
+        """Get token usage for the current UTC day (including reservations)."""
+        return self._ledger.usage_with_reservations(user.user_id)["daily"]
 
     async def _get_project_usage(self, user: UserProfile, project_id: str) -> int:
-        """Get token usage for a specific project."""
-        if self._token_tracker:
-            # Use tracker for accurate per-project usage
-            return await self._token_tracker.get_usage_for_period(
-                user_id=user.user_id,
-                project_id=project_id,
-                period_start=datetime.min,
-            )
-
-        # Fallback: can't track per-project without tracker
-        # Return total usage as conservative estimate
-        return user.token_usage.total_input_tokens + user.token_usage.total_output_tokens
+        """Get token usage for a specific project (including reservations)."""
+        return self._ledger.usage_with_reservations(user.user_id, project_id)["project"]
 
     async def get_remaining_budget(
         self,
@@ -0,0 +1,201 @@
+"""
+In-process pub/sub for live orchestrator events.
+
+emit_event() publishes every event here after persisting it, so API
+clients can follow a run over SSE or WebSocket instead of polling the
+events file and reloading ProjectState.
+
+Each project keeps a bounded replay buffer of recent events so a client
+can reconnect with the last event ID it saw and resume without gaps.
+Each subscriber gets a bounded queue; a subscriber that falls behind is
+disconnected (its `overflowed` flag is set) rather than slowing down the
+engine, and is expected to reconnect with its last event ID.
+
+See ADR-005 for observability.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import AsyncIterator
+
+from orchestrator_v2.telemetry.events import OrchestratorEvent
+
+logger = logging.getLogger(__name__)
+
+
+class EventSubscription:
+    """A single subscriber's view of a project's event stream."""
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        project_id: str,
+        max_queue_size: int,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        self.bus = bus
+        self.project_id = project_id
+        self.overflowed = False
+        self.closed = False
+        self._loop = loop
+        # None is the close sentinel, so leave room for it
+        self._queue: asyncio.Queue[OrchestratorEvent | None] = asyncio.Queue(max_queue_size + 1)
+        self._max_queue_size = max_queue_size
+
+    def _offer(self, event: OrchestratorEvent | None) -> None:
+        """Enqueue an event on the subscriber's loop."""
+        if self.closed:
+            return
+        if event is None:
+            self.closed = True
+            self._queue.put_nowait(None)
+            return
+        if self._queue.qsize() >= self._max_queue_size:
+            logger.warning(
+                f"Event subscriber for {self.project_id} fell behind; disconnecting"
+            )
+            self.overflowed = True
+            self.bus.unsubscribe(self)
+            return
+        self._queue.put_nowait(event)
+
+    def deliver(self, event: OrchestratorEvent | None) -> None:
+        """Deliver from any thread."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is self._loop:
+            self._offer(event)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._offer, event)
+
+    async def get(self, timeout: float | None = None) -> OrchestratorEvent | None:
+        """Wait for the next event.
+
+        Returns None when the subscription is closed. Raises
+        asyncio.TimeoutError if nothing arrives within `timeout`.
+        """
+        if self.closed and self._queue.empty():
+            return None
+        if timeout is None:
+            return await self._queue.get()
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self.bus.unsubscribe(self)
+
+    async def __aiter__(self) -> AsyncIterator[OrchestratorEvent]:
+        while True:
+            event = await self.get()
+            if event is None:
+                return
+            yield event
+
+
+class EventBus:
+    """Per-project fan-out of orchestrator events."""
+
+    def __init__(self, replay_size: int = 500, max_queue_size: int = 256):
+        """Initialize the bus.
+
+        Args:
+            replay_size: Recent events kept per project for resume.
+            max_queue_size: Undelivered events a subscriber may hold
+                before it is disconnected.
+        """
+        self.replay_size = replay_size
+        self.max_queue_size = max_queue_size
+        self._lock = threading.Lock()
+        self._history: dict[str, deque[OrchestratorEvent]] = {}
+        self._subscribers: dict[str, set[EventSubscription]] = {}
+
+    def publish(self, event: OrchestratorEvent) -> None:
+        """Record an event and deliver it to the project's subscribers."""
+        with self._lock:
+            history = self._history.get(event.project_id)
+            if history is None:
+                history = self._history[event.project_id] = deque(maxlen=self.replay_size)
+            history.append(event)
+            subscribers = list(self._subscribers.get(event.project_id, ()))
+
+        for subscription in subscribers:
+            subscription.deliver(event)
+
+    def subscribe(
+        self,
+        project_id: str,
+        last_event_id: str | None = None,
+    ) -> EventSubscription:
+        """Subscribe to a project's events.
+
+        Must be called from a running event loop.
+
+        Args:
+            project_id: Project identifier.
+            last_event_id: Last event the client saw. Buffered events
+                after it are queued first. If the ID is no longer
+                buffered, the whole buffer is replayed.
+        """
+        subscription = EventSubscription(
+            self, project_id, self.max_queue_size, asyncio.get_running_loop()
+        )
+        with self._lock:
+            self._subscribers.setdefault(project_id, set()).add(subscription)
+            backlog = self._backlog(project_id, last_event_id) if last_event_id else []
+
+        for event in backlog[-self.max_queue_size:]:
+            subscription._offer(event)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove a subscription and wake any reader."""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.project_id]
+        subscription.deliver(None)
+
+    def subscriber_count(self, project_id: str) -> int:
+        """Number of live subscribers for a project."""
+        with self._lock:
+            return len(self._subscribers.get(project_id, ()))
+
+    def recent(self, project_id: str) -> list[OrchestratorEvent]:
+        """Buffered events for a project, oldest first."""
+        with self._lock:
+            return list(self._history.get(project_id, ()))
+
+    def _backlog(self, project_id: str, last_event_id: str) -> list[OrchestratorEvent]:
+        history = list(self._history.get(project_id, ()))
+        for index in range(len(history) - 1, -1, -1):
+            if history[index].id == last_event_id:
+                return history[index + 1:]
+        return history
+
+    def clear(self, project_id: str) -> None:
+        """Drop the replay buffer for a project."""
+        with self._lock:
+            self._history.pop(project_id, None)
+
+
+# Global bus instance
+_event_bus: EventBus | None = None
+
+
+def get_event_bus() -> EventBus:
+    """Get the global event bus instance.
+
+    Returns:
+        EventBus instance.
+    """
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus()
+    return _event_bus
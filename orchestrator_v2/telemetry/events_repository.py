@@ -9,6 +9,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from .event_bus import get_event_bus
 from .events import EventType, OrchestratorEvent
 
 
@@ -177,6 +178,9 @@ def emit_event(
 ) -> OrchestratorEvent:
     """Convenience function to emit and persist an event.
 
+    The event is also published to the in-process event bus for live
+    subscribers.
+
     Args:
         event_type: Type of event.
         project_id: Project identifier.
@@ -199,5 +203,6 @@ def emit_event(
 
     repo = get_event_repository()
     repo.save_event(event)
+    get_event_bus().publish(event)
 
     return event
@@ -0,0 +1,59 @@
+"""
+Versioned model pricing for token cost calculation.
+
+Each pricing version is an immutable table of per-1K-token prices.
+Tracked usage records the version it was priced with, so historical
+costs stay reproducible when prices change. Add a new version instead
+of editing an existing one.
+
+See ADR-005 for token efficiency architecture.
+"""
+
+from decimal import Decimal
+from typing import TypedDict
+
+
+class ModelPrice(TypedDict):
+    """Per-1K-token pricing for one model."""
+    input: Decimal
+    output: Decimal
+    tier: str
+
+
+_SONNET_4_5: ModelPrice = {"input": Decimal("0.003"), "output": Decimal("0.015"), "tier": "premium"}
+_HAIKU_4_5: ModelPrice = {"input": Decimal("0.001"), "output": Decimal("0.005"), "tier": "cost-efficient"}
+
+MODEL_PRICING_VERSIONS: dict[int, dict[str, ModelPrice]] = {
+    1: {
+        # Current models with full version IDs
+        "claude-sonnet-4-5-20250929": _SONNET_4_5,
+        "claude-haiku-4-5-20251015": _HAIKU_4_5,
+        # Legacy aliases (map to same pricing)
+        "claude-sonnet-4-5": _SONNET_4_5,
+        "claude-haiku-4-5": _HAIKU_4_5,
+    },
+}
+
+CURRENT_PRICING_VERSION = max(MODEL_PRICING_VERSIONS)
+
+# Used when a model is missing from the pricing table
+DEFAULT_PRICING_MODEL = "claude-sonnet-4-5-20250929"
+
+
+def get_model_price(model_name: str | None, version: int = CURRENT_PRICING_VERSION) -> ModelPrice:
+    """Get pricing for a model, falling back to the default model's price."""
+    table = MODEL_PRICING_VERSIONS[version]
+    return table.get(model_name or "", table[DEFAULT_PRICING_MODEL])
+
+
+def calculate_cost(
+    input_tokens: int,
+    output_tokens: int,
+    model_name: str | None = None,
+    version: int = CURRENT_PRICING_VERSION,
+) -> Decimal:
+    """Calculate the USD cost of a call under a pricing version."""
+    pricing = get_model_price(model_name, version)
+    input_cost = (Decimal(input_tokens) / 1000) * pricing["input"]
+    output_cost = (Decimal(output_tokens) / 1000) * pricing["output"]
+    return input_cost + output_cost
@@ -0,0 +1,241 @@
+"""
+Durable SQLite backend for token tracking.
+
+Every tracked LLM call is stored as a row in `token_records` and, in
+the same transaction, folded into `token_rollups`, which keeps running
+totals per (workflow, phase, agent, model, day). Summary queries read
+the rollup table only, so their cost depends on the number of distinct
+combinations rather than on the number of calls ever tracked.
+
+Costs are stored as integer micro-USD to keep sums exact.
+
+See ADR-005 for token efficiency architecture.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from orchestrator_v2.telemetry.pricing import CURRENT_PRICING_VERSION
+
+MICRO_USD = Decimal(1_000_000)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS token_records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts TEXT NOT NULL,
+    day TEXT NOT NULL,
+    workflow_id TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    model TEXT NOT NULL,
+    provider TEXT,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cost_micro_usd INTEGER NOT NULL,
+    pricing_version INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_token_records_workflow ON token_records (workflow_id, ts);
+
+CREATE TABLE IF NOT EXISTS token_rollups (
+    workflow_id TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    model TEXT NOT NULL,
+    day TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    requests INTEGER NOT NULL DEFAULT 0,
+    cost_micro_usd INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (workflow_id, phase, agent_id, model, day)
+);
+CREATE INDEX IF NOT EXISTS idx_token_rollups_day ON token_rollups (day, model);
+"""
+
+_GROUP_COLUMNS = {"workflow", "phase", "agent", "model", "day"}
+_COLUMN_NAMES = {
+    "workflow": "workflow_id",
+    "phase": "phase",
+    "agent": "agent_id",
+    "model": "model",
+    "day": "day",
+}
+
+
+def to_micro_usd(cost: Decimal) -> int:
+    """Convert a USD amount to integer micro-USD."""
+    return int((cost * MICRO_USD).to_integral_value())
+
+
+def from_micro_usd(value: int) -> Decimal:
+    """Convert integer micro-USD back to USD."""
+    return Decimal(value) / MICRO_USD
+
+
+class SQLiteTokenStore:
+    """SQLite-backed token usage store with incremental rollups."""
+
+    def __init__(self, db_path: Path | str | None = None):
+        """Initialize the store.
+
+        Args:
+            db_path: SQLite file path, or ":memory:".
+                Defaults to .claude/orchestrator/telemetry/tokens.db
+        """
+        if db_path is None:
+            db_path = Path(".claude/orchestrator/telemetry/tokens.db")
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if str(db_path) != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def record(
+        self,
+        workflow_id: str,
+        phase: str,
+        agent_id: str,
+        model: str | None,
+        provider: str | None,
+        input_tokens: int,
+        output_tokens: int,
+        cost_usd: Decimal,
+        pricing_version: int = CURRENT_PRICING_VERSION,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """Store one LLM call and fold it into the rollups."""
+        timestamp = timestamp or datetime.utcnow()
+        day = timestamp.strftime("%Y-%m-%d")
+        model = model or "unknown"
+        cost = to_micro_usd(cost_usd)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO token_records (ts, day, workflow_id, phase, agent_id, model, "
+                "provider, input_tokens, output_tokens, cost_micro_usd, pricing_version) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    timestamp.isoformat(), day, workflow_id, phase, agent_id, model,
+                    provider, input_tokens, output_tokens, cost, pricing_version,
+                ),
+            )
+            self._conn.execute(
+                "INSERT INTO token_rollups (workflow_id, phase, agent_id, model, day, "
+                "input_tokens, output_tokens, requests, cost_micro_usd) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?) "
+                "ON CONFLICT (workflow_id, phase, agent_id, model, day) DO UPDATE SET "
+                "input_tokens = input_tokens + excluded.input_tokens, "
+                "output_tokens = output_tokens + excluded.output_tokens, "
+                "requests = requests + 1, "
+                "cost_micro_usd = cost_micro_usd + excluded.cost_micro_usd",
+                (workflow_id, phase, agent_id, model, day, input_tokens, output_tokens, cost),
+            )
+
+    def aggregate(
+        self,
+        group_by: list[str] | None = None,
+        workflow_id: str | None = None,
+        start_day: str | None = None,
+        end_day: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Aggregate rollups.
+
+        Args:
+            group_by: Any of "workflow", "phase", "agent", "model", "day".
+                Empty for a single grand total.
+            workflow_id: Restrict to one workflow.
+            start_day: Inclusive lower bound (YYYY-MM-DD).
+            end_day: Inclusive upper bound (YYYY-MM-DD).
+
+        Returns:
+            Rows with the group columns plus input_tokens, output_tokens,
+            total_tokens, requests and cost_usd (Decimal).
+        """
+        group_by = group_by or []
+        unknown = set(group_by) - _GROUP_COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown group_by columns: {sorted(unknown)}")
+
+        columns = [_COLUMN_NAMES[g] for g in group_by]
+        where, params = [], []
+        if workflow_id is not None:
+            where.append("workflow_id = ?")
+            params.append(workflow_id)
+        if start_day is not None:
+            where.append("day >= ?")
+            params.append(start_day)
+        if end_day is not None:
+            where.append("day <= ?")
+            params.append(end_day)
+
+        select = ", ".join(
+            columns + [
+                "COALESCE(SUM(input_tokens), 0) AS input_tokens",
+                "COALESCE(SUM(output_tokens), 0) AS output_tokens",
+                "COALESCE(SUM(requests), 0) AS requests",
+                "COALESCE(SUM(cost_micro_usd), 0) AS cost_micro_usd",
+            ]
+        )
+        sql = f"SELECT {select} FROM token_rollups"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if columns:
+            sql += " GROUP BY " + ", ".join(columns) + " ORDER BY " + ", ".join(columns)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        results = []
+        for row in rows:
+            item = {g: row[_COLUMN_NAMES[g]] for g in group_by}
+            item["input_tokens"] = row["input_tokens"]
+            item["output_tokens"] = row["output_tokens"]
+            item["total_tokens"] = row["input_tokens"] + row["output_tokens"]
+            item["requests"] = row["requests"]
+            item["cost_usd"] = from_micro_usd(row["cost_micro_usd"])
+            results.append(item)
+        return results
+
+    def rebuild_rollups(self) -> None:
+        """Recompute the rollup table from the raw records."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM token_rollups")
+            self._conn.execute(
+                "INSERT INTO token_rollups (workflow_id, phase, agent_id, model, day, "
+                "input_tokens, output_tokens, requests, cost_micro_usd) "
+                "SELECT workflow_id, phase, agent_id, model, day, SUM(input_tokens), "
+                "SUM(output_tokens), COUNT(*), SUM(cost_micro_usd) FROM token_records "
+                "GROUP BY workflow_id, phase, agent_id, model, day"
+            )
+
+
+# Global store instance
+_token_store: SQLiteTokenStore | None = None
+
+
+def get_token_store(db_path: Path | str | None = None) -> SQLiteTokenStore:
+    """Get the global token store instance.
+
+    Args:
+        db_path: SQLite file path (only used on first call).
+
+    Returns:
+        SQLiteTokenStore instance.
+    """
+    global _token_store
+    if _token_store is None:
+        _token_store = SQLiteTokenStore(db_path)
+    return _token_store
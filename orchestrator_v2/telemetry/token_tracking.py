@@ -2,6 +2,8 @@
 Token tracking for Orchestrator v2.
 
 Handles real-time token usage tracking and budget enforcement.
+Usage is persisted through a SQLiteTokenStore, which maintains running
+aggregates so reports do not scan individual calls.
 
 See ADR-005 for token efficiency architecture.
 """
@@ -11,6 +13,8 @@ from typing import Any
 
 from orchestrator_v2.engine.exceptions import BudgetExceededError
 from orchestrator_v2.engine.state_models import BudgetConfig, TokenUsage
+from orchestrator_v2.telemetry.pricing import CURRENT_PRICING_VERSION, calculate_cost
+from orchestrator_v2.telemetry.token_store import SQLiteTokenStore, get_token_store
 
 
 class TokenTracker:
@@ -25,8 +29,14 @@ class TokenTracker:
     See ADR-005 for tracking details.
     """
 
-    def __init__(self):
-        """Initialize the token tracker."""
+    def __init__(self, store: SQLiteTokenStore | None = None):
+        """Initialize the token tracker.
+
+        Args:
+            store: Durable usage store. Defaults to the process-wide store.
+        """
+        self._store = store or get_token_store()
+        # Per-workflow totals, seeded from the store on first access
         self._usage: dict[str, TokenUsage] = {}
         self._budgets: dict[str, BudgetConfig] = {}
 
@@ -66,15 +76,28 @@ class TokenTracker:
             cost_usd=self._calculate_cost(input_tokens, output_tokens, model_name, provider),
         )
 
-        # Attribute to workflow
+        self._store.record(
+            workflow_id=workflow_id,
+            phase=phase,
+            agent_id=agent_id,
+            model=model_name,
+            provider=provider,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=usage.cost_usd,
+            pricing_version=CURRENT_PRICING_VERSION,
+        )
+
+        # Attribute to workflow (get_usage seeds from the store, which
+        # already includes this call)
         key = f"{workflow_id}"
         if key not in self._usage:
-            self._usage[key] = TokenUsage()
-
-        self._usage[key].input_tokens += usage.input_tokens
-        self._usage[key].output_tokens += usage.output_tokens
-        self._usage[key].total_tokens += usage.total_tokens
-        self._usage[key].cost_usd += usage.cost_usd
+            self.get_usage(key)
+        else:
+            self._usage[key].input_tokens += usage.input_tokens
+            self._usage[key].output_tokens += usage.output_tokens
+            self._usage[key].total_tokens += usage.total_tokens
+            self._usage[key].cost_usd += usage.cost_usd
 
         # Check budgets
         self._check_budgets(workflow_id, phase, agent_id)
@@ -90,25 +113,11 @@ class TokenTracker:
     ) -> Decimal:
         """Calculate cost based on model pricing.
 
-        Uses model-specific pricing when available, otherwise defaults to Claude Sonnet 4.5 pricing.
+        Uses the current version of the pricing table in
+        orchestrator_v2.telemetry.pricing; unknown models are priced as
+        Claude Sonnet 4.5.
         """
-        # Model-specific pricing (per 1K tokens)
-        MODEL_PRICING = {
-            # Current models with full version IDs
-            'claude-sonnet-4-5-20250929': {'input': Decimal("0.003"), 'output': Decimal("0.015"), 'tier': 'premium'},
-            'claude-haiku-4-5-20251015': {'input': Decimal("0.001"), 'output': Decimal("0.005"), 'tier': 'cost-efficient'},
-            # Legacy aliases (map to same pricing)
-            'claude-sonnet-4-5': {'input': Decimal("0.003"), 'output': Decimal("0.015"), 'tier': 'premium'},
-            'claude-haiku-4-5': {'input': Decimal("0.001"), 'output': Decimal("0.005"), 'tier': 'cost-efficient'},
-        }
-
-        # Get pricing for model (default to Sonnet 4.5 pricing)
-        pricing = MODEL_PRICING.get(model_name or '', MODEL_PRICING['claude-sonnet-4-5-20250929'])
-
-        input_cost = (Decimal(input_tokens) / 1000) * pricing['input']
-        output_cost = (Decimal(output_tokens) / 1000) * pricing['output']
-
-        return input_cost + output_cost
+        return calculate_cost(input_tokens, output_tokens, model_name)
 
     def _check_budgets(
         self,
@@ -156,14 +165,20 @@ class TokenTracker:
         """Get usage for a scope.
 
         Args:
-            key: Usage scope key.
+            key: Usage scope key (workflow ID).
 
         Returns:
             Token usage.
-
-        TODO: Implement usage retrieval
         """
-        return self._usage.get(key, TokenUsage())
+        if key not in self._usage:
+            totals = self._store.aggregate(workflow_id=key)[0]
+            self._usage[key] = TokenUsage(
+                input_tokens=totals["input_tokens"],
+                output_tokens=totals["output_tokens"],
+                total_tokens=totals["total_tokens"],
+                cost_usd=totals["cost_usd"],
+            )
+        return self._usage[key]
 
     def get_remaining_budget(self, key: str) -> TokenUsage:
         """Get remaining budget for a scope.
@@ -187,10 +202,7 @@ class TokenTracker:
     def generate_report(self, workflow_id: str) -> dict[str, Any]:
         """Generate cost report for a workflow.
 
-        TODO: Implement report generation
-        TODO: Break down by phase
-        TODO: Break down by agent
-        TODO: Calculate efficiency metrics
+        Breakdowns come from the store's rollups, not individual calls.
         """
         usage = self.get_usage(workflow_id)
         return {
@@ -199,4 +211,38 @@ class TokenTracker:
             "total_cost_usd": float(usage.cost_usd),
             "input_tokens": usage.input_tokens,
             "output_tokens": usage.output_tokens,
+            "by_phase": self._breakdown(workflow_id, "phase"),
+            "by_agent": self._breakdown(workflow_id, "agent"),
+            "by_model": self._breakdown(workflow_id, "model"),
+        }
+
+    def _breakdown(self, workflow_id: str, dimension: str) -> dict[str, dict[str, Any]]:
+        """Summarize a workflow's usage along one dimension."""
+        return {
+            row[dimension]: {
+                "input_tokens": row["input_tokens"],
+                "output_tokens": row["output_tokens"],
+                "total_tokens": row["total_tokens"],
+                "requests": row["requests"],
+                "cost_usd": float(row["cost_usd"]),
+            }
+            for row in self._store.aggregate(group_by=[dimension], workflow_id=workflow_id)
         }
+
+    def get_daily_costs(
+        self,
+        start_day: str | None = None,
+        end_day: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get usage and cost per day and model across all workflows.
+
+        Args:
+            start_day: Inclusive lower bound (YYYY-MM-DD).
+            end_day: Inclusive upper bound (YYYY-MM-DD).
+        """
+        return [
+            {**row, "cost_usd": float(row["cost_usd"])}
+            for row in self._store.aggregate(
+                group_by=["day", "model"], start_day=start_day, end_day=end_day
+            )
+        ]
@@ -0,0 +1,500 @@
+"""
+Append-only token usage ledger for budget enforcement.
+
+Records every agent's token usage per user, keeps day/project/model
+rollups in memory, and writes records to disk in batches:
+
+    <base_path>/<user_id>/<YYYY-MM-DD>.jsonl   one JSON record per line
+    <base_path>/<user_id>/rollup.json          rollups + consumed offsets
+
+The rollup file stores how many bytes of each day file it already
+includes, so loading a user only replays records appended after the
+last rollup write (e.g. after a crash between the two writes).
+
+Budget checks reserve tokens against the in-memory counters under a
+lock, so concurrent agents cannot jointly overshoot a limit.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_FILENAME = "rollup.json"
+ROLLUP_VERSION = 1
+
+
+@dataclass
+class UsageRecord:
+    """A single agent's token usage."""
+    user_id: str
+    project_id: str
+    agent_role: str
+    model: str
+    input_tokens: int
+    output_tokens: int
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    @property
+    def day(self) -> str:
+        return self.timestamp.strftime("%Y-%m-%d")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "ts": self.timestamp.isoformat(),
+            "project_id": self.project_id,
+            "agent_role": self.agent_role,
+            "model": self.model,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+        }
+
+    @classmethod
+    def from_dict(cls, user_id: str, data: dict[str, Any]) -> "UsageRecord":
+        return cls(
+            user_id=user_id,
+            project_id=data["project_id"],
+            agent_role=data.get("agent_role", "unknown"),
+            model=data.get("model", "unknown"),
+            input_tokens=int(data.get("input_tokens", 0)),
+            output_tokens=int(data.get("output_tokens", 0)),
+            timestamp=datetime.fromisoformat(data["ts"]),
+        )
+
+
+@dataclass
+class Reservation:
+    """Tokens held against a user's budgets until usage is recorded."""
+    reservation_id: str
+    user_id: str
+    project_id: str
+    day: str
+    tokens: int
+    created_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class UserRollup:
+    """Aggregated usage for one user."""
+    by_day: dict[str, int] = field(default_factory=dict)
+    by_project: dict[str, int] = field(default_factory=dict)
+    by_model: dict[str, int] = field(default_factory=dict)
+    input_tokens: int = 0
+    output_tokens: int = 0
+    requests: int = 0
+    offsets: dict[str, int] = field(default_factory=dict)
+
+    def add(self, record: UsageRecord) -> None:
+        tokens = record.total_tokens
+        self.by_day[record.day] = self.by_day.get(record.day, 0) + tokens
+        self.by_project[record.project_id] = self.by_project.get(record.project_id, 0) + tokens
+        self.by_model[record.model] = self.by_model.get(record.model, 0) + tokens
+        self.input_tokens += record.input_tokens
+        self.output_tokens += record.output_tokens
+        self.requests += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": ROLLUP_VERSION,
+            "by_day": self.by_day,
+            "by_project": self.by_project,
+            "by_model": self.by_model,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "requests": self.requests,
+            "offsets": self.offsets,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "UserRollup":
+        return cls(
+            by_day=dict(data.get("by_day", {})),
+            by_project=dict(data.get("by_project", {})),
+            by_model=dict(data.get("by_model", {})),
+            input_tokens=int(data.get("input_tokens", 0)),
+            output_tokens=int(data.get("output_tokens", 0)),
+            requests=int(data.get("requests", 0)),
+            offsets=dict(data.get("offsets", {})),
+        )
+
+
+class UsageLedger:
+    """
+    Write-behind usage ledger with in-memory rollups and reservations.
+
+    Reads (budget checks, summaries) never touch disk once a user's
+    rollup is loaded. Writes are buffered and flushed when the buffer
+    reaches `flush_batch_size` records or is older than
+    `flush_interval_seconds`.
+    """
+
+    def __init__(
+        self,
+        base_path: Path | None = None,
+        flush_batch_size: int = 50,
+        flush_interval_seconds: float = 5.0,
+        reservation_ttl_seconds: float = 900.0,
+    ):
+        """
+        Initialize the ledger.
+
+        Args:
+            base_path: Storage directory. Defaults to ~/.orchestrator/usage
+            flush_batch_size: Buffered records that trigger a flush.
+            flush_interval_seconds: Max age of buffered records before flush.
+            reservation_ttl_seconds: Reservations older than this are
+                dropped (covers agents that died without recording).
+        """
+        if base_path is None:
+            base_path = Path.home() / ".orchestrator" / "usage"
+        self._base_path = base_path
+        self._base_path.mkdir(parents=True, exist_ok=True)
+        self._flush_batch_size = flush_batch_size
+        self._flush_interval = flush_interval_seconds
+        self._reservation_ttl = reservation_ttl_seconds
+
+        self._lock = threading.RLock()
+        self._rollups: dict[str, UserRollup] = {}
+        self._reservations: dict[str, Reservation] = {}
+        self._pending: list[UsageRecord] = []
+        self._pending_since: float | None = None
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _user_dir(self, user_id: str) -> Path:
+        safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in user_id)
+        return self._base_path / safe_id
+
+    def _rollup(self, user_id: str) -> UserRollup:
+        """Get a user's rollup, loading it from disk on first access."""
+        rollup = self._rollups.get(user_id)
+        if rollup is None:
+            rollup = self._load_rollup(user_id)
+            self._rollups[user_id] = rollup
+        return rollup
+
+    def _load_rollup(self, user_id: str) -> UserRollup:
+        """Load the persisted rollup and replay records appended after it."""
+        user_dir = self._user_dir(user_id)
+        rollup = UserRollup()
+        rollup_path = user_dir / ROLLUP_FILENAME
+        if rollup_path.exists():
+            try:
+                data = json.loads(rollup_path.read_text())
+                if data.get("version") == ROLLUP_VERSION:
+                    rollup = UserRollup.from_dict(data)
+            except json.JSONDecodeError:
+                logger.warning(f"Corrupt usage rollup for {user_id}; replaying ledger")
+
+        if not user_dir.exists():
+            return rollup
+
+        for day_file in sorted(user_dir.glob("*.jsonl")):
+            offset = rollup.offsets.get(day_file.name, 0)
+            if day_file.stat().st_size <= offset:
+                continue
+            rollup.offsets[day_file.name] = self._replay(user_id, rollup, day_file, offset)
+        return rollup
+
+    @staticmethod
+    def _replay(
+        user_id: str,
+        rollup: UserRollup,
+        day_file: Path,
+        start: int,
+        stop: int | None = None,
+    ) -> int:
+        """Add the records in day_file[start:stop] to a rollup.
+
+        Returns:
+            Offset just past the last complete line read.
+        """
+        offset = start
+        with open(day_file, "rb") as f:
+            f.seek(start)
+            data = f.read() if stop is None else f.read(stop - start)
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                # Torn write at the tail; ignore until completed
+                break
+            offset += len(line)
+            try:
+                rollup.add(UsageRecord.from_dict(user_id, json.loads(line)))
+            except (json.JSONDecodeError, KeyError, ValueError):
+                continue
+        return offset
+
+    @staticmethod
+    def _append(day_file: Path, payload: bytes) -> tuple[int, int]:
+        """Append to a day file with O_APPEND.
+
+        Returns:
+            The (start, end) offsets the payload landed at; other processes
+            may have appended before it.
+        """
+        fd = os.open(day_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            end = os.lseek(fd, 0, os.SEEK_CUR)
+        finally:
+            os.close(fd)
+        return end - len(payload), end
+
+    def _write_rollup(self, user_id: str, rollup: UserRollup) -> None:
+        """Atomically persist a user's rollup."""
+        user_dir = self._user_dir(user_id)
+        temp_path = user_dir / f".{ROLLUP_FILENAME}.{os.getpid()}.tmp"
+        temp_path.write_text(json.dumps(rollup.to_dict(), indent=2))
+        temp_path.replace(user_dir / ROLLUP_FILENAME)
+
+    # ------------------------------------------------------------------
+    # Reservations
+    # ------------------------------------------------------------------
+
+    def _expire_reservations(self) -> None:
+        cutoff = time.monotonic() - self._reservation_ttl
+        expired = [rid for rid, r in self._reservations.items() if r.created_at < cutoff]
+        for rid in expired:
+            del self._reservations[rid]
+
+    def _reserved(self, user_id: str, day: str | None = None, project_id: str | None = None) -> int:
+        return sum(
+            r.tokens for r in self._reservations.values()
+            if r.user_id == user_id
+            and (day is None or r.day == day)
+            and (project_id is None or r.project_id == project_id)
+        )
+
+    def usage_with_reservations(self, user_id: str, project_id: str | None = None) -> dict[str, int]:
+        """
+        Get today's and the project's usage, each including reservations.
+
+        Returns:
+            Dict with "daily", "project" (if project_id given) and
+            "reserved" (all outstanding reservations for the user).
+        """
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+        with self._lock:
+            self._expire_reservations()
+            rollup = self._rollup(user_id)
+            result = {
+                "daily": rollup.by_day.get(today, 0) + self._reserved(user_id, day=today),
+                "reserved": self._reserved(user_id),
+            }
+            if project_id is not None:
+                result["project"] = (
+                    rollup.by_project.get(project_id, 0)
+                    + self._reserved(user_id, project_id=project_id)
+                )
+            return result
+
+    def try_reserve(
+        self,
+        user_id: str,
+        project_id: str,
+        tokens: int,
+        limits: dict[str, int],
+        lifetime_usage: int = 0,
+    ) -> tuple[Reservation | None, str | None, int]:
+        """
+        Atomically check limits and reserve tokens.
+
+        Args:
+            user_id: User to charge.
+            project_id: Project to charge.
+            tokens: Tokens to reserve.
+            limits: Limits keyed by "daily", "project" and/or "total".
+            lifetime_usage: Lifetime tokens used, checked against "total"
+                (profile counters also cover usage predating the ledger).
+
+        Returns:
+            (reservation, None, 0) on success, or
+            (None, limit_type, current_usage) for the first limit exceeded.
+        """
+        with self._lock:
+            usage = self.usage_with_reservations(user_id, project_id)
+            usage["total"] = lifetime_usage + usage["reserved"]
+            for limit_type in ("daily", "project", "total"):
+                if limit_type not in limits:
+                    continue
+                current = usage[limit_type]
+                if current + tokens > limits[limit_type]:
+                    return None, limit_type, current
+
+            reservation = Reservation(
+                reservation_id=str(uuid.uuid4()),
+                user_id=user_id,
+                project_id=project_id,
+                day=datetime.utcnow().strftime("%Y-%m-%d"),
+                tokens=tokens,
+            )
+            self._reservations[reservation.reservation_id] = reservation
+            return reservation, None, 0
+
+    def release(self, reservation: Reservation | None) -> None:
+        """Drop a reservation without recording usage."""
+        if reservation is None:
+            return
+        with self._lock:
+            self._reservations.pop(reservation.reservation_id, None)
+
+    # ------------------------------------------------------------------
+    # Recording and flushing
+    # ------------------------------------------------------------------
+
+    def record(self, record: UsageRecord, reservation: Reservation | None = None) -> None:
+        """
+        Record usage, converting a reservation into actual usage.
+
+        The record is applied to in-memory rollups immediately and
+        buffered for the next flush.
+        """
+        with self._lock:
+            if reservation is not None:
+                self._reservations.pop(reservation.reservation_id, None)
+            self._rollup(record.user_id).add(record)
+            self._pending.append(record)
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+
+    def should_flush(self) -> bool:
+        """Check whether the buffer is full or old enough to flush."""
+        with self._lock:
+            if not self._pending:
+                return False
+            if len(self._pending) >= self._flush_batch_size:
+                return True
+            return time.monotonic() - (self._pending_since or 0) >= self._flush_interval
+
+    def flush(self) -> dict[str, dict[str, int]]:
+        """
+        Append buffered records to disk and persist rollups.
+
+        Records of a day file that cannot be written stay buffered and are
+        retried on the next flush.
+
+        Returns:
+            Per-user deltas written by this flush, with keys
+            "input_tokens", "output_tokens" and "requests".
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+            pending_since, self._pending_since = self._pending_since, None
+            if not pending:
+                return {}
+
+            grouped: dict[tuple[str, str], list[UsageRecord]] = {}
+            for record in pending:
+                grouped.setdefault((record.user_id, record.day), []).append(record)
+
+            deltas: dict[str, dict[str, int]] = {}
+            failed: list[UsageRecord] = []
+            for (user_id, day), records in grouped.items():
+                rollup = self._rollup(user_id)
+                user_dir = self._user_dir(user_id)
+                day_file = user_dir / f"{day}.jsonl"
+                payload = "".join(json.dumps(r.to_dict()) + "\n" for r in records).encode()
+                try:
+                    user_dir.mkdir(parents=True, exist_ok=True)
+                    start, end = self._append(day_file, payload)
+                except OSError as e:
+                    logger.error(f"Failed to write usage ledger {day_file}: {e}; will retry")
+                    failed.extend(records)
+                    continue
+
+                # Other processes may have appended since this rollup last
+                # read the file; take their records in before skipping past ours
+                consumed = rollup.offsets.get(day_file.name, 0)
+                if consumed < start:
+                    self._replay(user_id, rollup, day_file, consumed, start)
+                rollup.offsets[day_file.name] = end
+
+                delta = deltas.setdefault(user_id, {"input_tokens": 0, "output_tokens": 0, "requests": 0})
+                for record in records:
+                    delta["input_tokens"] += record.input_tokens
+                    delta["output_tokens"] += record.output_tokens
+                    delta["requests"] += 1
+
+            if failed:
+                self._pending = failed + self._pending
+                self._pending_since = pending_since
+
+            for user_id in deltas:
+                try:
+                    self._write_rollup(user_id, self._rollup(user_id))
+                except OSError as e:
+                    # The day files are the source of truth; a stale rollup
+                    # is caught up from its offsets on the next load
+                    logger.error(f"Failed to write usage rollup for {user_id}: {e}")
+
+            return deltas
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_usage_for_period(
+        self,
+        user_id: str,
+        project_id: str | None,
+        period_start: datetime,
+    ) -> int:
+        """Get recorded tokens since period_start (day granularity)."""
+        with self._lock:
+            rollup = self._rollup(user_id)
+            if project_id is not None:
+                # Project rollups are lifetime totals
+                return rollup.by_project.get(project_id, 0)
+            start_day = period_start.strftime("%Y-%m-%d") if period_start.year > 1 else ""
+            return sum(t for day, t in rollup.by_day.items() if day >= start_day)
+
+    def get_summary(self, user_id: str) -> dict[str, Any]:
+        """Get a user's usage rollups."""
+        with self._lock:
+            rollup = self._rollup(user_id)
+            return {
+                "user_id": user_id,
+                "input_tokens": rollup.input_tokens,
+                "output_tokens": rollup.output_tokens,
+                "requests": rollup.requests,
+                "by_day": dict(rollup.by_day),
+                "by_project": dict(rollup.by_project),
+                "by_model": dict(rollup.by_model),
+                "reserved": self._reserved(user_id),
+            }
+
+
+# Global ledger instance
+_usage_ledger: UsageLedger | None = None
+
+
+def get_usage_ledger(base_path: Path | None = None) -> UsageLedger:
+    """Get the global usage ledger instance.
+
+    Args:
+        base_path: Storage directory (only used on first call).
+
+    Returns:
+        UsageLedger instance.
+    """
+    global _usage_ledger
+    if _usage_ledger is None:
+        _usage_ledger = UsageLedger(base_path)
+    return _usage_ledger
@@ -8,6 +8,7 @@ from .models import (
     ApiKeyUpdate,
     TokenUsage,
 )
+from .index import UserIndex
 from .repository import (
     UserRepository,
     FileSystemUserRepository,
@@ -22,4 +23,5 @@ __all__ = [
     "TokenUsage",
     "UserRepository",
     "FileSystemUserRepository",
+    "UserIndex",
 ]
@@ -0,0 +1,337 @@
+"""
+Secondary indexes for the file-backed user repository.
+
+Maintains email -> user_id and tenant -> user_ids lookups in a single
+JSON document next to the user profiles, so logins and tenant listings
+do not need to parse every profile on disk.
+
+The index is written atomically (temp file + rename) after each profile
+write, under an exclusive lock file so writers in different processes do
+not lose each other's updates. Each entry records the (mtime, size) of
+the profile it was built from; whenever the index or the directory
+changes, entries are compared with the profiles on disk and the index is
+rebuilt if the process died between a profile write and its index update.
+JSON files that are not profiles are recorded the same way, so a stray
+file in the directory does not make the index look permanently stale.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+INDEX_FILENAME = ".index.json"
+INDEX_LOCK_FILENAME = ".index.lock"
+INDEX_VERSION = 3
+
+Signature = tuple[int, int, int]
+
+
+def _signature(path: Path) -> Optional[Signature]:
+    """Identify a file's current contents by inode, size and mtime."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+class UserIndex:
+    """
+    Email and tenant index over a directory of user profile JSON files.
+
+    Layout of the index document:
+        {
+            "version": 3,
+            "users": {user_id: {"email": ..., "tenant_id": ...,
+                                "file": profile name, "sig": [mtime_ns, size]}},
+            "ignored": {file name: [mtime_ns, size]},
+            "by_email": {email: user_id},
+            "by_tenant": {tenant_id: [user_id, ...]}
+        }
+    """
+
+    def __init__(self, base_path: Path):
+        """
+        Initialize the index.
+
+        Args:
+            base_path: Directory holding the user profile files.
+        """
+        self._base_path = base_path
+        self._path = base_path / INDEX_FILENAME
+        self._lock = threading.RLock()
+        self._lock_path = base_path / INDEX_LOCK_FILENAME
+        self._users: dict[str, dict[str, Any]] = {}
+        self._ignored: dict[str, list[int]] = {}
+        self._by_email: dict[str, str] = {}
+        self._by_tenant: dict[str, set[str]] = {}
+        self._loaded = False
+        self._index_sig: Optional[Signature] = None
+        self._dir_sig: Optional[Signature] = None
+
+    @property
+    def path(self) -> Path:
+        """Path of the on-disk index document."""
+        return self._path
+
+    # ------------------------------------------------------------------
+    # Loading and rebuild
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold the cross-process lock guarding index read-modify-writes."""
+        with open(self._lock_path, "a+b") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            else:  # pragma: no cover - Windows
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                else:  # pragma: no cover - Windows
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _profile_files(self) -> list[os.DirEntry]:
+        """List user profile files (excludes the index and temp files)."""
+        with os.scandir(self._base_path) as it:
+            return [
+                entry for entry in it
+                if entry.name.endswith(".json")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+
+    def _is_stale(self, skip: Optional[str] = None) -> bool:
+        """
+        Check whether the index disagrees with the profiles on disk.
+
+        Args:
+            skip: Profile file name to ignore (one about to be upserted).
+        """
+        on_disk = {
+            entry.name: (entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in self._profile_files()
+            if entry.name != skip
+        }
+        indexed = {
+            meta.get("file"): tuple(meta.get("sig") or ())
+            for meta in self._users.values()
+            if meta.get("file") != skip
+        }
+        indexed.update(
+            (name, tuple(sig)) for name, sig in self._ignored.items() if name != skip
+        )
+        return on_disk != indexed
+
+    def _ensure_loaded(self) -> None:
+        """
+        Bring the in-memory index up to date with the disk.
+
+        Runs on every access: two stats detect another writer replacing the
+        index or any profile changing in the directory. A changed index is
+        re-read, and any change re-checks the entries against the profiles.
+        """
+        index_sig = _signature(self._path)
+        dir_sig = _signature(self._base_path)
+        if self._loaded and index_sig == self._index_sig and dir_sig == self._dir_sig:
+            return
+
+        with self._lock:
+            if not self._loaded or _signature(self._path) != self._index_sig:
+                if not self._read():
+                    self.rebuild()
+                    return
+            if self._is_stale():
+                self.rebuild()
+                return
+            self._dir_sig = dir_sig
+
+    def _read(self) -> bool:
+        """Read the index document. Returns False if missing or unreadable."""
+        index_sig = _signature(self._path)
+        try:
+            data = json.loads(self._path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+
+        if data.get("version") != INDEX_VERSION:
+            return False
+
+        self._users = {
+            uid: {
+                "email": meta.get("email"),
+                "tenant_id": meta.get("tenant_id"),
+                "file": meta.get("file"),
+                "sig": meta.get("sig"),
+            }
+            for uid, meta in data.get("users", {}).items()
+        }
+        self._ignored = data.get("ignored", {})
+        self._reindex()
+        self._loaded = True
+        self._index_sig = index_sig
+        return True
+
+    def _refresh(self) -> None:
+        """Re-read the index if another process replaced it (file lock held)."""
+        if not self._loaded or _signature(self._path) != self._index_sig:
+            if not self._read():
+                self._rebuild()
+
+    def rebuild(self) -> int:
+        """
+        Rebuild the index by scanning every profile file.
+
+        Returns:
+            Number of users indexed.
+        """
+        with self._lock, self._file_lock():
+            return self._rebuild()
+
+    def _rebuild(self) -> int:
+        """Scan the profiles and write a fresh index (both locks held)."""
+        users: dict[str, dict[str, Any]] = {}
+        ignored: dict[str, list[int]] = {}
+        for entry in self._profile_files():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            sig = [stat.st_mtime_ns, stat.st_size]
+            try:
+                data = json.loads(Path(entry.path).read_text())
+            except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+                ignored[entry.name] = sig
+                continue
+            user_id = data.get("user_id") if isinstance(data, dict) else None
+            if not user_id:
+                ignored[entry.name] = sig
+                continue
+            if user_id in users:
+                # Duplicate profile for the same user: index the first one
+                ignored[entry.name] = sig
+                continue
+            users[user_id] = {
+                "email": data.get("email"),
+                "tenant_id": data.get("tenant_id"),
+                "file": entry.name,
+                "sig": sig,
+            }
+        self._users = users
+        self._ignored = ignored
+        self._reindex()
+        self._write()
+        return len(users)
+
+    def _reindex(self) -> None:
+        """Derive the email and tenant maps from the users map."""
+        self._by_email = {}
+        self._by_tenant = {}
+        for user_id, meta in self._users.items():
+            if meta.get("email"):
+                self._by_email[meta["email"]] = user_id
+            if meta.get("tenant_id"):
+                self._by_tenant.setdefault(meta["tenant_id"], set()).add(user_id)
+
+    def _write(self) -> None:
+        """Atomically write the index document (file lock held)."""
+        data: dict[str, Any] = {
+            "version": INDEX_VERSION,
+            "users": self._users,
+            "ignored": self._ignored,
+            "by_email": self._by_email,
+            "by_tenant": {t: sorted(ids) for t, ids in self._by_tenant.items()},
+        }
+        temp_path = self._path.with_name(f"{INDEX_FILENAME}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(data, indent=2))
+        temp_path.replace(self._path)
+        self._loaded = True
+        self._index_sig = _signature(self._path)
+        self._dir_sig = _signature(self._base_path)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def upsert(
+        self,
+        user_id: str,
+        email: Optional[str],
+        tenant_id: Optional[str],
+        profile_path: Path,
+    ) -> None:
+        """Record (or move) a user's email and tenant entries."""
+        with self._lock, self._file_lock():
+            self._refresh()
+            if self._is_stale(skip=profile_path.name):
+                self._rebuild()
+                return
+            stat = profile_path.stat()
+            self._ignored.pop(profile_path.name, None)
+            previous = self._users.get(user_id)
+            if previous:
+                self._discard(user_id, previous)
+            self._users[user_id] = {
+                "email": email,
+                "tenant_id": tenant_id,
+                "file": profile_path.name,
+                "sig": [stat.st_mtime_ns, stat.st_size],
+            }
+            if email:
+                self._by_email[email] = user_id
+            if tenant_id:
+                self._by_tenant.setdefault(tenant_id, set()).add(user_id)
+            self._write()
+
+    def remove(self, user_id: str) -> None:
+        """Drop a user from the index."""
+        with self._lock, self._file_lock():
+            self._refresh()
+            previous = self._users.pop(user_id, None)
+            if previous is None:
+                return
+            self._discard(user_id, previous)
+            self._write()
+
+    def _discard(self, user_id: str, meta: dict[str, Any]) -> None:
+        """Remove a user's entries from the derived maps."""
+        email = meta.get("email")
+        if email and self._by_email.get(email) == user_id:
+            del self._by_email[email]
+        tenant_id = meta.get("tenant_id")
+        if tenant_id and tenant_id in self._by_tenant:
+            self._by_tenant[tenant_id].discard(user_id)
+            if not self._by_tenant[tenant_id]:
+                del self._by_tenant[tenant_id]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def user_id_for_email(self, email: str) -> Optional[str]:
+        """Look up a user ID by email."""
+        self._ensure_loaded()
+        return self._by_email.get(email)
+
+    def user_ids_for_tenant(self, tenant_id: str) -> list[str]:
+        """List user IDs belonging to a tenant."""
+        self._ensure_loaded()
+        return sorted(self._by_tenant.get(tenant_id, ()))
+
+    def all_user_ids(self) -> list[str]:
+        """List every indexed user ID."""
+        self._ensure_loaded()
+        return sorted(self._users)
@@ -45,6 +45,9 @@ class UserProfile(BaseModel):
     # Access control
     role: UserRole = UserRole.DEVELOPER
 
+    # Tenant (client organization) the user belongs to, if any
+    tenant_id: Optional[str] = None
+
     # BYOK LLM API key (encrypted at rest in production)
     llm_api_key: Optional[str] = None
     llm_provider: str = "anthropic"  # anthropic, openai, etc.
@@ -103,6 +106,7 @@ class UserProfileCreate(BaseModel):
     email: str
     name: Optional[str] = None
     role: UserRole = UserRole.DEVELOPER
+    tenant_id: Optional[str] = None
 
 
 class UserProfileUpdate(BaseModel):
@@ -6,10 +6,13 @@ database or external identity provider integration.
 """
 
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Protocol, Optional
 from datetime import datetime
 
+from .index import UserIndex
 from .models import UserProfile, UserProfileCreate
 
 
@@ -32,8 +35,8 @@ class UserRepository(Protocol):
         """Delete user profile."""
         ...
 
-    async def list_users(self) -> list[UserProfile]:
-        """List all user profiles."""
+    async def list_users(self, tenant_id: Optional[str] = None) -> list[UserProfile]:
+        """List user profiles, optionally restricted to one tenant."""
         ...
 
     async def create(self, data: UserProfileCreate) -> UserProfile:
@@ -47,6 +50,10 @@ class FileSystemUserRepository:
 
     Stores user profiles as JSON files at:
     ~/.orchestrator/users/<user_id>.json
+
+    Email and tenant lookups go through a maintained index
+    (~/.orchestrator/users/.index.json), and parsed profiles are kept in
+    an in-memory cache validated against each file's mtime and size.
     """
 
     def __init__(self, base_path: Optional[Path] = None):
@@ -61,6 +68,9 @@ class FileSystemUserRepository:
             base_path = Path.home() / ".orchestrator" / "users"
         self._base_path = base_path
         self._base_path.mkdir(parents=True, exist_ok=True)
+        self._index = UserIndex(self._base_path)
+        self._cache: dict[str, tuple[tuple[int, int], UserProfile]] = {}
+        self._cache_lock = threading.Lock()
 
     def _user_path(self, user_id: str) -> Path:
         """Get file path for a user profile."""
@@ -68,29 +78,51 @@ class FileSystemUserRepository:
         safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in user_id)
         return self._base_path / f"{safe_id}.json"
 
-    async def get_by_id(self, user_id: str) -> Optional[UserProfile]:
-        """Get user profile by ID."""
+    def _read_profile(self, user_id: str) -> Optional[UserProfile]:
+        """Read a profile through the in-memory cache."""
         path = self._user_path(user_id)
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            with self._cache_lock:
+                self._cache.pop(user_id, None)
             return None
 
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(user_id)
+        if cached and cached[0] == key:
+            return cached[1]
+
         try:
             data = json.loads(path.read_text())
-            return UserProfile(**data)
-        except (json.JSONDecodeError, ValueError) as e:
+            user = UserProfile(**data)
+        except (json.JSONDecodeError, ValueError):
             # Log error in production
             return None
 
+        with self._cache_lock:
+            self._cache[user_id] = (key, user)
+        return user
+
+    async def get_by_id(self, user_id: str) -> Optional[UserProfile]:
+        """Get user profile by ID."""
+        user = self._read_profile(user_id)
+        # Hand out a copy so callers can mutate without touching the cache
+        return user.model_copy(deep=True) if user else None
+
     async def get_by_email(self, email: str) -> Optional[UserProfile]:
-        """Get user profile by email (searches all profiles)."""
-        for user_file in self._base_path.glob("*.json"):
-            try:
-                data = json.loads(user_file.read_text())
-                if data.get("email") == email:
-                    return UserProfile(**data)
-            except (json.JSONDecodeError, ValueError):
-                continue
-        return None
+        """Get user profile by email (via the email index)."""
+        user_id = self._index.user_id_for_email(email)
+        if user_id is None:
+            return None
+
+        user = await self.get_by_id(user_id)
+        if user is None or user.email != email:
+            # Index drifted from disk (e.g. external edit); repair and retry
+            self._index.rebuild()
+            user_id = self._index.user_id_for_email(email)
+            user = await self.get_by_id(user_id) if user_id else None
+        return user
 
     async def save(self, user: UserProfile) -> UserProfile:
         """Save or update user profile."""
@@ -99,29 +131,59 @@ class FileSystemUserRepository:
 
         # Convert to JSON-serializable dict
         data = user.model_dump(mode="json")
-        path.write_text(json.dumps(data, indent=2, default=str))
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(data, indent=2, default=str))
+        temp_path.replace(path)
+
+        # Profile first, then index: a crash in between leaves an index
+        # entry that no longer matches the profile, which triggers a rebuild.
+        self._index.upsert(user.user_id, user.email, user.tenant_id, path)
+
+        stat = path.stat()
+        with self._cache_lock:
+            self._cache[user.user_id] = (
+                (stat.st_mtime_ns, stat.st_size),
+                user.model_copy(deep=True),
+            )
 
         return user
 
     async def delete(self, user_id: str) -> bool:
         """Delete user profile."""
         path = self._user_path(user_id)
+        with self._cache_lock:
+            self._cache.pop(user_id, None)
         if path.exists():
             path.unlink()
+            self._index.remove(user_id)
             return True
         return False
 
-    async def list_users(self) -> list[UserProfile]:
-        """List all user profiles."""
+    async def list_users(self, tenant_id: Optional[str] = None) -> list[UserProfile]:
+        """
+        List user profiles.
+
+        Args:
+            tenant_id: If given, only users of this tenant are loaded.
+        """
+        if tenant_id is None:
+            user_ids = self._index.all_user_ids()
+        else:
+            user_ids = self._index.user_ids_for_tenant(tenant_id)
+
         users = []
-        for user_file in self._base_path.glob("*.json"):
-            try:
-                data = json.loads(user_file.read_text())
-                users.append(UserProfile(**data))
-            except (json.JSONDecodeError, ValueError):
-                continue
+        for user_id in user_ids:
+            user = await self.get_by_id(user_id)
+            if user is not None:
+                users.append(user)
         return users
 
+    def rebuild_index(self) -> int:
+        """Rebuild the email/tenant index from the profiles on disk."""
+        with self._cache_lock:
+            self._cache.clear()
+        return self._index.rebuild()
+
     async def create(self, data: UserProfileCreate) -> UserProfile:
         """Create a new user profile."""
         # Check if user already exists
@@ -135,6 +197,7 @@ class FileSystemUserRepository:
             email=data.email,
             name=data.name,
             role=data.role,
+            tenant_id=data.tenant_id,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
         )
@@ -169,7 +232,8 @@ class FileSystemUserRepository:
         self,
         user_id: str,
         input_tokens: int,
-        output_tokens: int
+        output_tokens: int,
+        requests: int = 1,
     ) -> bool:
         """Update token usage counters for a user."""
         user = await self.get_by_id(user_id)
@@ -178,7 +242,7 @@ class FileSystemUserRepository:
 
         user.token_usage.total_input_tokens += input_tokens
         user.token_usage.total_output_tokens += output_tokens
-        user.token_usage.total_requests += 1
+        user.token_usage.total_requests += requests
         await self.save(user)
 
         return True
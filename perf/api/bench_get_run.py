@@ -0,0 +1,136 @@
+"""
+Benchmark: GET /runs/{id} latency and allocations under concurrent load.
+
+Compares two modes against the in-process ASGI app:
+
+- per-request: a new OrchestratorService (and repository) per request,
+  which re-parses the project file every time (previous behaviour)
+- shared: the application-scoped service with cached project state
+
+Run:
+    python perf/api/bench_get_run.py --concurrency 16 --requests 400
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import httpx  # noqa: E402
+
+from orchestrator_v2.api.routes.runs import get_orchestrator_service  # noqa: E402
+from orchestrator_v2.api.server import app  # noqa: E402
+from orchestrator_v2.engine.state_models import (  # noqa: E402
+    ArtifactInfo,
+    PhaseState,
+    PhaseType,
+    ProjectState,
+)
+from orchestrator_v2.persistence.fs_repository import FileSystemProjectRepository  # noqa: E402
+from orchestrator_v2.services.orchestrator_service import OrchestratorService  # noqa: E402
+from orchestrator_v2.telemetry.token_store import SQLiteTokenStore  # noqa: E402
+
+RUN_ID = "bench-run"
+
+
+async def seed(repo: FileSystemProjectRepository) -> None:
+    """Write a project with realistic phase history and metadata."""
+    state = ProjectState(
+        project_id=RUN_ID,
+        run_id=RUN_ID,
+        project_name="Benchmark",
+        project_type="analytics_forecast_app",
+        current_phase=PhaseType.DEVELOPMENT,
+        metadata={"intake": "x" * 4000, "notes": [f"note {i}" for i in range(200)]},
+    )
+    for phase in (PhaseType.PLANNING, PhaseType.ARCHITECTURE, PhaseType.DATA):
+        state.phase_states[phase.value] = PhaseState(
+            phase=phase,
+            status="completed",
+            started_at=datetime.utcnow(),
+            completed_at=datetime.utcnow(),
+            agent_ids=["architect", "developer"],
+            artifacts={
+                f"{phase.value}/artifact_{i}.md": ArtifactInfo(
+                    path=f"{phase.value}/artifact_{i}.md", hash="0" * 64, size_bytes=1024,
+                )
+                for i in range(50)
+            },
+        )
+    await repo.save(state)
+
+
+async def run_load(concurrency: int, requests: int) -> tuple[list[float], int]:
+    """Issue concurrent GETs; return per-request latencies and peak traced memory."""
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                start = time.perf_counter()
+                response = await client.get(f"/runs/{RUN_ID}")
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        # Warm up
+        await client.get(f"/runs/{RUN_ID}")
+
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        per_worker = max(1, requests // concurrency)
+        await asyncio.gather(*(worker(per_worker) for _ in range(concurrency)))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return latencies, peak
+
+
+def report(name: str, latencies: list[float], peak: int) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{name:<12} n={len(ordered):<5} "
+        f"mean={statistics.mean(ordered) * 1000:7.2f}ms "
+        f"p50={statistics.median(ordered) * 1000:7.2f}ms "
+        f"p95={p95 * 1000:7.2f}ms "
+        f"peak_alloc={peak / 1024:8.1f}KiB"
+    )
+
+
+async def main(concurrency: int, requests: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp) / "projects"
+        token_store = SQLiteTokenStore(":memory:")
+        await seed(FileSystemProjectRepository(base))
+
+        # Previous behaviour: fresh service and repository per request
+        app.dependency_overrides[get_orchestrator_service] = lambda: OrchestratorService(
+            project_repo=FileSystemProjectRepository(base),
+            token_store=token_store,
+        )
+        report("per-request", *await run_load(concurrency, requests))
+
+        shared = OrchestratorService(
+            project_repo=FileSystemProjectRepository(base),
+            token_store=token_store,
+        )
+        app.dependency_overrides[get_orchestrator_service] = lambda: shared
+        report("shared", *await run_load(concurrency, requests))
+
+        app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=400)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.requests))
@@ -0,0 +1,183 @@
+"""
+Recorded GitHub API responses for offline collection runs.
+
+RecordedTransport is an httpx transport that serves responses from a JSON
+fixture keyed by request path and query string, honouring If-None-Match
+with 304s and optionally adding latency, so IncrementalGitHubCollector can
+be tested and benchmarked without network access. RecordingTransport wraps
+a live transport and captures responses into the same format, and
+synthesize_fixtures builds a repository of any size.
+
+Fixture format:
+    {
+        "GET /repos/o/r/pulls?direction=desc&per_page=100&sort=updated&state=closed": {
+            "status": 200,
+            "headers": {"ETag": "\\"abc\\"", "Link": "..."},
+            "body": [...]
+        },
+        ...
+    }
+"""
+
+import asyncio
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+import httpx
+
+
+def request_key(request: httpx.Request) -> str:
+    """Fixture key for a request: method, path and sorted query string."""
+    params = sorted(request.url.params.multi_items())
+    query = f"?{urlencode(params)}" if params else ""
+    return f"{request.method} {request.url.path}{query}"
+
+
+class RecordedTransport(httpx.AsyncBaseTransport):
+    """Serve GitHub API responses from recorded fixtures."""
+
+    def __init__(self, fixtures: Dict[str, Dict[str, Any]], latency: float = 0.0):
+        """
+        Initialize transport.
+
+        Args:
+            fixtures: Mapping of request key to {"status", "headers", "body"}
+            latency: Simulated round-trip time per request in seconds
+        """
+        self.fixtures = fixtures
+        self.latency = latency
+        self.requests: List[str] = []
+
+    @classmethod
+    def from_file(cls, path: Path, latency: float = 0.0) -> "RecordedTransport":
+        """Load fixtures written by RecordingTransport.save (or by hand)."""
+        with open(path) as f:
+            return cls(json.load(f), latency=latency)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request)
+        self.requests.append(key)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        fixture = self.fixtures.get(key)
+        if fixture is None:
+            return httpx.Response(404, json={"message": "Not Found"}, request=request)
+
+        headers = dict(fixture.get("headers", {}))
+        etag = headers.get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=headers, request=request)
+
+        return httpx.Response(
+            fixture.get("status", 200),
+            headers=headers,
+            json=fixture.get("body"),
+            request=request,
+        )
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Pass requests through to a live transport and record the responses."""
+
+    RECORDED_HEADERS = ("ETag", "Link", "X-RateLimit-Remaining", "X-RateLimit-Reset")
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self.fixtures: Dict[str, Dict[str, Any]] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        if response.status_code == 200:
+            body = await response.aread()
+            self.fixtures[request_key(request)] = {
+                "status": 200,
+                "headers": {
+                    name: response.headers[name]
+                    for name in self.RECORDED_HEADERS
+                    if name in response.headers
+                },
+                "body": json.loads(body),
+            }
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def save(self, path: Path) -> None:
+        """Write recorded fixtures to path."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.fixtures, f, indent=2, sort_keys=True)
+
+
+def _iso(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def make_fixture(body: Any, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """200 fixture with a content-derived ETag, as GitHub sends."""
+    digest = hashlib.sha1(json.dumps(body, sort_keys=True).encode()).hexdigest()
+    return {"status": 200, "headers": {"ETag": f'"{digest}"', **(headers or {})}, "body": body}
+
+
+def synthesize_fixtures(
+    repo: str,
+    count: int,
+    now: Optional[datetime] = None,
+    force_push_every: int = 4,
+    per_page: int = 100,
+    base_url: str = "https://api.github.com",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Build fixtures for `count` closed PRs in repo, one updated per hour.
+
+    PR `count` is the most recently updated. Every `force_push_every`-th PR
+    has a head_ref_force_pushed event and every third PR is closed unmerged.
+    """
+    now = now or datetime.now(timezone.utc)
+    prs = []
+    for number in range(count, 0, -1):
+        updated_at = now - timedelta(hours=count - number + 1)
+        created_at = updated_at - timedelta(hours=24 + number % 48)
+        prs.append({
+            "number": number,
+            "title": f"Change {number}",
+            "user": {"login": f"dev{number % 5}"},
+            "created_at": _iso(created_at),
+            "updated_at": _iso(updated_at),
+            "closed_at": _iso(updated_at),
+            "merged_at": _iso(updated_at) if number % 3 else None,
+            "commits": 1 + number % 7,
+            "changed_files": 1 + number % 11,
+            "additions": 10 * number % 500,
+            "deletions": 3 * number % 200,
+        })
+
+    fixtures: Dict[str, Dict[str, Any]] = {}
+    listing = f"/repos/{repo}/pulls"
+    pages = [prs[i:i + per_page] for i in range(0, len(prs), per_page)] or [[]]
+    for index, page in enumerate(pages, start=1):
+        params: Dict[str, Any] = {"direction": "desc", "per_page": per_page, "sort": "updated", "state": "closed"}
+        if index > 1:
+            params["page"] = index
+        headers = {}
+        if index < len(pages):
+            next_query = urlencode(sorted({**params, "page": index + 1}.items()))
+            headers["Link"] = f'<{base_url}{listing}?{next_query}>; rel="next"'
+        fixtures[f"GET {listing}?{urlencode(sorted(params.items()))}"] = make_fixture(page, headers)
+
+    for pr in prs:
+        number = pr["number"]
+        events = [{"event": "labeled", "created_at": pr["created_at"]}]
+        if number % force_push_every == 0:
+            pushed_at = datetime.strptime(pr["created_at"], "%Y-%m-%dT%H:%M:%SZ") + timedelta(hours=2)
+            events.append({"event": "head_ref_force_pushed", "created_at": _iso(pushed_at)})
+        fixtures[f"GET {listing}/{number}"] = make_fixture(pr)
+        fixtures[f"GET /repos/{repo}/issues/{number}/events?per_page=100"] = make_fixture(events)
+
+    return fixtures
@@ -0,0 +1,106 @@
+"""
+Benchmark: yearly metrics trend report (52 weeks, 12 months, 4 quarters).
+
+Compares:
+
+- legacy: every bucket re-opens and re-parses each source's snapshot files
+  (how the aggregator worked before the time-series store)
+- cold: MetricsAggregator with an empty time-series store
+- warm: a second report, after one new collection, reusing cached rollups
+
+Snapshot files carry the measurement lists collectors write next to their
+summaries, so parsing cost scales with --measurements.
+
+Run:
+    python perf/metrics/bench_aggregator.py --measurements 2000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.orchestrator.metrics.aggregator import SNAPSHOT_SOURCES, MetricsAggregator  # noqa: E402
+
+
+def write_snapshots(metrics_dir: Path, measurements: int, collected_at: datetime) -> None:
+    for snapshots in SNAPSHOT_SOURCES.values():
+        for relative_path, fields in snapshots:
+            path = metrics_dir / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(
+                    {
+                        "collection_timestamp": collected_at.isoformat(),
+                        "measurements": [
+                            {"commit_sha": f"{i:040x}", "lead_time_hours": i % 97} for i in range(measurements)
+                        ],
+                        "summary": {key: 12.5 for key in fields},
+                    },
+                    f,
+                    indent=2,
+                )
+
+
+def legacy_report(metrics_dir: Path) -> int:
+    """One load of every snapshot file per source per bucket; returns files parsed."""
+    parsed = 0
+    for _ in range(52 + 12):
+        for snapshots in SNAPSHOT_SOURCES.values():
+            for relative_path, fields in snapshots:
+                with open(metrics_dir / relative_path) as f:
+                    summary = json.load(f).get("summary", {})
+                {metric: summary.get(key, 0) for key, metric in fields.items()}
+                parsed += 1
+    return parsed
+
+
+def report(aggregator: MetricsAggregator) -> None:
+    aggregator.aggregate_weekly(52)
+    aggregator.aggregate_monthly(12)
+    aggregator.aggregate_quarterly(4)
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(measurements: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        metrics_dir = root / ".claude" / "metrics"
+        write_snapshots(metrics_dir, measurements, datetime.now() - timedelta(days=3))
+
+        parsed = 0
+
+        def run_legacy():
+            nonlocal parsed
+            parsed = legacy_report(metrics_dir)
+
+        legacy = timed(run_legacy)
+
+        cold_aggregator = MetricsAggregator(project_root=root)
+        cold = timed(lambda: report(cold_aggregator))
+
+        write_snapshots(metrics_dir, measurements, datetime.now())
+        warm_aggregator = MetricsAggregator(project_root=root)
+        warm = timed(lambda: report(warm_aggregator))
+
+    print(f"legacy     {legacy * 1000:9.1f}ms  snapshot files parsed={parsed}")
+    print(f"cold       {cold * 1000:9.1f}ms  rollups {cold_aggregator.store.stats}")
+    print(f"warm       {warm * 1000:9.1f}ms  rollups {warm_aggregator.store.stats}")
+    print(f"speedup    {legacy / cold:.1f}x cold, {legacy / warm:.1f}x warm")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--measurements", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.measurements)
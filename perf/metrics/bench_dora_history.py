@@ -0,0 +1,133 @@
+"""
+Benchmark: DORA metrics on a repository with many release tags.
+
+Compares a full report (all four metrics) computed:
+
+- legacy: one tag listing per metric plus one `git log prev..curr` per tag
+  pair for lead time and per hotfix for MTTR (previous behaviour)
+- cold: DORAMetricsCalculator with an empty history cache (one git log pass,
+  including writing the report files)
+- warm: a second report, with one new release, reusing the cache
+
+The repository is generated with git fast-import.
+
+Run:
+    python perf/metrics/bench_dora_history.py --tags 400 --commits-per-tag 5
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.orchestrator.metrics.dora_metrics import DORAMetricsCalculator  # noqa: E402
+
+TAG_LOG = ["log", "--tags", "--simplify-by-decoration", "--pretty=format:%ai|%H|%D"]
+
+
+def build_repo(path: Path, tags: int, commits_per_tag: int, start: datetime) -> datetime:
+    """Create a linear history with a release tag every few commits; returns the last commit time."""
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    stream = []
+    when = start
+    mark = 0
+    for release in range(tags):
+        for _ in range(commits_per_tag):
+            mark += 1
+            when += timedelta(hours=3)
+            stamp = f"{int(when.timestamp())} +0000"
+            message = f"change {mark}\n"
+            stream.append(f"commit refs/heads/main\nmark :{mark}\n")
+            stream.append(f"author Dev <dev@example.com> {stamp}\ncommitter Dev <dev@example.com> {stamp}\n")
+            stream.append(f"data {len(message)}\n{message}")
+            if mark > 1:
+                stream.append(f"from :{mark - 1}\n")
+            stream.append("\n")
+        # Every fifth release is a quick patch bump (hotfix)
+        major, minor, patch = 1, release // 5, release % 5
+        stream.append(f"reset refs/tags/v{major}.{minor}.{patch}\nfrom :{mark}\n\n")
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=path, input="".join(stream), text=True, check=True)
+    subprocess.run(["git", "checkout", "-q", "main"], cwd=path, check=True)
+    return when
+
+
+def legacy_report(repo: Path, days_back: int) -> int:
+    """Previous subprocess pattern; returns the number of lead time measurements."""
+    since = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+
+    def git(args):
+        return subprocess.run(["git"] + args, cwd=repo, capture_output=True, text=True).stdout.strip()
+
+    def tag_list():
+        tags = []
+        for line in git(TAG_LOG + [f"--since={since}"]).split("\n"):
+            match = re.search(r"tag:\s*(v?\d+\.\d+\.\d+[^\s,]*)", line)
+            if match:
+                tags.append((match.group(1), datetime.strptime(line[:19], "%Y-%m-%d %H:%M:%S")))
+        return tags
+
+    tag_list()  # deployment frequency
+    tags = tag_list()  # lead time
+    measurements = 0
+    for i in range(len(tags) - 1):
+        out = git(["log", f"{tags[i + 1][0]}..{tags[i][0]}", "--pretty=format:%H|%ai", "--first-parent"])
+        measurements += len([line for line in out.split("\n") if line])
+    tags = tag_list()  # MTTR
+    for i in range(len(tags) - 1):
+        if tags[i][1] - tags[i + 1][1] <= timedelta(hours=48) and tags[i][0].endswith(("1", "2", "3", "4")):
+            git(["log", f"{tags[i + 1][0]}..{tags[i][0]}", "--pretty=format:%H", "--first-parent"])
+    tag_list()  # change failure rate
+    return measurements
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(tags: int, commits_per_tag: int) -> None:
+    days_back = 365
+    start = datetime.now() - timedelta(hours=3 * tags * commits_per_tag + 24)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / "repo"
+        last = build_repo(repo, tags, commits_per_tag, start)
+
+        legacy, legacy_count = timed(lambda: legacy_report(repo, days_back))
+
+        cold_calc = DORAMetricsCalculator(repo, days_back)
+        cold, result = timed(cold_calc.collect_all)
+        cold_count = len(result["lead_time"]["measurements"])
+        assert cold_count == legacy_count, (cold_count, legacy_count)
+
+        subprocess.run(
+            ["git", "commit", "-q", "--allow-empty", "-m", "release", f"--date={last.isoformat()}"],
+            cwd=repo, check=True,
+            env={**os.environ, "GIT_AUTHOR_NAME": "Dev", "GIT_AUTHOR_EMAIL": "dev@example.com",
+                 "GIT_COMMITTER_NAME": "Dev", "GIT_COMMITTER_EMAIL": "dev@example.com"},
+        )
+        subprocess.run(["git", "tag", "v9.0.0"], cwd=repo, check=True)
+        warm_calc = DORAMetricsCalculator(repo, days_back)
+        warm, _ = timed(warm_calc.collect_all)
+
+    print(f"{tags} tags, {tags * commits_per_tag} commits, {legacy_count} lead time measurements")
+    print(f"legacy     {legacy * 1000:9.1f}ms")
+    print(f"cold       {cold * 1000:9.1f}ms  commits scanned={cold_calc._history.commits_scanned}")
+    print(f"warm       {warm * 1000:9.1f}ms  commits scanned={warm_calc._history.commits_scanned}")
+    print(f"speedup    {legacy / cold:.1f}x cold, {legacy / warm:.1f}x warm")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tags", type=int, default=400)
+    parser.add_argument("--commits-per-tag", type=int, default=5)
+    args = parser.parse_args()
+    main(args.tags, args.commits_per_tag)
@@ -0,0 +1,111 @@
+"""
+Benchmark: agent prompt loading and interpolation with large contexts.
+
+Compares, per agent invocation:
+
+- legacy: read the template from disk, then one re.sub per context key
+  (previous behaviour of load_and_interpolate)
+- compiled: mtime-cached CompiledTemplate rendered in a single pass
+
+The context mimics a late-phase run: large artifact summaries and intake
+text plus many extra keys, most of which the template never references.
+
+Run:
+    python perf/prompts/bench_prompt_render.py --iterations 200 --artifact-kb 256
+"""
+
+import argparse
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.orchestrator.prompt_loader import load_and_interpolate  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def legacy_load_and_interpolate(agent_name: str, context: dict, project_root: Path) -> str:
+    """Previous implementation, kept here as the baseline."""
+    with open(project_root / "subagent_prompts" / f"{agent_name}.md") as f:
+        result = f.read()
+    for key, value in context.items():
+        pattern = r'\{\{' + re.escape(key) + r'\}\}'
+        str_value = str(value) if value is not None else ""
+        result = re.sub(pattern, str_value, result)
+    return result
+
+
+def build_context(artifact_kb: int, extra_keys: int) -> dict:
+    line = "    • artifacts/development/src/module_{i}.py (sha256 0123456789abcdef)\n"
+    summary = "".join(line.format(i=i) for i in range(artifact_kb * 1024 // len(line)))
+    context = {
+        "project_root": "/srv/projects/demo",
+        "phase": "development",
+        "agent": "developer",
+        "project_name": "Demo",
+        "project_type": "analytics_forecast_app",
+        "description": "Forecasting platform " * 200,
+        "intake_summary": "Project Intake:\n" + "  - Requirement\n" * 2000,
+        "last_artifacts": "Previous Artifacts:\n" + summary,
+        "entrypoints": "Available Entrypoints:\n  - test: pytest -q",
+        "checkpoint_policy": "Standard validation",
+    }
+    for i in range(extra_keys):
+        context[f"extra_{i}"] = f"value {i}"
+    return context
+
+
+def measure(fn, iterations: int) -> list[float]:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name: str, timings: list[float]) -> None:
+    print(
+        f"{name:<10} n={len(timings):<5} "
+        f"mean={statistics.mean(timings) * 1000:8.3f}ms "
+        f"p50={statistics.median(timings) * 1000:8.3f}ms "
+        f"min={min(timings) * 1000:8.3f}ms"
+    )
+
+
+def main(iterations: int, artifact_kb: int, extra_keys: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        project_root = Path(tmp)
+        shutil.copytree(REPO_ROOT / "subagent_prompts", project_root / "subagent_prompts")
+        # Make sure large values actually land in the template
+        template = project_root / "subagent_prompts" / "developer.md"
+        template.write_text(template.read_text() + "\n{{last_artifacts}}\n{{intake_summary}}\n")
+
+        context = build_context(artifact_kb, extra_keys)
+
+        # Backslash-free context, so both produce identical output
+        assert legacy_load_and_interpolate("developer", context, project_root) == load_and_interpolate(
+            "developer", context, project_root
+        )
+
+        legacy = measure(lambda: legacy_load_and_interpolate("developer", context, project_root), iterations)
+        compiled = measure(lambda: load_and_interpolate("developer", context, project_root), iterations)
+
+        report("legacy", legacy)
+        report("compiled", compiled)
+        print(f"speedup    {statistics.mean(legacy) / statistics.mean(compiled):.1f}x (mean)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--artifact-kb", type=int, default=256)
+    parser.add_argument("--extra-keys", type=int, default=40)
+    args = parser.parse_args()
+    main(args.iterations, args.artifact_kb, args.extra_keys)
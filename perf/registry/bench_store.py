@@ -0,0 +1,99 @@
+"""
+Benchmark: publishing into and querying a large model registry.
+
+Compares:
+
+- legacy: load releases.json, append and rewrite it per publish, and
+  filter listings in Python (previous RegistryManager)
+- store: the SQLite registry store (one indexed row per publish)
+- store+manifest: the same, then one releases.json export for the batch
+  (as `registry export` does)
+
+Run:
+    python perf/registry/bench_store.py --models 2000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.registry.schemas import ModelEntry  # noqa: E402
+from src.registry.store import RegistryStore  # noqa: E402
+
+
+def entry(i: int) -> ModelEntry:
+    return ModelEntry(
+        id=f"model_{i}_1.0.0",
+        name=f"model_{i}",
+        version="1.0.0",
+        created_at=datetime.utcnow().isoformat() + "Z",
+        artifacts=[f"models/model_{i}.pkl"],
+        sha256="0" * 64,
+        client=f"client-{i % 20}",
+    )
+
+
+def legacy_publish(manifest: Path, model: ModelEntry) -> None:
+    data = json.loads(manifest.read_text()) if manifest.exists() else {"models": []}
+    data["models"].append(model.model_dump(by_alias=True))
+    data["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    tmp = manifest.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=2))
+    tmp.replace(manifest)
+
+
+def legacy_list(manifest: Path, client: str) -> list:
+    data = json.loads(manifest.read_text())
+    return [ModelEntry(**m) for m in data["models"] if m.get("client") == client]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(count: int) -> None:
+    entries = [entry(i) for i in range(count)]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        manifest = root / "releases.json"
+        store = RegistryStore(root / "registry.db")
+
+        legacy, _ = timed(lambda: [legacy_publish(manifest, e) for e in entries])
+        print(f"legacy     publish {legacy * 1000:9.1f}ms  ({manifest.stat().st_size / 1024:.0f}KB manifest)")
+        fast, _ = timed(lambda: [store.add("model", e) for e in entries])
+        print(f"store      publish {fast * 1000:9.1f}ms")
+
+        exported = RegistryStore(root / "exported.db")
+        export_manifest = root / "exported.json"
+
+        def publish_and_export() -> None:
+            for model in entries:
+                exported.add("model", model)
+            exported.write_manifest("model", export_manifest)
+
+        with_manifest, _ = timed(publish_and_export)
+        print(f"store+manifest publish {with_manifest * 1000:9.1f}ms")
+        exported.close()
+
+        legacy_q, found = timed(lambda: legacy_list(manifest, "client-3"))
+        store_q, rows = timed(lambda: store.list("model", client="client-3"))
+        assert len(found) == len(rows)
+        print(f"list       legacy {legacy_q * 1000:.1f}ms, store {store_q * 1000:.1f}ms ({len(rows)} entries)")
+        print(f"speedup    {legacy / fast:.1f}x publish ({legacy / with_manifest:.1f}x with manifest), "
+              f"{legacy_q / store_q:.1f}x filtered list")
+        store.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.models)
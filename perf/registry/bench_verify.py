@@ -0,0 +1,109 @@
+"""
+Benchmark: registry integrity verification and dataset schema hashing.
+
+Compares:
+
+- legacy: serial SHA256 of every artifact in 8KB reads (previous
+  verify_integrity)
+- cold: verify_integrity with no verification cache (parallel 1MB reads)
+- warm: a repeat verify after touching one artifact
+- changed-only: verify_integrity(changed_only=True) after the same touch
+
+and, for one Parquet dataset, the previous full-table schema read against
+the footer-only read.
+
+Run:
+    python perf/registry/bench_verify.py --artifacts 8 --mb 64
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.registry.manager import RegistryManager  # noqa: E402
+
+
+def legacy_verify(manager: RegistryManager) -> int:
+    """Previous serial verification; returns artifacts hashed."""
+    hashed = 0
+    for model in manager.list_models():
+        sha256 = hashlib.sha256()
+        with open(manager.project_root / model.artifacts[0], "rb") as f:
+            for chunk in iter(lambda: f.read(8192), b""):
+                sha256.update(chunk)
+        assert sha256.hexdigest() == model.sha256
+        hashed += 1
+    return hashed
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def bench_schema(root: Path, rows: int) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("schema     skipped (pyarrow not installed)")
+        return
+
+    path = root / "datasets" / "events.parquet"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(
+        pa.table({"id": range(rows), "value": [i * 0.5 for i in range(rows)], "label": ["event"] * rows}),
+        path,
+    )
+    manager = RegistryManager(root)
+    full, _ = timed(lambda: str(pq.read_table(path).schema))
+    footer, _ = timed(lambda: manager._compute_schema_hash(path))
+    print(f"schema     full read {full * 1000:.1f}ms, footer {footer * 1000:.1f}ms "
+          f"({path.stat().st_size / (1024 * 1024):.1f}MB, {rows} rows)")
+
+
+def main(artifacts: int, size_mb: int, rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        manager = RegistryManager(root)
+        (root / "models").mkdir(exist_ok=True)
+        for i in range(artifacts):
+            path = root / "models" / f"model_{i}.bin"
+            path.write_bytes(os.urandom(1024 * 1024) * size_mb)
+            manager.publish_model(name=f"model_{i}", version="1.0.0", artifacts=[f"models/model_{i}.bin"])
+        manager.store.forget_hashes(f"models/model_{i}.bin" for i in range(artifacts))
+        total = artifacts * size_mb
+
+        legacy, _ = timed(lambda: legacy_verify(manager))
+        print(f"legacy     {legacy * 1000:9.1f}ms  {total}MB hashed")
+
+        cold, results = timed(lambda: manager.verify_integrity())
+        print(f"cold       {cold * 1000:9.1f}ms  hashed={results['artifacts_hashed']}")
+
+        os.utime(root / "models" / "model_0.bin")
+        warm, results = timed(lambda: manager.verify_integrity())
+        print(f"warm       {warm * 1000:9.1f}ms  hashed={results['artifacts_hashed']} "
+              f"cached={results['artifacts_cached']}")
+
+        os.utime(root / "models" / "model_1.bin")
+        changed, results = timed(lambda: manager.verify_integrity(changed_only=True))
+        print(f"changed    {changed * 1000:9.1f}ms  checked={results['models_checked']}")
+        print(f"speedup    {legacy / cold:.1f}x cold, {legacy / warm:.1f}x warm")
+
+        bench_schema(root, rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--artifacts", type=int, default=8)
+    parser.add_argument("--mb", type=int, default=64, help="Size of each artifact")
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Rows in the Parquet dataset")
+    args = parser.parse_args()
+    main(args.artifacts, args.mb, args.rows)
@@ -0,0 +1,107 @@
+"""
+Benchmark: recent-entry reads and filtered exports on a large audit log.
+
+Compares:
+
+- legacy: readlines() of a single log for the last N entries and a full
+  scan for a 1-day, one-tenant CSV export (previous AuditLogger)
+- segmented: the same reads against rotated, indexed segments
+
+Run:
+    python perf/security/bench_audit.py --events 1000000
+"""
+
+import argparse
+import csv
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.security.audit import AuditLogger  # noqa: E402
+
+TENANTS = [f"tenant-{i}" for i in range(50)]
+
+
+def event_lines(count: int, days: int):
+    """Events spread evenly over the last `days` days, oldest first."""
+    start = datetime.utcnow() - timedelta(days=days)
+    step = timedelta(days=days) / count
+    for i in range(count):
+        yield json.dumps({
+            "ts": (start + step * i).isoformat(),
+            "actor": f"user-{i % 200}",
+            "actor_type": "user",
+            "tenant": TENANTS[(i // 5000) % len(TENANTS)],
+            "action": "download",
+            "resource": "artifact",
+            "resource_id": f"artifacts/report_{i}.pdf",
+            "result": "success",
+            "ip": "10.0.0.1",
+            "trace_id": f"trace-{i}",
+        })
+
+
+def legacy_recent(path: Path, limit: int) -> int:
+    with open(path, "r") as f:
+        lines = f.readlines()
+    return len([json.loads(line) for line in lines[-limit:]])
+
+
+def legacy_export(path: Path, output: Path, days: int, tenant: str) -> int:
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    written = 0
+    with open(path, "r") as infile, open(output, "w", newline="") as outfile:
+        writer = csv.writer(outfile)
+        for line in infile:
+            data = json.loads(line)
+            if datetime.fromisoformat(data["ts"]) < cutoff or data.get("tenant") != tenant:
+                continue
+            writer.writerow(data.values())
+            written += 1
+    return written
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(count: int, days: int, segment_mb: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        single = root / "single.log"
+        logger = AuditLogger(str(root / "audit.log"), max_segment_bytes=segment_mb * 1024 * 1024)
+        with open(single, "w") as f:
+            for line in event_lines(count, days):
+                f.write(line + "\n")
+                logger._write(line)
+        tenant = logger.read_recent(1)[0]["tenant"]
+        print(f"log        {single.stat().st_size / (1024 * 1024):.0f}MB, "
+              f"{len(logger._segments())} sealed segments")
+
+        legacy, _ = timed(lambda: legacy_recent(single, 100))
+        fast, recent = timed(lambda: logger.read_recent(100))
+        print(f"recent     legacy {legacy * 1000:9.1f}ms, segmented {fast * 1000:7.1f}ms ({len(recent)} entries)")
+
+        output = root / "export.csv"
+        legacy_x, legacy_rows = timed(lambda: legacy_export(single, output, 1, tenant))
+        cold_x, rows = timed(lambda: logger.export_csv(str(output), days=1, tenant=tenant))
+        warm_x, _ = timed(lambda: logger.export_csv(str(output), days=1, tenant=tenant))
+        print(f"export     legacy {legacy_x * 1000:9.1f}ms, indexing {cold_x * 1000:7.1f}ms, "
+              f"indexed {warm_x * 1000:7.1f}ms ({legacy_rows}/{rows} rows)")
+        print(f"speedup    {legacy / fast:.0f}x recent, {legacy_x / warm_x:.1f}x export")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=90, help="History covered by the events")
+    parser.add_argument("--segment-mb", type=int, default=16)
+    args = parser.parse_args()
+    main(args.events, args.days, args.segment_mb)
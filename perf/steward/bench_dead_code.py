@@ -0,0 +1,107 @@
+"""
+Benchmark: dead code analysis on a synthetic package.
+
+Compares:
+
+- legacy: serial parse of every file, with a regex rescan of the source
+  lines for each defined symbol (previous analyze_dead_code)
+- cold: analyze_dead_code with an empty symbol table cache
+- warm: a repeat analysis after editing a handful of modules
+
+Run:
+    python perf/steward/bench_dead_code.py --modules 800
+"""
+
+import argparse
+import ast
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.steward.config import HygieneConfig  # noqa: E402
+from src.steward.dead_code import analyze_dead_code  # noqa: E402
+
+
+def module_source(i: int, functions: int) -> str:
+    lines = ["import os", "import json", f"from pkg.mod{max(i - 1, 0)} import func_0", ""]
+    for f in range(functions):
+        lines += [
+            "",
+            f"def func_{f}(value):",
+            f'    """Function {f} of module {i}."""',
+            "    total = 0",
+            "    for item in range(value):",
+            "        total += item * 2",
+            "    return json.dumps(total)",
+        ]
+    lines += ["", "", f"class Model{i}:", "    def run(self):", "        return func_0(1)", ""]
+    return "\n".join(lines)
+
+
+def build_package(root: Path, modules: int, functions: int) -> None:
+    package = root / "pkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    for i in range(modules):
+        (package / f"mod{i}.py").write_text(module_source(i, functions))
+
+
+def legacy_analyze(root: Path) -> int:
+    """Previous per-file analysis; returns the number of unused functions."""
+    unused = 0
+    for py_file in root.rglob("*.py"):
+        if py_file.name == "__init__.py":
+            continue
+        source = py_file.read_text()
+        lines = source.split("\n")
+        tree = ast.parse(source)
+        defined = {n.name for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)}
+        used = {n.id for n in ast.walk(tree) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+        for name in defined - used:
+            pattern = re.compile(rf"^\s*def\s+{name}\s*[\(:]")
+            for lineno, line in enumerate(lines, 1):
+                if pattern.match(line):
+                    unused += 1
+                    break
+    return unused
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(modules: int, functions: int, workers: int) -> None:
+    config = HygieneConfig()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_package(root, modules, functions)
+        output = root / "reports" / "dead_code.md"
+
+        legacy, legacy_unused = timed(lambda: legacy_analyze(root))
+        print(f"legacy     {legacy * 1000:9.1f}ms  unused functions={legacy_unused} (per-file usage)")
+
+        cold, results = timed(lambda: analyze_dead_code(root, config, output, max_workers=workers))
+        print(f"cold       {cold * 1000:9.1f}ms  unused functions={len(results['functions'])} (cross-module)")
+
+        for i in range(0, 10):
+            path = root / "pkg" / f"mod{i}.py"
+            path.write_text(path.read_text() + "\n# edited\n")
+        warm, results = timed(lambda: analyze_dead_code(root, config, output, max_workers=workers))
+        print(f"warm       {warm * 1000:9.1f}ms  unused functions={len(results['functions'])}")
+
+        print(f"speedup    {legacy / cold:.1f}x cold, {legacy / warm:.1f}x warm")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modules", type=int, default=800)
+    parser.add_argument("--functions", type=int, default=40, help="Functions per module")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
+    args = parser.parse_args()
+    main(args.modules, args.functions, args.workers)
@@ -0,0 +1,120 @@
+"""
+Benchmark: ignore-aware repository walk over a synthetic tree.
+
+Compares:
+
+- legacy: rglob over every file, then is_gitignored/is_tidyignored per file,
+  re-reading both ignore files and fnmatch-ing each pattern (previous scanner)
+- compiled: walk_files with one IgnoreMatcher, pruning ignored directories
+
+Most of the tree lives in gitignored or tidyignored directories, as vendored
+dependencies, caches and datasets do in real repositories.
+
+Run:
+    python perf/steward/bench_ignore.py --files 200000
+"""
+
+import argparse
+import fnmatch
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.steward.ignore import IgnoreMatcher, walk_files  # noqa: E402
+
+GITIGNORE = """# caches and logs
+*.pyc
+*.log
+cache/**
+vendor/**
+"""
+
+TIDYIGNORE = """data/raw/**
+docs/**/*.png
+*.whl
+"""
+
+# (directory template, share of files, suffix)
+LAYOUT = [
+    ("src/pkg{n}", 0.15, ".py"),
+    ("src/pkg{n}", 0.05, ".pyc"),
+    ("docs/section{n}", 0.05, ".png"),
+    ("docs/section{n}", 0.05, ".md"),
+    ("vendor/lib{n}/sub", 0.35, ".js"),
+    ("cache/shard{n}", 0.15, ".bin"),
+    ("data/raw/batch{n}", 0.20, ".csv"),
+]
+
+
+def build_tree(root: Path, files: int) -> None:
+    (root / ".gitignore").write_text(GITIGNORE)
+    (root / ".tidyignore").write_text(TIDYIGNORE)
+    for template, share, suffix in LAYOUT:
+        count = int(files * share)
+        for i in range(count):
+            directory = root / template.format(n=i % 100)
+            if i < 100:
+                directory.mkdir(parents=True, exist_ok=True)
+            (directory / f"f{i}{suffix}").touch()
+
+
+def _legacy_ignored(rel_path: str, ignore_file: Path) -> bool:
+    if not ignore_file.exists():
+        return False
+    with open(ignore_file, "r") as f:
+        patterns = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    for pattern in patterns:
+        if fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(rel_path, f"**/{pattern}"):
+            return True
+    return False
+
+
+def legacy_walk(root: Path) -> int:
+    kept = 0
+    for file_path in root.rglob("*"):
+        if not file_path.is_file() or ".git" in file_path.parts:
+            continue
+        rel_path = str(file_path.relative_to(root))
+        if _legacy_ignored(rel_path, root / ".gitignore"):
+            continue
+        if _legacy_ignored(rel_path, root / ".tidyignore"):
+            continue
+        kept += 1
+    return kept
+
+
+def compiled_walk(root: Path) -> int:
+    matcher = IgnoreMatcher(root, (".gitignore", ".tidyignore"))
+    return sum(1 for _ in walk_files(root, matcher, prune=lambda name: name == ".git"))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(files: int, skip_legacy: bool) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build, _ = timed(lambda: build_tree(root, files))
+        print(f"tree       {build * 1000:9.1f}ms  files={files}")
+
+        compiled, kept = timed(lambda: compiled_walk(root))
+        print(f"compiled   {compiled * 1000:9.1f}ms  kept={kept}")
+
+        if not skip_legacy:
+            legacy, legacy_kept = timed(lambda: legacy_walk(root))
+            print(f"legacy     {legacy * 1000:9.1f}ms  kept={legacy_kept}")
+            print(f"speedup    {legacy / compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=200000)
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the compiled walk")
+    args = parser.parse_args()
+    main(args.files, args.skip_legacy)
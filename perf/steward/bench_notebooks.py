@@ -0,0 +1,115 @@
+"""
+Benchmark: notebook hygiene checks on notebooks with large image outputs.
+
+Compares:
+
+- legacy: serial json.load of every notebook (previous check_notebooks)
+- cold: streaming scan with an empty cache (parallel above a few notebooks)
+- warm: a repeat check after editing one notebook
+
+Also reports the peak Python memory of checking one notebook both ways.
+
+Run:
+    python perf/steward/bench_notebooks.py --notebooks 10 --mb 20
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.steward.config import HygieneConfig  # noqa: E402
+from src.steward.notebooks import check_notebooks, scan_notebook  # noqa: E402
+
+IMAGE_BYTES = 512 * 1024
+
+
+def write_notebook(path: Path, size_mb: int) -> None:
+    """A notebook of plotting cells, each with one embedded base64 PNG."""
+    image = "iVBORw0KGgo" * (IMAGE_BYTES // 11)
+    cells = []
+    for i in range(max(1, size_mb * 1024 * 1024 // IMAGE_BYTES)):
+        cells.append({"cell_type": "markdown", "metadata": {}, "source": [f"## Figure {i}"]})
+        cells.append(
+            {
+                "cell_type": "code",
+                "execution_count": i + 1,
+                "metadata": {"scrolled": True},
+                "outputs": [
+                    {"output_type": "display_data", "data": {"image/png": image, "text/plain": ["<Figure>"]}, "metadata": {}}
+                ],
+                "source": ["plt.plot(range(10))\n", "plt.show()"],
+            }
+        )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"cells": cells, "metadata": {}, "nbformat": 4, "nbformat_minor": 5}, f, indent=1)
+
+
+def legacy_check(root: Path) -> int:
+    """Previous full-load check; returns notebooks with outputs."""
+    found = 0
+    for nb_path in root.rglob("*.ipynb"):
+        with open(nb_path, "r", encoding="utf-8") as f:
+            notebook = json.load(f)
+        found += any(
+            cell.get("outputs") or cell.get("execution_count")
+            for cell in notebook.get("cells", [])
+            if cell.get("cell_type") == "code"
+        )
+    return found
+
+
+def peak_mb(fn) -> float:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(count: int, size_mb: int) -> None:
+    config = HygieneConfig()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(count):
+            write_notebook(root / "notebooks" / f"analysis_{i}.ipynb", size_mb)
+        report = root / "reports" / "notebook_sanitizer.md"
+        sample = root / "notebooks" / "analysis_0.ipynb"
+
+        legacy, legacy_found = timed(lambda: legacy_check(root))
+        print(f"legacy     {legacy * 1000:9.1f}ms  with outputs={legacy_found}")
+
+        cold, found = timed(lambda: check_notebooks(root, config, report))
+        print(f"cold       {cold * 1000:9.1f}ms  with outputs={len(found)}")
+
+        write_notebook(sample, size_mb)
+        warm, found = timed(lambda: check_notebooks(root, config, report))
+        print(f"warm       {warm * 1000:9.1f}ms  with outputs={len(found)}")
+        print(f"speedup    {legacy / cold:.1f}x cold, {legacy / warm:.1f}x warm")
+
+        def load():
+            with open(sample, "r", encoding="utf-8") as f:
+                json.load(f)
+
+        print(f"peak mem   json.load {peak_mb(load):.1f}MB, streaming {peak_mb(lambda: scan_notebook(sample)):.1f}MB "
+              f"(notebook {sample.stat().st_size / (1024 * 1024):.1f}MB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--notebooks", type=int, default=10)
+    parser.add_argument("--mb", type=int, default=20, help="Approximate size of each notebook")
+    args = parser.parse_args()
+    main(args.notebooks, args.mb)
@@ -0,0 +1,106 @@
+"""
+Benchmark: steward orphan scan on a synthetic repository.
+
+Compares:
+
+- legacy: one rglob + full read of every .py/.md file per orphan candidate
+  (previous find_references)
+- cold: scan_orphans with an empty reference index cache
+- warm: a repeat scan after touching a handful of files
+
+Run:
+    python perf/steward/bench_orphan_scan.py --files 1500
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.steward.config import HygieneConfig  # noqa: E402
+from src.steward.scanner import scan_orphans  # noqa: E402
+
+OLD = time.time() - 90 * 86400
+
+
+def build_repo(root: Path, files: int) -> None:
+    """Python modules importing their neighbours, docs naming data files, and stray assets."""
+    for i in range(files):
+        kind = i % 3
+        if kind == 0:
+            path = root / "src" / f"pkg{i % 20}" / f"module_{i}.py"
+            body = f"from .module_{i - 3} import thing\n" + "x = 1  # filler\n" * 200
+        elif kind == 1:
+            path = root / "notes" / f"note_{i}.md"
+            body = f"Uses assets/asset_{i + 1}.csv\n" + "Lorem ipsum dolor sit amet.\n" * 200
+        else:
+            path = root / "assets" / f"asset_{i}.csv"
+            body = "a,b,c\n" * 50
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body)
+        os.utime(path, (OLD, OLD))
+
+
+def legacy_scan(root: Path, search_exts: list) -> int:
+    """Previous per-candidate reference search; returns the orphan count."""
+    orphans = 0
+    for file_path in root.rglob("*"):
+        if not file_path.is_file() or any(part.startswith(".") for part in file_path.relative_to(root).parts):
+            continue
+        count = 0
+        for ext in search_exts:
+            for search_file in root.rglob(f"*{ext}"):
+                if search_file == file_path:
+                    continue
+                with open(search_file, "r", encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+                if file_path.name in content or str(file_path.relative_to(root)) in content:
+                    count += 1
+        orphans += count == 0
+    return orphans
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(files: int, skip_legacy: bool) -> None:
+    config = HygieneConfig()
+    config.config["whitelist_globs"] = []
+    search_exts = config.get("orphan_detection.reference_extensions")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_repo(root, files)
+        output = root / ".reports" / "orphans.csv"
+
+        if not skip_legacy:
+            legacy, legacy_orphans = timed(lambda: legacy_scan(root, search_exts))
+            print(f"legacy     {legacy * 1000:9.1f}ms  orphans={legacy_orphans}")
+
+        cold, orphans = timed(lambda: scan_orphans(root, config, output))
+        print(f"cold       {cold * 1000:9.1f}ms  orphans={len(orphans)}")
+
+        for i in range(0, 30, 3):
+            path = root / "src" / f"pkg{i % 20}" / f"module_{i}.py"
+            path.write_text(path.read_text() + "# touched\n")
+            os.utime(path, (OLD + 1, OLD + 1))
+        warm, orphans = timed(lambda: scan_orphans(root, config, output))
+        print(f"warm       {warm * 1000:9.1f}ms  orphans={len(orphans)}")
+
+        if not skip_legacy:
+            print(f"speedup    {legacy / cold:.1f}x cold, {legacy / warm:.1f}x warm")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=1500)
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the indexed scan")
+    args = parser.parse_args()
+    main(args.files, args.skip_legacy)
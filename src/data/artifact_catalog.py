@@ -0,0 +1,379 @@
+"""
+Artifact catalog for run outputs under artifacts/{run_id}/.
+
+Artifacts are recorded in a SQLite index (artifacts/.catalog.db) when
+they are written, so browsing does not have to walk and stat every file
+on disk. Per-run counts and sizes are maintained by triggers in the
+`runs` table, which makes run listings and storage totals independent
+of the total number of artifact files.
+
+Writers record their own files. Readers call ensure_indexed(), which
+backfills the existing tree the first time and afterwards re-indexes any
+run directory whose mtime differs from when it was last indexed, so runs
+written outside packaging appear once a file is added or removed. Files
+rewritten in place leave the directory mtime unchanged; a full index_all()
+picks those up. Re-indexing hashes only files whose size or mtime changed.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CATALOG_FILENAME = ".catalog.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    run_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    artifact_type TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (run_id, path)
+);
+
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    artifact_count INTEGER NOT NULL DEFAULT 0,
+    total_bytes INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT
+);
+
+-- Run directory mtime at its last index_run
+CREATE TABLE IF NOT EXISTS run_dirs (
+    run_id TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS artifacts_after_insert AFTER INSERT ON artifacts BEGIN
+    INSERT INTO runs (run_id, artifact_count, total_bytes, updated_at)
+    VALUES (NEW.run_id, 1, NEW.size_bytes, NEW.created_at)
+    ON CONFLICT (run_id) DO UPDATE SET
+        artifact_count = artifact_count + 1,
+        total_bytes = total_bytes + NEW.size_bytes,
+        updated_at = max(coalesce(updated_at, ''), NEW.created_at);
+END;
+
+CREATE TRIGGER IF NOT EXISTS artifacts_after_update AFTER UPDATE ON artifacts BEGIN
+    UPDATE runs SET
+        total_bytes = total_bytes - OLD.size_bytes + NEW.size_bytes,
+        updated_at = max(coalesce(updated_at, ''), NEW.created_at)
+    WHERE run_id = NEW.run_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS artifacts_after_delete AFTER DELETE ON artifacts BEGIN
+    UPDATE runs SET
+        artifact_count = artifact_count - 1,
+        total_bytes = total_bytes - OLD.size_bytes
+    WHERE run_id = OLD.run_id;
+END;
+"""
+
+
+def artifact_type_for(path: Path) -> str:
+    """Display type for an artifact, derived from its suffix."""
+    return path.suffix.upper().replace(".", "") or "FILE"
+
+
+def hash_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactCatalog:
+    """SQLite index of run artifacts with cached per-run and global totals."""
+
+    def __init__(self, root: Path = Path("artifacts"), db_path: Optional[Path] = None):
+        """
+        Initialize catalog.
+
+        Args:
+            root: Artifacts root containing one directory per run
+            db_path: SQLite file (defaults to {root}/.catalog.db)
+        """
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path or root / CATALOG_FILENAME
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        # Storage totals, valid while PRAGMA data_version is unchanged
+        self._totals: Optional[Dict[str, int]] = None
+        self._totals_version: Optional[int] = None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _row_for(self, run_id: str, file_path: Path, known: Optional[sqlite3.Row] = None) -> tuple:
+        """Catalog row for a file, reusing the known hash if size and mtime are unchanged."""
+        stat = file_path.stat()
+        created_at = datetime.fromtimestamp(stat.st_mtime).isoformat()
+        if known is not None and known["size_bytes"] == stat.st_size and known["created_at"] == created_at:
+            sha256 = known["sha256"]
+        else:
+            sha256 = hash_file(file_path)
+        return (
+            run_id,
+            file_path.relative_to(self.root / run_id).as_posix(),
+            stat.st_size,
+            artifact_type_for(file_path),
+            sha256,
+            created_at,
+        )
+
+    def _upsert(self, rows: List[tuple]) -> None:
+        self._conn.executemany(
+            """
+            INSERT INTO artifacts (run_id, path, size_bytes, artifact_type, sha256, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (run_id, path) DO UPDATE SET
+                size_bytes = excluded.size_bytes,
+                artifact_type = excluded.artifact_type,
+                sha256 = excluded.sha256,
+                created_at = excluded.created_at
+            """,
+            rows,
+        )
+
+    def record(self, run_id: str, file_path: Path) -> Dict[str, Any]:
+        """
+        Record (or refresh) an artifact that was just written.
+
+        Args:
+            run_id: Run the artifact belongs to
+            file_path: Path of the file under {root}/{run_id}/
+
+        Returns:
+            The catalog entry
+        """
+        row = self._row_for(run_id, file_path)
+        with self._lock, self._conn:
+            self._upsert([row])
+            self._totals = None
+        return dict(zip(("run_id", "path", "size_bytes", "artifact_type", "sha256", "created_at"), row))
+
+    def remove(self, run_id: str, path: str) -> None:
+        """Remove an artifact from the catalog."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM artifacts WHERE run_id = ? AND path = ?", (run_id, path))
+            self._totals = None
+
+    def index_run(self, run_id: str) -> int:
+        """
+        Re-index one run directory, replacing its catalog entries.
+
+        Files whose size and mtime match their catalog entry keep the
+        recorded hash; only new or changed files are hashed.
+
+        Returns:
+            Number of artifacts indexed
+        """
+        run_dir = self.root / run_id
+        with self._lock:
+            known = {
+                row["path"]: row
+                for row in self._conn.execute(
+                    "SELECT path, size_bytes, sha256, created_at FROM artifacts WHERE run_id = ?", (run_id,)
+                )
+            }
+
+        try:
+            # Taken before listing, so files added during the scan re-index next time
+            dir_mtime_ns: Optional[int] = run_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime_ns = None
+
+        rows, changed = [], []
+        if dir_mtime_ns is not None and run_dir.is_dir():
+            for p in sorted(run_dir.iterdir()):
+                if not p.is_file():
+                    continue
+                entry = known.get(p.name)
+                row = self._row_for(run_id, p, entry)
+                rows.append(row)
+                if entry is None or (entry["size_bytes"], entry["sha256"], entry["created_at"]) != (
+                    row[2], row[4], row[5]
+                ):
+                    changed.append(row)
+        gone = known.keys() - {row[1] for row in rows}
+
+        with self._lock, self._conn:
+            if dir_mtime_ns is not None and run_dir.is_dir():
+                self._conn.executemany(
+                    "DELETE FROM artifacts WHERE run_id = ? AND path = ?", [(run_id, path) for path in gone]
+                )
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO runs (run_id, updated_at) VALUES (?, ?)",
+                    (run_id, datetime.now().isoformat()),
+                )
+                self._upsert(changed)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO run_dirs (run_id, mtime_ns) VALUES (?, ?)",
+                    (run_id, dir_mtime_ns),
+                )
+            else:
+                self._conn.execute("DELETE FROM artifacts WHERE run_id = ?", (run_id,))
+                self._conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+                self._conn.execute("DELETE FROM run_dirs WHERE run_id = ?", (run_id,))
+            self._totals = None
+        return len(rows)
+
+    def index_all(self) -> int:
+        """
+        Index every run directory under the root (used for backfill).
+
+        Blocking: hashes every new or changed file. Call it from a worker
+        thread in async code.
+
+        Returns:
+            Number of artifacts indexed
+        """
+        count = 0
+        for run_dir in sorted(self.root.iterdir()):
+            if run_dir.is_dir():
+                count += self.index_run(run_dir.name)
+        self._set_meta("indexed_at", datetime.now().isoformat())
+        return count
+
+    def ensure_indexed(self) -> None:
+        """
+        Bring the catalog up to date with run directories added, removed or
+        changed since they were last indexed.
+
+        Backfills the whole tree if this catalog has never been indexed;
+        otherwise stats each run directory and re-indexes those whose mtime
+        differs from the recorded one. Blocking, like index_all().
+        """
+        if self._get_meta("indexed_at") is None:
+            self.index_all()
+            return
+
+        with self._lock:
+            known = dict(self._conn.execute("SELECT run_id, mtime_ns FROM run_dirs").fetchall())
+            catalogued = {row[0] for row in self._conn.execute("SELECT run_id FROM runs")}
+        on_disk = {}
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    on_disk[entry.name] = entry.stat().st_mtime_ns
+
+        stale = [run_id for run_id, mtime_ns in on_disk.items() if known.get(run_id) != mtime_ns]
+        stale.extend((known.keys() | catalogued) - on_disk.keys())
+        for run_id in sorted(stale):
+            self.index_run(run_id)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def list_runs(self, offset: int = 0, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Page of runs, newest run ID first, with cached counts and sizes.
+
+        Returns:
+            List of dicts with run_id, artifact_count, total_bytes, updated_at
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM runs ORDER BY run_id DESC LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def list_artifacts(self, run_id: str, offset: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Page of artifacts for one run, ordered by path.
+
+        Returns:
+            List of catalog entries
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM artifacts WHERE run_id = ? ORDER BY path LIMIT ? OFFSET ?",
+                (run_id, limit, offset),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Cached totals for one run, or None if unknown."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    def totals(self) -> Dict[str, int]:
+        """
+        Storage totals across all runs.
+
+        Cached until this or another connection commits a change.
+
+        Returns:
+            Dict with runs, artifacts and total_bytes
+        """
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._totals is None or self._totals_version != version:
+                row = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(artifact_count), 0), COALESCE(SUM(total_bytes), 0) FROM runs"
+                ).fetchone()
+                self._totals = {"runs": row[0], "artifacts": row[1], "total_bytes": row[2]}
+                self._totals_version = version
+            return dict(self._totals)
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+
+# Catalog instances per artifacts root
+_catalogs: Dict[Path, ArtifactCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_artifact_catalog(root: Path = Path("artifacts")) -> ArtifactCatalog:
+    """
+    Get the catalog for an artifacts root.
+
+    Args:
+        root: Artifacts root directory
+
+    Returns:
+        ArtifactCatalog instance
+    """
+    key = root.resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = ArtifactCatalog(root)
+        return catalog
@@ -5,6 +5,7 @@ Governance module for data quality, model performance, and platform health monit
 from .profiling import profile_dataset, profile_model, detect_drift, persist_profile
 from .runner import run_nightly, rebuild_snapshot, load_latest_profile
 from .flags import is_enabled, get_all_flags, set_flag, unset_flag
+from .scorecard import ScorecardTracker, get_scorecard_tracker
 
 __all__ = [
     "profile_dataset",
@@ -18,4 +19,6 @@ __all__ = [
     "get_all_flags",
     "set_flag",
     "unset_flag",
+    "ScorecardTracker",
+    "get_scorecard_tracker",
 ]
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Dict, List, Any
 
 from .profiling import profile_dataset, profile_model, persist_profile, detect_drift
+from .scorecard import ScorecardTracker
 
 
 def load_latest_profile(kind: str, name: str, profiles_dir: Path = Path("governance/profiles")) -> Dict[str, Any] | None:
@@ -179,6 +180,10 @@ def run_nightly(
     with open(snapshot_path, "w") as f:
         json.dump(snapshot, f, indent=2)
 
+    # Record today's KPIs in the daily rollup behind /trends, so days on
+    # which nobody opens the scorecard still get a point
+    ScorecardTracker(governance_dir=profiles_dir.parent).compute(force=True)
+
     return summary
 
 
@@ -0,0 +1,378 @@
+"""
+Incremental governance scorecard.
+
+The profile and audit logs (governance/profiles/*.ndjson,
+governance/audit/flags.ndjson) are append-only and grow forever. Instead
+of re-parsing them on every request, ScorecardTracker remembers the byte
+offset it has read up to in each file, parses only newly appended lines,
+and keeps the small rolling windows each index needs:
+
+- data quality: per-profile scores from the last 24 hours, plus the
+  last 10 as a fallback
+- model performance: the last 10 model profiles
+- security compliance: flag changes from the last 7 days
+
+Computed scorecards are cached for a short TTL, and each computation is
+folded into a compact daily rollup (governance/rollups/daily.json) that
+backs the trends endpoint.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+KPI_NAMES = (
+    "data_quality_index",
+    "model_performance_index",
+    "platform_reliability_index",
+    "security_compliance_index",
+)
+
+
+class NdjsonTail:
+    """Reads only the lines appended to an NDJSON file since the last call."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._offset = 0
+        self._inode: Optional[int] = None
+
+    def read_new(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Parse complete lines appended since the previous call.
+
+        Returns:
+            (entries, reset) where reset is True if the file was replaced
+            or truncated and entries were re-read from the start.
+        """
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            reset = self._offset > 0
+            self._offset, self._inode = 0, None
+            return [], reset
+
+        reset = False
+        if self._inode is not None and (stat.st_ino != self._inode or stat.st_size < self._offset):
+            self._offset = 0
+            reset = True
+        self._inode = stat.st_ino
+
+        if stat.st_size == self._offset:
+            return [], reset
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read(stat.st_size - self._offset)
+
+        # Leave a partially written last line for the next read
+        end = chunk.rfind(b"\n") + 1
+        self._offset += end
+
+        entries = []
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return entries, reset
+
+
+def _dataset_profile_score(profile: Dict[str, Any]) -> float:
+    """Quality score (0-100) for a single dataset profile."""
+    stats = profile.get("stats", {})
+    columns = stats.get("columns_detail", {})
+
+    # Null percentage (inverted - lower is better)
+    avg_null_pct = sum(col.get("null_pct", 0) for col in columns.values()) / max(len(columns), 1)
+    null_score = max(0, 100 - avg_null_pct)
+
+    # Duplicate percentage (inverted)
+    dup_score = max(0, 100 - stats.get("duplicate_pct", 0))
+
+    return null_score * 0.6 + dup_score * 0.4
+
+
+def _parse_timestamp(entry: Dict[str, Any]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(entry["timestamp"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class ScorecardTracker:
+    """Maintains governance KPIs incrementally from the append-only logs."""
+
+    def __init__(
+        self,
+        governance_dir: Path = Path("governance"),
+        cleanliness_file: Path = Path("reports/cleanliness/latest_score.json"),
+        ops_metrics_file: Path = Path("perf/metrics/latest.json"),
+        ttl_seconds: float = 30.0,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            governance_dir: Root of profiles/, audit/ and rollups/
+            cleanliness_file: Latest cleanliness score artifact
+            ops_metrics_file: Latest ops metrics artifact
+            ttl_seconds: How long a computed scorecard is reused
+        """
+        self.governance_dir = governance_dir
+        self.cleanliness_file = cleanliness_file
+        self.ops_metrics_file = ops_metrics_file
+        self.ttl_seconds = ttl_seconds
+        self.rollup_file = governance_dir / "rollups" / "daily.json"
+
+        self._lock = threading.Lock()
+        self._datasets_tail = NdjsonTail(governance_dir / "profiles" / "datasets.ndjson")
+        self._models_tail = NdjsonTail(governance_dir / "profiles" / "models.ndjson")
+        self._flags_tail = NdjsonTail(governance_dir / "audit" / "flags.ndjson")
+        self._reset_windows()
+
+        self._cached: Optional[Dict[str, Any]] = None
+        self._cached_at = 0.0
+
+    def _reset_windows(self) -> None:
+        # (timestamp, score) for dataset profiles inside the 24h window
+        self._dataset_window: Deque[Tuple[datetime, float]] = deque()
+        self._dataset_window_sum = 0.0
+        self._dataset_last: Deque[float] = deque(maxlen=10)
+        self._model_last: Deque[Dict[str, Any]] = deque(maxlen=10)
+        self._flag_window: Deque[datetime] = deque()
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def _ingest(self) -> None:
+        """Fold newly appended log lines into the rolling windows."""
+        datasets, reset = self._datasets_tail.read_new()
+        if reset:
+            self._dataset_window.clear()
+            self._dataset_window_sum = 0.0
+            self._dataset_last.clear()
+        for profile in datasets:
+            score = _dataset_profile_score(profile)
+            self._dataset_last.append(score)
+            ts = _parse_timestamp(profile)
+            if ts is not None:
+                self._dataset_window.append((ts, score))
+                self._dataset_window_sum += score
+
+        models, reset = self._models_tail.read_new()
+        if reset:
+            self._model_last.clear()
+        self._model_last.extend(models)
+
+        flags, reset = self._flags_tail.read_new()
+        if reset:
+            self._flag_window.clear()
+        for entry in flags:
+            ts = _parse_timestamp(entry)
+            if ts is not None:
+                self._flag_window.append(ts)
+
+    def _evict(self, now: datetime) -> None:
+        """Drop entries that have left their time windows."""
+        cutoff = now - timedelta(days=1)
+        while self._dataset_window and self._dataset_window[0][0] <= cutoff:
+            _, score = self._dataset_window.popleft()
+            self._dataset_window_sum -= score
+
+        cutoff = now - timedelta(days=7)
+        while self._flag_window and self._flag_window[0] <= cutoff:
+            self._flag_window.popleft()
+
+    # ------------------------------------------------------------------
+    # Indices
+    # ------------------------------------------------------------------
+
+    def _data_quality_index(self) -> float:
+        if self._dataset_window:
+            avg_score = self._dataset_window_sum / len(self._dataset_window)
+        elif self._dataset_last:
+            avg_score = sum(self._dataset_last) / len(self._dataset_last)
+        else:
+            return 0.0
+
+        # Add cleanliness bonus if available
+        cleanliness = self._read_json(self.cleanliness_file)
+        if cleanliness is not None:
+            avg_score = avg_score * 0.7 + cleanliness.get("4S_total", 0) * 0.3
+
+        return round(avg_score, 1)
+
+    def _model_performance_index(self) -> float:
+        if not self._model_last:
+            return 75.0  # Default if no data
+
+        total_score = 0.0
+        count = 0
+        with_metrics = 0
+        for profile in self._model_last:
+            metrics = profile.get("stats", {}).get("metrics", {})
+            if not metrics:
+                continue
+            with_metrics += 1
+
+            score = 0.0
+            # R2 score (higher is better)
+            r2 = metrics.get("r2")
+            if r2 is not None:
+                score += max(0, r2 * 100)
+                count += 1
+            # RMSE (lower is better; rmse < 0.2 is excellent)
+            rmse = metrics.get("rmse")
+            if rmse is not None:
+                score += max(0, (1 - min(rmse / 0.2, 1)) * 100)
+                count += 1
+            # Accuracy (if available)
+            accuracy = metrics.get("accuracy")
+            if accuracy is not None:
+                score += accuracy * 100
+                count += 1
+
+            if count > 0:
+                total_score += score / count
+
+        if count == 0:
+            return 75.0
+        return round(total_score / with_metrics, 1)
+
+    def _platform_reliability_index(self) -> float:
+        metrics = self._read_json(self.ops_metrics_file)
+        if metrics is None:
+            return 85.0  # Default optimistic score
+
+        score = 100.0
+        # Latency (p95 < 400ms target)
+        latency = metrics.get("latency_p95_ms", 200)
+        if latency > 400:
+            score -= min(30, (latency - 400) / 10)
+        # Error rate (< 1% target)
+        error_rate = metrics.get("error_rate_pct", 0.1)
+        if error_rate > 1.0:
+            score -= min(20, (error_rate - 1.0) * 10)
+        # Cache hit rate (> 80% target)
+        cache_hit = metrics.get("cache_hit_rate_pct", 85)
+        if cache_hit < 80:
+            score -= min(15, (80 - cache_hit) / 2)
+
+        return round(max(0, score), 1)
+
+    def _security_compliance_index(self) -> float:
+        # More flag changes in the last week = slightly lower score
+        base_score = 95.0
+        changes = len(self._flag_window)
+        if changes > 20:
+            base_score -= min(10, (changes - 20) * 0.5)
+        return round(base_score, 1)
+
+    @staticmethod
+    def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+        if not path.exists():
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def compute(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Get the current scorecard, recomputing it if the cache expired.
+
+        Args:
+            force: Ignore the TTL cache
+
+        Returns:
+            Dict with the four KPI indices and a timestamp
+        """
+        with self._lock:
+            if (
+                not force
+                and self._cached is not None
+                and time.monotonic() - self._cached_at < self.ttl_seconds
+            ):
+                return dict(self._cached)
+
+            now = datetime.utcnow()
+            self._ingest()
+            self._evict(now)
+
+            scorecard = {
+                "data_quality_index": self._data_quality_index(),
+                "model_performance_index": self._model_performance_index(),
+                "platform_reliability_index": self._platform_reliability_index(),
+                "security_compliance_index": self._security_compliance_index(),
+                "timestamp": now.isoformat(),
+            }
+            self._record_daily(now.strftime("%Y-%m-%d"), scorecard)
+
+            self._cached = scorecard
+            self._cached_at = time.monotonic()
+            return dict(scorecard)
+
+    def trends(self, days: int) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Daily KPI values for the most recent `days` days with data.
+
+        Returns:
+            Dict of KPI name -> list of {"date", "value"}, oldest first
+        """
+        rollup = self._load_rollup()
+        dates = sorted(rollup)[-days:]
+        return {
+            name: [{"date": d, "value": rollup[d][name]} for d in dates if name in rollup[d]]
+            for name in KPI_NAMES
+        }
+
+    def _load_rollup(self) -> Dict[str, Dict[str, float]]:
+        if not self.rollup_file.exists():
+            return {}
+        try:
+            with open(self.rollup_file) as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            return {}
+
+    def _record_daily(self, date: str, scorecard: Dict[str, Any]) -> None:
+        """Store the latest KPI values for `date` in the daily rollup."""
+        values = {name: scorecard[name] for name in KPI_NAMES}
+        rollup = self._load_rollup()
+        if rollup.get(date) == values:
+            return
+        rollup[date] = values
+
+        self.rollup_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.rollup_file.with_name(f".{self.rollup_file.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(rollup, f, indent=2, sort_keys=True)
+        temp_path.replace(self.rollup_file)
+
+
+# Global tracker instance
+_tracker: Optional[ScorecardTracker] = None
+
+
+def get_scorecard_tracker() -> ScorecardTracker:
+    """
+    Get the global scorecard tracker.
+
+    Returns:
+        ScorecardTracker instance
+    """
+    global _tracker
+    if _tracker is None:
+        _tracker = ScorecardTracker()
+    return _tracker
@@ -9,6 +9,8 @@ from .metrics import (
     isochrone_requests_total,
     orchestrator_phase_seconds,
     orchestrator_agent_retries_total,
+    MetricsSampler,
+    get_metrics_sampler,
 )
 
 __all__ = [
@@ -22,4 +24,6 @@ __all__ = [
     "isochrone_requests_total",
     "orchestrator_phase_seconds",
     "orchestrator_agent_retries_total",
+    "MetricsSampler",
+    "get_metrics_sampler",
 ]
@@ -8,8 +8,17 @@ Provides counters, gauges, and histograms for:
 - Isochrone requests by provider
 - Orchestrator phase duration
 - Agent retries
+
+MetricsSampler snapshots a subset of these into fixed-size ring buffers
+so dashboards can read rates and p95s without re-serializing the registry.
 """
 
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
 try:
     from prometheus_client import (
         Counter,
@@ -171,3 +180,212 @@ def get_content_type() -> str:
         return CONTENT_TYPE_LATEST
     else:
         return "text/plain"
+
+
+def _collect_samples(metric) -> List[Any]:
+    """Flatten the samples of a metric (empty for dummy metrics)."""
+    if not PROMETHEUS_AVAILABLE:
+        return []
+    return [sample for family in metric.collect() for sample in family.samples]
+
+
+def histogram_quantile(q: float, buckets: Dict[float, float]) -> float:
+    """
+    Estimate a quantile from cumulative histogram bucket counts.
+
+    Uses the same linear interpolation as PromQL's histogram_quantile.
+
+    Args:
+        q: Quantile in [0, 1]
+        buckets: Upper bound -> cumulative count (must include +Inf)
+
+    Returns:
+        Estimated quantile value, or 0.0 if there are no observations
+    """
+    bounds = sorted(buckets)
+    if not bounds:
+        return 0.0
+    total = buckets[bounds[-1]]
+    if total <= 0:
+        return 0.0
+
+    rank = q * total
+    prev_bound, prev_count = 0.0, 0.0
+    for bound in bounds:
+        count = buckets[bound]
+        if count >= rank:
+            if bound == float("inf"):
+                return prev_bound
+            if count == prev_count:
+                return bound
+            return prev_bound + (bound - prev_bound) * (rank - prev_count) / (count - prev_count)
+        prev_bound, prev_count = bound, count
+    return prev_bound
+
+
+class MetricsSampler:
+    """
+    Periodically snapshots counters and histograms into ring buffers.
+
+    Each sample holds values precomputed over the preceding interval
+    (request rate, p95 latency) plus cumulative ratios, so readers pay a
+    constant cost regardless of how many series the registry holds.
+    """
+
+    def __init__(self, interval_seconds: float = 10.0, size: int = 60):
+        """
+        Initialize sampler.
+
+        Args:
+            interval_seconds: Seconds between samples
+            size: Number of samples kept per series
+        """
+        self.interval_seconds = interval_seconds
+        self.size = size
+        self._samples: Deque[Dict[str, Any]] = deque(maxlen=size)
+        self._previous: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _read_totals(self) -> Dict[str, Any]:
+        """Read the current cumulative values of the sampled metrics."""
+        requests = sum(
+            s.value for s in _collect_samples(http_requests_total) if s.name.endswith("_total")
+        )
+
+        latency_buckets: Dict[float, float] = {}
+        for s in _collect_samples(http_request_latency):
+            if s.name.endswith("_bucket"):
+                bound = float(s.labels["le"])
+                latency_buckets[bound] = latency_buckets.get(bound, 0.0) + s.value
+
+        hits = sum(s.value for s in _collect_samples(cache_hits_total) if s.name.endswith("_total"))
+        misses = sum(s.value for s in _collect_samples(cache_misses_total) if s.name.endswith("_total"))
+
+        phase_sum: Dict[str, float] = {}
+        phase_count: Dict[str, float] = {}
+        for s in _collect_samples(orchestrator_phase_seconds):
+            phase = s.labels.get("phase")
+            if s.name.endswith("_sum"):
+                phase_sum[phase] = s.value
+            elif s.name.endswith("_count"):
+                phase_count[phase] = s.value
+
+        return {
+            "requests": requests,
+            "latency_buckets": latency_buckets,
+            "cache_hits": hits,
+            "cache_misses": misses,
+            "phase_averages": {
+                phase: phase_sum.get(phase, 0.0) / count
+                for phase, count in phase_count.items()
+                if count > 0
+            },
+        }
+
+    def sample(self, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Take one snapshot and append it to the ring buffer.
+
+        The first call only records a baseline.
+
+        Args:
+            now: Timestamp of the sample (defaults to time.time())
+
+        Returns:
+            The appended sample, or None for the baseline call
+        """
+        now = time.time() if now is None else now
+        totals = self._read_totals()
+        totals["timestamp"] = now
+
+        with self._lock:
+            previous, self._previous = self._previous, totals
+            if previous is None:
+                return None
+
+            elapsed = max(now - previous["timestamp"], 1e-9)
+            interval_buckets = {
+                bound: max(0.0, count - previous["latency_buckets"].get(bound, 0.0))
+                for bound, count in totals["latency_buckets"].items()
+            }
+            cache_ops = totals["cache_hits"] + totals["cache_misses"]
+
+            entry = {
+                "timestamp": now,
+                "request_rate": max(0.0, totals["requests"] - previous["requests"]) / elapsed,
+                "p95_latency_seconds": histogram_quantile(0.95, interval_buckets),
+                "cache_hit_ratio": totals["cache_hits"] / cache_ops if cache_ops > 0 else 0.0,
+                "orchestrator_phase_durations": totals["phase_averages"],
+            }
+            self._samples.append(entry)
+            return entry
+
+    def series(self, name: str) -> List[Any]:
+        """
+        Get one field of every buffered sample, oldest first.
+
+        Args:
+            name: Sample field (e.g. "request_rate", "p95_latency_seconds")
+
+        Returns:
+            List of values
+        """
+        with self._lock:
+            return [entry[name] for entry in self._samples]
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Get the most recent sample, if any."""
+        with self._lock:
+            return dict(self._samples[-1]) if self._samples else None
+
+    def start(self) -> None:
+        """Start sampling in a background daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="metrics-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.sample()
+            except Exception:
+                # Never let a bad sample kill the sampler thread
+                continue
+
+
+# Global sampler instance
+_sampler: Optional[MetricsSampler] = None
+
+
+def get_metrics_sampler() -> MetricsSampler:
+    """
+    Get the global metrics sampler.
+
+    The interval and buffer size come from METRICS_SAMPLE_INTERVAL_SECONDS
+    (default 10) and METRICS_SAMPLE_SIZE (default 60). The API server
+    starts and stops it in its lifespan.
+
+    Returns:
+        MetricsSampler instance
+    """
+    global _sampler
+
+    if _sampler is None:
+        _sampler = MetricsSampler(
+            interval_seconds=float(os.environ.get("METRICS_SAMPLE_INTERVAL_SECONDS", "10")),
+            size=int(os.environ.get("METRICS_SAMPLE_SIZE", "60")),
+        )
+
+    return _sampler
@@ -1252,6 +1252,9 @@ def release_prepare(
     skip_gates: Optional[List[str]] = typer.Option(
         None, "--skip-gate", help="Gate to skip (can be repeated)"
     ),
+    fail_fast: bool = typer.Option(
+        False, "--fail-fast", help="Cancel remaining gates after the first blocking failure"
+    ),
 ):
     """
     Prepare release: version bump, changelog, quality gates.
@@ -1280,13 +1283,21 @@ def release_prepare(
                 console.print("Valid options: major, minor, patch")
                 return
 
+        def show_gate_progress(gate):
+            cached = " (cached)" if gate.cached else ""
+            console.print(f"  [dim]{gate.gate_name}: {gate.status.value}{cached}[/dim]")
+
         # Prepare release
+        console.print("[bold]Running quality gates...[/bold]")
         plan = prepare_release(
             project_root=Path.cwd(),
             bump_type=bump_type,
             prerelease=prerelease,
             skip_gates=skip_gates,
+            fail_fast=fail_fast,
+            on_gate_result=show_gate_progress,
         )
+        console.print()
 
         # Show version bump
         console.print("[bold]Version:[/bold]")
@@ -5,9 +5,11 @@ This package provides:
 - Runtime metrics tracking (metrics.py - existing)
 - DORA metrics calculation (dora_metrics.py)
 - GitHub collaboration metrics (github_metrics.py)
+- Incremental GitHub PR sync (github_sync.py)
 - AI review impact metrics (ai_review_impact.py)
 - Contribution analysis (contribution_analyzer.py)
 - Metrics aggregation and trending (aggregator.py)
+- Time-series store backing aggregator rollups (timeseries.py)
 """
 
 from pathlib import Path
@@ -13,9 +13,14 @@ Inputs:
 - .claude/metrics/contributions/*.json
 - .claude/metrics/ai_review/*.json
 
+Inputs are ingested once per change into the time-series store
+(.claude/metrics/timeseries.db, see timeseries.py); rollup windows are
+served from it as cached aggregate queries.
+
 Outputs:
 - .claude/metrics/aggregated/weekly_summary.json
 - .claude/metrics/aggregated/monthly_summary.json
+- .claude/metrics/aggregated/quarterly_summary.json
 - .claude/metrics/aggregated/trends.json
 """
 
@@ -28,8 +33,48 @@ from collections import defaultdict
 import logging
 import statistics
 
+from .timeseries import MetricsTimeSeriesStore
+
 logger = logging.getLogger(__name__)
 
+# Snapshot files per source: (path under the metrics dir, {summary key: metric name})
+SNAPSHOT_SOURCES = {
+    "dora": [
+        ("dora/deployments.json", {"deploys_per_week": "deployment_frequency"}),
+        ("dora/lead_time.json", {"median_lead_time_hours": "lead_time_hours"}),
+        ("dora/mttr.json", {"median_resolution_time_hours": "mttr_hours"}),
+        ("dora/change_failure_rate.json", {"failure_rate": "change_failure_rate"}),
+    ],
+    "github": [
+        (
+            "github/pull_requests.json",
+            {"median_cycle_time_hours": "pr_cycle_time_hours", "merge_rate": "merge_rate"},
+        ),
+        ("github/conflicts.json", {"conflict_rate": "conflict_rate"}),
+        ("github/velocity.json", {"avg_features_per_week": "features_per_week"}),
+    ],
+    "contributions": [
+        (
+            "contributions/attribution.json",
+            {
+                "human_percentage": "human_percentage",
+                "ai_percentage": "ai_percentage",
+                "collaborative_percentage": "collaborative_percentage",
+            },
+        ),
+    ],
+    "ai_review": [
+        (
+            "ai_review/impact.json",
+            {
+                "review_coverage": "review_coverage",
+                "avg_suggestions_per_pr": "avg_suggestions_per_pr",
+                "avg_acceptance_rate": "avg_acceptance_rate",
+            },
+        ),
+    ],
+}
+
 
 @dataclass
 class WeeklySummary:
@@ -53,6 +98,17 @@ class MonthlySummary:
     trends: Dict[str, float] = field(default_factory=dict)
 
 
+@dataclass
+class QuarterlySummary:
+    """Quarterly metrics summary"""
+
+    quarter_id: str
+    quarter_start: str
+    quarter_end: str
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    trends: Dict[str, float] = field(default_factory=dict)
+
+
 @dataclass
 class TrendAnalysis:
     """Trend analysis for a metric"""
@@ -83,28 +139,28 @@ class MetricsAggregator:
         self.output_dir = self.metrics_dir / "aggregated"
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        self.store = MetricsTimeSeriesStore(self.metrics_dir / "timeseries.db")
+
         logger.info(f"Initialized metrics aggregator with base: {self.metrics_dir}")
 
-    def _load_json(self, filepath: Path) -> Optional[Dict]:
+    def ingest_snapshots(self) -> int:
         """
-        Load JSON file safely.
-
-        Args:
-            filepath: Path to JSON file
+        Append collector snapshot files that changed since the last ingest.
 
         Returns:
-            Parsed JSON dict or None if error
+            Number of samples appended
         """
-        try:
-            if not filepath.exists():
-                logger.debug(f"File not found: {filepath}")
-                return None
-
-            with open(filepath, "r") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Could not load {filepath}: {e}")
-            return None
+        appended = 0
+        for source, snapshots in SNAPSHOT_SOURCES.items():
+            for relative_path, fields in snapshots:
+                appended += self.store.ingest_snapshot(source, self.metrics_dir / relative_path, fields)
+        if appended:
+            logger.debug(f"Ingested {appended} metric samples")
+        return appended
+
+    def _rollup(self, start: datetime, end: datetime) -> Dict[str, Dict]:
+        """Metrics of every source for a window, served by the time-series store."""
+        return {source: self.store.window(source, start, end) for source in SNAPSHOT_SOURCES}
 
     def _calculate_trend(
         self, current: float, previous: float, threshold: float = 10.0
@@ -188,6 +244,7 @@ class MetricsAggregator:
         """
         logger.info(f"Aggregating weekly metrics (last {weeks_back} weeks)")
 
+        self.ingest_snapshots()
         weekly_summaries = []
 
         # Generate week ranges
@@ -197,13 +254,7 @@ class MetricsAggregator:
             week_start = week_end - timedelta(days=6)
             week_id = week_start.strftime("%Y-W%U")
 
-            # Load metrics for this week
-            metrics = {
-                "dora": self._aggregate_dora_for_week(week_start, week_end),
-                "github": self._aggregate_github_for_week(week_start, week_end),
-                "contributions": self._aggregate_contributions_for_week(week_start, week_end),
-                "ai_review": self._aggregate_ai_review_for_week(week_start, week_end),
-            }
+            metrics = self._rollup(week_start, week_end)
 
             # Calculate trends (week-over-week)
             trends = {}
@@ -241,6 +292,7 @@ class MetricsAggregator:
         """
         logger.info(f"Aggregating monthly metrics (last {months_back} months)")
 
+        self.ingest_snapshots()
         monthly_summaries = []
 
         # Generate month ranges
@@ -251,13 +303,7 @@ class MetricsAggregator:
             month_start = datetime(month_end.year, month_end.month, 1)
             month_id = month_start.strftime("%Y-%m")
 
-            # Load metrics for this month
-            metrics = {
-                "dora": self._aggregate_dora_for_month(month_start, month_end),
-                "github": self._aggregate_github_for_month(month_start, month_end),
-                "contributions": self._aggregate_contributions_for_month(month_start, month_end),
-                "ai_review": self._aggregate_ai_review_for_month(month_start, month_end),
-            }
+            metrics = self._rollup(month_start, month_end)
 
             # Calculate trends (month-over-month)
             trends = {}
@@ -283,105 +329,58 @@ class MetricsAggregator:
         logger.info(f"Aggregated {len(monthly_summaries)} months")
         return monthly_summaries
 
-    def _aggregate_dora_for_week(self, week_start: datetime, week_end: datetime) -> Dict:
-        """Aggregate DORA metrics for a week"""
-        # Load DORA metrics files
-        deployments = self._load_json(self.metrics_dir / "dora" / "deployments.json")
-        lead_time = self._load_json(self.metrics_dir / "dora" / "lead_time.json")
-        mttr = self._load_json(self.metrics_dir / "dora" / "mttr.json")
-        cfr = self._load_json(self.metrics_dir / "dora" / "change_failure_rate.json")
-
-        summary = {}
-
-        if deployments:
-            summary["deployment_frequency"] = deployments.get("summary", {}).get(
-                "deploys_per_week", 0
-            )
-
-        if lead_time:
-            summary["lead_time_hours"] = lead_time.get("summary", {}).get(
-                "median_lead_time_hours", 0
-            )
-
-        if mttr:
-            summary["mttr_hours"] = mttr.get("summary", {}).get("median_resolution_time_hours", 0)
-
-        if cfr:
-            summary["change_failure_rate"] = cfr.get("summary", {}).get("failure_rate", 0)
-
-        return summary
-
-    def _aggregate_github_for_week(self, week_start: datetime, week_end: datetime) -> Dict:
-        """Aggregate GitHub metrics for a week"""
-        prs = self._load_json(self.metrics_dir / "github" / "pull_requests.json")
-        conflicts = self._load_json(self.metrics_dir / "github" / "conflicts.json")
-        velocity = self._load_json(self.metrics_dir / "github" / "velocity.json")
-
-        summary = {}
-
-        if prs:
-            summary["pr_cycle_time_hours"] = prs.get("summary", {}).get(
-                "median_cycle_time_hours", 0
-            )
-            summary["merge_rate"] = prs.get("summary", {}).get("merge_rate", 0)
-
-        if conflicts:
-            summary["conflict_rate"] = conflicts.get("summary", {}).get("conflict_rate", 0)
-
-        if velocity:
-            summary["features_per_week"] = velocity.get("summary", {}).get(
-                "avg_features_per_week", 0
-            )
-
-        return summary
+    def aggregate_quarterly(self, quarters_back: int = 4) -> List[QuarterlySummary]:
+        """
+        Aggregate metrics by calendar quarter.
 
-    def _aggregate_contributions_for_week(self, week_start: datetime, week_end: datetime) -> Dict:
-        """Aggregate contribution metrics for a week"""
-        contrib = self._load_json(self.metrics_dir / "contributions" / "attribution.json")
+        Args:
+            quarters_back: Number of quarters to aggregate (including the current one)
 
-        summary = {}
+        Returns:
+            List of QuarterlySummary objects, newest first
+        """
+        logger.info(f"Aggregating quarterly metrics (last {quarters_back} quarters)")
 
-        if contrib:
-            summary["human_percentage"] = contrib.get("summary", {}).get("human_percentage", 0)
-            summary["ai_percentage"] = contrib.get("summary", {}).get("ai_percentage", 0)
-            summary["collaborative_percentage"] = contrib.get("summary", {}).get(
-                "collaborative_percentage", 0
-            )
+        self.ingest_snapshots()
+        quarterly_summaries = []
 
-        return summary
+        now = datetime.now()
+        year, quarter = now.year, (now.month - 1) // 3
+        for i in range(quarters_back):
+            quarter_start = datetime(year, quarter * 3 + 1, 1)
+            next_start = datetime(year + (quarter == 3), (quarter + 1) % 4 * 3 + 1, 1)
+            quarter_end = next_start - timedelta(days=1)
 
-    def _aggregate_ai_review_for_week(self, week_start: datetime, week_end: datetime) -> Dict:
-        """Aggregate AI review impact for a week"""
-        impact = self._load_json(self.metrics_dir / "ai_review" / "impact.json")
+            metrics = self._rollup(quarter_start, quarter_end)
 
-        summary = {}
+            # Calculate trends (quarter-over-quarter)
+            trends = {}
+            if i > 0 and quarterly_summaries:
+                prev_summary = quarterly_summaries[-1]
+                trends = self._calculate_weekly_trends(metrics, prev_summary.metrics)
 
-        if impact:
-            summary["review_coverage"] = impact.get("summary", {}).get("review_coverage", 0)
-            summary["avg_suggestions_per_pr"] = impact.get("summary", {}).get(
-                "avg_suggestions_per_pr", 0
+            quarterly_summaries.append(
+                QuarterlySummary(
+                    quarter_id=f"{year}-Q{quarter + 1}",
+                    quarter_start=quarter_start.strftime("%Y-%m-%d"),
+                    quarter_end=quarter_end.strftime("%Y-%m-%d"),
+                    metrics=metrics,
+                    trends=trends,
+                )
             )
-            summary["avg_acceptance_rate"] = impact.get("summary", {}).get("avg_acceptance_rate", 0)
 
-        return summary
+            if quarter == 0:
+                year, quarter = year - 1, 3
+            else:
+                quarter -= 1
 
-    def _aggregate_dora_for_month(self, month_start: datetime, month_end: datetime) -> Dict:
-        """Aggregate DORA metrics for a month"""
-        return self._aggregate_dora_for_week(month_start, month_end)
-
-    def _aggregate_github_for_month(self, month_start: datetime, month_end: datetime) -> Dict:
-        """Aggregate GitHub metrics for a month"""
-        return self._aggregate_github_for_week(month_start, month_end)
-
-    def _aggregate_contributions_for_month(
-        self, month_start: datetime, month_end: datetime
-    ) -> Dict:
-        """Aggregate contribution metrics for a month"""
-        return self._aggregate_contributions_for_week(month_start, month_end)
+        # Save to JSON
+        output_file = self.output_dir / "quarterly_summary.json"
+        with open(output_file, "w") as f:
+            json.dump([asdict(s) for s in quarterly_summaries], f, indent=2)
 
-    def _aggregate_ai_review_for_month(self, month_start: datetime, month_end: datetime) -> Dict:
-        """Aggregate AI review impact for a month"""
-        return self._aggregate_ai_review_for_week(month_start, month_end)
+        logger.info(f"Aggregated {len(quarterly_summaries)} quarters")
+        return quarterly_summaries
 
     def _calculate_weekly_trends(self, current: Dict, previous: Dict) -> Dict:
         """Calculate week-over-week trends"""
@@ -467,13 +466,16 @@ class MetricsAggregator:
         logger.info(f"Analyzed {len(trends)} metric trends")
         return trends
 
-    def aggregate_all(self, weeks_back: int = 12, months_back: int = 6) -> Dict:
+    def aggregate_all(
+        self, weeks_back: int = 12, months_back: int = 6, quarters_back: int = 4
+    ) -> Dict:
         """
         Run all aggregation tasks.
 
         Args:
             weeks_back: Number of weeks to aggregate
             months_back: Number of months to aggregate
+            quarters_back: Number of quarters to aggregate
 
         Returns:
             Dictionary with all aggregation results
@@ -484,6 +486,7 @@ class MetricsAggregator:
 
         weekly = self.aggregate_weekly(weeks_back)
         monthly = self.aggregate_monthly(months_back)
+        quarterly = self.aggregate_quarterly(quarters_back)
         trends = self.analyze_trends(weeks_back)
 
         logger.info("=" * 60)
@@ -493,6 +496,7 @@ class MetricsAggregator:
         return {
             "weekly_summaries": len(weekly),
             "monthly_summaries": len(monthly),
+            "quarterly_summaries": len(quarterly),
             "trends_analyzed": len(trends),
         }
 
@@ -508,6 +512,9 @@ def main():
     parser.add_argument(
         "--months", type=int, default=6, help="Number of months to aggregate (default: 6)"
     )
+    parser.add_argument(
+        "--quarters", type=int, default=4, help="Number of quarters to aggregate (default: 4)"
+    )
     parser.add_argument("--output", type=Path, help="Metrics directory (default: .claude/metrics/)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
@@ -525,7 +532,9 @@ def main():
             project_root=args.output.parent.parent if args.output else None
         )
 
-        aggregator.aggregate_all(weeks_back=args.weeks, months_back=args.months)
+        aggregator.aggregate_all(
+            weeks_back=args.weeks, months_back=args.months, quarters_back=args.quarters
+        )
 
     except Exception as e:
         logger.error(f"Aggregation failed: {e}")
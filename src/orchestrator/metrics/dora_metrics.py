@@ -7,6 +7,11 @@ Calculates DevOps Research & Assessment (DORA) metrics from git history:
 - Mean Time to Recovery (MTTR): Time to restore service after incident
 - Change Failure Rate: % of deployments requiring hotfix
 
+All four metrics are derived from one GitHistoryIndex per report, built
+from a single streaming git log pass and cached by commit SHA in
+.claude/metrics/dora/history_cache.json, so repeat reports only scan new
+commits.
+
 Based on DORA research: https://dora.dev/research/
 """
 
@@ -83,6 +88,191 @@ class ChangeFailureRateMetrics:
     summary: Dict = field(default_factory=dict)
 
 
+class GitHistoryIndex:
+    """
+    Commit and tag index built from streaming git log passes.
+
+    Persisted to a JSON cache keyed by commit SHA: each commit's first parent,
+    author date and decorations, each semver tag's commit, and the tag each
+    commit first shipped in (walking first parents back to the previous
+    tag). A refresh lists tags once and logs only commits not reachable from
+    tags already indexed, so later reports only process new history.
+    """
+
+    CACHE_VERSION = 1
+    SEMVER_TAG = re.compile(r"v?\d+\.\d+\.\d+")
+
+    def __init__(self, project_root: Path, cache_file: Path):
+        """
+        Initialize history index.
+
+        Args:
+            project_root: Root directory of git repository
+            cache_file: JSON file the index is persisted to
+        """
+        self.project_root = Path(project_root)
+        self.cache_file = Path(cache_file)
+        self.commits: Dict[str, Dict] = {}  # sha -> {"parent", "time", "refs"}
+        self.tags: Dict[str, str] = {}  # tag name -> commit sha
+        self.deployed_in: Dict[str, str] = {}  # commit sha -> tag that shipped it
+        self.tag_commits: Dict[str, List[str]] = {}  # tag name -> shipped commits, newest first
+        self.commits_scanned = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable DORA history cache: {e}")
+            return
+        if data.get("version") != self.CACHE_VERSION:
+            return
+        self.commits = data["commits"]
+        self.tags = data["tags"]
+        self.tag_commits = data["tag_commits"]
+        self.deployed_in = {sha: tag for tag, shas in self.tag_commits.items() for sha in shas}
+
+    def _save(self) -> None:
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.cache_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump(
+                {
+                    "version": self.CACHE_VERSION,
+                    "commits": self.commits,
+                    "tags": self.tags,
+                    "tag_commits": self.tag_commits,
+                },
+                f,
+            )
+        temp_file.replace(self.cache_file)
+
+    def _git_lines(self, args: List[str]):
+        """Stream stdout lines of a git command."""
+        process = subprocess.Popen(
+            ["git"] + args,
+            cwd=self.project_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            for line in process.stdout:
+                yield line.rstrip("\n")
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read()
+            process.stderr.close()
+            if process.wait() != 0:
+                logger.error(f"Git command failed: {stderr.strip()}")
+
+    def _list_tags(self) -> Dict[str, str]:
+        """Semver tags mapped to the commit they point at (annotated tags peeled)."""
+        tags = {}
+        for line in self._git_lines(
+            ["for-each-ref", "refs/tags", "--format=%(refname:short)|%(objectname)|%(*objectname)"]
+        ):
+            name, obj, peeled = line.split("|")
+            if self.SEMVER_TAG.match(name):
+                tags[name] = peeled or obj
+        return tags
+
+    def refresh(self) -> "GitHistoryIndex":
+        """Index commits and tags added since the cache was written."""
+        self.commits_scanned = 0
+        current = self._list_tags()
+        rebuild = any(current.get(name) != sha for name, sha in self.tags.items())
+        if rebuild:
+            # A tag was moved or deleted: cached assignments may be wrong
+            logger.info("Tags changed since last DORA scan, rebuilding history index")
+            self.commits, self.tags, self.deployed_in, self.tag_commits = {}, {}, {}, {}
+
+        new_tags = {name: sha for name, sha in current.items() if name not in self.tags}
+        if not new_tags:
+            if rebuild:
+                self._save()
+            return self
+
+        tips = sorted(set(new_tags.values()) - set(self.commits))
+        if tips:
+            args = ["log", "--topo-order", "--pretty=format:%H|%P|%ai|%D"] + tips
+            known_tips = sorted(set(self.tags.values()))
+            if known_tips:
+                args += ["--not"] + known_tips
+            for line in self._git_lines(args):
+                sha, parents, timestamp, refs = line.split("|", 3)
+                self.commits[sha] = {
+                    "parent": parents.split(" ")[0] if parents else None,
+                    "time": timestamp,
+                    "refs": refs,
+                }
+                self.commits_scanned += 1
+        new_tags = {name: sha for name, sha in new_tags.items() if sha in self.commits}
+
+        newest_known = max((self.commits[sha]["time"] for sha in self.tags.values()), default=None)
+        self.tags.update(new_tags)
+        if newest_known and any(self.commits[sha]["time"] < newest_known for sha in new_tags.values()):
+            # Tag added behind existing releases: reassign everything
+            self.deployed_in, self.tag_commits = {}, {}
+            self._assign(self.tags)
+        else:
+            self._assign(new_tags)
+
+        self._save()
+        return self
+
+    def _assign(self, tags: Dict[str, str]) -> None:
+        """Walk first parents from each tag (oldest first) to the previous release."""
+        for name, sha in sorted(tags.items(), key=lambda item: (self.commits[item[1]]["time"], item[0])):
+            shipped = []
+            while sha and sha in self.commits and sha not in self.deployed_in:
+                self.deployed_in[sha] = name
+                shipped.append(sha)
+                sha = self.commits[sha]["parent"]
+            self.tag_commits[name] = shipped
+
+    def deployments(self, since: datetime) -> List[Deployment]:
+        """One deployment per tagged commit with an author date on or after since, newest first."""
+        by_commit: Dict[str, str] = {}
+        for name in sorted(self.tags):
+            by_commit.setdefault(self.tags[name], name)
+
+        deployments = []
+        for sha, name in by_commit.items():
+            commit = self.commits[sha]
+            timestamp = _parse_git_time(commit["time"])
+            if timestamp is None or timestamp < since:
+                continue
+            refs = commit["refs"]
+            branch = "main"
+            if "origin/main" in refs or "main" in refs:
+                branch = "main"
+            elif "origin/master" in refs or "master" in refs:
+                branch = "master"
+            deployments.append(Deployment(version=name, timestamp=timestamp, commit_sha=sha, branch=branch))
+
+        deployments.sort(key=lambda d: d.timestamp, reverse=True)
+        return deployments
+
+    def shipped_commits(self, tag: str) -> List[Tuple[str, datetime]]:
+        """Commits first released by tag, newest first, with their author dates."""
+        return [
+            (sha, _parse_git_time(self.commits[sha]["time"]))
+            for sha in self.tag_commits.get(tag, [])
+        ]
+
+
+def _parse_git_time(value: str) -> Optional[datetime]:
+    """Parse git's %ai format, dropping the UTC offset like the rest of this module."""
+    try:
+        return datetime.fromisoformat(value.strip()[:19])
+    except ValueError:
+        return None
+
+
 class DORAMetricsCalculator:
     """Calculate DORA metrics from git history"""
 
@@ -131,6 +321,8 @@ class DORAMetricsCalculator:
         if not (self.project_root / ".git").exists():
             raise ValueError(f"Not a git repository: {self.project_root}")
 
+        self._history: Optional[GitHistoryIndex] = None
+
     def _run_git_command(self, args: List[str]) -> str:
         """
         Run git command and return output.
@@ -150,6 +342,22 @@ class DORAMetricsCalculator:
             logger.error(f"Git command failed: {e.stderr}")
             return ""
 
+    def _load_history(self) -> GitHistoryIndex:
+        """History index shared by all metrics of this report, refreshed once."""
+        if self._history is None:
+            self._history = GitHistoryIndex(
+                self.project_root, self.output_dir / "history_cache.json"
+            ).refresh()
+            logger.debug(f"Indexed {self._history.commits_scanned} new commit(s)")
+        return self._history
+
+    def _deployments(self) -> List[Deployment]:
+        """Semver-tagged deployments inside the analysis window, newest first."""
+        since = datetime.strptime(
+            (datetime.now() - timedelta(days=self.days_back)).strftime("%Y-%m-%d"), "%Y-%m-%d"
+        )
+        return self._load_history().deployments(since)
+
     def _parse_semver(self, tag: str) -> Optional[Tuple[int, int, int]]:
         """
         Parse semantic version tag.
@@ -258,53 +466,7 @@ class DORAMetricsCalculator:
         """
         logger.info(f"Collecting deployment frequency (last {self.days_back} days)")
 
-        # Get all tags with timestamps (semver pattern only)
-        since_date = (datetime.now() - timedelta(days=self.days_back)).strftime("%Y-%m-%d")
-        git_output = self._run_git_command(
-            [
-                "log",
-                "--tags",
-                "--simplify-by-decoration",
-                "--pretty=format:%ai|%H|%D",
-                f"--since={since_date}",
-            ]
-        )
-
-        deployments = []
-        for line in git_output.split("\n"):
-            if not line or "tag:" not in line:
-                continue
-
-            parts = line.split("|")
-            if len(parts) < 3:
-                continue
-
-            timestamp_str, commit_sha, refs = parts
-
-            # Extract tag name
-            tag_match = re.search(r"tag:\s*(v?\d+\.\d+\.\d+[^\s,]*)", refs)
-            if not tag_match:
-                continue
-
-            tag_name = tag_match.group(1)
-
-            # Parse timestamp
-            try:
-                timestamp = datetime.strptime(timestamp_str.strip()[:19], "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                continue
-
-            # Determine branch (look for branch in refs)
-            branch = "main"
-            if "origin/main" in refs or "main" in refs:
-                branch = "main"
-            elif "origin/master" in refs or "master" in refs:
-                branch = "master"
-
-            deployment = Deployment(
-                version=tag_name, timestamp=timestamp, commit_sha=commit_sha.strip(), branch=branch
-            )
-            deployments.append(deployment)
+        deployments = self._deployments()
 
         # Calculate summary statistics
         total_deployments = len(deployments)
@@ -357,37 +519,9 @@ class DORAMetricsCalculator:
         """
         logger.info(f"Calculating lead time for changes (last {self.days_back} days)")
 
-        # Get deployments (tags)
         since_date = (datetime.now() - timedelta(days=self.days_back)).strftime("%Y-%m-%d")
-        tags_output = self._run_git_command(
-            [
-                "log",
-                "--tags",
-                "--simplify-by-decoration",
-                "--pretty=format:%ai|%H|%D",
-                f"--since={since_date}",
-            ]
-        )
-
-        tags = []
-        for line in tags_output.split("\n"):
-            if not line or "tag:" not in line:
-                continue
-
-            parts = line.split("|")
-            if len(parts) < 3:
-                continue
-
-            timestamp_str, commit_sha, refs = parts
-            tag_match = re.search(r"tag:\s*(v?\d+\.\d+\.\d+[^\s,]*)", refs)
-            if not tag_match:
-                continue
-
-            try:
-                timestamp = datetime.strptime(timestamp_str.strip()[:19], "%Y-%m-%d %H:%M:%S")
-                tags.append((tag_match.group(1), timestamp, commit_sha.strip()))
-            except ValueError:
-                continue
+        tags = self._deployments()
+        history = self._load_history()
 
         if len(tags) < 2:
             logger.warning("Need at least 2 deployments to calculate lead time")
@@ -397,39 +531,25 @@ class DORAMetricsCalculator:
                 summary={"median_lead_time_hours": 0, "p95_lead_time_hours": 0, "rating": "low"},
             )
 
-        # For each deployment, get commits since previous deployment
+        # For each deployment, the commits it shipped since the previous deployment
         measurements = []
-        for i in range(len(tags) - 1):
-            curr_tag, curr_time, _ = tags[i]
-            prev_tag, _, _ = tags[i + 1]
-
-            # Get commits between tags
-            commits_output = self._run_git_command(
-                ["log", f"{prev_tag}..{curr_tag}", "--pretty=format:%H|%ai", "--first-parent"]
-            )
+        for deployment in tags[:-1]:
+            curr_tag, curr_time = deployment.version, deployment.timestamp
 
-            for commit_line in commits_output.split("\n"):
-                if not commit_line:
+            for commit_sha, commit_time in history.shipped_commits(curr_tag):
+                if commit_time is None:
                     continue
+                lead_time_hours = (curr_time - commit_time).total_seconds() / 3600
 
-                commit_sha, commit_time_str = commit_line.split("|")
-                try:
-                    commit_time = datetime.strptime(
-                        commit_time_str.strip()[:19], "%Y-%m-%d %H:%M:%S"
-                    )
-                    lead_time_hours = (curr_time - commit_time).total_seconds() / 3600
-
-                    measurements.append(
-                        {
-                            "commit_sha": commit_sha,
-                            "commit_time": commit_time.isoformat(),
-                            "deployment_version": curr_tag,
-                            "deployment_time": curr_time.isoformat(),
-                            "lead_time_hours": round(lead_time_hours, 2),
-                        }
-                    )
-                except ValueError:
-                    continue
+                measurements.append(
+                    {
+                        "commit_sha": commit_sha,
+                        "commit_time": commit_time.isoformat(),
+                        "deployment_version": curr_tag,
+                        "deployment_time": curr_time.isoformat(),
+                        "lead_time_hours": round(lead_time_hours, 2),
+                    }
+                )
 
         # Calculate summary statistics
         if measurements:
@@ -472,55 +592,22 @@ class DORAMetricsCalculator:
         """
         logger.info(f"Calculating MTTR (last {self.days_back} days)")
 
-        # Get all tags with timestamps
         since_date = (datetime.now() - timedelta(days=self.days_back)).strftime("%Y-%m-%d")
-        tags_output = self._run_git_command(
-            [
-                "log",
-                "--tags",
-                "--simplify-by-decoration",
-                "--pretty=format:%ai|%H|%D",
-                f"--since={since_date}",
-            ]
-        )
-
-        tags = []
-        for line in tags_output.split("\n"):
-            if not line or "tag:" not in line:
-                continue
-
-            parts = line.split("|")
-            if len(parts) < 3:
-                continue
-
-            timestamp_str, commit_sha, refs = parts
-            tag_match = re.search(r"tag:\s*(v?\d+\.\d+\.\d+[^\s,]*)", refs)
-            if not tag_match:
-                continue
-
-            try:
-                timestamp = datetime.strptime(timestamp_str.strip()[:19], "%Y-%m-%d %H:%M:%S")
-                tags.append((tag_match.group(1), timestamp, commit_sha.strip()))
-            except ValueError:
-                continue
+        tags = self._deployments()
+        history = self._load_history()
 
         # Detect hotfixes
         incidents = []
         for i in range(len(tags) - 1):
-            curr_tag, curr_time, curr_sha = tags[i]
-            prev_tag, prev_time, _ = tags[i + 1]
+            curr_tag, curr_time = tags[i].version, tags[i].timestamp
+            prev_tag, prev_time = tags[i + 1].version, tags[i + 1].timestamp
 
             time_diff = curr_time - prev_time
 
             if self._is_hotfix(curr_tag, prev_tag, time_diff):
                 # This is a hotfix - calculate MTTR
                 mttr_hours = time_diff.total_seconds() / 3600
-
-                # Get hotfix commits
-                commits_output = self._run_git_command(
-                    ["log", f"{prev_tag}..{curr_tag}", "--pretty=format:%H", "--first-parent"]
-                )
-                hotfix_commits = [c for c in commits_output.split("\n") if c]
+                hotfix_commits = [sha for sha, _ in history.shipped_commits(curr_tag)]
 
                 incidents.append(
                     {
@@ -570,45 +657,16 @@ class DORAMetricsCalculator:
         """
         logger.info(f"Calculating change failure rate (last {self.days_back} days)")
 
-        # Get all tags
         since_date = (datetime.now() - timedelta(days=self.days_back)).strftime("%Y-%m-%d")
-        tags_output = self._run_git_command(
-            [
-                "log",
-                "--tags",
-                "--simplify-by-decoration",
-                "--pretty=format:%ai|%H|%D",
-                f"--since={since_date}",
-            ]
-        )
-
-        tags = []
-        for line in tags_output.split("\n"):
-            if not line or "tag:" not in line:
-                continue
-
-            parts = line.split("|")
-            if len(parts) < 3:
-                continue
-
-            timestamp_str, commit_sha, refs = parts
-            tag_match = re.search(r"tag:\s*(v?\d+\.\d+\.\d+[^\s,]*)", refs)
-            if not tag_match:
-                continue
-
-            try:
-                timestamp = datetime.strptime(timestamp_str.strip()[:19], "%Y-%m-%d %H:%M:%S")
-                tags.append((tag_match.group(1), timestamp, commit_sha.strip()))
-            except ValueError:
-                continue
+        tags = self._deployments()
 
         total_deployments = len(tags)
         failed_deployments = 0
 
         # Count hotfixes
         for i in range(len(tags) - 1):
-            curr_tag, curr_time, _ = tags[i]
-            prev_tag, prev_time, _ = tags[i + 1]
+            curr_tag, curr_time = tags[i].version, tags[i].timestamp
+            prev_tag, prev_time = tags[i + 1].version, tags[i + 1].timestamp
 
             time_diff = curr_time - prev_time
 
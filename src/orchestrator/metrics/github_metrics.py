@@ -9,6 +9,8 @@ Collects collaboration metrics from GitHub API:
 Requires GITHUB_TOKEN environment variable for API access.
 """
 
+from __future__ import annotations
+
 import os
 import json
 import asyncio
@@ -520,6 +522,11 @@ async def main():
     parser.add_argument(
         "--output", type=Path, help="Output directory (default: .claude/metrics/github/)"
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Sync PR cycle time and conflicts incrementally over the REST API (skips velocity)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
@@ -531,12 +538,25 @@ async def main():
     )
 
     # Run collection
+    project_root = args.output.parent.parent.parent if args.output else None
     try:
+        if args.incremental:
+            from .github_sync import IncrementalGitHubCollector
+
+            sync_collector = IncrementalGitHubCollector(
+                repo_name=args.repo,
+                token=args.token,
+                days_back=args.days,
+                project_root=project_root,
+            )
+            await sync_collector.sync()
+            return
+
         collector = GitHubMetricsCollector(
             repo_name=args.repo,
             token=args.token,
             days_back=args.days,
-            project_root=args.output.parent.parent.parent if args.output else None,
+            project_root=project_root,
         )
 
         await collector.collect_all()
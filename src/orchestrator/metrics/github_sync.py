@@ -0,0 +1,509 @@
+"""
+Incremental GitHub PR Metrics Collector
+
+Replaces the serial PyGithub walk in github_metrics.py for PR cycle time
+and merge conflict metrics:
+
+- Persists a sync cursor (newest PR updated_at seen) and ETags in
+  .claude/metrics/github/sync_state.json, so each run only lists PRs
+  updated since the last sync and sends conditional requests (a 304
+  does not count against the rate limit)
+- Fetches per-PR details and issue events concurrently with a bounded
+  pool, pausing when X-RateLimit-Remaining runs low and honouring
+  Retry-After on secondary rate limits
+- Writes the same pull_requests.json / conflicts.json files as
+  GitHubMetricsCollector, so the aggregator is unchanged
+
+Uses httpx; pass `transport` (e.g. the RecordedTransport in
+perf/metrics/_github_fixtures.py) to run offline against recorded responses.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from .github_metrics import ConflictMetrics, PRCycleTimeMetrics, PRMetrics
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+EVENTS_PER_PAGE = 100
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO-8601 timestamp ('Z' suffix) into an aware datetime."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _next_link(response: httpx.Response) -> Optional[str]:
+    """URL of the next page from a Link header, if any."""
+    next_link = response.links.get("next")
+    return next_link["url"] if next_link else None
+
+
+@dataclass
+class SyncState:
+    """Persisted state between incremental syncs."""
+
+    repo: str = ""
+    cursor: Optional[str] = None  # newest PR updated_at already synced
+    list_etag: Optional[str] = None  # ETag of the first page of the PR listing
+    # PR number -> {"updated_at", "pr", "conflict", "detail_etag", "events_page"}
+    prs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path, repo: str) -> "SyncState":
+        """Load state for repo, or a fresh state if missing or for another repo."""
+        if path.exists():
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                if data.get("repo") == repo:
+                    return cls(**data)
+            except (json.JSONDecodeError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable sync state {path}: {e}")
+        return cls(repo=repo)
+
+    def save(self, path: Path) -> None:
+        """Atomically write state to path."""
+        temp_path = path.with_suffix(".json.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(asdict(self), f, indent=2)
+        temp_path.replace(path)
+
+
+class RateLimiter:
+    """Tracks GitHub rate-limit headers and delays requests when exhausted."""
+
+    def __init__(self, reserve: int = 50, max_wait_seconds: float = 900.0):
+        """
+        Initialize rate limiter.
+
+        Args:
+            reserve: Pause once X-RateLimit-Remaining drops to this value
+            max_wait_seconds: Longest single pause before giving up
+        """
+        self.reserve = reserve
+        self.max_wait_seconds = max_wait_seconds
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def update(self, response: httpx.Response) -> None:
+        """Record the rate-limit headers of a response."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is not None:
+            self.remaining = int(remaining)
+        if reset is not None:
+            self.reset_at = float(reset)
+
+    def retry_after(self, response: httpx.Response) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, if it was one."""
+        if response.status_code not in (403, 429):
+            return None
+        if "Retry-After" in response.headers:
+            return float(response.headers["Retry-After"])
+        if response.headers.get("X-RateLimit-Remaining") == "0" and self.reset_at:
+            return max(0.0, self.reset_at - time.time())
+        return None
+
+    async def wait(self) -> None:
+        """Block while the remaining budget is at or below the reserve."""
+        async with self._lock:
+            if self.remaining is None or self.remaining > self.reserve or self.reset_at is None:
+                return
+            delay = self.reset_at - time.time()
+            if delay <= 0:
+                return
+            if delay > self.max_wait_seconds:
+                raise RuntimeError(
+                    f"GitHub rate limit exhausted; resets in {delay:.0f}s "
+                    f"(max wait {self.max_wait_seconds:.0f}s)"
+                )
+            logger.warning(f"API rate limit low ({self.remaining} remaining), pausing {delay:.0f}s")
+            await asyncio.sleep(delay)
+            self.remaining = None
+
+
+class IncrementalGitHubCollector:
+    """Incrementally sync PR cycle time and conflict metrics over the REST API."""
+
+    def __init__(
+        self,
+        repo_name: str,
+        token: Optional[str] = None,
+        days_back: int = 90,
+        project_root: Optional[Path] = None,
+        max_concurrency: int = 8,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        base_url: str = GITHUB_API_URL,
+        rate_limit_reserve: int = 50,
+        max_retries: int = 3,
+    ):
+        """
+        Initialize collector.
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            token: GitHub API token (default: GITHUB_TOKEN env var)
+            days_back: Number of days of history to keep (default: 90)
+            project_root: Root directory for output (default: current directory)
+            max_concurrency: Maximum in-flight per-PR requests
+            transport: Optional httpx transport (recorded fixtures for offline runs)
+            base_url: GitHub API base URL
+            rate_limit_reserve: Pause when this many requests remain
+            max_retries: Retries for rate-limited or 5xx responses
+        """
+        self.repo_name = repo_name
+        self.days_back = days_back
+        self.token = token or os.getenv("GITHUB_TOKEN")
+        self.max_concurrency = max_concurrency
+        self.transport = transport
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.rate_limiter = RateLimiter(reserve=rate_limit_reserve)
+
+        root = Path(project_root) if project_root else Path.cwd()
+        self.output_dir = root / ".claude" / "metrics" / "github"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path = self.output_dir / "sync_state.json"
+
+        # Request counters for the last sync
+        self.stats: Dict[str, int] = {}
+
+    def _client(self) -> httpx.AsyncClient:
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            transport=self.transport,
+            timeout=30.0,
+        )
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        etag: Optional[str] = None,
+    ) -> httpx.Response:
+        """GET with conditional headers, rate-limit pauses and retries."""
+        headers = {"If-None-Match": etag} if etag else {}
+
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.wait()
+            response = await client.get(url, params=params, headers=headers)
+            self.rate_limiter.update(response)
+            self.stats["requests"] = self.stats.get("requests", 0) + 1
+
+            if response.status_code == 304:
+                self.stats["not_modified"] = self.stats.get("not_modified", 0) + 1
+                return response
+
+            delay = self.rate_limiter.retry_after(response)
+            if delay is None and response.status_code >= 500:
+                delay = 2 ** attempt
+            if delay is None or attempt == self.max_retries:
+                response.raise_for_status()
+                return response
+
+            logger.warning(f"GET {url} returned {response.status_code}, retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+
+        raise RuntimeError("unreachable")
+
+    async def _list_changed_prs(
+        self,
+        client: httpx.AsyncClient,
+        state: SyncState,
+        since: datetime,
+    ) -> List[Dict[str, Any]]:
+        """Closed PRs updated after the cursor (and inside the window), newest first."""
+        cursor = _parse_time(state.cursor)
+        stop_at = max(cursor, since) if cursor else since
+
+        url: Optional[str] = f"/repos/{self.repo_name}/pulls"
+        params: Optional[Dict[str, Any]] = {
+            "state": "closed",
+            "sort": "updated",
+            "direction": "desc",
+            "per_page": 100,
+        }
+        changed: List[Dict[str, Any]] = []
+        first_page = True
+
+        while url:
+            response = await self._get(client, url, params, etag=state.list_etag if first_page else None)
+            if first_page:
+                if response.status_code == 304:
+                    return []
+                state.list_etag = response.headers.get("ETag")
+                first_page = False
+
+            done = False
+            for pr in response.json():
+                if _parse_time(pr["updated_at"]) <= stop_at:
+                    done = True
+                    break
+                changed.append(pr)
+
+            if done:
+                break
+            url, params = _next_link(response), None
+
+        return changed
+
+    async def _fetch_events(
+        self,
+        client: httpx.AsyncClient,
+        number: int,
+        last_page: Optional[Dict[str, Any]],
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        """
+        All issue events of a PR, or (None, last_page) if none were added.
+
+        Issue events are listed oldest first, so new events land on the last
+        page (or a page after it). The conditional request therefore goes to
+        the last page seen, and only a 304 for a page that was not full
+        proves nothing was added.
+
+        Args:
+            last_page: {"url", "etag", "full"} of the last page from the previous sync
+
+        Returns:
+            (events, last page of this listing)
+        """
+        if last_page:
+            response = await self._get(client, last_page["url"], etag=last_page.get("etag"))
+            if response.status_code == 304 and not last_page.get("full"):
+                return None, last_page
+
+        url: Optional[str] = f"/repos/{self.repo_name}/issues/{number}/events"
+        params: Optional[Dict[str, Any]] = {"per_page": EVENTS_PER_PAGE}
+        events: List[Dict[str, Any]] = []
+
+        while url:
+            response = await self._get(client, url, params)
+            page = response.json()
+            events.extend(page)
+            url, params = _next_link(response), None
+
+        return events, {
+            "url": str(response.url),
+            "etag": response.headers.get("ETag"),
+            "full": len(page) >= EVENTS_PER_PAGE,
+        }
+
+    @staticmethod
+    def _conflict_from_events(pr: Dict[str, Any], events: List[Dict[str, Any]]) -> Optional[Dict]:
+        """Same heuristic as GitHubMetricsCollector._detect_conflict."""
+        force_pushes = [e for e in events if e.get("event") == "head_ref_force_pushed"]
+        if not force_pushes:
+            return None
+
+        detected_at = _parse_time(force_pushes[0]["created_at"])
+        resolved_at = (
+            _parse_time(pr.get("merged_at"))
+            or _parse_time(pr.get("closed_at"))
+            or datetime.now(timezone.utc)
+        )
+        resolution_time_hours = (resolved_at - detected_at).total_seconds() / 3600
+
+        return {
+            "pr_number": pr["number"],
+            "detected_at": detected_at.isoformat(),
+            "resolved_at": resolved_at.isoformat(),
+            "resolution_time_hours": round(resolution_time_hours, 2),
+            "force_pushes": len(force_pushes),
+        }
+
+    @staticmethod
+    def _pr_metrics(pr: Dict[str, Any]) -> Dict[str, Any]:
+        """PRMetrics record from a pull request detail payload."""
+        created_at = _parse_time(pr["created_at"])
+        merged_at = _parse_time(pr.get("merged_at"))
+        closed_at = _parse_time(pr.get("closed_at"))
+        cycle_time = None
+        if merged_at and created_at:
+            cycle_time = round((merged_at - created_at).total_seconds() / 3600, 2)
+
+        return asdict(PRMetrics(
+            pr_number=pr["number"],
+            title=pr["title"],
+            opened_at=created_at.isoformat(),
+            merged_at=merged_at.isoformat() if merged_at else None,
+            closed_at=closed_at.isoformat() if closed_at else None,
+            cycle_time_hours=cycle_time,
+            commits=pr.get("commits", 0),
+            files_changed=pr.get("changed_files", 0),
+            additions=pr.get("additions", 0),
+            deletions=pr.get("deletions", 0),
+            author=(pr.get("user") or {}).get("login", "unknown"),
+            state="merged" if merged_at else "closed",
+        ))
+
+    async def _sync_pr(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        summary: Dict[str, Any],
+        previous: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Refresh one PR's detail and conflict data."""
+        number = summary["number"]
+        previous = previous or {}
+
+        async with semaphore:
+            detail_response = await self._get(
+                client, f"/repos/{self.repo_name}/pulls/{number}", etag=previous.get("detail_etag"),
+            )
+        if detail_response.status_code == 304:
+            pr_record = previous["pr"]
+            detail = None
+            detail_etag = previous.get("detail_etag")
+        else:
+            detail = detail_response.json()
+            pr_record = self._pr_metrics(detail)
+            detail_etag = detail_response.headers.get("ETag")
+
+        async with semaphore:
+            events, events_page = await self._fetch_events(
+                client, number, previous.get("events_page")
+            )
+        if events is None:
+            conflict = previous.get("conflict")
+        else:
+            conflict = self._conflict_from_events(detail or summary, events)
+
+        return {
+            "updated_at": summary["updated_at"],
+            "pr": pr_record,
+            "conflict": conflict,
+            "detail_etag": detail_etag,
+            "events_page": events_page,
+        }
+
+    async def sync(self) -> Dict[str, Any]:
+        """
+        Fetch PRs changed since the last sync and rewrite the metrics files.
+
+        Returns:
+            Dictionary with pr_cycle_time and conflicts metrics
+        """
+        since = datetime.now(timezone.utc) - timedelta(days=self.days_back)
+        state = SyncState.load(self.state_path, self.repo_name)
+        self.stats = {"requests": 0, "not_modified": 0}
+
+        async with self._client() as client:
+            changed = await self._list_changed_prs(client, state, since)
+            logger.info(f"{len(changed)} PR(s) changed since {state.cursor or 'start of window'}")
+
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            records = await asyncio.gather(*(
+                self._sync_pr(client, semaphore, pr, state.prs.get(str(pr["number"])))
+                for pr in changed
+            ))
+
+        for pr, record in zip(changed, records):
+            state.prs[str(pr["number"])] = record
+        if changed:
+            newest = max(changed, key=lambda p: _parse_time(p["updated_at"]))["updated_at"]
+            if state.cursor is None or _parse_time(newest) > _parse_time(state.cursor):
+                state.cursor = newest
+
+        # Drop PRs that left the window
+        state.prs = {
+            number: record
+            for number, record in state.prs.items()
+            if _parse_time(record["updated_at"]) >= since
+        }
+        state.save(self.state_path)
+
+        self.stats["changed_prs"] = len(changed)
+        pr_metrics, conflict_metrics = self._build_metrics(state, since)
+        logger.info(
+            f"Synced {len(changed)} PR(s) with {self.stats['requests']} request(s) "
+            f"({self.stats['not_modified']} not modified)"
+        )
+        return {
+            "pr_cycle_time": asdict(pr_metrics),
+            "conflicts": asdict(conflict_metrics),
+        }
+
+    def _build_metrics(
+        self,
+        state: SyncState,
+        since: datetime,
+    ) -> Tuple[PRCycleTimeMetrics, ConflictMetrics]:
+        """Summaries over all PRs in the window, written like GitHubMetricsCollector."""
+        # Newest first, matching the order of the API listing
+        records = sorted(state.prs.values(), key=lambda r: r["updated_at"], reverse=True)
+        pull_requests = [r["pr"] for r in records]
+        conflicts = [r["conflict"] for r in records if r.get("conflict")]
+
+        total_prs = len(pull_requests)
+        cycle_times = [p["cycle_time_hours"] for p in pull_requests if p["cycle_time_hours"] is not None]
+        merged_prs = len(cycle_times)
+        if cycle_times:
+            median_cycle_time = sorted(cycle_times)[len(cycle_times) // 2]
+            merge_rate = (merged_prs / total_prs) * 100
+        else:
+            median_cycle_time = 0
+            merge_rate = 0
+
+        if conflicts:
+            resolution_times = [c["resolution_time_hours"] for c in conflicts]
+            median_resolution = sorted(resolution_times)[len(resolution_times) // 2]
+            conflict_rate = (len(conflicts) / total_prs) * 100
+        else:
+            median_resolution = 0
+            conflict_rate = 0
+
+        period = f"{since.strftime('%Y-%m-%d')}/{datetime.now().strftime('%Y-%m-%d')}"
+        timestamp = datetime.now().isoformat()
+
+        pr_metrics = PRCycleTimeMetrics(
+            period=period,
+            collection_timestamp=timestamp,
+            pull_requests=pull_requests,
+            summary={
+                "total_prs": total_prs,
+                "merged_prs": merged_prs,
+                "median_cycle_time_hours": round(median_cycle_time, 2),
+                "merge_rate": round(merge_rate, 2),
+            },
+        )
+        conflict_metrics = ConflictMetrics(
+            period=period,
+            collection_timestamp=timestamp,
+            conflicts=conflicts,
+            summary={
+                "total_conflicts": len(conflicts),
+                "total_prs_analyzed": total_prs,
+                "median_resolution_time_hours": round(median_resolution, 2),
+                "conflict_rate": round(conflict_rate, 2),
+            },
+        )
+
+        with open(self.output_dir / "pull_requests.json", "w") as f:
+            json.dump(asdict(pr_metrics), f, indent=2)
+        with open(self.output_dir / "conflicts.json", "w") as f:
+            json.dump(asdict(conflict_metrics), f, indent=2)
+
+        return pr_metrics, conflict_metrics
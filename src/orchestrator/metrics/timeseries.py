@@ -0,0 +1,264 @@
+"""
+Metrics Time-Series Store
+
+Local SQLite store (.claude/metrics/timeseries.db) for metric samples:
+- Samples are appended per source (dora, github, contributions, ai_review)
+  and partitioned into daily sum/count/last-value rows by a trigger, so
+  window aggregates read one row per metric per day
+- Collector snapshot files are ingested once per change (tracked by path
+  and mtime), not re-parsed for every rollup bucket
+- Window rollups are cached with a watermark (the newest sample sequence
+  number at or before the window end) and recomputed only when a sample
+  lands inside or before the window
+
+A window's value for a metric is the mean of its samples inside the window,
+or the last value before the window when there are none (gauges carry
+forward until the next collection).
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, Tuple, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    day TEXT NOT NULL,
+    value REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS daily (
+    source TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    day TEXT NOT NULL,
+    total REAL NOT NULL,
+    count INTEGER NOT NULL,
+    last_ts TEXT NOT NULL,
+    last_value REAL NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (source, metric, day)
+);
+
+CREATE INDEX IF NOT EXISTS daily_source_day ON daily (source, day, seq);
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    collected_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rollups (
+    source TEXT NOT NULL,
+    start_day TEXT NOT NULL,
+    end_day TEXT NOT NULL,
+    watermark INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (source, start_day, end_day)
+);
+
+CREATE TRIGGER IF NOT EXISTS samples_after_insert AFTER INSERT ON samples BEGIN
+    INSERT INTO daily (source, metric, day, total, count, last_ts, last_value, seq)
+    VALUES (NEW.source, NEW.metric, NEW.day, NEW.value, 1, NEW.ts, NEW.value, NEW.seq)
+    ON CONFLICT (source, metric, day) DO UPDATE SET
+        total = total + NEW.value,
+        count = count + 1,
+        last_value = CASE WHEN NEW.ts >= last_ts THEN NEW.value ELSE last_value END,
+        last_ts = max(last_ts, NEW.ts),
+        seq = NEW.seq;
+END;
+"""
+
+Day = Union[date, datetime]
+
+
+def _day(value: Day) -> str:
+    return (value.date() if isinstance(value, datetime) else value).isoformat()
+
+
+class MetricsTimeSeriesStore:
+    """SQLite-backed metric samples with cached window rollups."""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize store.
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        # Rollups served from cache vs computed, for the lifetime of this store
+        self.stats = {"cached": 0, "computed": 0}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def append(self, source: str, metric: str, value: float, timestamp: datetime) -> None:
+        """Append one sample."""
+        self.append_many([(source, metric, value, timestamp)])
+
+    def append_many(self, samples: Iterable[Tuple[str, str, float, datetime]]) -> int:
+        """
+        Append samples in one transaction.
+
+        Args:
+            samples: (source, metric, value, timestamp) tuples
+
+        Returns:
+            Number of samples appended
+        """
+        rows = [
+            (source, metric, timestamp.isoformat(), _day(timestamp), float(value))
+            for source, metric, value, timestamp in samples
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO samples (source, metric, ts, day, value) VALUES (?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def ingest_snapshot(self, source: str, path: Path, fields: Dict[str, str]) -> int:
+        """
+        Append the summary values of a collector snapshot file once.
+
+        The file is skipped without parsing while its mtime is unchanged, and
+        not re-appended if it was rewritten with the same collection_timestamp.
+
+        Args:
+            source: Metric source (e.g. 'dora')
+            path: Snapshot JSON file with 'summary' and 'collection_timestamp'
+            fields: Mapping of summary key to stored metric name
+
+        Returns:
+            Number of samples appended
+        """
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+        key = str(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, collected_at FROM snapshots WHERE path = ?", (key,)
+            ).fetchone()
+        if row and row["mtime_ns"] == mtime_ns:
+            return 0
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not load {path}: {e}")
+            return 0
+
+        collected_at = data.get("collection_timestamp") or datetime.fromtimestamp(
+            mtime_ns / 1e9
+        ).isoformat()
+        try:
+            timestamp = datetime.fromisoformat(collected_at)
+        except ValueError:
+            timestamp = datetime.fromtimestamp(mtime_ns / 1e9)
+
+        appended = 0
+        if not row or row["collected_at"] != collected_at:
+            summary = data.get("summary", {})
+            appended = self.append_many(
+                (source, metric, summary.get(summary_key, 0), timestamp)
+                for summary_key, metric in fields.items()
+                if isinstance(summary.get(summary_key, 0), (int, float))
+            )
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots (path, mtime_ns, collected_at) VALUES (?, ?, ?)",
+                (key, mtime_ns, collected_at),
+            )
+        return appended
+
+    def window(self, source: str, start: Day, end: Day) -> Dict[str, float]:
+        """
+        Metric values of a source for the inclusive day window [start, end].
+
+        Args:
+            source: Metric source
+            start: First day of the window
+            end: Last day of the window
+
+        Returns:
+            Dictionary of metric name to value
+        """
+        start_day, end_day = _day(start), _day(end)
+
+        with self._lock:
+            watermark = self._conn.execute(
+                "SELECT coalesce(max(seq), 0) FROM daily WHERE source = ? AND day <= ?",
+                (source, end_day),
+            ).fetchone()[0]
+            cached = self._conn.execute(
+                "SELECT watermark, payload FROM rollups WHERE source = ? AND start_day = ? AND end_day = ?",
+                (source, start_day, end_day),
+            ).fetchone()
+            if cached and cached["watermark"] == watermark:
+                self.stats["cached"] += 1
+                return json.loads(cached["payload"])
+
+            values = {
+                row["metric"]: round(row["value"], 2)
+                for row in self._conn.execute(
+                    """
+                    SELECT d.metric, d.last_value AS value FROM daily d
+                    WHERE d.source = ? AND d.day = (
+                        SELECT max(day) FROM daily
+                        WHERE source = d.source AND metric = d.metric AND day < ?
+                    )
+                    """,
+                    (source, start_day),
+                )
+            }
+            for row in self._conn.execute(
+                """
+                SELECT metric, sum(total) / sum(count) AS value FROM daily
+                WHERE source = ? AND day BETWEEN ? AND ?
+                GROUP BY metric
+                """,
+                (source, start_day, end_day),
+            ):
+                values[row["metric"]] = round(row["value"], 2)
+
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rollups (source, start_day, end_day, watermark, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (source, start_day, end_day, watermark, json.dumps(values)),
+                )
+            self.stats["computed"] += 1
+            return values
+
+    def series(self, source: str, metric: str) -> Iterable[Tuple[str, float]]:
+        """Daily (day, mean value) points for one metric, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, total / count AS value FROM daily WHERE source = ? AND metric = ? ORDER BY day",
+                (source, metric),
+            ).fetchall()
+        return [(row["day"], row["value"]) for row in rows]
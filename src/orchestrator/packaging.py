@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from ..data.artifact_catalog import get_artifact_catalog
+
 
 def package_phase_artifacts(
     phase_name: str,
@@ -72,6 +74,8 @@ def package_phase_artifacts(
                         arcname = file_path.relative_to(project_root)
                         zipf.write(file_path, arcname=arcname)
 
+    get_artifact_catalog(project_root / "artifacts").record(run_id, zip_path)
+
     return zip_path
 
 
@@ -1,20 +1,86 @@
 """Utilities for loading and interpolating subagent prompt templates."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 import re
 
 
-def load_prompt_template(agent_name: str, project_root: Optional[Path] = None) -> str:
+# Matches {{name}}; names may not contain braces
+_PLACEHOLDER = re.compile(r"\{\{([^{}]*)\}\}")
+
+
+class CompiledTemplate:
     """
-    Load a subagent's prompt template from subagent_prompts/.
+    A prompt template parsed once into literal and placeholder segments.
+
+    Rendering is a single pass over the segments. Values are inserted
+    verbatim (no backslash or group-reference interpretation) and are not
+    themselves scanned for placeholders. Placeholders with no value in the
+    context are left as-is.
+    """
+
+    def __init__(self, source: str):
+        """
+        Parse a template.
+
+        Args:
+            source: Raw template string with {{placeholders}}
+        """
+        self.source = source
+        # literals[i] precedes names[i]; literals has one more item than names
+        self._literals: List[str] = []
+        self._names: List[str] = []
+
+        pos = 0
+        for match in _PLACEHOLDER.finditer(source):
+            self._literals.append(source[pos:match.start()])
+            self._names.append(match.group(1))
+            pos = match.end()
+        self._literals.append(source[pos:])
+
+    @property
+    def placeholders(self) -> Set[str]:
+        """Names of all placeholders in the template."""
+        return set(self._names)
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """
+        Render the template with context values.
+
+        Args:
+            context: Dictionary of values to interpolate (None renders as "")
+
+        Returns:
+            Interpolated prompt string
+        """
+        parts = [self._literals[0]]
+        for name, literal in zip(self._names, self._literals[1:]):
+            if name in context:
+                value = context[name]
+                parts.append(str(value) if value is not None else "")
+            else:
+                parts.append("{{" + name + "}}")
+            parts.append(literal)
+        return "".join(parts)
+
+
+# Compiled templates by path, keyed by (mtime_ns, size) of the file
+_template_cache: Dict[Path, Tuple[Tuple[int, int], CompiledTemplate]] = {}
+
+
+def load_compiled_template(agent_name: str, project_root: Optional[Path] = None) -> CompiledTemplate:
+    """
+    Load a subagent's prompt template from subagent_prompts/, compiled.
+
+    The template is only re-read and re-parsed when the file changes.
 
     Args:
         agent_name: Name of the agent (e.g., "architect", "data")
         project_root: Root directory of the project (defaults to current working directory)
 
     Returns:
-        Raw template content
+        CompiledTemplate for the agent
 
     Raises:
         FileNotFoundError: If template doesn't exist
@@ -24,11 +90,52 @@ def load_prompt_template(agent_name: str, project_root: Optional[Path] = None) -
 
     template_path = project_root / "subagent_prompts" / f"{agent_name}.md"
 
-    if not template_path.exists():
-        raise FileNotFoundError(f"Prompt template not found: {template_path}")
+    try:
+        stat = template_path.stat()
+    except FileNotFoundError:
+        _template_cache.pop(template_path, None)
+        raise FileNotFoundError(f"Prompt template not found: {template_path}") from None
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _template_cache.get(template_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
 
     with open(template_path) as f:
-        return f.read()
+        compiled = CompiledTemplate(f.read())
+    _template_cache[template_path] = (signature, compiled)
+    return compiled
+
+
+def load_prompt_template(agent_name: str, project_root: Optional[Path] = None) -> str:
+    """
+    Load a subagent's prompt template from subagent_prompts/.
+
+    Args:
+        agent_name: Name of the agent (e.g., "architect", "data")
+        project_root: Root directory of the project (defaults to current working directory)
+
+    Returns:
+        Raw template content
+
+    Raises:
+        FileNotFoundError: If template doesn't exist
+    """
+    return load_compiled_template(agent_name, project_root).source
+
+
+@lru_cache(maxsize=64)
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Compile a template string (cached for repeated templates).
+
+    Args:
+        template: Raw template string with {{placeholders}}
+
+    Returns:
+        CompiledTemplate
+    """
+    return CompiledTemplate(template)
 
 
 def interpolate_prompt(template: str, context: Dict[str, Any]) -> str:
@@ -49,16 +156,7 @@ def interpolate_prompt(template: str, context: Dict[str, Any]) -> str:
         >>> interpolate_prompt(template, {"project_name": "MyApp"})
         'Project: MyApp'
     """
-    result = template
-
-    # Replace {{variable}} patterns
-    for key, value in context.items():
-        pattern = r'\{\{' + re.escape(key) + r'\}\}'
-        # Convert value to string, handle None
-        str_value = str(value) if value is not None else ""
-        result = re.sub(pattern, str_value, result)
-
-    return result
+    return compile_template(template).render(context)
 
 
 def build_agent_context(
@@ -165,5 +263,4 @@ def load_and_interpolate(
     Returns:
         Fully interpolated prompt ready for agent execution
     """
-    template = load_prompt_template(agent_name, project_root)
-    return interpolate_prompt(template, context)
+    return load_compiled_template(agent_name, project_root).render(context)
@@ -7,6 +7,7 @@ Provides commands for:
 - Fetching entries by name/version
 - Listing with filters
 - Verifying integrity
+- Exporting JSON manifests
 """
 
 import typer
@@ -341,24 +342,56 @@ def list_entries(
 
 
 @app.command("verify")
-def verify_integrity():
+def verify_integrity(
+    changed_only: bool = typer.Option(
+        False, "--changed-only", help="Only check artifacts changed since the last verify"
+    ),
+    rehash: bool = typer.Option(False, "--rehash", help="Re-hash every artifact, ignoring cached hashes"),
+):
     """
     Verify integrity of registry and catalog.
 
     Checks that all artifacts exist and SHA256 hashes match.
+    Artifacts unchanged since the last verify (same inode, size and mtime)
+    are not re-hashed unless --rehash is given.
     Returns non-zero exit code if any errors found.
 
     Example:
-        orchestrator registry verify
+        orchestrator registry verify --changed-only
     """
+    from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn
+
     try:
         manager = RegistryManager(PROJECT_ROOT)
 
         console.print("[cyan]Verifying registry integrity...[/cyan]")
-        results = manager.verify_integrity()
+        with Progress(
+            TextColumn("Hashing {task.fields[artifacts]}"),
+            BarColumn(),
+            DownloadColumn(),
+            console=console,
+            transient=True,
+        ) as progress:
+            task = progress.add_task("hash", total=None, artifacts="")
+
+            def report(done: int, total: int, done_bytes: int, total_bytes: int):
+                progress.update(task, completed=done_bytes, total=total_bytes, artifacts=f"{done}/{total}")
+
+            results = manager.verify_integrity(
+                changed_only=changed_only, use_cache=not rehash, progress=report
+            )
 
         console.print(f"Models checked: {results['models_checked']}")
         console.print(f"Datasets checked: {results['datasets_checked']}")
+        console.print(
+            f"Artifacts hashed: {results['artifacts_hashed']} "
+            f"({results['artifacts_cached']} unchanged since last verify)"
+        )
+
+        if results["changed"]:
+            console.print(f"\n[cyan]Changed since last verify ({len(results['changed'])}):[/cyan]")
+            for changed in results["changed"]:
+                console.print(f"  - {changed}")
 
         if results["errors"]:
             console.print(f"\n[red]Errors found ({len(results['errors'])}):[/red]")
@@ -422,5 +455,29 @@ def show_stats():
         raise typer.Exit(1)
 
 
+@app.command("export")
+def export_manifests():
+    """
+    Export the registry database to JSON manifests.
+
+    Writes models/registry/releases.json and datasets/catalog.json in the
+    manifest format used before the registry moved to SQLite.
+
+    Example:
+        orchestrator registry export
+    """
+    try:
+        manager = RegistryManager(PROJECT_ROOT)
+
+        written = manager.export_manifests()
+
+        for kind, path in written.items():
+            console.print(f"[green]✓ Exported {kind} manifest:[/green] {path.relative_to(PROJECT_ROOT)}")
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]", file=sys.stderr)
+        raise typer.Exit(1)
+
+
 if __name__ == "__main__":
     app()
@@ -2,7 +2,7 @@
 
 import subprocess
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
 import json
@@ -16,7 +16,7 @@ from .changelog import (
     update_changelog,
     generate_release_notes,
 )
-from .release_gates import run_all_gates, GatesReport, save_gates_report
+from .release_gates import run_all_gates, GateResult, GatesReport, save_gates_report
 from .github_release import (
     create_github_release,
     prepare_release_assets,
@@ -51,6 +51,8 @@ def prepare_release(
     prerelease: Optional[str] = None,
     skip_gates: Optional[List[str]] = None,
     highlights: Optional[List[str]] = None,
+    fail_fast: bool = False,
+    on_gate_result: Optional[Callable[[GateResult], None]] = None,
 ) -> ReleasePlan:
     """
     Prepare release: version bump, changelog, gates, assets.
@@ -61,6 +63,8 @@ def prepare_release(
         prerelease: Prerelease identifier (e.g., "alpha.1")
         skip_gates: List of gates to skip
         highlights: Optional release highlights
+        fail_fast: Cancel remaining gates after the first blocking failure
+        on_gate_result: Called with each gate result as it finishes
 
     Returns:
         ReleasePlan with all release data
@@ -93,7 +97,12 @@ def prepare_release(
     new_version = current_version.bump(bump_type, prerelease=prerelease)
 
     # 4. Run quality gates
-    gates_report = run_all_gates(project_root, skip_gates=skip_gates)
+    gates_report = run_all_gates(
+        project_root,
+        skip_gates=skip_gates,
+        fail_fast=fail_fast,
+        on_result=on_gate_result,
+    )
     save_gates_report(gates_report, project_root)
 
     # 5. Generate changelog
@@ -1,12 +1,38 @@
-"""Pre-release quality gates: tests, hygiene, security checks."""
+"""Pre-release quality gates: tests, hygiene, security checks.
 
+Gates run concurrently on a bounded thread pool (they are almost entirely
+subprocess time) and results are yielded as each gate finishes. Passing
+results of the expensive gates are cached per source tree, so re-running
+a release on an unchanged tree does not re-run tests, bandit or the
+build.
+"""
+
+import hashlib
 import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Any
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 import json
 
+# Canonical gate order used in reports
+GATE_ORDER = ["git_status", "tests", "hygiene", "security", "build"]
+
+# Gates whose results are cached by tree hash. git_status and hygiene are
+# cheap reads of local state and always run.
+CACHEABLE_GATES = {"tests", "security", "build"}
+
+# Bump when the gate implementations change meaningfully
+GATE_CACHE_VERSION = 2
+GATE_CACHE_MAX_ENTRIES = 100
+
+# Directories written by gates and reports; ignored when hashing the tree
+GATE_OUTPUT_DIRS = (".claude", "dist", "build")
+
 
 class GateStatus(str, Enum):
     """Quality gate status."""
@@ -26,6 +52,7 @@ class GateResult:
     message: str
     details: Dict[str, Any] = field(default_factory=dict)
     blocking: bool = True  # If True, FAIL prevents release
+    cached: bool = False  # True if reused from a previous run on the same tree
 
     @property
     def passed(self) -> bool:
@@ -58,24 +85,69 @@ class GatesReport:
             return "✅ All gates passed"
 
 
-def run_tests_gate(project_root: Path) -> GateResult:
+class GateCancelled(Exception):
+    """Raised inside a gate when the run was cancelled (fail-fast)."""
+
+
+def _run_command(
+    args: List[str],
+    cwd: Path,
+    timeout: float,
+    cancel_event: Optional[threading.Event] = None,
+) -> subprocess.CompletedProcess:
+    """
+    Run a command like subprocess.run(capture_output=True, text=True),
+    killing it if cancel_event is set.
+
+    Raises:
+        FileNotFoundError: If the executable does not exist
+        subprocess.TimeoutExpired: If the command exceeds timeout
+        GateCancelled: If cancel_event was set while running
+    """
+    deadline = time.monotonic() + timeout
+    with subprocess.Popen(
+        args, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    ) as proc:
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=0.2)
+                return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
+            except subprocess.TimeoutExpired:
+                if cancel_event is not None and cancel_event.is_set():
+                    proc.kill()
+                    proc.communicate()
+                    raise GateCancelled()
+                if time.monotonic() >= deadline:
+                    proc.kill()
+                    proc.communicate()
+                    raise subprocess.TimeoutExpired(args, timeout)
+
+
+TESTS_COMMAND = ["pytest", "tests/", "-v", "--tb=short"]
+SECURITY_COMMAND = ["bandit", "-r", "src/", "-f", "json", "-q"]
+BUILD_COMMAND = ["python", "-m", "build", "--wheel", "--outdir", "dist/"]
+
+
+def run_tests_gate(
+    project_root: Path, cancel_event: Optional[threading.Event] = None
+) -> GateResult:
     """
     Run test suite.
 
     Args:
         project_root: Project root directory
+        cancel_event: Set to abort the run (fail-fast)
 
     Returns:
         GateResult with test execution status
     """
     try:
         # Run pytest
-        result = subprocess.run(
-            ["pytest", "tests/", "-v", "--tb=short"],
+        result = _run_command(
+            TESTS_COMMAND,
             cwd=project_root,
-            capture_output=True,
-            text=True,
             timeout=300,  # 5 minute timeout
+            cancel_event=cancel_event,
         )
 
         if result.returncode == 0:
@@ -104,7 +176,11 @@ def run_tests_gate(project_root: Path) -> GateResult:
                 gate_name="tests",
                 status=GateStatus.FAIL,
                 message=f"Tests failed ({failed_count} failures)",
-                details={"failed": failed_count, "exit_code": result.returncode, "stderr": result.stderr[:500]},
+                details={
+                    "failed": failed_count,
+                    "exit_code": result.returncode,
+                    "stderr": result.stderr[:500],
+                },
                 blocking=True,
             )
 
@@ -122,6 +198,8 @@ def run_tests_gate(project_root: Path) -> GateResult:
             message="pytest not found, skipping tests",
             blocking=False,
         )
+    except GateCancelled:
+        raise
     except Exception as e:
         return GateResult(
             gate_name="tests",
@@ -193,24 +271,26 @@ def run_hygiene_gate(project_root: Path, min_score: int = 85) -> GateResult:
         )
 
 
-def run_security_gate(project_root: Path) -> GateResult:
+def run_security_gate(
+    project_root: Path, cancel_event: Optional[threading.Event] = None
+) -> GateResult:
     """
     Run security checks (bandit for Python).
 
     Args:
         project_root: Project root directory
+        cancel_event: Set to abort the run (fail-fast)
 
     Returns:
         GateResult with security scan status
     """
     try:
         # Run bandit security scanner
-        result = subprocess.run(
-            ["bandit", "-r", "src/", "-f", "json", "-q"],
+        result = _run_command(
+            SECURITY_COMMAND,
             cwd=project_root,
-            capture_output=True,
-            text=True,
             timeout=120,
+            cancel_event=cancel_event,
         )
 
         if result.returncode == 0:
@@ -224,8 +304,9 @@ def run_security_gate(project_root: Path) -> GateResult:
             # Parse bandit JSON output
             try:
                 report = json.loads(result.stdout)
-                high = len([r for r in report.get("results", []) if r.get("issue_severity") == "HIGH"])
-                medium = len([r for r in report.get("results", []) if r.get("issue_severity") == "MEDIUM"])
+                severities = [r.get("issue_severity") for r in report.get("results", [])]
+                high = severities.count("HIGH")
+                medium = severities.count("MEDIUM")
 
                 if high > 0:
                     return GateResult(
@@ -267,6 +348,8 @@ def run_security_gate(project_root: Path) -> GateResult:
             message="Security scan timed out",
             blocking=False,
         )
+    except GateCancelled:
+        raise
     except Exception as e:
         return GateResult(
             gate_name="security",
@@ -323,31 +406,43 @@ def run_git_status_gate(project_root: Path) -> GateResult:
         )
 
 
-def run_build_gate(project_root: Path) -> GateResult:
+def run_build_gate(
+    project_root: Path, cancel_event: Optional[threading.Event] = None
+) -> GateResult:
     """
     Verify package can be built.
 
     Args:
         project_root: Project root directory
+        cancel_event: Set to abort the run (fail-fast)
 
     Returns:
         GateResult indicating if build succeeds
     """
     try:
+        started = time.time()
+
         # Try building with python -m build (if available)
-        result = subprocess.run(
-            ["python", "-m", "build", "--wheel", "--outdir", "dist/"],
+        result = _run_command(
+            BUILD_COMMAND,
             cwd=project_root,
-            capture_output=True,
-            text=True,
             timeout=120,
+            cancel_event=cancel_event,
         )
 
         if result.returncode == 0:
+            # Wheels written by this build; a cached result is only reused
+            # while they still exist (release assets are taken from dist/)
+            wheels = sorted(
+                str(p.relative_to(project_root))
+                for p in (project_root / "dist").glob("*.whl")
+                if p.stat().st_mtime >= started - 1
+            )
             return GateResult(
                 gate_name="build",
                 status=GateStatus.PASS,
                 message="Package built successfully",
+                details={"outputs": wheels},
                 blocking=True,
             )
         else:
@@ -375,50 +470,279 @@ def run_build_gate(project_root: Path) -> GateResult:
         )
 
 
-def run_all_gates(
+def tree_hash(project_root: Path) -> Optional[str]:
+    """
+    Hash identifying the current source tree, for caching gate results.
+
+    Combines the HEAD tree hash with the diff of tracked files against
+    HEAD and the size/mtime of untracked (non-ignored) files. Files
+    written by the gates themselves are excluded so a gate run does not
+    invalidate its own cache.
+
+    Returns:
+        Hex digest, or None if project_root is not a git repository
+    """
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD^{tree}"],
+            cwd=project_root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        diff = subprocess.run(
+            ["git", "diff", "HEAD", "--binary", "--", "."]
+            + [f":(exclude){d}" for d in GATE_OUTPUT_DIRS],
+            cwd=project_root, capture_output=True, check=True,
+        ).stdout
+        untracked = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+            cwd=project_root, capture_output=True, text=True, check=True,
+        ).stdout.split("\0")
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+    digest = hashlib.sha256(head.encode())
+    digest.update(hashlib.sha256(diff).digest())
+    for rel in sorted(untracked):
+        if not rel or rel.split("/", 1)[0] in GATE_OUTPUT_DIRS or ".egg-info/" in rel:
+            continue
+        try:
+            stat = (project_root / rel).stat()
+        except OSError:
+            continue
+        digest.update(f"{rel}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+class GateResultCache:
+    """
+    Passing gate results keyed by tree hash, gate name and gate config.
+
+    Only PASS results are stored. Failures and warnings may come from the
+    environment rather than the tree (e.g. pytest not installed), so they
+    are always re-checked.
+    """
+
+    def __init__(self, project_root: Path):
+        """
+        Initialize cache.
+
+        Args:
+            project_root: Project root directory
+        """
+        self.project_root = project_root
+        self.path = project_root / ".claude" / "release" / "gate_cache.json"
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self._entries = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                self._entries = {}
+
+    @staticmethod
+    def key(tree: str, gate_name: str, config: Dict[str, Any]) -> str:
+        """Cache key for a gate run on a tree with the given config."""
+        payload = json.dumps(
+            {"v": GATE_CACHE_VERSION, "tree": tree, "gate": gate_name, "config": config},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[GateResult]:
+        """Cached result for key, if present and its outputs still exist."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        outputs = entry.get("details", {}).get("outputs", [])
+        if not all((self.project_root / p).exists() for p in outputs):
+            return None
+
+        return GateResult(
+            gate_name=entry["gate_name"],
+            status=GateStatus(entry["status"]),
+            message=entry["message"],
+            details=entry.get("details", {}),
+            blocking=entry.get("blocking", True),
+            cached=True,
+        )
+
+    def put(self, key: str, result: GateResult) -> None:
+        """Store a result if it is cacheable (PASS only)."""
+        if result.status != GateStatus.PASS:
+            return
+        entry = asdict(result)
+        entry["status"] = result.status.value
+        entry.pop("cached", None)
+        entry["stored_at"] = datetime.now().isoformat()
+        with self._lock:
+            self._entries[key] = entry
+            # Keep the newest entries only
+            if len(self._entries) > GATE_CACHE_MAX_ENTRIES:
+                ordered = sorted(self._entries.items(), key=lambda kv: kv[1].get("stored_at", ""))
+                self._entries = dict(ordered[-GATE_CACHE_MAX_ENTRIES:])
+            self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".json.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(self._entries, f, indent=2)
+        temp_path.replace(self.path)
+
+
+def iter_gates(
     project_root: Path,
     skip_gates: Optional[List[str]] = None,
     min_hygiene_score: int = 85,
-) -> GatesReport:
+    max_workers: int = 4,
+    use_cache: bool = True,
+    fail_fast: bool = False,
+) -> Iterator[GateResult]:
     """
-    Run all quality gates.
+    Run quality gates concurrently, yielding results as they finish.
 
     Args:
         project_root: Project root directory
         skip_gates: List of gate names to skip
         min_hygiene_score: Minimum hygiene score
+        max_workers: Maximum number of gates running at once
+        use_cache: Reuse passing results for an unchanged tree
+        fail_fast: Cancel remaining gates after the first blocking failure
 
-    Returns:
-        GatesReport with all gate results
+    Yields:
+        GateResult for every gate (skipped, cached, cancelled or run)
     """
-    from datetime import datetime
-
     if skip_gates is None:
         skip_gates = []
 
-    gates = []
+    cancel_event = threading.Event()
 
-    # Run each gate
-    gate_functions = {
+    gate_functions: Dict[str, Callable[[], GateResult]] = {
         "git_status": lambda: run_git_status_gate(project_root),
-        "tests": lambda: run_tests_gate(project_root),
+        "tests": lambda: run_tests_gate(project_root, cancel_event),
         "hygiene": lambda: run_hygiene_gate(project_root, min_hygiene_score),
-        "security": lambda: run_security_gate(project_root),
-        "build": lambda: run_build_gate(project_root),
+        "security": lambda: run_security_gate(project_root, cancel_event),
+        "build": lambda: run_build_gate(project_root, cancel_event),
     }
+    gate_configs: Dict[str, Dict[str, Any]] = {
+        "tests": {"command": TESTS_COMMAND},
+        "security": {"command": SECURITY_COMMAND},
+        "build": {"command": BUILD_COMMAND},
+    }
+
+    tree = tree_hash(project_root) if use_cache else None
+    cache = GateResultCache(project_root) if tree else None
+    cache_keys: Dict[str, str] = {}
 
-    for gate_name, gate_func in gate_functions.items():
+    to_run: List[str] = []
+    for gate_name in GATE_ORDER:
         if gate_name in skip_gates:
-            gates.append(
-                GateResult(
-                    gate_name=gate_name,
-                    status=GateStatus.SKIP,
-                    message="Skipped by user",
-                    blocking=False,
-                )
+            yield GateResult(
+                gate_name=gate_name,
+                status=GateStatus.SKIP,
+                message="Skipped by user",
+                blocking=False,
             )
-        else:
-            gates.append(gate_func())
+            continue
+
+        if cache is not None and gate_name in CACHEABLE_GATES:
+            key = GateResultCache.key(tree, gate_name, gate_configs[gate_name])
+            cache_keys[gate_name] = key
+            cached = cache.get(key)
+            if cached is not None:
+                yield cached
+                continue
+
+        to_run.append(gate_name)
+
+    failed_gate: Optional[str] = None
+
+    def run_gate(gate_name: str) -> GateResult:
+        try:
+            return gate_functions[gate_name]()
+        except GateCancelled:
+            return _cancelled_result(gate_name, failed_gate)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, max_workers), thread_name_prefix="release-gate"
+    ) as pool:
+        pending: Dict[Future, str] = {pool.submit(run_gate, name): name for name in to_run}
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                gate_name = pending.pop(future)
+                if future.cancelled():
+                    yield _cancelled_result(gate_name, failed_gate)
+                    continue
+
+                result = future.result()
+                if cache is not None and gate_name in cache_keys:
+                    cache.put(cache_keys[gate_name], result)
+                yield result
+
+                if (
+                    fail_fast
+                    and failed_gate is None
+                    and result.status == GateStatus.FAIL
+                    and result.blocking
+                ):
+                    failed_gate = gate_name
+                    cancel_event.set()
+                    for other in pending:
+                        other.cancel()
+
+
+def _cancelled_result(gate_name: str, failed_gate: Optional[str] = None) -> GateResult:
+    reason = f" after {failed_gate} failed" if failed_gate else ""
+    return GateResult(
+        gate_name=gate_name,
+        status=GateStatus.SKIP,
+        message=f"Cancelled{reason}",
+        blocking=False,
+    )
+
+
+def run_all_gates(
+    project_root: Path,
+    skip_gates: Optional[List[str]] = None,
+    min_hygiene_score: int = 85,
+    max_workers: int = 4,
+    use_cache: bool = True,
+    fail_fast: bool = False,
+    on_result: Optional[Callable[[GateResult], None]] = None,
+) -> GatesReport:
+    """
+    Run all quality gates.
+
+    Args:
+        project_root: Project root directory
+        skip_gates: List of gate names to skip
+        min_hygiene_score: Minimum hygiene score
+        max_workers: Maximum number of gates running at once
+        use_cache: Reuse passing results for an unchanged tree
+        fail_fast: Cancel remaining gates after the first blocking failure
+        on_result: Called with each result as soon as its gate finishes
+
+    Returns:
+        GatesReport with all gate results, in canonical gate order
+    """
+    results: Dict[str, GateResult] = {}
+    for result in iter_gates(
+        project_root,
+        skip_gates=skip_gates,
+        min_hygiene_score=min_hygiene_score,
+        max_workers=max_workers,
+        use_cache=use_cache,
+        fail_fast=fail_fast,
+    ):
+        results[result.gate_name] = result
+        if on_result is not None:
+            on_result(result)
+
+    gates = [results[name] for name in GATE_ORDER if name in results]
 
     # Count failures and warnings
     blocking_failures = sum(1 for g in gates if g.status == GateStatus.FAIL and g.blocking)
@@ -461,6 +785,7 @@ def save_gates_report(report: GatesReport, project_root: Path) -> Path:
                 "message": g.message,
                 "details": g.details,
                 "blocking": g.blocking,
+                "cached": g.cached,
             }
             for g in report.gates
         ],
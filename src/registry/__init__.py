@@ -9,6 +9,7 @@ from .schemas import (
     RegisterDatasetRequest,
 )
 from .manager import RegistryManager
+from .store import RegistryStore
 
 __all__ = [
     "ModelEntry",
@@ -18,4 +19,5 @@ __all__ = [
     "PublishModelRequest",
     "RegisterDatasetRequest",
     "RegistryManager",
+    "RegistryStore",
 ]
@@ -2,20 +2,31 @@
 Registry Manager for Model Registry and Dataset Catalog.
 
 Handles CRUD operations, manifest persistence, and integrity validation.
+Entries are stored in a SQLite database (see store.py); the JSON manifests
+are exported from it on request (`registry export`, run by the release
+workflow) and merged back in when they change on disk.
 """
 
-import json
 import hashlib
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Callable, Optional, List, Dict, Any, Tuple
 from .schemas import (
     ModelEntry,
     DatasetEntry,
     ModelRegistry,
     DatasetCatalog,
 )
+from .store import RegistryStore
+
+# Bytes read per hashing step (hashlib releases the GIL for large updates)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Called with (artifacts done, artifacts to hash, bytes done, bytes to hash)
+ProgressCallback = Callable[[int, int, int, int], None]
 
 
 class RegistryManager:
@@ -40,65 +51,44 @@ class RegistryManager:
         self.project_root = project_root
         self.models_path = project_root / "models" / "registry" / "releases.json"
         self.datasets_path = project_root / "datasets" / "catalog.json"
+        self.db_path = project_root / "models" / "registry" / "registry.db"
 
-        # Ensure directories exist
-        self.models_path.parent.mkdir(parents=True, exist_ok=True)
-        self.datasets_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Initialize manifests if they don't exist
-        self._initialize_manifests()
+        self.store = RegistryStore(self.db_path)
 
-    def _initialize_manifests(self):
-        """Initialize manifest files if they don't exist."""
-        if not self.models_path.exists():
-            registry = ModelRegistry(updated_at=datetime.utcnow().isoformat() + "Z", models=[])
-            self._write_models_manifest(registry)
+        # Merge manifest entries the database has not seen (e.g. pulled by git)
+        self.store.import_manifest("model", self.models_path)
+        self.store.import_manifest("dataset", self.datasets_path)
 
-        if not self.datasets_path.exists():
-            catalog = DatasetCatalog(updated_at=datetime.utcnow().isoformat() + "Z", datasets=[])
-            self._write_datasets_manifest(catalog)
+    def close(self):
+        """Close the registry database."""
+        self.store.close()
 
     def _read_models_manifest(self) -> ModelRegistry:
-        """Read models manifest from disk."""
-        with open(self.models_path, "r") as f:
-            data = json.load(f)
-        return ModelRegistry(**data)
-
-    def _write_models_manifest(self, registry: ModelRegistry):
-        """Write models manifest to disk (atomic)."""
-        registry.updated_at = datetime.utcnow().isoformat() + "Z"
-
-        # Write to temp file first
-        temp_path = self.models_path.with_suffix(".tmp")
-        with open(temp_path, "w") as f:
-            json.dump(registry.model_dump(by_alias=True), f, indent=2)
-
-        # Atomic rename
-        temp_path.replace(self.models_path)
+        """All models in the JSON manifest format."""
+        return self.store.export_manifest("model")
 
     def _read_datasets_manifest(self) -> DatasetCatalog:
-        """Read datasets manifest from disk."""
-        with open(self.datasets_path, "r") as f:
-            data = json.load(f)
-        return DatasetCatalog(**data)
-
-    def _write_datasets_manifest(self, catalog: DatasetCatalog):
-        """Write datasets manifest to disk (atomic)."""
-        catalog.updated_at = datetime.utcnow().isoformat() + "Z"
+        """All datasets in the JSON manifest format."""
+        return self.store.export_manifest("dataset")
 
-        # Write to temp file first
-        temp_path = self.datasets_path.with_suffix(".tmp")
-        with open(temp_path, "w") as f:
-            json.dump(catalog.model_dump(by_alias=True), f, indent=2)
+    def export_manifests(self) -> Dict[str, Path]:
+        """
+        Write releases.json and catalog.json from the registry database.
 
-        # Atomic rename
-        temp_path.replace(self.datasets_path)
+        Returns:
+            Paths written, by entry kind
+        """
+        written = {}
+        for kind, path in (("model", self.models_path), ("dataset", self.datasets_path)):
+            self.store.write_manifest(kind, path)
+            written[kind] = path
+        return written
 
     def _compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA256 hash of file."""
         sha256 = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
                 sha256.update(chunk)
         return sha256.hexdigest()
 
@@ -106,18 +96,17 @@ class RegistryManager:
         """
         Compute schema hash for dataset.
 
-        For parquet: hash of schema
+        For parquet: hash of schema, read from the file footer only
         For CSV: hash of header row
         """
         if file_path.suffix == ".parquet":
             try:
                 import pyarrow.parquet as pq
 
-                table = pq.read_table(file_path)
-                schema_str = str(table.schema)
+                schema_str = str(pq.read_schema(file_path))
                 return hashlib.sha256(schema_str.encode()).hexdigest()
-            except ImportError:
-                # Fallback: hash first 8KB
+            except (ImportError, OSError, ValueError):
+                # Fallback: hash first 8KB (no pyarrow, or not a readable parquet file)
                 pass
 
         # Fallback: hash first chunk
@@ -126,6 +115,15 @@ class RegistryManager:
             sha256.update(f.read(8192))
         return sha256.hexdigest()
 
+    @staticmethod
+    def _stat_key(stat: os.stat_result) -> List[int]:
+        """Identity of a file's content for the verification cache."""
+        return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+    def _remember_hash(self, artifact: str, file_path: Path, sha256: str):
+        """Record a freshly computed artifact hash so the next verify can skip it."""
+        self.store.record_hashes({artifact: (self._stat_key(file_path.stat()), sha256)})
+
     def publish_model(
         self,
         name: str,
@@ -165,12 +163,6 @@ class RegistryManager:
         # Compute hash
         sha256 = self._compute_file_hash(primary_artifact)
 
-        # Check for duplicates
-        registry = self._read_models_manifest()
-        for model in registry.models:
-            if model.name == name and model.version == version:
-                raise ValueError(f"Model {name} v{version} already exists")
-
         # Create entry
         entry = ModelEntry(
             id=str(uuid.uuid4()),
@@ -186,9 +178,9 @@ class RegistryManager:
             notes=notes,
         )
 
-        # Add to registry
-        registry.models.append(entry)
-        self._write_models_manifest(registry)
+        # Add to registry (rejects duplicate name+version atomically)
+        self.store.add("model", entry)
+        self._remember_hash(artifacts[0], primary_artifact, sha256)
 
         return entry
 
@@ -232,12 +224,6 @@ class RegistryManager:
         sha256 = self._compute_file_hash(primary_artifact)
         schema_hash = self._compute_schema_hash(primary_artifact)
 
-        # Check for duplicates
-        catalog = self._read_datasets_manifest()
-        for dataset in catalog.datasets:
-            if dataset.name == name and dataset.version == version:
-                raise ValueError(f"Dataset {name} v{version} already exists")
-
         # Create entry
         entry = DatasetEntry(
             id=str(uuid.uuid4()),
@@ -254,9 +240,9 @@ class RegistryManager:
             notes=notes,
         )
 
-        # Add to catalog
-        catalog.datasets.append(entry)
-        self._write_datasets_manifest(catalog)
+        # Add to catalog (rejects duplicate name+version atomically)
+        self.store.add("dataset", entry)
+        self._remember_hash(artifacts[0], primary_artifact, sha256)
 
         return entry
 
@@ -271,22 +257,7 @@ class RegistryManager:
         Returns:
             Model entry or None if not found
         """
-        registry = self._read_models_manifest()
-
-        # Filter by name
-        matches = [m for m in registry.models if m.name == name]
-        if not matches:
-            return None
-
-        # Filter by version or get latest
-        if version:
-            for model in matches:
-                if model.version == version:
-                    return model
-            return None
-        else:
-            # Return latest version (sort by semver)
-            return max(matches, key=lambda m: tuple(map(int, m.version.split("."))))
+        return self.store.get("model", name, version)
 
     def get_dataset(self, name: str, version: Optional[str] = None) -> Optional[DatasetEntry]:
         """
@@ -299,22 +270,7 @@ class RegistryManager:
         Returns:
             Dataset entry or None if not found
         """
-        catalog = self._read_datasets_manifest()
-
-        # Filter by name
-        matches = [d for d in catalog.datasets if d.name == name]
-        if not matches:
-            return None
-
-        # Filter by version or get latest
-        if version:
-            for dataset in matches:
-                if dataset.version == version:
-                    return dataset
-            return None
-        else:
-            # Return latest version (sort by semver)
-            return max(matches, key=lambda d: tuple(map(int, d.version.split("."))))
+        return self.store.get("dataset", name, version)
 
     def list_models(
         self, client: Optional[str] = None, release_tag: Optional[str] = None
@@ -329,16 +285,7 @@ class RegistryManager:
         Returns:
             List of matching models
         """
-        registry = self._read_models_manifest()
-        models = registry.models
-
-        if client:
-            models = [m for m in models if m.client == client]
-
-        if release_tag:
-            models = [m for m in models if m.release_tag == release_tag]
-
-        return models
+        return self.store.list("model", client=client, release_tag=release_tag)
 
     def list_datasets(
         self, client: Optional[str] = None, release_tag: Optional[str] = None
@@ -353,18 +300,15 @@ class RegistryManager:
         Returns:
             List of matching datasets
         """
-        catalog = self._read_datasets_manifest()
-        datasets = catalog.datasets
-
-        if client:
-            datasets = [d for d in datasets if d.client == client]
-
-        if release_tag:
-            datasets = [d for d in datasets if d.release_tag == release_tag]
-
-        return datasets
+        return self.store.list("dataset", client=client, release_tag=release_tag)
 
-    def verify_integrity(self) -> Dict[str, Any]:
+    def verify_integrity(
+        self,
+        changed_only: bool = False,
+        use_cache: bool = True,
+        max_workers: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
         """
         Verify integrity of registry and catalog.
 
@@ -373,6 +317,17 @@ class RegistryManager:
         - SHA256 hashes match
         - Manifest file sizes
 
+        Artifacts whose inode, size and mtime match the last verification
+        reuse the hash recorded then; only changed artifacts are re-read, in
+        parallel.
+
+        Args:
+            changed_only: Only report entries whose artifact changed (or
+                disappeared) since the last verification
+            use_cache: Reuse cached hashes of unchanged artifacts (False re-hashes everything)
+            max_workers: Hashing threads (default: executor default)
+            progress: Called as changed artifacts finish hashing
+
         Returns:
             Dict with verification results
         """
@@ -382,61 +337,95 @@ class RegistryManager:
             "warnings": [],
             "models_checked": 0,
             "datasets_checked": 0,
+            "changed": [],
+            "artifacts_hashed": 0,
+            "artifacts_cached": 0,
+            "bytes_hashed": 0,
         }
 
-        # Check models
-        registry = self._read_models_manifest()
-        for model in registry.models:
-            results["models_checked"] += 1
-
-            # Check primary artifact
-            primary_artifact = self.project_root / model.artifacts[0]
-            if not primary_artifact.exists():
-                results["valid"] = False
-                results["errors"].append(f"Model {model.name} v{model.version}: Artifact not found: {model.artifacts[0]}")
+        entries: List[Tuple[str, Any]] = [("Model", model) for model in self.store.list("model")]
+        entries += [("Dataset", dataset) for dataset in self.store.list("dataset")]
+
+        previous_verify = self.store.artifact_hashes()
+        cache = previous_verify if use_cache else {}
+        fresh: Dict[str, Tuple[List[int], str]] = {}
+        missing: List[str] = []
+        hashes: Dict[str, str] = {}
+        stale: Dict[str, int] = {}
+        checked: List[Tuple[str, Any, str]] = []
+
+        # Stat every primary artifact; only those changed since the last
+        # verification need hashing
+        for kind, entry in entries:
+            artifact = entry.artifacts[0]
+            label = f"{kind} {entry.name} v{entry.version}"
+            try:
+                stat = (self.project_root / artifact).stat()
+            except FileNotFoundError:
+                stat = None
+
+            previous = previous_verify.get(artifact)
+            changed = stat is None or previous is None or previous[0] != self._stat_key(stat)
+            if changed:
+                results["changed"].append(f"{label}: {artifact}")
+            elif changed_only:
                 continue
 
-            # Verify hash
-            actual_hash = self._compute_file_hash(primary_artifact)
-            if actual_hash != model.sha256:
+            results["models_checked" if kind == "Model" else "datasets_checked"] += 1
+            if stat is None:
                 results["valid"] = False
-                results["errors"].append(
-                    f"Model {model.name} v{model.version}: Hash mismatch (expected {model.sha256[:8]}..., got {actual_hash[:8]}...)"
-                )
-
-        # Check datasets
-        catalog = self._read_datasets_manifest()
-        for dataset in catalog.datasets:
-            results["datasets_checked"] += 1
-
-            # Check primary artifact
-            primary_artifact = self.project_root / dataset.artifacts[0]
-            if not primary_artifact.exists():
-                results["valid"] = False
-                results["errors"].append(
-                    f"Dataset {dataset.name} v{dataset.version}: Artifact not found: {dataset.artifacts[0]}"
-                )
+                results["errors"].append(f"{label}: Artifact not found: {artifact}")
+                missing.append(artifact)
                 continue
 
-            # Verify hash
-            actual_hash = self._compute_file_hash(primary_artifact)
-            if actual_hash != dataset.sha256:
+            cached = cache.get(artifact)
+            if cached is not None and cached[0] == self._stat_key(stat):
+                hashes[artifact] = cached[1]
+            elif artifact not in stale:
+                stale[artifact] = stat.st_size
+            checked.append((label, entry, artifact))
+
+        results["artifacts_cached"] = len(hashes)
+        total_bytes = sum(stale.values())
+        if stale:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    pool.submit(self._hash_with_stat, self.project_root / artifact): artifact
+                    for artifact in stale
+                }
+                for future in as_completed(futures):
+                    artifact = futures[future]
+                    sha256, stat_key = future.result()
+                    hashes[artifact] = sha256
+                    fresh[artifact] = (stat_key, sha256)
+                    results["artifacts_hashed"] += 1
+                    results["bytes_hashed"] += stale[artifact]
+                    if progress:
+                        progress(results["artifacts_hashed"], len(stale), results["bytes_hashed"], total_bytes)
+
+        for label, entry, artifact in checked:
+            actual_hash = hashes[artifact]
+            if actual_hash != entry.sha256:
                 results["valid"] = False
                 results["errors"].append(
-                    f"Dataset {dataset.name} v{dataset.version}: Hash mismatch (expected {dataset.sha256[:8]}..., got {actual_hash[:8]}...)"
+                    f"{label}: Hash mismatch (expected {entry.sha256[:8]}..., got {actual_hash[:8]}...)"
                 )
 
-        # Check manifest sizes
-        if self.models_path.stat().st_size > 10 * 1024 * 1024:  # 10 MB
-            results["warnings"].append(f"Models manifest exceeds 10 MB ({self.models_path.stat().st_size / 1024 / 1024:.1f} MB)")
+        self.store.record_hashes(fresh)
+        self.store.forget_hashes(missing)
 
-        if self.datasets_path.stat().st_size > 10 * 1024 * 1024:  # 10 MB
-            results["warnings"].append(
-                f"Datasets manifest exceeds 10 MB ({self.datasets_path.stat().st_size / 1024 / 1024:.1f} MB)"
-            )
+        # Check sizes of exported manifests
+        for label, path in (("Models", self.models_path), ("Datasets", self.datasets_path)):
+            if path.exists() and path.stat().st_size > 10 * 1024 * 1024:  # 10 MB
+                results["warnings"].append(f"{label} manifest exceeds 10 MB ({path.stat().st_size / 1024 / 1024:.1f} MB)")
 
         return results
 
+    def _hash_with_stat(self, file_path: Path) -> Tuple[str, List[int]]:
+        """Hash a file, returning the stat key observed before reading it."""
+        stat_key = self._stat_key(file_path.stat())
+        return self._compute_file_hash(file_path), stat_key
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get aggregate statistics.
@@ -444,38 +433,14 @@ class RegistryManager:
         Returns:
             Dict with stats (count by client, avg cleanliness, etc.)
         """
-        registry = self._read_models_manifest()
-        catalog = self._read_datasets_manifest()
-
-        # Models stats
-        models_by_client: Dict[str, int] = {}
-        model_cleanliness_scores = []
-
-        for model in registry.models:
-            if model.client:
-                models_by_client[model.client] = models_by_client.get(model.client, 0) + 1
-            if model.cleanliness_score is not None:
-                model_cleanliness_scores.append(model.cleanliness_score)
-
-        # Datasets stats
-        datasets_by_client: Dict[str, int] = {}
-        dataset_cleanliness_scores = []
-
-        for dataset in catalog.datasets:
-            if dataset.client:
-                datasets_by_client[dataset.client] = datasets_by_client.get(dataset.client, 0) + 1
-            if dataset.cleanliness_score is not None:
-                dataset_cleanliness_scores.append(dataset.cleanliness_score)
+        models = self.store.stats("model")
+        datasets = self.store.stats("dataset")
 
         return {
-            "models_total": len(registry.models),
-            "datasets_total": len(catalog.datasets),
-            "models_by_client": models_by_client,
-            "datasets_by_client": datasets_by_client,
-            "avg_model_cleanliness": sum(model_cleanliness_scores) / len(model_cleanliness_scores)
-            if model_cleanliness_scores
-            else None,
-            "avg_dataset_cleanliness": sum(dataset_cleanliness_scores) / len(dataset_cleanliness_scores)
-            if dataset_cleanliness_scores
-            else None,
+            "models_total": models["total"],
+            "datasets_total": datasets["total"],
+            "models_by_client": models["by_client"],
+            "datasets_by_client": datasets["by_client"],
+            "avg_model_cleanliness": models["avg_cleanliness"],
+            "avg_dataset_cleanliness": datasets["avg_cleanliness"],
         }
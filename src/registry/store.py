@@ -0,0 +1,351 @@
+"""
+SQLite store for the model registry and dataset catalog.
+
+Entries live in models/registry/registry.db (WAL mode), one row per
+model or dataset version:
+- Publishing inserts a single row in its own transaction; a UNIQUE
+  (name, version) constraint rejects duplicates atomically, so concurrent
+  publishers (e.g. parallel CI jobs) neither collide nor overwrite each other
+- Lookups and filtered listings use indexes on name/version, client,
+  release tag and created_at instead of loading every entry
+- The full entry is kept as JSON next to the indexed columns and
+  exported on request (`registry export`) in the previous releases.json /
+  catalog.json manifest format, under the database write lock so
+  concurrent exports never interleave
+- Artifact hashes from the last verification are kept by inode, size and
+  mtime, so unchanged artifacts are not re-hashed
+
+JSON manifests are imported whenever their content differs from what the
+store last imported or exported, so entries pulled in by git (the manifests
+are tracked; the database is not) are merged on the next open. A manifest
+whose inode, size and mtime match the last import or export is not read.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .schemas import DatasetCatalog, DatasetEntry, ModelEntry, ModelRegistry
+
+Entry = Union[ModelEntry, DatasetEntry]
+
+# Table per entry kind, with the pydantic model its rows hold
+KINDS = {"model": ("models", ModelEntry), "dataset": ("datasets", DatasetEntry)}
+
+# Stands in for the entry list while the manifest envelope is encoded
+_ENTRIES_PLACEHOLDER = "\0entries\0"
+
+_TABLE = """
+CREATE TABLE IF NOT EXISTS {table} (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    version_key TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    client TEXT,
+    release_tag TEXT,
+    cleanliness_score INTEGER,
+    payload TEXT NOT NULL,
+    UNIQUE (name, version)
+);
+
+CREATE INDEX IF NOT EXISTS {table}_name_version ON {table} (name, version_key);
+CREATE INDEX IF NOT EXISTS {table}_client ON {table} (client);
+CREATE INDEX IF NOT EXISTS {table}_release_tag ON {table} (release_tag);
+CREATE INDEX IF NOT EXISTS {table}_created_at ON {table} (created_at);
+"""
+
+_SCHEMA = "".join(_TABLE.format(table=table) for table, _ in KINDS.values()) + """
+CREATE TABLE IF NOT EXISTS artifact_hashes (
+    path TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    hashed_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def version_key(version: str) -> str:
+    """Semantic version padded so that string order is version order."""
+    return ".".join(f"{int(part):010d}" for part in version.split("."))
+
+
+class RegistryStore:
+    """Transactional, indexed storage for registry entries."""
+
+    def __init__(self, db_path: Path, busy_timeout: float = 30.0):
+        """
+        Initialize store.
+
+        Args:
+            db_path: SQLite database file
+            busy_timeout: Seconds a writer waits for another process's transaction
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=busy_timeout, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _table(kind: str) -> str:
+        return KINDS[kind][0]
+
+    @staticmethod
+    def _row(entry: Entry) -> tuple:
+        return (
+            entry.id,
+            entry.name,
+            entry.version,
+            version_key(entry.version),
+            entry.created_at,
+            entry.client,
+            entry.release_tag,
+            entry.cleanliness_score,
+            json.dumps(entry.model_dump(by_alias=True), indent=2),
+        )
+
+    def _entries(self, kind: str, rows: List[sqlite3.Row]) -> List[Entry]:
+        model = KINDS[kind][1]
+        return [model.model_validate_json(row["payload"]) for row in rows]
+
+    def add(self, kind: str, entry: Entry) -> None:
+        """
+        Insert an entry.
+
+        Raises:
+            ValueError: If an entry with the same name and version exists
+        """
+        table = self._table(kind)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    f"INSERT INTO {table} (id, name, version, version_key, created_at, client, "
+                    "release_tag, cleanliness_score, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    self._row(entry),
+                )
+        except sqlite3.IntegrityError:
+            raise ValueError(f"{kind.capitalize()} {entry.name} v{entry.version} already exists")
+
+    def get(self, kind: str, name: str, version: Optional[str] = None) -> Optional[Entry]:
+        """Entry by name and version, or the highest version when none is given."""
+        table = self._table(kind)
+        with self._lock:
+            if version:
+                rows = self._conn.execute(
+                    f"SELECT payload FROM {table} WHERE name = ? AND version = ?", (name, version)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    f"SELECT payload FROM {table} WHERE name = ? ORDER BY version_key DESC LIMIT 1",
+                    (name,),
+                ).fetchall()
+        entries = self._entries(kind, rows)
+        return entries[0] if entries else None
+
+    def list(
+        self, kind: str, client: Optional[str] = None, release_tag: Optional[str] = None
+    ) -> List[Entry]:
+        """Entries in publish order, optionally filtered by client and release tag."""
+        clauses, params = [], []
+        if client:
+            clauses.append("client = ?")
+            params.append(client)
+        if release_tag:
+            clauses.append("release_tag = ?")
+            params.append(release_tag)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT payload FROM {self._table(kind)}{where} ORDER BY seq", params
+            ).fetchall()
+        return self._entries(kind, rows)
+
+    def stats(self, kind: str) -> Dict[str, Any]:
+        """Entry count, counts by client and mean cleanliness score."""
+        table = self._table(kind)
+        with self._lock:
+            total, average = self._conn.execute(
+                f"SELECT COUNT(*), AVG(cleanliness_score) FROM {table}"
+            ).fetchone()
+            by_client = self._conn.execute(
+                f"SELECT client, COUNT(*) FROM {table} WHERE client IS NOT NULL "
+                "GROUP BY client ORDER BY MIN(seq)"
+            ).fetchall()
+        return {
+            "total": total,
+            "by_client": {client: count for client, count in by_client},
+            "avg_cleanliness": average,
+        }
+
+    @staticmethod
+    def _digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def _stat_key(path: Path) -> str:
+        stat = path.stat()
+        return f"{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _record_manifest(self, kind: str, digest: str, stat_key: str) -> None:
+        """Remember the manifest content and file state the store is in sync with."""
+        self._set_meta(f"manifest:{kind}", digest)
+        self._set_meta(f"manifest_stat:{kind}", stat_key)
+
+    def import_manifest(self, kind: str, manifest_path: Path) -> int:
+        """
+        Merge entries from a JSON manifest if it changed since the store last
+        imported or exported it.
+
+        Entries already in the store (same id, or same name and version) are
+        kept as they are.
+
+        Returns:
+            Number of entries added (0 if unchanged or absent)
+        """
+        try:
+            stat_key = self._stat_key(manifest_path)
+        except FileNotFoundError:
+            return 0
+        with self._lock:
+            if self._meta(f"manifest_stat:{kind}") == stat_key:
+                return 0
+        data = manifest_path.read_bytes()
+        digest = self._digest(data)
+        with self._lock, self._conn:
+            if self._meta(f"manifest:{kind}") == digest:
+                # Touched or re-checked out, but the content is unchanged
+                self._record_manifest(kind, digest, stat_key)
+                return 0
+        model = KINDS[kind][1]
+        entries: List[Entry] = [
+            model(**item) for item in json.loads(data).get(self._table(kind), [])
+        ]
+
+        table = self._table(kind)
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO {table} (id, name, version, version_key, created_at, "
+                "client, release_tag, cleanliness_score, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._row(entry) for entry in entries],
+            )
+            added = self._conn.total_changes - before
+            self._record_manifest(kind, digest, stat_key)
+        return added
+
+    def export_manifest(self, kind: str) -> Union[ModelRegistry, DatasetCatalog]:
+        """All entries of a kind in the JSON manifest format."""
+        entries = self.list(kind)
+        return self._manifest(kind, entries)
+
+    @staticmethod
+    def _manifest(kind: str, entries: List[Entry]) -> Union[ModelRegistry, DatasetCatalog]:
+        updated_at = datetime.utcnow().isoformat() + "Z"
+        if kind == "model":
+            return ModelRegistry(updated_at=updated_at, models=entries)
+        return DatasetCatalog(updated_at=updated_at, datasets=entries)
+
+    def _render_manifest(self, kind: str, payloads: List[str]) -> str:
+        """
+        Manifest JSON (indent=2) spliced from stored payloads.
+
+        Payloads are already-validated entries serialized with indent=2, so
+        only the envelope is encoded here rather than every entry on each
+        publish.
+        """
+        table = self._table(kind)
+        manifest = self._manifest(kind, []).model_dump(by_alias=True)
+        manifest[table] = _ENTRIES_PLACEHOLDER
+        if payloads:
+            entries = (
+                "[\n" + ",\n".join("    " + p.replace("\n", "\n    ") for p in payloads) + "\n  ]"
+            )
+        else:
+            entries = "[]"
+        return json.dumps(manifest, indent=2).replace(json.dumps(_ENTRIES_PLACEHOLDER), entries, 1)
+
+    def write_manifest(self, kind: str, manifest_path: Path) -> None:
+        """
+        Write all entries of a kind to a JSON manifest.
+
+        The read and the file replace happen inside one write transaction, so
+        an export from another process cannot replace the file with an older
+        snapshot afterwards.
+        """
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(
+                f"SELECT payload FROM {self._table(kind)} ORDER BY seq"
+            ).fetchall()
+            data = self._render_manifest(kind, [row["payload"] for row in rows]).encode()
+
+            # Write to temp file first, then rename atomically
+            temp_path = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.tmp")
+            temp_path.write_bytes(data)
+            temp_path.replace(manifest_path)
+            self._record_manifest(kind, self._digest(data), self._stat_key(manifest_path))
+
+    def artifact_hashes(self) -> Dict[str, Tuple[List[int], str]]:
+        """Last known hash of each artifact path, with the [inode, size, mtime_ns] hashed."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, inode, size, mtime_ns, sha256 FROM artifact_hashes"
+            ).fetchall()
+        return {
+            row["path"]: ([row["inode"], row["size"], row["mtime_ns"]], row["sha256"])
+            for row in rows
+        }
+
+    def record_hashes(self, hashes: Dict[str, Tuple[List[int], str]]) -> None:
+        """Store freshly computed artifact hashes, replacing older ones."""
+        hashed_at = datetime.utcnow().isoformat() + "Z"
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO artifact_hashes "
+                "(path, inode, size, mtime_ns, sha256, hashed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (path, *stat_key, sha256, hashed_at)
+                    for path, (stat_key, sha256) in hashes.items()
+                ],
+            )
+
+    def forget_hashes(self, paths: Iterable[str]) -> None:
+        """Drop hashes of artifacts that no longer exist."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM artifact_hashes WHERE path = ?", [(path,) for path in paths]
+            )
@@ -9,26 +9,108 @@ Appends events to NDJSON audit log with fields:
 - resource type and ID
 - result
 - IP address, trace ID
+
+The log is split into segments so reads stay cheap as history grows:
+- The active segment is the configured log path; once it reaches
+  max_segment_bytes (or its first entry is older than max_segment_age) it
+  is renamed to <log>.NNNNNN and a new active segment is started
+- Each sealed segment gets a sidecar index (<log>.NNNNNN.idx) with its
+  first/last timestamp, the tenants it mentions and a sparse list of
+  (byte offset, timestamp) points every index_interval entries
+- read_recent seeks backwards from the end of the newest segments and
+  stops once it has enough entries
+- export_csv skips segments outside the time window or without the
+  requested tenant, and seeks into the first relevant one via the sparse
+  index
 """
 
+from bisect import bisect_left
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import csv
 import json
+import os
+import re
+import threading
 
 from .schemas import AuditEvent, Identity
 
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+INDEX_INTERVAL = 1024
+INDEX_VERSION = 1
+READ_BLOCK_SIZE = 64 * 1024
+
+CSV_HEADER = [
+    "timestamp", "actor", "actor_type", "tenant", "action",
+    "resource", "resource_id", "result", "result_details",
+    "ip", "trace_id"
+]
+
+
+def _parse_ts(value: Any) -> Optional[datetime]:
+    """Parse an entry timestamp as naive UTC."""
+    try:
+        ts = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
+
+def _reverse_lines(path: Path, block_size: int = READ_BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield the lines of a file last to first, reading blocks from the end."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        tail = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + tail).split(b"\n")
+            tail = lines[0]
+            for line in reversed(lines[1:]):
+                yield line
+        yield tail
+
 
 class AuditLogger:
     """
     Append-only audit logger.
 
-    Writes to NDJSON file.
+    Writes to rotating NDJSON segments.
     """
 
-    def __init__(self, log_path: str = ".claude/logs/audit.log"):
+    def __init__(
+        self,
+        log_path: str = ".claude/logs/audit.log",
+        max_segment_bytes: int = SEGMENT_MAX_BYTES,
+        max_segment_age: Optional[float] = None,
+        index_interval: int = INDEX_INTERVAL,
+    ):
+        """
+        Initialize audit logger.
+
+        Args:
+            log_path: Active segment path; sealed segments are written next to it
+            max_segment_bytes: Rotate once the active segment reaches this size
+            max_segment_age: Rotate once the active segment's first entry is
+                this many seconds old (None = size-based only)
+            index_interval: Entries between sparse index points
+        """
         self.log_path = Path(log_path)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age = max_segment_age
+        self.index_interval = index_interval
+
+        self._lock = threading.Lock()
+        self._segment_pattern = re.compile(rf"^{re.escape(self.log_path.name)}\.(\d{{6}})$")
+        self._indexes: Dict[str, Dict[str, Any]] = {}
+        # (inode, first timestamp) of the active segment, for age-based rotation
+        self._active_started: Optional[Tuple[int, Optional[datetime]]] = None
 
         # Create file if not exists
         if not self.log_path.exists():
@@ -233,92 +315,252 @@ class AuditLogger:
         )
 
     def _append(self, event: AuditEvent):
-        """Append event to audit log."""
-        with open(self.log_path, "a") as f:
-            f.write(event.to_ndjson_line() + "\n")
+        """Append event to the active segment, rotating it when full."""
+        self._write(event.to_ndjson_line())
+
+    def _write(self, line: str):
+        data = (line + "\n").encode("utf-8")
+        with self._lock:
+            with open(self.log_path, "ab") as f:
+                f.write(data)
+                size = f.tell()
+                inode = os.fstat(f.fileno()).st_ino
+            if self._should_rotate(inode, size):
+                self._rotate(inode)
+
+    def _should_rotate(self, inode: int, size: int) -> bool:
+        if size >= self.max_segment_bytes:
+            return True
+        if self.max_segment_age is None:
+            return False
+        if self._active_started is None or self._active_started[0] != inode:
+            self._active_started = (inode, self._first_timestamp(self.log_path))
+        started = self._active_started[1]
+        return started is not None and (datetime.utcnow() - started).total_seconds() >= self.max_segment_age
+
+    @staticmethod
+    def _first_timestamp(path: Path) -> Optional[datetime]:
+        with open(path, "rb") as f:
+            line = f.readline()
+        try:
+            return _parse_ts(json.loads(line).get("ts"))
+        except (ValueError, AttributeError):
+            return None
+
+    def _rotate(self, inode: int):
+        """Seal the active segment under the next free segment number."""
+        try:
+            if os.stat(self.log_path).st_ino != inode:
+                return  # Already rotated by another process
+        except FileNotFoundError:
+            return
 
-    def read_recent(self, limit: int = 100) -> list[AuditEvent]:
+        segments = self._segments()
+        seq = segments[-1][0] + 1 if segments else 1
+        target = self.log_path.with_name(f"{self.log_path.name}.{seq:06d}")
+        while target.exists():
+            seq += 1
+            target = self.log_path.with_name(f"{self.log_path.name}.{seq:06d}")
+        try:
+            os.rename(self.log_path, target)
+        except FileNotFoundError:
+            return
+        self.log_path.touch()
+        self._active_started = None
+
+    def _segments(self) -> List[Tuple[int, Path]]:
+        """Sealed segments as (number, path), oldest first."""
+        found = []
+        for entry in os.scandir(self.log_path.parent):
+            match = self._segment_pattern.match(entry.name)
+            if match:
+                found.append((int(match.group(1)), Path(entry.path)))
+        return sorted(found)
+
+    def _segment_index(self, path: Path) -> Dict[str, Any]:
+        """Sparse index of a sealed segment, built on first use and kept in a sidecar file."""
+        stat = path.stat()
+        key = [stat.st_size, stat.st_mtime_ns]
+        cached = self._indexes.get(path.name)
+        if cached is not None and cached["stat"] == key:
+            return cached
+
+        sidecar = path.with_name(path.name + ".idx")
+        try:
+            with open(sidecar, "r") as f:
+                index = json.load(f)
+            if index.get("version") == INDEX_VERSION and index.get("stat") == key:
+                self._indexes[path.name] = index
+                return index
+        except (FileNotFoundError, ValueError):
+            pass
+
+        index = self._build_index(path)
+        index["stat"] = key
+        tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp, sidecar)
+        self._indexes[path.name] = index
+        return index
+
+    def _build_index(self, path: Path) -> Dict[str, Any]:
+        entries = 0
+        offset = 0
+        first_ts = last_ts = None
+        newest: Optional[datetime] = None
+        tenants = set()
+        sparse: List[List[Any]] = []
+        with open(path, "rb") as f:
+            for line in f:
+                start = offset
+                offset += len(line)
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(data, dict):
+                    continue
+
+                ts = data.get("ts")
+                if entries % self.index_interval == 0:
+                    sparse.append([start, ts])
+                entries += 1
+                if first_ts is None:
+                    first_ts = ts
+                parsed = _parse_ts(ts)
+                if parsed is not None and (newest is None or parsed >= newest):
+                    newest, last_ts = parsed, ts
+                if data.get("tenant"):
+                    tenants.add(data["tenant"])
+
+        return {
+            "version": INDEX_VERSION,
+            "bytes": offset,
+            "entries": entries,
+            "first_ts": first_ts,
+            "last_ts": last_ts,
+            "tenants": sorted(tenants),
+            "sparse": sparse,
+        }
+
+    @staticmethod
+    def _relevant(index: Dict[str, Any], cutoff: Optional[datetime], tenant: Optional[str]) -> bool:
+        """Whether a sealed segment can hold entries matching the filters."""
+        if tenant and tenant not in index["tenants"]:
+            return False
+        if cutoff is not None:
+            last = _parse_ts(index["last_ts"])
+            if last is None or last < cutoff:
+                return False
+        return True
+
+    @staticmethod
+    def _start_offset(index: Dict[str, Any], cutoff: Optional[datetime]) -> int:
+        """Offset of the last sparse index point before the cutoff."""
+        if cutoff is None:
+            return 0
+        times = [_parse_ts(ts) or datetime.min for _, ts in index["sparse"]]
+        pos = bisect_left(times, cutoff)
+        return index["sparse"][pos - 1][0] if pos else 0
+
+    @staticmethod
+    def _iter_entries(path: Path, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(data, dict):
+                    yield data
+
+    def read_recent(self, limit: int = 100, tenant: Optional[str] = None) -> list[dict]:
         """
         Read recent audit events.
 
+        Reads backwards from the end of the newest segments, so the cost
+        depends on limit rather than on the size of the history.
+
         Args:
             limit: Maximum events to return
+            tenant: Only return events for this tenant
 
         Returns:
             List of recent events (newest first)
         """
-        if not self.log_path.exists():
-            return []
-
-        events = []
-        with open(self.log_path, "r") as f:
-            lines = f.readlines()
-
-        # Read last N lines
-        for line in lines[-limit:]:
-            line = line.strip()
-            if not line:
-                continue
+        events: List[Dict[str, Any]] = []
+        if limit <= 0:
+            return events
 
+        sealed = [path for _, path in reversed(self._segments())]
+        for path in [self.log_path] + sealed:
             try:
-                data = json.loads(line)
-                # Reconstruct AuditEvent (simplified)
-                events.append(data)
-            except Exception:
+                if tenant and path != self.log_path and tenant not in self._segment_index(path)["tenants"]:
+                    continue
+                for line in _reverse_lines(path):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except ValueError:
+                        continue
+                    if not isinstance(data, dict) or (tenant and data.get("tenant") != tenant):
+                        continue
+                    events.append(data)
+                    if len(events) >= limit:
+                        return events
+            except FileNotFoundError:
                 continue
-
-        # Return newest first
-        events.reverse()
         return events
 
-    def export_csv(self, output_path: str, days: Optional[int] = None):
+    def export_csv(self, output_path: str, days: Optional[int] = None, tenant: Optional[str] = None) -> int:
         """
         Export audit log to CSV.
 
+        Only segments that overlap the time window and mention the tenant
+        are read.
+
         Args:
             output_path: Output CSV path
             days: Only export last N days (None = all)
-        """
-        import csv
-        from datetime import timedelta
+            tenant: Only export events for this tenant (None = all)
 
-        if not self.log_path.exists():
-            return
-
-        cutoff = None
-        if days:
-            cutoff = datetime.utcnow() - timedelta(days=days)
-
-        with open(self.log_path, "r") as infile:
-            with open(output_path, "w", newline="") as outfile:
-                writer = csv.writer(outfile)
-
-                # Write header
-                writer.writerow([
-                    "timestamp", "actor", "actor_type", "tenant", "action",
-                    "resource", "resource_id", "result", "result_details",
-                    "ip", "trace_id"
-                ])
-
-                for line in infile:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
+        Returns:
+            Number of events exported
+        """
+        cutoff = datetime.utcnow() - timedelta(days=days) if days else None
 
-                        # Check cutoff
+        sources = []
+        for _, path in self._segments():
+            try:
+                index = self._segment_index(path)
+            except FileNotFoundError:
+                continue
+            if self._relevant(index, cutoff, tenant):
+                sources.append((path, self._start_offset(index, cutoff)))
+        sources.append((self.log_path, 0))
+
+        exported = 0
+        with open(output_path, "w", newline="") as outfile:
+            writer = csv.writer(outfile)
+            writer.writerow(CSV_HEADER)
+
+            for path, offset in sources:
+                try:
+                    for data in self._iter_entries(path, offset):
+                        if tenant and data.get("tenant") != tenant:
+                            continue
                         if cutoff:
-                            ts_str = data.get("ts", "")
-                            try:
-                                ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                                if ts < cutoff:
-                                    continue
-                            except Exception:
+                            ts = _parse_ts(data.get("ts", ""))
+                            if ts is None or ts < cutoff:
                                 continue
 
-                        # Write row
                         writer.writerow([
                             data.get("ts", ""),
                             data.get("actor", ""),
@@ -332,8 +574,10 @@ class AuditLogger:
                             data.get("ip", ""),
                             data.get("trace_id", ""),
                         ])
-                    except Exception:
-                        continue
+                        exported += 1
+                except FileNotFoundError:
+                    continue
+        return exported
 
 
 # Global instance
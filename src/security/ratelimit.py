@@ -3,18 +3,78 @@ Rate limiting with token bucket algorithm.
 
 Supports:
 - In-process rate limiting (default)
-- Redis-backed rate limiting (optional)
+- SQLite-backed rate limiting shared by local worker processes
 - Per-tenant, per-user, per-route limits
 - Configurable burst allowance
+
+Bucket state is a single float per key: the time at which the bucket will
+be full again. Tokens available at time t are
+capacity - max(0, full_at - t) * refill_rate, and consuming n tokens moves
+full_at forward by n / refill_rate. A bucket that has refilled is the same
+as no bucket, so backends can drop it without changing any decision.
+
+The in-process backend splits keys over independently locked shards, each
+of at most max_buckets / shards keys, so memory stays bounded under
+high-cardinality traffic. A full shard drops refilled buckets first; only
+when none has refilled does it forget a bucket that still holds state (see
+MemoryBackend). The SQLite backend updates one row per request in
+an IMMEDIATE transaction and periodically deletes refilled rows, so every
+worker using the same database file enforces the same limit.
 """
 
+import sqlite3
+import itertools
+import threading
 import time
-from typing import Dict, Tuple, Optional
-from collections import defaultdict
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Protocol, Tuple, Optional
 
 from .schemas import Identity
 
+DEFAULT_MAX_BUCKETS = 100_000
+DEFAULT_SHARDS = 16
+
+# Least recently used buckets examined when the oldest has not refilled
+EVICTION_SCAN = 16
+
+# Tolerance for float drift in token arithmetic
+_EPSILON = 1e-9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    key TEXT PRIMARY KEY,
+    full_at REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS buckets_full_at ON buckets (full_at);
+"""
+
+
+def _take(
+    full_at: float, now: float, capacity: int, refill_rate: float, tokens: int
+) -> Tuple[bool, float, float]:
+    """
+    Apply one request to a bucket.
+
+    Args:
+        full_at: Time the bucket would be full (<= now if already full)
+        now: Current time
+        capacity: Maximum tokens (burst allowance)
+        refill_rate: Tokens per second
+        tokens: Tokens to consume
+
+    Returns:
+        Tuple of (allowed, new full_at, tokens remaining)
+    """
+    full_at = max(full_at, now)
+    available = capacity - (full_at - now) * refill_rate
+    allowed = available + _EPSILON >= tokens
+    if allowed:
+        full_at += tokens / refill_rate
+        available -= tokens
+    return allowed, full_at, max(0.0, available)
+
 
 class TokenBucket:
     """
@@ -78,16 +138,186 @@ class TokenBucket:
         return tokens_needed / self.refill_rate
 
 
+class RateLimitBackend(Protocol):
+    """Protocol for rate limit bucket storage."""
+
+    def take(self, key: str, capacity: int, refill_rate: float, tokens: int = 1) -> Tuple[bool, float, float]:
+        """
+        Atomically consume tokens from a bucket.
+
+        Returns:
+            Tuple of (allowed, remaining, reset_in)
+        """
+        ...
+
+    def reset(self, key: str) -> None:
+        """Forget a bucket, leaving it full."""
+        ...
+
+    def __len__(self) -> int:
+        """Number of buckets currently held."""
+        ...
+
+
+class MemoryBackend:
+    """
+    Sharded in-process bucket storage with bounded size.
+
+    Each shard is an OrderedDict of key -> full_at in least recently used
+    order behind its own lock; lookups and updates are O(1).
+
+    A full shard first drops its least recently used buckets that have
+    refilled, which changes no decision. If the least recently used bucket
+    has not refilled (more keys were active within one refill period than
+    the shard holds), the bucket closest to full among the EVICTION_SCAN
+    least recently used is dropped instead. Forgetting it grants that key
+    the tokens it had not yet regained, but a depleted bucket is only
+    dropped when every scanned bucket is at least as depleted, so flooding
+    distinct keys evicts the flood's own fresh buckets before a throttled
+    one. Size max_buckets above the number of keys active per refill
+    period to avoid this fallback.
+    """
+
+    def __init__(self, max_buckets: int = DEFAULT_MAX_BUCKETS, shards: int = DEFAULT_SHARDS):
+        """
+        Initialize backend.
+
+        Args:
+            max_buckets: Maximum buckets held across all shards
+            shards: Number of independently locked shards
+        """
+        self.max_buckets = max_buckets
+        self._per_shard = max(1, max_buckets // shards)
+        self._shards: List[Tuple[threading.Lock, "OrderedDict[str, float]"]] = [
+            (threading.Lock(), OrderedDict()) for _ in range(shards)
+        ]
+
+    def _shard(self, key: str) -> Tuple[threading.Lock, "OrderedDict[str, float]"]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def take(self, key: str, capacity: int, refill_rate: float, tokens: int = 1) -> Tuple[bool, float, float]:
+        """Consume tokens from a bucket, evicting another one if the shard is full."""
+        lock, buckets = self._shard(key)
+        now = time.time()
+        with lock:
+            allowed, full_at, remaining = _take(buckets.get(key, now), now, capacity, refill_rate, tokens)
+            buckets[key] = full_at
+            buckets.move_to_end(key)
+            if len(buckets) > self._per_shard:
+                self._evict(buckets, now)
+        return allowed, remaining, full_at - now
+
+    @staticmethod
+    def _evict(buckets: "OrderedDict[str, float]", now: float) -> None:
+        """Drop refilled buckets, or else the scanned bucket closest to full."""
+        evicted = False
+        while buckets and next(iter(buckets.values())) <= now:
+            buckets.popitem(last=False)
+            evicted = True
+        if evicted:
+            return
+
+        victim, victim_full_at = None, float("inf")
+        for key, full_at in itertools.islice(buckets.items(), EVICTION_SCAN):
+            if full_at < victim_full_at:
+                victim, victim_full_at = key, full_at
+        del buckets[victim]
+
+    def reset(self, key: str) -> None:
+        lock, buckets = self._shard(key)
+        with lock:
+            buckets.pop(key, None)
+
+    def __len__(self) -> int:
+        return sum(len(buckets) for _, buckets in self._shards)
+
+
+class SqliteBackend:
+    """
+    Bucket storage in a SQLite database shared by local worker processes.
+
+    One WAL-mode database file holds one row per active bucket; each
+    request is a single read-modify-write in an IMMEDIATE transaction, so
+    concurrent workers serialize on the bucket update only.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = Path(".claude/security/ratelimit.db"),
+        busy_timeout: float = 5.0,
+        prune_interval: float = 60.0,
+    ):
+        """
+        Initialize backend.
+
+        Args:
+            db_path: SQLite database file shared by all workers
+            busy_timeout: Seconds to wait for another worker's transaction
+            prune_interval: Seconds between deletions of refilled buckets
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.prune_interval = prune_interval
+        self._last_prune = time.time()
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=busy_timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def take(self, key: str, capacity: int, refill_rate: float, tokens: int = 1) -> Tuple[bool, float, float]:
+        """Consume tokens from a bucket shared with the other workers."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._conn.execute("SELECT full_at FROM buckets WHERE key = ?", (key,)).fetchone()
+                allowed, full_at, remaining = _take(row[0] if row else now, now, capacity, refill_rate, tokens)
+                if allowed:
+                    self._conn.execute(
+                        "INSERT INTO buckets (key, full_at) VALUES (?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET full_at = excluded.full_at",
+                        (key, full_at),
+                    )
+                if now - self._last_prune >= self.prune_interval:
+                    self._conn.execute("DELETE FROM buckets WHERE full_at <= ?", (now,))
+                    self._last_prune = now
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return allowed, remaining, full_at - now
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM buckets WHERE key = ?", (key,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM buckets").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
 class RateLimiter:
     """
-    In-process rate limiter with per-tenant/user/route limits.
+    Rate limiter with per-tenant/user/route limits.
+
+    Buckets live in the given backend (in-process by default).
     """
 
     def __init__(
         self,
         default_requests_per_minute: int = 60,
         default_burst: int = 10,
-        route_limits: Optional[Dict[str, Dict[str, int]]] = None
+        route_limits: Optional[Dict[str, Dict[str, int]]] = None,
+        backend: Optional[RateLimitBackend] = None
     ):
         """
         Initialize rate limiter.
@@ -96,17 +326,12 @@ class RateLimiter:
             default_requests_per_minute: Default rate limit
             default_burst: Default burst allowance
             route_limits: Per-route overrides {route: {requests_per_minute, burst}}
+            backend: Bucket storage (defaults to a MemoryBackend)
         """
         self.default_rpm = default_requests_per_minute
         self.default_burst = default_burst
         self.route_limits = route_limits or {}
-
-        # Buckets: {key -> TokenBucket}
-        self.buckets: Dict[str, TokenBucket] = {}
-
-        # Cleanup old buckets periodically
-        self.last_cleanup = time.time()
-        self.cleanup_interval = 300  # 5 minutes
+        self.backend = backend if backend is not None else MemoryBackend()
 
     def check_rate_limit(
         self,
@@ -133,45 +358,22 @@ class RateLimiter:
         # Compute rate limit key
         key = f"{tenant}:{identity.id}:{route}"
 
-        # Get or create bucket
-        if key not in self.buckets:
-            refill_rate = rpm / 60.0  # Convert to per-second
-            self.buckets[key] = TokenBucket(capacity=burst, refill_rate=refill_rate)
-
-        bucket = self.buckets[key]
-
-        # Try to consume token
-        allowed = bucket.consume(1)
-        remaining = bucket.remaining()
-        reset_in = bucket.reset_in()
-
-        # Periodic cleanup
-        self._maybe_cleanup()
-
-        return allowed, remaining, reset_in
-
-    def _maybe_cleanup(self):
-        """Cleanup old buckets periodically."""
-        now = time.time()
-        if now - self.last_cleanup < self.cleanup_interval:
-            return
-
-        # Remove buckets that are full (not actively used)
-        keys_to_remove = []
-        for key, bucket in self.buckets.items():
-            if bucket.tokens >= bucket.capacity:
-                keys_to_remove.append(key)
-
-        for key in keys_to_remove:
-            del self.buckets[key]
-
-        self.last_cleanup = now
+        allowed, remaining, reset_in = self.backend.take(key, burst, rpm / 60.0)
+        return allowed, int(remaining + _EPSILON), reset_in
 
     def reset(self, identity: Identity, tenant: str, route: str):
         """Reset rate limit for specific key."""
-        key = f"{tenant}:{identity.id}:{route}"
-        if key in self.buckets:
-            del self.buckets[key]
+        self.backend.reset(f"{tenant}:{identity.id}:{route}")
+
+
+def _backend_from_config(config: Dict[str, Any]) -> RateLimitBackend:
+    """Backend from the rate_limits.backend section of security.yaml."""
+    if config.get("type") == "sqlite":
+        return SqliteBackend(db_path=Path(config.get("path", ".claude/security/ratelimit.db")))
+    return MemoryBackend(
+        max_buckets=config.get("max_buckets", DEFAULT_MAX_BUCKETS),
+        shards=config.get("shards", DEFAULT_SHARDS),
+    )
 
 
 # Global instance
@@ -185,7 +387,6 @@ def get_rate_limiter() -> RateLimiter:
         # Load config from security.yaml
         try:
             import yaml
-            from pathlib import Path
 
             config_path = Path("configs/security.yaml")
             if config_path.exists():
@@ -200,7 +401,8 @@ def get_rate_limiter() -> RateLimiter:
                 _rate_limiter = RateLimiter(
                     default_requests_per_minute=default_rpm,
                     default_burst=default_burst,
-                    route_limits=route_limits
+                    route_limits=route_limits,
+                    backend=_backend_from_config(rate_config.get("backend", {}))
                 )
             else:
                 _rate_limiter = RateLimiter()
@@ -210,7 +412,7 @@ def get_rate_limiter() -> RateLimiter:
     return _rate_limiter
 
 
-def is_rate_limited(identity: Identity, tenant: str, route: str) -> Tuple[bool, Dict[str, any]]:
+def is_rate_limited(identity: Identity, tenant: str, route: str) -> Tuple[bool, Dict[str, Any]]:
     """
     Check if request is rate limited.
 
@@ -11,6 +11,7 @@ from fastapi import APIRouter, Request, Form, HTTPException
 from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from pathlib import Path
+import asyncio
 import time
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
@@ -21,10 +22,11 @@ import csv
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.data.warehouse import DuckDBWarehouse, QueryNotAllowed, QueryTimeout
+from src.data.artifact_catalog import get_artifact_catalog
 
 # Import ops modules for metrics
 try:
-    from src.ops.metrics import get_metrics
+    from src.ops.metrics import get_metrics_sampler
     from src.data.cache import get_cache
     from src.ops.logging import get_logger
     logger = get_logger("admin")
@@ -39,6 +41,13 @@ templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
 # Constants
 MAX_ROWS = 1000
 DEFAULT_TIMEOUT = 3
+CACHE_STATS_TTL_SECONDS = 60
+ARTIFACTS_DIR = Path("artifacts")
+RUNS_PER_PAGE = 50
+ARTIFACTS_PER_PAGE = 100
+
+_cache_stats: Optional[Dict[str, Any]] = None
+_cache_stats_at = 0.0
 
 
 def get_warehouse() -> DuckDBWarehouse:
@@ -55,134 +64,55 @@ def format_size(bytes: int) -> str:
     return f"{bytes:.1f} TB"
 
 
-def parse_prometheus_metrics(metrics_text: bytes) -> Dict[str, Any]:
-    """
-    Parse Prometheus metrics text format into structured data.
-
-    Returns dict with:
-    - http_requests_total: total requests
-    - http_request_latency_p95: p95 latency in seconds
-    - cache_hits: total cache hits
-    - cache_misses: total cache misses
-    - recent_errors: list of recent errors (placeholder)
+def get_cache_stats() -> Dict[str, Any]:
     """
-    result = {
-        "http_requests_total": 0,
-        "http_request_latency_p95": 0.0,
-        "cache_hits": 0,
-        "cache_misses": 0,
-        "orchestrator_phases": {},
-        "recent_errors": [],
-    }
-
-    try:
-        lines = metrics_text.decode("utf-8").split("\n")
-
-        for line in lines:
-            # Skip comments and empty lines
-            if not line or line.startswith("#"):
-                continue
-
-            # Parse metric lines: metric_name{labels} value
-            if "http_requests_total" in line and "{" in line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        result["http_requests_total"] += float(parts[-1])
-                    except ValueError:
-                        pass
-
-            elif "http_request_latency_seconds" in line and "quantile=\"0.95\"" in line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        result["http_request_latency_p95"] = float(parts[-1])
-                    except ValueError:
-                        pass
-
-            elif "cache_hits_total" in line and "{" in line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        result["cache_hits"] += float(parts[-1])
-                    except ValueError:
-                        pass
-
-            elif "cache_misses_total" in line and "{" in line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        result["cache_misses"] += float(parts[-1])
-                    except ValueError:
-                        pass
-
-            elif "orchestrator_phase_seconds" in line and "phase=" in line:
-                # Extract phase name and value
-                if "{" in line:
-                    phase_start = line.find('phase="') + 7
-                    phase_end = line.find('"', phase_start)
-                    if phase_start > 6 and phase_end > phase_start:
-                        phase = line[phase_start:phase_end]
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            try:
-                                # Store as average (simplified)
-                                result["orchestrator_phases"][phase] = float(parts[-1])
-                            except ValueError:
-                                pass
+    Get query cache stats, refreshed at most every CACHE_STATS_TTL_SECONDS.
 
-    except Exception as e:
-        if logger:
-            logger.warning("Failed to parse metrics", error=str(e))
+    QueryCache.get_stats() globs and reads the whole cache directory, so it
+    is not run on every dashboard load.
+    """
+    global _cache_stats, _cache_stats_at
 
-    return result
+    now = time.monotonic()
+    if _cache_stats is None or now - _cache_stats_at >= CACHE_STATS_TTL_SECONDS:
+        _cache_stats = get_cache().get_stats()
+        _cache_stats_at = now
+    return _cache_stats
 
 
 def get_ops_metrics() -> Dict[str, Any]:
     """
     Get ops metrics for admin dashboard.
 
+    Reads precomputed samples from the metrics sampler's ring buffers.
+
     Returns:
-    - request_rate_sparkline: list of recent request counts (last 10 minutes, 1min buckets)
-    - p95_latency_sparkline: list of recent p95 latencies
-    - orchestrator_phase_durations: dict of phase -> duration
+    - request_rate_sparkline: requests/second per sample interval
+    - p95_latency_sparkline: p95 latency (seconds) per sample interval
+    - orchestrator_phase_durations: dict of phase -> average duration
     - cache_hit_ratio: float 0-1
     - recent_warnings: list of recent warnings with trace IDs
     """
+    empty = {
+        "request_rate_sparkline": [],
+        "p95_latency_sparkline": [],
+        "orchestrator_phase_durations": {},
+        "cache_hit_ratio": 0.0,
+        "recent_warnings": [],
+    }
     if not HAS_OPS:
-        return {
-            "request_rate_sparkline": [0] * 10,
-            "p95_latency_sparkline": [0.0] * 10,
-            "orchestrator_phase_durations": {},
-            "cache_hit_ratio": 0.0,
-            "recent_warnings": [],
-        }
+        return empty
 
-    # Get current metrics snapshot
     try:
-        metrics_bytes = get_metrics()
-        metrics = parse_prometheus_metrics(metrics_bytes)
-
-        # Get cache stats
-        cache = get_cache()
-        cache_stats = cache.get_stats()
-
-        # Calculate cache hit ratio
-        total_cache_ops = metrics["cache_hits"] + metrics["cache_misses"]
-        cache_hit_ratio = metrics["cache_hits"] / total_cache_ops if total_cache_ops > 0 else 0.0
-
-        # Generate sparklines (simplified - in production, store historical data)
-        # For now, use mock data that varies slightly
-        import random
-        request_rate_sparkline = [int(metrics["http_requests_total"] * random.uniform(0.05, 0.15)) for _ in range(10)]
-        p95_latency_sparkline = [metrics["http_request_latency_p95"] * random.uniform(0.8, 1.2) for _ in range(10)]
+        sampler = get_metrics_sampler()
+        latest = sampler.latest() or {}
 
         return {
-            "request_rate_sparkline": request_rate_sparkline,
-            "p95_latency_sparkline": p95_latency_sparkline,
-            "orchestrator_phase_durations": metrics["orchestrator_phases"],
-            "cache_hit_ratio": cache_hit_ratio,
-            "cache_stats": cache_stats,
+            "request_rate_sparkline": sampler.series("request_rate"),
+            "p95_latency_sparkline": sampler.series("p95_latency_seconds"),
+            "orchestrator_phase_durations": latest.get("orchestrator_phase_durations", {}),
+            "cache_hit_ratio": latest.get("cache_hit_ratio", 0.0),
+            "cache_stats": get_cache_stats(),
             "recent_warnings": [
                 {"timestamp": "2 min ago", "message": "High latency detected", "trace_id": "a1b2c3d4"},
                 {"timestamp": "15 min ago", "message": "Cache miss rate elevated", "trace_id": "e5f6g7h8"},
@@ -192,13 +122,7 @@ def get_ops_metrics() -> Dict[str, Any]:
     except Exception as e:
         if logger:
             logger.error("Failed to get ops metrics", error=str(e))
-        return {
-            "request_rate_sparkline": [0] * 10,
-            "p95_latency_sparkline": [0.0] * 10,
-            "orchestrator_phase_durations": {},
-            "cache_hit_ratio": 0.0,
-            "recent_warnings": [],
-        }
+        return empty
 
 
 def generate_sparkline_svg(values: List[float], width: int = 100, height: int = 30, color: str = "#7823DC") -> str:
@@ -456,56 +380,79 @@ async def sql_console_post(
 
 
 @router.get("/admin/artifacts", response_class=HTMLResponse)
-async def artifacts_browser(request: Request):
+async def artifacts_browser(request: Request, page: int = 1, rescan: bool = False):
     """
     GET /admin/artifacts - Browse artifacts by run ID.
 
     Shows:
-    - List of run IDs
-    - Artifacts per run with sizes and download links
+    - Paginated list of run IDs with artifact counts and sizes
+    - Artifacts per run, loaded on expansion
     - Storage summary
-    """
-    artifacts_dir = Path("artifacts")
 
-    if not artifacts_dir.exists():
-        return templates.TemplateResponse("artifacts.html", {
-            "request": request,
-            "run_ids": [],
-            "artifacts": {},
-            "total_artifacts": 0,
-            "total_size": "0 B",
-        })
+    Reads the artifact catalog, re-indexing runs whose directory changed;
+    ?rescan=true re-indexes every run (e.g. after files were rewritten in place).
+    Indexing hashes files, so it runs in a worker thread.
+    """
+    catalog = get_artifact_catalog(ARTIFACTS_DIR)
+    await asyncio.to_thread(catalog.index_all if rescan else catalog.ensure_indexed)
 
-    # Scan artifacts directory
-    run_ids = []
-    artifacts = {}
-    total_artifacts = 0
-    total_bytes = 0
-
-    for run_dir in sorted(artifacts_dir.iterdir(), reverse=True):
-        if run_dir.is_dir():
-            run_id = run_dir.name
-            run_ids.append(run_id)
-            artifacts[run_id] = []
-
-            for artifact_file in run_dir.iterdir():
-                if artifact_file.is_file():
-                    size = artifact_file.stat().st_size
-                    total_bytes += size
-                    total_artifacts += 1
-
-                    artifacts[run_id].append({
-                        "name": artifact_file.name,
-                        "size": format_size(size),
-                        "type": artifact_file.suffix.upper().replace('.', '') or "FILE",
-                    })
+    totals = catalog.totals()
+    page = max(page, 1)
+    total_pages = max(1, -(-totals["runs"] // RUNS_PER_PAGE))
+    runs = catalog.list_runs(offset=(page - 1) * RUNS_PER_PAGE, limit=RUNS_PER_PAGE)
 
     return templates.TemplateResponse("artifacts.html", {
         "request": request,
-        "run_ids": run_ids,
-        "artifacts": artifacts,
-        "total_artifacts": total_artifacts,
-        "total_size": format_size(total_bytes),
+        "run_ids": [run["run_id"] for run in runs],
+        "runs": [
+            {**run, "size": format_size(run["total_bytes"])}
+            for run in runs
+        ],
+        "page": page,
+        "total_pages": total_pages,
+        "total_runs": totals["runs"],
+        "total_artifacts": totals["artifacts"],
+        "total_size": format_size(totals["total_bytes"]),
+    })
+
+
+@router.get("/admin/artifacts/{run_id}", response_class=HTMLResponse)
+async def run_artifacts(request: Request, run_id: str, page: int = 1):
+    """
+    GET /admin/artifacts/{run_id} - HTMX partial listing one run's artifacts.
+
+    The run directory is re-indexed when expanded so files written outside
+    the catalog still show up.
+    """
+    if ".." in run_id or "/" in run_id:
+        raise HTTPException(status_code=400, detail="Invalid path")
+
+    catalog = get_artifact_catalog(ARTIFACTS_DIR)
+    if page == 1:
+        await asyncio.to_thread(catalog.index_run, run_id)
+
+    run = catalog.get_run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    page = max(page, 1)
+    entries = catalog.list_artifacts(run_id, offset=(page - 1) * ARTIFACTS_PER_PAGE, limit=ARTIFACTS_PER_PAGE)
+
+    return templates.TemplateResponse("artifact_rows.html", {
+        "request": request,
+        "run_id": run_id,
+        "artifacts": [
+            {
+                "name": entry["path"],
+                "size": format_size(entry["size_bytes"]),
+                "type": entry["artifact_type"],
+                "sha256": entry["sha256"],
+                "created_at": entry["created_at"],
+            }
+            for entry in entries
+        ],
+        "page": page,
+        "has_more": page * ARTIFACTS_PER_PAGE < run["artifact_count"],
     })
 
 
@@ -529,7 +476,7 @@ async def download_artifact(run_id: str, filename: str):
     if ".." in run_id or ".." in filename:
         raise HTTPException(status_code=400, detail="Invalid path")
 
-    artifact_path = Path("artifacts") / run_id / filename
+    artifact_path = ARTIFACTS_DIR / run_id / filename
 
     if not artifact_path.exists() or not artifact_path.is_file():
         raise HTTPException(status_code=404, detail="Artifact not found")
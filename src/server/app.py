@@ -6,6 +6,7 @@ from fastapi.responses import JSONResponse, StreamingResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
 import json
 from pathlib import Path
 import io
@@ -32,6 +33,7 @@ from src.ops.metrics import (
     http_request_latency,
     get_metrics,
     get_content_type,
+    get_metrics_sampler,
 )
 
 # Security layer
@@ -47,11 +49,22 @@ configure_logging(json=False, level="INFO")
 logger = get_logger(__name__)
 init_tracer(service_name="kearney-platform-api")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Sample dashboard metrics for as long as the app is running."""
+    sampler = get_metrics_sampler()
+    sampler.start()
+    yield
+    sampler.stop()
+
+
 # Create app
 app = FastAPI(
     title="Kearney Data Platform API",
     description="DuckDB warehouse API with allowlisted SQL execution and admin dashboard",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Instrument with OpenTelemetry
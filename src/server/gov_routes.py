@@ -2,16 +2,14 @@
 Governance API routes for scorecards, dashboards, and feature flags.
 """
 
-import json
-from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Dict, List, Any
+from datetime import datetime
+from typing import List
 
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 
 from ..governance.flags import get_all_flags, set_flag, is_enabled
-from ..governance.runner import load_latest_profile
+from ..governance.scorecard import get_scorecard_tracker
 
 router = APIRouter(prefix="/api/gov", tags=["governance"])
 
@@ -40,213 +38,6 @@ class TrendsResponse(BaseModel):
     security_compliance: List[TrendPoint]
 
 
-def _compute_data_quality_index() -> float:
-    """
-    Compute data quality index from profiling and cleanliness scores.
-
-    Returns:
-        Score from 0-100
-    """
-    # Load recent profiles
-    profiles_dir = Path("governance/profiles")
-    datasets_file = profiles_dir / "datasets.ndjson"
-
-    if not datasets_file.exists():
-        return 0.0
-
-    # Read last 10 profiles
-    profiles = []
-    with open(datasets_file) as f:
-        for line in f:
-            profiles.append(json.loads(line))
-
-    if not profiles:
-        return 0.0
-
-    # Recent profiles (last 24 hours)
-    cutoff = datetime.utcnow() - timedelta(days=1)
-    recent = [
-        p for p in profiles
-        if datetime.fromisoformat(p["timestamp"]) > cutoff
-    ]
-
-    if not recent:
-        recent = profiles[-10:]  # Fallback to last 10
-
-    # Compute quality score
-    # Factors: null %, duplicate %, freshness
-    total_score = 0.0
-    for profile in recent:
-        stats = profile.get("stats", {})
-
-        # Null percentage (inverted - lower is better)
-        avg_null_pct = sum(
-            col.get("null_pct", 0)
-            for col in stats.get("columns_detail", {}).values()
-        ) / max(len(stats.get("columns_detail", {})), 1)
-
-        null_score = max(0, 100 - avg_null_pct)
-
-        # Duplicate percentage (inverted)
-        dup_pct = stats.get("duplicate_pct", 0)
-        dup_score = max(0, 100 - dup_pct)
-
-        # Combine
-        profile_score = (null_score * 0.6 + dup_score * 0.4)
-        total_score += profile_score
-
-    avg_score = total_score / len(recent)
-
-    # Add cleanliness bonus if available
-    cleanliness_file = Path("reports/cleanliness/latest_score.json")
-    if cleanliness_file.exists():
-        with open(cleanliness_file) as f:
-            cleanliness = json.load(f)
-            cleanliness_score = cleanliness.get("4S_total", 0)
-            avg_score = avg_score * 0.7 + cleanliness_score * 0.3
-
-    return round(avg_score, 1)
-
-
-def _compute_model_performance_index() -> float:
-    """
-    Compute model performance index from metrics.
-
-    Returns:
-        Score from 0-100
-    """
-    profiles_dir = Path("governance/profiles")
-    models_file = profiles_dir / "models.ndjson"
-
-    if not models_file.exists():
-        return 75.0  # Default if no data
-
-    # Read last 10 model profiles
-    profiles = []
-    with open(models_file) as f:
-        for line in f:
-            profiles.append(json.loads(line))
-
-    if not profiles:
-        return 75.0
-
-    recent = profiles[-10:]
-
-    # Compute score from metrics
-    total_score = 0.0
-    count = 0
-
-    for profile in recent:
-        metrics = profile.get("stats", {}).get("metrics", {})
-
-        if not metrics:
-            continue
-
-        score = 0.0
-
-        # R2 score (higher is better)
-        r2 = metrics.get("r2")
-        if r2 is not None:
-            score += max(0, r2 * 100)
-            count += 1
-
-        # RMSE (lower is better, normalize to 0-100)
-        rmse = metrics.get("rmse")
-        if rmse is not None:
-            # Assume rmse < 0.2 is excellent
-            rmse_score = max(0, (1 - min(rmse / 0.2, 1)) * 100)
-            score += rmse_score
-            count += 1
-
-        # Accuracy (if available)
-        accuracy = metrics.get("accuracy")
-        if accuracy is not None:
-            score += accuracy * 100
-            count += 1
-
-        if count > 0:
-            total_score += score / count
-
-    if count == 0:
-        return 75.0
-
-    return round(total_score / len([p for p in recent if p.get("stats", {}).get("metrics")]), 1)
-
-
-def _compute_platform_reliability_index() -> float:
-    """
-    Compute platform reliability from ops metrics.
-
-    Returns:
-        Score from 0-100
-    """
-    # Look for ops metrics artifact
-    ops_metrics_file = Path("perf/metrics/latest.json")
-
-    if not ops_metrics_file.exists():
-        return 85.0  # Default optimistic score
-
-    with open(ops_metrics_file) as f:
-        metrics = json.load(f)
-
-    # Factors: latency, error rate, cache hit rate
-    score = 100.0
-
-    # Latency (p95 < 400ms target)
-    latency = metrics.get("latency_p95_ms", 200)
-    if latency > 400:
-        score -= min(30, (latency - 400) / 10)
-
-    # Error rate (< 1% target)
-    error_rate = metrics.get("error_rate_pct", 0.1)
-    if error_rate > 1.0:
-        score -= min(20, (error_rate - 1.0) * 10)
-
-    # Cache hit rate (> 80% target)
-    cache_hit = metrics.get("cache_hit_rate_pct", 85)
-    if cache_hit < 80:
-        score -= min(15, (80 - cache_hit) / 2)
-
-    return round(max(0, score), 1)
-
-
-def _compute_security_compliance_index() -> float:
-    """
-    Compute security compliance from audit logs and security checks.
-
-    Returns:
-        Score from 0-100
-    """
-    # Check for recent security events
-    audit_dir = Path("governance/audit")
-
-    if not audit_dir.exists():
-        return 95.0  # Default if no audit data
-
-    # Check flag changes audit
-    flags_audit = audit_dir / "flags.ndjson"
-
-    if not flags_audit.exists():
-        return 95.0
-
-    # Read recent flag changes
-    recent_changes = []
-    cutoff = datetime.utcnow() - timedelta(days=7)
-
-    with open(flags_audit) as f:
-        for line in f:
-            entry = json.loads(line)
-            if datetime.fromisoformat(entry["timestamp"]) > cutoff:
-                recent_changes.append(entry)
-
-    # Score based on change frequency (more changes = slightly lower score)
-    base_score = 95.0
-    if len(recent_changes) > 20:
-        base_score -= min(10, (len(recent_changes) - 20) * 0.5)
-
-    return round(base_score, 1)
-
-
 @router.get("/scorecard", response_model=ScorecardResponse)
 async def get_scorecard():
     """
@@ -257,14 +48,11 @@ async def get_scorecard():
     - Model performance index (metrics trend + registry freshness)
     - Platform reliability index (p95 latency, error rate, cache hit)
     - Security compliance index (Phase 11 checks, audit anomalies)
+
+    Values are maintained incrementally from the governance logs and
+    cached briefly (see ScorecardTracker).
     """
-    return ScorecardResponse(
-        data_quality_index=_compute_data_quality_index(),
-        model_performance_index=_compute_model_performance_index(),
-        platform_reliability_index=_compute_platform_reliability_index(),
-        security_compliance_index=_compute_security_compliance_index(),
-        timestamp=datetime.utcnow().isoformat(),
-    )
+    return ScorecardResponse(**get_scorecard_tracker().compute())
 
 
 @router.get("/trends", response_model=TrendsResponse)
@@ -272,51 +60,20 @@ async def get_trends(days: int = 7):
     """
     Get time-series trends for KPIs.
 
+    Reads the daily KPI rollup maintained by the scorecard.
+
     Args:
         days: Number of days to retrieve (7, 30, or 90)
     """
     if days not in [7, 30, 90]:
         raise HTTPException(status_code=400, detail="days must be 7, 30, or 90")
 
-    # Load snapshots
-    snapshots_dir = Path("governance/snapshots")
-
-    if not snapshots_dir.exists():
-        # Return empty trends
-        return TrendsResponse(
-            data_quality=[],
-            model_performance=[],
-            platform_reliability=[],
-            security_compliance=[],
-        )
-
-    # Get recent snapshots
-    snapshots = sorted(snapshots_dir.glob("*.json"), reverse=True)[:days]
-
-    # Build trends (simplified - use summary data)
-    data_quality_trend = []
-    model_perf_trend = []
-    platform_rel_trend = []
-    security_comp_trend = []
-
-    for snapshot_file in reversed(snapshots):
-        with open(snapshot_file) as f:
-            snapshot = json.load(f)
-
-        date = snapshot.get("date", "")
-
-        # Use snapshot summary as proxy for trends
-        # In real implementation, store actual KPI values in snapshots
-        data_quality_trend.append(TrendPoint(date=date, value=_compute_data_quality_index()))
-        model_perf_trend.append(TrendPoint(date=date, value=_compute_model_performance_index()))
-        platform_rel_trend.append(TrendPoint(date=date, value=_compute_platform_reliability_index()))
-        security_comp_trend.append(TrendPoint(date=date, value=_compute_security_compliance_index()))
-
+    trends = get_scorecard_tracker().trends(days)
     return TrendsResponse(
-        data_quality=data_quality_trend,
-        model_performance=model_perf_trend,
-        platform_reliability=platform_rel_trend,
-        security_compliance=security_comp_trend,
+        data_quality=trends["data_quality_index"],
+        model_performance=trends["model_performance_index"],
+        platform_reliability=trends["platform_reliability_index"],
+        security_compliance=trends["security_compliance_index"],
     )
 
 
@@ -11,8 +11,12 @@ Provides REST API for:
 
 from fastapi import APIRouter, HTTPException, Header
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from typing import Optional, Dict, Any, List
 from pathlib import Path
+from datetime import datetime
+from collections import OrderedDict
+from uuid import uuid4
 import json
 
 from src.registry.manager import RegistryManager
@@ -32,6 +36,23 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 # TODO: Move to proper secrets management in Phase 10
 REGISTRY_API_KEY = "kearney-registry-key"  # Placeholder
 
+# Progress of recent POST /verify runs by verify ID, served by GET /verify/progress
+_verify_progress: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+# Finished runs kept for polling after they complete
+VERIFY_PROGRESS_KEEP = 20
+
+
+def _start_verify_progress(verify_id: str) -> Dict[str, Any]:
+    """Register a verify run's progress entry and drop the oldest finished ones."""
+    progress = {"running": True, "started_at": datetime.utcnow().isoformat() + "Z"}
+    _verify_progress[verify_id] = progress
+    _verify_progress.move_to_end(verify_id)
+
+    finished = [key for key, entry in _verify_progress.items() if not entry["running"]]
+    for key in finished[: max(0, len(finished) - VERIFY_PROGRESS_KEEP)]:
+        del _verify_progress[key]
+    return progress
+
 
 def verify_api_key(api_key: Optional[str]):
     """Verify API key for write operations."""
@@ -286,7 +307,11 @@ async def get_metrics():
 
 @router.post("/verify")
 async def verify_integrity(
+    changed_only: bool = False,
+    rehash: bool = False,
+    verify_id: Optional[str] = None,
     x_api_key: Optional[str] = Header(None),
+    x_request_id: Optional[str] = Header(None),
 ):
     """
     Verify integrity of registry and catalog.
@@ -298,20 +323,71 @@ async def verify_integrity(
     - SHA256 hashes match
     - Manifest file sizes
 
+    Artifacts unchanged since the last verification are not re-hashed
+    (unless rehash=true); with changed_only=true only changed artifacts are
+    checked. Hashing runs off the event loop, so
+    GET /verify/progress?verify_id=... can be polled meanwhile. The ID is
+    the verify_id parameter, else the X-Request-ID header, else generated;
+    it is returned as verify_id in the results.
+
     Returns:
         Verification results
     """
     verify_api_key(x_api_key)
+    verify_id = verify_id or x_request_id or uuid4().hex
 
     try:
         manager = RegistryManager(PROJECT_ROOT)
-        results = manager.verify_integrity()
+        progress = _start_verify_progress(verify_id)
+
+        def report(done: int, total: int, done_bytes: int, total_bytes: int):
+            progress.update(
+                artifacts_done=done,
+                artifacts_total=total,
+                bytes_done=done_bytes,
+                bytes_total=total_bytes,
+            )
+
+        try:
+            results = await run_in_threadpool(
+                manager.verify_integrity,
+                changed_only=changed_only,
+                use_cache=not rehash,
+                progress=report,
+            )
+        finally:
+            progress["running"] = False
 
         status_code = 200 if results["valid"] else 500
 
         return JSONResponse(
             status_code=status_code,
-            content=results,
+            content={"verify_id": verify_id, **results},
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to verify integrity: {str(e)}")
+
+
+@router.get("/verify/progress")
+async def get_verify_progress(verify_id: Optional[str] = None):
+    """
+    Get progress of integrity verifications.
+
+    Args:
+        verify_id: ID of one verify run (see POST /verify)
+
+    Returns:
+        For verify_id: its running flag, start time, and artifacts/bytes
+        hashed so far. Without it: the same for every recent run.
+    """
+    if verify_id is None:
+        return {
+            "runs": [
+                {"verify_id": key, **progress} for key, progress in _verify_progress.items()
+            ]
+        }
+
+    progress = _verify_progress.get(verify_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail=f"Unknown verify run: {verify_id}")
+    return {"verify_id": verify_id, **progress}
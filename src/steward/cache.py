@@ -0,0 +1,76 @@
+"""Per-file result caches and parallel scanning shared by the steward checks."""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def load_json_cache(cache_path: Optional[Path], version: int, **params: Any) -> Dict[str, list]:
+    """
+    Per-file entries from a versioned JSON cache.
+
+    Args:
+        cache_path: Cache file (None disables caching)
+        version: Format version the caller writes
+        params: Settings the entries depend on; a cache written with other
+            values is discarded
+
+    Returns:
+        Entries by root-relative path ({} if missing, unreadable or outdated)
+    """
+    if cache_path is None or not cache_path.exists():
+        return {}
+    try:
+        with open(cache_path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != version:
+        return {}
+    if any(data.get(key) != value for key, value in params.items()):
+        return {}
+    return data.get("files", {})
+
+
+def save_json_cache(
+    cache_path: Optional[Path], version: int, files: Dict[str, list], **params: Any
+) -> None:
+    """Atomically write per-file entries (temp file + rename) for load_json_cache."""
+    if cache_path is None:
+        return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(temp_path, "w") as f:
+        json.dump({"version": version, **params, "files": files}, f)
+    temp_path.replace(cache_path)
+
+
+def map_maybe_parallel(
+    fn: Callable[[T], R],
+    items: Sequence[T],
+    threshold: int,
+    max_workers: Optional[int],
+    chunksize: int = 1,
+) -> List[R]:
+    """
+    Apply fn to each item, in a process pool once there are enough items.
+
+    Args:
+        fn: Picklable module-level function
+        items: Arguments, one per call
+        threshold: Item count at which the pool is used; fewer run inline
+        max_workers: Worker processes (default: CPU count); 1 always runs inline
+        chunksize: Items sent to a worker at a time
+
+    Returns:
+        Results in item order
+    """
+    if len(items) >= threshold and max_workers != 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(fn, items, chunksize=chunksize))
+    return [fn(item) for item in items]
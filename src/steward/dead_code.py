@@ -1,20 +1,39 @@
 """Dead code detection using static analysis."""
 
 import ast
+import hashlib
 import re
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import Any, List, Dict, Set, Optional, Tuple
 from collections import defaultdict
 
+from .cache import load_json_cache, map_maybe_parallel, save_json_cache
 from .config import HygieneConfig
+from .ignore import IgnoreMatcher, walk_files
+
+# Per-file symbol tables, reused while file contents are unchanged
+SYMBOL_TABLE_CACHE = Path(".claude") / "steward" / "dead_code_cache.json"
+
+TABLE_VERSION = 1
+
+# Stale files at which parsing moves to a process pool; fewer are parsed inline
+PARALLEL_MIN_FILES = 64
+
+SKIP_DIRS = {"__pycache__", "venv", ".venv", "node_modules"}
+
+
+def _first_line(lines: Dict[str, int], name: str, lineno: int) -> None:
+    if name not in lines or lineno < lines[name]:
+        lines[name] = lineno
 
 
 class DeadCodeAnalyzer(ast.NodeVisitor):
     """AST visitor for dead code detection."""
 
-    def __init__(self, source_code: str, filepath: Path):
+    def __init__(self, source_code: str, filepath: Path, module: str = ""):
         self.source = source_code
         self.filepath = filepath
+        self.module = module
         self.lines = source_code.split("\n")
 
         # Track definitions
@@ -23,57 +42,100 @@ class DeadCodeAnalyzer(ast.NodeVisitor):
         self.defined_vars: Set[str] = set()
         self.imports: Set[str] = set()
 
+        # First line of each definition and import, from the AST
+        self.function_lines: Dict[str, int] = {}
+        self.class_lines: Dict[str, int] = {}
+        self.import_lines: Dict[str, int] = {}
+
+        # Dotted names this module imports ("pkg.mod.name") and star-imports
+        self.import_targets: Set[str] = set()
+        self.star_imports: Set[str] = set()
+
         # Track usage
         self.used_names: Set[str] = set()
+        self.used_attributes: Set[str] = set()
 
         # Results
         self.unused_functions: List[Dict] = []
         self.unused_classes: List[Dict] = []
         self.unused_imports: List[Dict] = []
 
+    def visit(self, node):
+        """Dispatch every node of the tree to its visit_ method, iteratively."""
+        handlers = {}
+        for child in ast.walk(node):
+            kind = type(child)
+            if kind not in handlers:
+                name = "visit_" + kind.__name__
+                # Skip NodeVisitor's own (recursive) compatibility handlers
+                own = getattr(type(self), name, None) is not getattr(ast.NodeVisitor, name, None)
+                handlers[kind] = getattr(self, name) if own else None
+            handler = handlers[kind]
+            if handler is not None:
+                handler(child)
+
     def visit_FunctionDef(self, node):
         """Visit function definition."""
         self.defined_functions.add(node.name)
-        self.generic_visit(node)
+        _first_line(self.function_lines, node.name, node.lineno)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
 
     def visit_ClassDef(self, node):
         """Visit class definition."""
         self.defined_classes.add(node.name)
-        self.generic_visit(node)
+        _first_line(self.class_lines, node.name, node.lineno)
 
     def visit_Import(self, node):
         """Visit import statement."""
         for alias in node.names:
-            name = alias.asname if alias.asname else alias.name
+            # 'import a.b' binds 'a'
+            name = alias.asname if alias.asname else alias.name.split(".")[0]
             self.imports.add(name)
-        self.generic_visit(node)
+            _first_line(self.import_lines, name, node.lineno)
+            self.import_targets.add(alias.name)
 
     def visit_ImportFrom(self, node):
         """Visit from...import statement."""
+        base = self._resolve_from(node)
         for alias in node.names:
             if alias.name != "*":
                 name = alias.asname if alias.asname else alias.name
                 self.imports.add(name)
-        self.generic_visit(node)
+                _first_line(self.import_lines, name, node.lineno)
+                if base:
+                    self.import_targets.add(f"{base}.{alias.name}")
+            elif base:
+                self.star_imports.add(base)
+
+    def _resolve_from(self, node: ast.ImportFrom) -> str:
+        """Absolute module of a from-import, resolving relative levels against this module."""
+        if not node.level:
+            return node.module or ""
+        package = self.module.split(".")
+        if self.filepath.name != "__init__.py":
+            package = package[:-1]
+        if node.level > 1:
+            package = package[: len(package) - (node.level - 1)]
+        return ".".join(package + ([node.module] if node.module else []))
 
     def visit_Name(self, node):
         """Visit name reference."""
         if isinstance(node.ctx, ast.Load):
             self.used_names.add(node.id)
-        self.generic_visit(node)
 
     def visit_Attribute(self, node):
         """Visit attribute access."""
         # Track attribute usage
         if isinstance(node.value, ast.Name):
             self.used_names.add(node.value.id)
-        self.generic_visit(node)
+        if isinstance(node.ctx, ast.Load):
+            self.used_attributes.add(node.attr)
 
     def visit_Call(self, node):
         """Visit function call."""
         if isinstance(node.func, ast.Name):
             self.used_names.add(node.func.id)
-        self.generic_visit(node)
 
     def analyze(self) -> None:
         """Run analysis to find unused code."""
@@ -84,8 +146,7 @@ class DeadCodeAnalyzer(ast.NodeVisitor):
             # Find unused functions
             for func_name in self.defined_functions:
                 if func_name not in self.used_names and not func_name.startswith("_"):
-                    # Find line number
-                    lineno = self._find_definition_line(func_name, "def")
+                    lineno = self.function_lines[func_name]
                     if lineno:
                         self.unused_functions.append(
                             {
@@ -99,7 +160,7 @@ class DeadCodeAnalyzer(ast.NodeVisitor):
             # Find unused classes
             for class_name in self.defined_classes:
                 if class_name not in self.used_names:
-                    lineno = self._find_definition_line(class_name, "class")
+                    lineno = self.class_lines[class_name]
                     if lineno:
                         self.unused_classes.append(
                             {
@@ -113,7 +174,7 @@ class DeadCodeAnalyzer(ast.NodeVisitor):
             # Find unused imports
             for import_name in self.imports:
                 if import_name not in self.used_names:
-                    lineno = self._find_import_line(import_name)
+                    lineno = self.import_lines[import_name]
                     if lineno:
                         self.unused_imports.append(
                             {
@@ -127,28 +188,179 @@ class DeadCodeAnalyzer(ast.NodeVisitor):
         except SyntaxError:
             pass  # Skip files with syntax errors
 
-    def _find_definition_line(self, name: str, keyword: str) -> Optional[int]:
-        """Find line number of definition."""
-        pattern = re.compile(rf"^\s*{keyword}\s+{name}\s*[\(:]")
-        for i, line in enumerate(self.lines, 1):
-            if pattern.match(line):
-                return i
+    def symbol_table(self) -> Dict[str, Any]:
+        """Parse the source and return its definitions and references (JSON-serializable)."""
+        tree = ast.parse(self.source, filename=str(self.filepath))
+        self.visit(tree)
+        return {
+            "module": self.module,
+            "functions": self.function_lines,
+            "classes": self.class_lines,
+            "imports": self.import_lines,
+            "import_targets": sorted(self.import_targets),
+            "star_imports": sorted(self.star_imports),
+            "names": sorted(self.used_names),
+            "attributes": sorted(self.used_attributes),
+        }
+
+
+def module_name(rel_path: str) -> str:
+    """Dotted module name of a root-relative .py path."""
+    parts = rel_path[: -len(".py")].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+def _parse_file(paths: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """Symbol table of one (absolute path, relative path) file (None if it does not parse)."""
+    path, rel_path = paths
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            source = f.read()
+        return DeadCodeAnalyzer(source, Path(rel_path), module_name(rel_path)).symbol_table()
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError, RecursionError):
         return None
 
-    def _find_import_line(self, name: str) -> Optional[int]:
-        """Find line number of import."""
-        for i, line in enumerate(self.lines, 1):
-            if f"import {name}" in line or f"import.*{name}" in line:
-                return i
-        return None
+
+def _suffixes(dotted: str, minimum: int) -> List[str]:
+    """Trailing dotted components of a name, longest first, at least minimum long."""
+    parts = dotted.split(".")
+    return [".".join(parts[i:]) for i in range(len(parts) - minimum + 1)]
+
+
+class SymbolIndex:
+    """Per-file symbol tables merged into a repository-wide reference graph."""
+
+    def __init__(
+        self,
+        root: Path,
+        cache_path: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+        matcher: Optional[IgnoreMatcher] = None,
+    ):
+        """
+        Initialize index.
+
+        Args:
+            root: Repository root
+            cache_path: JSON file caching symbol tables by content hash (optional)
+            max_workers: Parser processes for large change sets (default: CPU count)
+            matcher: Ignore matcher; ignored files and directories are not parsed
+        """
+        self.root = root
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self.matcher = matcher
+
+        # rel path -> (sha256, symbol table or None)
+        self._tables: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
+        self.files_parsed = 0
+
+        # Repository-wide references
+        self._names: Dict[str, Set[str]] = {}
+        self._imported: Set[str] = set()
+        self._attributes: Set[str] = set()
+        self._star_names: Dict[str, Set[str]] = {}
+
+    def _python_files(self) -> List[str]:
+        return [
+            rel
+            for rel, entry in walk_files(
+                self.root,
+                self.matcher,
+                prune=lambda name: name.startswith(".") or name in SKIP_DIRS,
+            )
+            if rel.endswith(".py")
+        ]
+
+    def build(self) -> "SymbolIndex":
+        """Parse every Python file once, re-parsing only files whose content changed."""
+        cached = load_json_cache(self.cache_path, TABLE_VERSION)
+        tables: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
+        stale: List[Tuple[str, str]] = []
+
+        for rel in self._python_files():
+            try:
+                digest = hashlib.sha256((self.root / rel).read_bytes()).hexdigest()
+            except OSError:
+                continue
+            entry = cached.get(rel)
+            if entry and entry[0] == digest:
+                tables[rel] = (digest, entry[1])
+            else:
+                stale.append((rel, digest))
+
+        parsed = map_maybe_parallel(
+            _parse_file,
+            [(str(self.root / rel), rel) for rel, _ in stale],
+            PARALLEL_MIN_FILES,
+            self.max_workers,
+            chunksize=16,
+        )
+
+        for (rel, digest), table in zip(stale, parsed):
+            tables[rel] = (digest, table)
+        self.files_parsed = len(stale)
+        self._tables = tables
+        self._merge()
+
+        if stale or len(tables) != len(cached):
+            save_json_cache(
+                self.cache_path,
+                TABLE_VERSION,
+                {rel: list(entry) for rel, entry in tables.items()},
+            )
+        return self
+
+    def _merge(self) -> None:
+        """Build the repository-wide reference sets from the per-file tables."""
+        self._names, self._imported, self._attributes, self._star_names = {}, set(), set(), {}
+        for rel, (_, table) in self._tables.items():
+            if table is None:
+                continue
+            self._names[rel] = set(table["names"])
+            # Imports also match modules named relative to a source root
+            # ('steward.scanner.x' for a definition in src/steward/scanner.py)
+            for target in table["import_targets"]:
+                self._imported.update(_suffixes(target, minimum=2))
+            self._attributes.update(table["attributes"])
+            for module in table["star_imports"]:
+                for suffix in _suffixes(module, minimum=1):
+                    self._star_names.setdefault(suffix, set()).update(table["names"])
+
+    def is_used(self, rel_path: str, name: str) -> bool:
+        """Whether a name defined in rel_path is referenced anywhere in the repository.
+
+        A definition is used when its own module loads the name, another
+        module imports it (directly or with a star import and then loads it),
+        or any module accesses an attribute of that name.
+        """
+        if name in self._names.get(rel_path, ()) or name in self._attributes:
+            return True
+        module = self._tables[rel_path][1]["module"]
+        if f"{module}.{name}" in self._imported:
+            return True
+        return any(name in self._star_names.get(suffix, ()) for suffix in _suffixes(module, minimum=1))
+
+    def tables(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """(rel path, symbol table) of every file that parsed, in path order."""
+        return [(rel, table) for rel, (_, table) in sorted(self._tables.items()) if table is not None]
 
 
 def analyze_dead_code(
     root: Path,
     config: HygieneConfig,
     output_path: Optional[Path] = None,
+    cache_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
 ) -> Dict:
-    """Analyze repository for dead code."""
+    """Analyze repository for dead code.
+
+    Symbol tables are cached by content hash at cache_path (default:
+    .claude/steward/dead_code_cache.json), so repeat runs re-parse only
+    changed files, and usage is judged across all modules.
+    """
     if output_path is None:
         output_path = root / "reports" / "dead_code.md"
 
@@ -167,43 +379,43 @@ def analyze_dead_code(
     )
     ignore_unused_imports = config.get("dead_code.ignore_unused_imports", ["__init__.py"])
 
-    # Scan Python files
-    for py_file in root.rglob("*.py"):
-        # Skip excluded paths
-        if any(
-            part.startswith(".")
-            or part in ["__pycache__", "venv", ".venv", "node_modules"]
-            for part in py_file.parts
-        ):
-            continue
+    index = SymbolIndex(
+        root,
+        cache_path=cache_path or root / SYMBOL_TABLE_CACHE,
+        max_workers=max_workers,
+        matcher=IgnoreMatcher(root, (".gitignore",)),
+    ).build()
 
-        # Skip excluded patterns
-        rel_path = str(py_file.relative_to(root))
+    # Excluded files are not reported on, but their references still count
+    for rel_path, table in index.tables():
         if any(re.search(pattern, rel_path) for pattern in exclude_patterns):
             continue
-
-        try:
-            with open(py_file, "r", encoding="utf-8") as f:
-                source = f.read()
-
-            analyzer = DeadCodeAnalyzer(source, py_file.relative_to(root))
-            analyzer.analyze()
-
-            # Filter out excluded names
-            for func in analyzer.unused_functions:
-                if func["name"] not in exclude_names:
-                    all_unused_functions.append(func)
-
-            for cls in analyzer.unused_classes:
-                if cls["name"] not in exclude_names:
-                    all_unused_classes.append(cls)
-
-            # Filter imports based on file
-            if py_file.name not in ignore_unused_imports:
-                all_unused_imports.extend(analyzer.unused_imports)
-
-        except Exception:
-            continue
+        file = str(Path(rel_path))
+
+        for func_name, lineno in sorted(table["functions"].items(), key=lambda item: item[1]):
+            if func_name.startswith("_") or func_name in exclude_names:
+                continue
+            if not index.is_used(rel_path, func_name):
+                all_unused_functions.append(
+                    {"name": func_name, "file": file, "line": lineno, "type": "function"}
+                )
+
+        for class_name, lineno in sorted(table["classes"].items(), key=lambda item: item[1]):
+            if class_name in exclude_names:
+                continue
+            if not index.is_used(rel_path, class_name):
+                all_unused_classes.append(
+                    {"name": class_name, "file": file, "line": lineno, "type": "class"}
+                )
+
+        # Imports are only used by the importing module itself
+        if Path(rel_path).name not in ignore_unused_imports:
+            names = set(table["names"])
+            for import_name, lineno in sorted(table["imports"].items(), key=lambda item: item[1]):
+                if import_name not in names:
+                    all_unused_imports.append(
+                        {"name": import_name, "file": file, "line": lineno, "type": "import"}
+                    )
 
     # Generate report
     with open(output_path, "w") as f:
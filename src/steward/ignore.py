@@ -0,0 +1,277 @@
+"""Compiled, hierarchical .gitignore-style matchers and a pruning tree walker."""
+
+import os
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+class IgnoreRule:
+    """One gitignore pattern, compiled relative to the directory of its ignore file."""
+
+    def __init__(self, pattern: str):
+        """
+        Compile a gitignore pattern.
+
+        Args:
+            pattern: Pattern line (comments and trailing spaces already removed)
+        """
+        self.pattern = pattern
+        self.negate = pattern.startswith("!")
+        if self.negate:
+            pattern = pattern[1:]
+        elif pattern.startswith("\\"):
+            pattern = pattern[1:]
+
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+
+        # Patterns containing a slash are anchored to the ignore file's
+        # directory; others match a name at any depth below it
+        anchored = "/" in pattern
+        self.source = _translate(pattern.lstrip("/"))
+        if not anchored:
+            self.source = "(?:.*/)?" + self.source
+
+    def matches(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Whether the rule matches a path relative to its ignore file's directory."""
+        if self.dir_only and not is_dir:
+            return False
+        return re.fullmatch(self.source, rel_path) is not None
+
+    def __repr__(self) -> str:
+        return f"IgnoreRule({self.pattern!r})"
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob into a regular expression."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                at_start = i == 0 or pattern[i - 1] == "/"
+                i += 2
+                if at_start and i < n and pattern[i] == "/":
+                    # '**/' : zero or more directories
+                    out.append("(?:.*/)?")
+                    i += 1
+                elif at_start and i == n:
+                    # trailing '/**' : everything inside
+                    out.append(".*")
+                else:
+                    out.append("[^/]*")
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2 if pattern[i + 1:i + 2] in ("!", "^") else i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                out.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def parse_ignore_lines(lines: Sequence[str]) -> List[IgnoreRule]:
+    """Compile the patterns of an ignore file."""
+    rules = []
+    for line in lines:
+        line = line.rstrip("\n")
+        if not line.strip() or line.startswith("#"):
+            continue
+        # Trailing spaces are ignored unless escaped
+        if not line.endswith("\\ "):
+            line = line.rstrip()
+        rules.append(IgnoreRule(line))
+    return rules
+
+
+class CompiledIgnoreFile:
+    """
+    Rules of one directory's ignore files, compiled into two alternations.
+
+    Alternatives are ordered last rule first, so the first alternative that
+    matches is the rule git would apply; its group name identifies it.
+    """
+
+    def __init__(self, rules: List[IgnoreRule]):
+        self.rules = rules
+        self.negations = {f"r{i}": rule.negate for i, rule in enumerate(rules)}
+        self._files = self._compile([i for i, rule in enumerate(rules) if not rule.dir_only])
+        self._dirs = self._compile(list(range(len(rules))))
+
+    def _compile(self, indexes: List[int]) -> Optional["re.Pattern[str]"]:
+        if not indexes:
+            return None
+        return re.compile("|".join(f"(?P<r{i}>{self.rules[i].source})" for i in reversed(indexes)))
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """True if ignored, False if re-included by a negation, None if no rule matches."""
+        regex = self._dirs if is_dir else self._files
+        if regex is None:
+            return None
+        found = regex.fullmatch(rel_path)
+        if found is None:
+            return None
+        return not self.negations[found.lastgroup]
+
+
+class IgnoreMatcher:
+    """
+    Hierarchical ignore matcher for one or more ignore file names.
+
+    Ignore files are read once, on first use of their directory. Rules in
+    deeper files take precedence over shallower ones, later rules over earlier
+    ones, and a path inside an ignored directory stays ignored (as in git).
+
+    Each file name is evaluated on its own and a path is ignored if any of
+    them ignores it, so a negation in .tidyignore cannot re-include a path
+    that .gitignore excludes.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        filenames: Sequence[str] = (".gitignore",),
+        revalidate: bool = False,
+    ):
+        """
+        Initialize matcher.
+
+        Args:
+            root: Repository root
+            filenames: Ignore file names read in every directory (e.g. .gitignore)
+            revalidate: Re-stat a directory's ignore files on every lookup and
+                re-read them if they changed (for long-lived matchers)
+        """
+        self.root = Path(root)
+        self.filenames = tuple(filenames)
+        self.revalidate = revalidate
+        # directory -> compiled rules per file name (None where it has none)
+        self._compiled: Dict[str, Tuple[Optional[CompiledIgnoreFile], ...]] = {}
+        # directory -> (mtime_ns, size) per file name (None where missing)
+        self._stamps: Dict[str, Tuple[Optional[Tuple[int, int]], ...]] = {}
+
+    def _stamp(self, directory: str) -> Tuple[Optional[Tuple[int, int]], ...]:
+        stamps = []
+        for filename in self.filenames:
+            try:
+                stat = (self.root / directory / filename).stat()
+            except OSError:
+                stamps.append(None)
+            else:
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(stamps)
+
+    def compiled_for(self, directory: str) -> Tuple[Optional[CompiledIgnoreFile], ...]:
+        """Compiled rules of one root-relative directory, one entry per file name."""
+        if directory in self._compiled:
+            if not self.revalidate:
+                return self._compiled[directory]
+            stamp = self._stamp(directory)
+            if stamp == self._stamps[directory]:
+                return self._compiled[directory]
+        else:
+            stamp = self._stamp(directory) if self.revalidate else ()
+
+        compiled: List[Optional[CompiledIgnoreFile]] = []
+        for filename in self.filenames:
+            path = self.root / directory / filename
+            try:
+                with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                    rules = parse_ignore_lines(f.readlines())
+            except (FileNotFoundError, NotADirectoryError):
+                rules = []
+            compiled.append(CompiledIgnoreFile(rules) if rules else None)
+        self._compiled[directory] = tuple(compiled)
+        self._stamps[directory] = stamp
+        return self._compiled[directory]
+
+    def _match_file(self, index: int, rel_path: str, is_dir: bool) -> bool:
+        """Whether the ignore files named filenames[index] ignore rel_path."""
+        directory = rel_path
+        while directory:
+            directory = directory.rpartition("/")[0]
+            compiled = self.compiled_for(directory)[index]
+            if compiled is not None:
+                sub_path = rel_path[len(directory) + 1:] if directory else rel_path
+                result = compiled.match(sub_path, is_dir)
+                if result is not None:
+                    return result
+        return False
+
+    def match(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Whether rel_path is ignored by the rules of its ancestors' ignore files.
+
+        Does not consider whether a parent directory is ignored; the tree
+        walker prunes those, and is_ignored checks them explicitly.
+        """
+        return any(
+            self._match_file(index, rel_path, is_dir) for index in range(len(self.filenames))
+        )
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Whether rel_path, or any directory containing it, is ignored."""
+        parts = rel_path.split("/")
+        for i in range(1, len(parts)):
+            if self.match("/".join(parts[:i]), is_dir=True):
+                return True
+        return self.match(rel_path, is_dir)
+
+
+def walk_files(
+    root: Path,
+    matcher: Optional[IgnoreMatcher] = None,
+    prune: Optional[Callable[[str], bool]] = None,
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Walk a tree, never descending into ignored or pruned directories.
+
+    Args:
+        root: Directory to walk
+        matcher: Ignore matcher; ignored files and directories are skipped
+        prune: Called with each directory name; True skips the directory
+
+    Yields:
+        (root-relative POSIX path, DirEntry) for every regular file
+    """
+    stack = [""]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(root / directory if directory else root) as entries:
+                entries = sorted(entries, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            rel = f"{directory}/{entry.name}" if directory else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if prune and prune(entry.name):
+                    continue
+                if matcher and matcher.match(rel, is_dir=True):
+                    continue
+                subdirs.append(rel)
+            elif entry.is_file():
+                if matcher and matcher.match(rel):
+                    continue
+                yield rel, entry
+        stack.extend(reversed(subdirs))
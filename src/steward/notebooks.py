@@ -1,10 +1,289 @@
 """Jupyter notebook hygiene checker and sanitizer."""
 
 import json
+import re
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, BinaryIO, List, Dict, Optional, Tuple
 
+from .cache import load_json_cache, map_maybe_parallel, save_json_cache
 from .config import HygieneConfig
+from .ignore import IgnoreMatcher, walk_files
+
+# Per-notebook statistics, reused while size and mtime are unchanged
+NOTEBOOK_CACHE = Path(".claude") / "steward" / "notebook_cache.json"
+
+CACHE_VERSION = 1
+
+# Stale notebooks at which scanning moves to a process pool; fewer are read inline
+PARALLEL_MIN_FILES = 8
+
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+
+
+class _JsonStream:
+    """
+    Forward-only JSON reader over a binary file.
+
+    Holds one chunk at a time: values that are skipped (such as output
+    payloads) are scanned for their end but never materialized.
+    """
+
+    def __init__(self, f: BinaryIO, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = b""
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+
+    @property
+    def position(self) -> int:
+        """Absolute byte offset of the next unread byte."""
+        return self.offset + self.pos
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.offset += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> bytes:
+        """Next non-whitespace byte (not consumed)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos:self.pos + 1]
+            if not self._fill():
+                raise ValueError("Unexpected end of notebook JSON")
+
+    def expect(self, char: bytes) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at byte {self.position}")
+        self.pos += 1
+
+    def _string(self, keep: bool) -> bytes:
+        self.expect(b'"')
+        parts = []
+        # Whether the string read so far ends in an unpaired backslash
+        escaping = False
+        while True:
+            quote = self.buf.find(b'"', self.pos)
+            end = len(self.buf) if quote == -1 else quote
+            run_start = end
+            while run_start > self.pos and self.buf[run_start - 1] == 0x5C:
+                run_start -= 1
+            escaped = (end - run_start) % 2 == 1
+            if run_start == self.pos:
+                escaped ^= escaping
+            if keep:
+                parts.append(self.buf[self.pos:end])
+
+            if quote == -1:
+                # Chunk ended inside the string: carry the escape state on
+                escaping = escaped
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise ValueError("Unterminated string in notebook JSON")
+                continue
+            self.pos = quote + 1
+            if not escaped:
+                return b"".join(parts)
+            if keep:
+                parts.append(b'"')
+            escaping = False
+
+    def read_string(self) -> bytes:
+        """Raw bytes of a (short) string, escapes left as written."""
+        return self._string(keep=True)
+
+    def read_scalar(self) -> bytes:
+        """A number, true, false or null."""
+        self.peek()
+        while True:
+            end = _SCALAR.match(self.buf, self.pos).end()
+            if end < len(self.buf) or not self._fill():
+                break
+        value = self.buf[self.pos:end]
+        if not value:
+            raise ValueError(f"Expected a value at byte {self.position}")
+        self.pos = end
+        return value
+
+    def skip_value(self) -> None:
+        """Consume one complete value of any size."""
+        depth = 0
+        while True:
+            char = self.peek()
+            if char == b'"':
+                self._string(keep=False)
+            elif char in (b"{", b"["):
+                self.pos += 1
+                depth += 1
+                continue
+            elif char in (b"}", b"]"):
+                self.pos += 1
+                depth -= 1
+            elif char in (b",", b":"):
+                self.pos += 1
+                continue
+            else:
+                self.read_scalar()
+            if depth <= 0:
+                return
+
+    def members(self):
+        """Iterate the keys of an object; the caller consumes each value."""
+        self.expect(b"{")
+        if self.peek() == b"}":
+            self.pos += 1
+            return
+        while True:
+            key = self.read_string()
+            self.expect(b":")
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == b"}":
+                return
+            if char != b",":
+                raise ValueError(f"Expected ',' or '}}' at byte {self.position - 1}")
+
+    def items(self):
+        """Iterate the elements of an array; the caller consumes each element."""
+        self.expect(b"[")
+        if self.peek() == b"]":
+            self.pos += 1
+            return
+        while True:
+            yield
+            char = self.peek()
+            self.pos += 1
+            if char == b"]":
+                return
+            if char != b",":
+                raise ValueError(f"Expected ',' or ']' at byte {self.position - 1}")
+
+
+def _scan_cell(stream: _JsonStream) -> Dict[str, Any]:
+    cell = {"code": False, "outputs": 0, "output_bytes": 0, "executed": False, "metadata": False}
+    for key in stream.members():
+        if key == b"cell_type" and stream.peek() == b'"':
+            cell["code"] = stream.read_string() == b"code"
+        elif key == b"execution_count" and stream.peek() != b'"':
+            cell["executed"] = stream.read_scalar() not in (b"null", b"0", b"false")
+        elif key == b"outputs" and stream.peek() == b"[":
+            start = stream.position
+            for _ in stream.items():
+                stream.skip_value()
+                cell["outputs"] += 1
+            cell["output_bytes"] = stream.position - start
+        elif key == b"metadata" and stream.peek() == b"{":
+            for _ in stream.members():
+                cell["metadata"] = True
+                stream.skip_value()
+        else:
+            stream.skip_value()
+    return cell
+
+
+def scan_notebook(path: Path, chunk_size: int = CHUNK_SIZE) -> Dict[str, int]:
+    """
+    Inspect a notebook's cells without loading its outputs.
+
+    Args:
+        path: Notebook file
+        chunk_size: Bytes read at a time
+
+    Returns:
+        Counts of code cells with outputs or execution counts, executed
+        cells and cells with metadata, plus the total size of all outputs
+
+    Raises:
+        ValueError: If the file is not valid notebook JSON
+    """
+    stats = {"cells_with_outputs": 0, "executed_cells": 0, "cells_with_metadata": 0, "output_bytes": 0}
+    with open(path, "rb") as f:
+        stream = _JsonStream(f, chunk_size)
+        for key in stream.members():
+            if key != b"cells" or stream.peek() != b"[":
+                stream.skip_value()
+                continue
+            for _ in stream.items():
+                if stream.peek() != b"{":
+                    stream.skip_value()
+                    continue
+                cell = _scan_cell(stream)
+                stats["cells_with_metadata"] += cell["metadata"]
+                if not cell["code"]:
+                    continue
+                stats["executed_cells"] += cell["executed"]
+                stats["output_bytes"] += cell["output_bytes"]
+                if cell["outputs"] or cell["executed"]:
+                    stats["cells_with_outputs"] += 1
+    return stats
+
+
+def _scan_notebook_file(path: str) -> Optional[Dict[str, int]]:
+    try:
+        return scan_notebook(Path(path))
+    except (OSError, ValueError):
+        return None
+
+
+def scan_notebooks(
+    root: Path,
+    cache_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[Dict[str, Optional[Dict[str, int]]], int]:
+    """
+    Scan every notebook under root, skipping files unchanged since the last scan.
+
+    Args:
+        root: Repository root
+        cache_path: JSON file caching statistics by size and mtime (optional)
+        max_workers: Scanner processes for many changed notebooks (default: CPU count)
+
+    Returns:
+        (statistics by root-relative path, None for invalid notebooks;
+        number of notebooks actually read)
+    """
+    cached = load_json_cache(cache_path, CACHE_VERSION)
+    results: Dict[str, Optional[Dict[str, int]]] = {}
+    entries: Dict[str, list] = {}
+    stale: List[Tuple[str, int, int]] = []
+
+    for rel, entry in walk_files(
+        root, IgnoreMatcher(root, (".gitignore",)), prune=lambda name: name.startswith(".")
+    ):
+        if not rel.endswith(".ipynb") or entry.name.startswith("."):
+            continue
+        stat = entry.stat()
+        hit = cached.get(rel)
+        if hit and hit[0] == stat.st_mtime_ns and hit[1] == stat.st_size:
+            results[rel] = hit[2]
+            entries[rel] = hit
+        else:
+            stale.append((rel, stat.st_mtime_ns, stat.st_size))
+
+    paths = [str(root / rel) for rel, _, _ in stale]
+    scanned = map_maybe_parallel(_scan_notebook_file, paths, PARALLEL_MIN_FILES, max_workers)
+
+    for (rel, mtime_ns, size), stats in zip(stale, scanned):
+        results[rel] = stats
+        entries[rel] = [mtime_ns, size, stats]
+
+    if stale or len(entries) != len(cached):
+        save_json_cache(cache_path, CACHE_VERSION, entries)
+    return dict(sorted(results.items())), len(stale)
 
 
 def check_notebooks(
@@ -12,73 +291,65 @@ def check_notebooks(
     config: HygieneConfig,
     output_path: Optional[Path] = None,
     clear_outputs: bool = False,
+    cache_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
 ) -> List[Dict]:
-    """Check notebooks for outputs and optionally clear them."""
+    """Check notebooks for outputs and optionally clear them.
+
+    Notebooks are scanned in parallel without loading output payloads;
+    statistics are cached at cache_path (default:
+    .claude/steward/notebook_cache.json) and reused for notebooks whose size
+    and mtime are unchanged. Only notebooks being cleared are fully loaded.
+    """
     if output_path is None:
         output_path = root / "reports" / "notebook_sanitizer.md"
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path = cache_path or root / NOTEBOOK_CACHE
 
     notebooks_with_outputs = []
     notebooks_cleared = []
 
-    # Find all notebooks
-    for nb_path in root.rglob("*.ipynb"):
-        # Skip .ipynb_checkpoints
-        if ".ipynb_checkpoints" in nb_path.parts:
-            continue
-
-        # Skip hidden directories
-        if any(part.startswith(".") for part in nb_path.parts if part != "."):
+    scanned, _ = scan_notebooks(root, cache_path, max_workers)
+    for rel, stats in scanned.items():
+        # Skip invalid notebooks
+        if stats is None or not stats["cells_with_outputs"]:
             continue
 
-        rel_path = nb_path.relative_to(root)
+        nb_path = root / rel
+        rel_path = Path(rel)
 
         # Check if whitelisted
         whitelisted = any(
             rel_path.match(pattern) for pattern in config.whitelist_globs
         )
 
-        try:
-            with open(nb_path, "r", encoding="utf-8") as f:
-                notebook = json.load(f)
-
-            # Check for outputs
-            has_outputs = False
-            cells_with_outputs = 0
-
-            for cell in notebook.get("cells", []):
-                if cell.get("cell_type") == "code":
-                    outputs = cell.get("outputs", [])
-                    execution_count = cell.get("execution_count")
-
-                    if outputs or execution_count:
-                        has_outputs = True
-                        cells_with_outputs += 1
-
-            if has_outputs:
-                notebooks_with_outputs.append(
-                    {
-                        "path": str(rel_path),
-                        "cells_with_outputs": cells_with_outputs,
-                        "whitelisted": whitelisted,
-                        "recommendation": "KEEP"
-                        if whitelisted
-                        else "CLEAR_OUTPUTS",
-                    }
-                )
-
-                # Clear outputs if requested and not whitelisted
-                if clear_outputs and not whitelisted:
-                    _clear_notebook_outputs(notebook)
-                    with open(nb_path, "w", encoding="utf-8") as f:
-                        json.dump(notebook, f, indent=1, ensure_ascii=False)
-                        f.write("\n")  # Add trailing newline
-                    notebooks_cleared.append(str(rel_path))
+        notebooks_with_outputs.append(
+            {
+                "path": str(rel_path),
+                "cells_with_outputs": stats["cells_with_outputs"],
+                "executed_cells": stats["executed_cells"],
+                "cells_with_metadata": stats["cells_with_metadata"],
+                "output_bytes": stats["output_bytes"],
+                "whitelisted": whitelisted,
+                "recommendation": "KEEP"
+                if whitelisted
+                else "CLEAR_OUTPUTS",
+            }
+        )
 
-        except (json.JSONDecodeError, KeyError, FileNotFoundError):
-            # Skip invalid notebooks
-            continue
+        # Clear outputs if requested and not whitelisted
+        if clear_outputs and not whitelisted:
+            try:
+                with open(nb_path, "r", encoding="utf-8") as f:
+                    notebook = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                continue
+            _clear_notebook_outputs(notebook)
+            with open(nb_path, "w", encoding="utf-8") as f:
+                json.dump(notebook, f, indent=1, ensure_ascii=False)
+                f.write("\n")  # Add trailing newline
+            notebooks_cleared.append(str(rel_path))
 
     # Generate report
     with open(output_path, "w") as f:
@@ -92,6 +363,9 @@ def check_notebooks(
         f.write(
             f"- **Requiring cleanup**: {sum(1 for nb in notebooks_with_outputs if not nb['whitelisted'])}\n"
         )
+        f.write(
+            f"- **Output size**: {_format_size(sum(nb['output_bytes'] for nb in notebooks_with_outputs))}\n"
+        )
 
         if clear_outputs:
             f.write(f"- **Cleared**: {len(notebooks_cleared)}\n")
@@ -100,12 +374,12 @@ def check_notebooks(
 
         if notebooks_with_outputs:
             f.write("## Notebooks with Outputs\n\n")
-            f.write("| Path | Cells with Outputs | Whitelisted | Recommendation |\n")
-            f.write("|------|-------------------|-------------|----------------|\n")
+            f.write("| Path | Cells with Outputs | Output Size | Whitelisted | Recommendation |\n")
+            f.write("|------|-------------------|-------------|-------------|----------------|\n")
 
             for nb in notebooks_with_outputs:
                 f.write(
-                    f"| {nb['path']} | {nb['cells_with_outputs']} | "
+                    f"| {nb['path']} | {nb['cells_with_outputs']} | {_format_size(nb['output_bytes'])} | "
                     f"{'✓' if nb['whitelisted'] else '✗'} | {nb['recommendation']} |\n"
                 )
 
@@ -129,6 +403,15 @@ def check_notebooks(
     return notebooks_with_outputs
 
 
+def _format_size(size_bytes: int) -> str:
+    """Human-readable byte count."""
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    if size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    return f"{size_bytes / (1024 * 1024):.1f} MB"
+
+
 def _clear_notebook_outputs(notebook: Dict) -> None:
     """Clear all outputs from notebook cells."""
     for cell in notebook.get("cells", []):
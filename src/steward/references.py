@@ -0,0 +1,195 @@
+"""Inverted index of file references for orphan detection."""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .cache import load_json_cache, map_maybe_parallel, save_json_cache
+from .ignore import IgnoreMatcher, walk_files
+
+INDEX_VERSION = 2
+
+# Stale files at which tokenizing moves to a process pool; fewer are read inline
+PARALLEL_MIN_FILES = 256
+
+# Runs of characters that can appear in a file name; path separators, quotes
+# and brackets split them into components. Runs holding characters other
+# than [\w.-] (e.g. 'notes+draft.md', 'a=b') also count split at those.
+_NAME_TOKEN = re.compile(r"[^\s/\\\"'`<>|:;,()\[\]{}*?]+")
+_PLAIN_NAME = re.compile(r"[\w.\-]+")
+# Quoted or backticked text, which may name files with spaces or parentheses
+_QUOTED = re.compile(r"[\"'`]([^\"'`\n]+)[\"'`]")
+_IMPORT = re.compile(
+    r"^\s*(?:from\s+([\w.]+)\s+import\s+\(?([\w\s,*]+)|import\s+([\w.,\s]+?)(?:\s+as\s+\w+)?\s*$)",
+    re.MULTILINE,
+)
+
+
+def _module_prefixes(module: str) -> List[str]:
+    """'a.b.c' -> ['a', 'a.b', 'a.b.c']."""
+    parts = module.split(".")
+    return [".".join(parts[: i + 1]) for i in range(len(parts))]
+
+
+def tokenize(content: str) -> Tuple[Set[str], Set[str]]:
+    """
+    Extract referenced names from file content.
+
+    Args:
+        content: File text
+
+    Returns:
+        (basenames, modules): path components such as 'scanner.py' or
+        'my report (1).csv', and the dotted module paths a Python import
+        statement can load ('from a.b import c' gives a, a.b and a.b.c;
+        relative imports drop their leading dots)
+    """
+    tokens = set(_NAME_TOKEN.findall(content))
+    for token in [t for t in tokens if not _PLAIN_NAME.fullmatch(t)]:
+        tokens.update(_PLAIN_NAME.findall(token))
+    names = {token.rstrip(".-") for token in tokens}
+    for quoted in _QUOTED.findall(content):
+        names.update(part.strip() for part in re.split(r"[/\\]", quoted))
+    names.discard("")
+
+    modules: Set[str] = set()
+    for match in _IMPORT.finditer(content):
+        module, imported, plain = match.groups()
+        if plain:
+            for part in plain.split(","):
+                words = part.split()
+                if words:
+                    modules.update(_module_prefixes(words[0]))
+            continue
+        base = module.lstrip(".")
+        if base:
+            modules.update(_module_prefixes(base))
+        for part in imported.split(","):
+            words = part.split()
+            if words and words[0] != "*":
+                modules.add(f"{base}.{words[0]}" if base else words[0])
+    return names, modules
+
+
+def _tokenize_file(path: str) -> Tuple[List[str], List[str]]:
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            names, modules = tokenize(f.read())
+    except OSError:
+        return [], []
+    return sorted(names), sorted(modules)
+
+
+class ReferenceIndex:
+    """Basenames and module paths mentioned by each searchable file, inverted."""
+
+    def __init__(
+        self,
+        root: Path,
+        search_exts: List[str],
+        cache_path: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+        matcher: Optional[IgnoreMatcher] = None,
+    ):
+        """
+        Initialize index.
+
+        Args:
+            root: Repository root
+            search_exts: Extensions of files whose content counts as a reference
+            cache_path: JSON file caching per-file tokens by mtime (optional)
+            max_workers: Tokenizer processes for large change sets (default: CPU count)
+            matcher: Ignore matcher; ignored files and directories are not searched
+        """
+        self.root = root
+        self.search_exts = list(search_exts)
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self.matcher = matcher
+
+        # rel path -> (mtime_ns, size, names, modules)
+        self._files: Dict[str, Tuple[int, int, List[str], List[str]]] = {}
+        self._weights: Dict[str, int] = {}
+        self._by_name: Dict[str, Set[str]] = {}
+        self._by_module: Dict[str, Set[str]] = {}
+        self.files_read = 0
+
+    def _searchable_files(self) -> Iterable[Tuple[str, os.stat_result, int]]:
+        """Files matching the search extensions, with how many extensions each matched."""
+        cache_rel = None
+        if self.cache_path is not None:
+            try:
+                cache_rel = self.cache_path.relative_to(self.root).as_posix()
+            except ValueError:
+                pass
+
+        for rel, entry in walk_files(self.root, self.matcher, prune=lambda name: name == ".git"):
+            weight = sum(1 for ext in self.search_exts if entry.name.endswith(ext))
+            if not weight or rel == cache_rel:
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            yield rel, stat, weight
+
+    def build(self) -> "ReferenceIndex":
+        """Tokenize every searchable file once, re-reading only files changed since the cache."""
+        cached = load_json_cache(self.cache_path, INDEX_VERSION, search_exts=self.search_exts)
+        files: Dict[str, Tuple[int, int, List[str], List[str]]] = {}
+        stale: List[Tuple[str, int, int]] = []
+
+        for rel, stat, weight in self._searchable_files():
+            self._weights[rel] = weight
+            entry = cached.get(rel)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                files[rel] = tuple(entry)
+            else:
+                stale.append((rel, stat.st_mtime_ns, stat.st_size))
+
+        paths = [str(self.root / rel) for rel, _, _ in stale]
+        tokens = map_maybe_parallel(
+            _tokenize_file, paths, PARALLEL_MIN_FILES, self.max_workers, chunksize=64
+        )
+
+        for (rel, mtime_ns, size), (names, modules) in zip(stale, tokens):
+            files[rel] = (mtime_ns, size, names, modules)
+        self.files_read = len(stale)
+
+        self._files = files
+        self._by_name, self._by_module = {}, {}
+        for rel, (_, _, names, modules) in files.items():
+            for name in names:
+                self._by_name.setdefault(name, set()).add(rel)
+            for module in modules:
+                self._by_module.setdefault(module, set()).add(rel)
+
+        if stale or len(files) != len(cached):
+            save_json_cache(
+                self.cache_path,
+                INDEX_VERSION,
+                {rel: list(entry) for rel, entry in files.items()},
+                search_exts=self.search_exts,
+            )
+        return self
+
+    def referencing_files(self, file_path: Path) -> Set[str]:
+        """Searchable files (other than file_path) that mention it."""
+        rel = file_path.relative_to(self.root).as_posix()
+        found = set(self._by_name.get(file_path.name, ()))
+        if file_path.suffix == ".py":
+            # Imported under any trailing part of its dotted path ('scanner',
+            # 'steward.scanner', 'src.steward.scanner'), whichever the
+            # importer's sys.path root or relative import uses
+            parts = Path(rel).with_suffix("").parts
+            if parts and parts[-1] == "__init__":
+                parts = parts[:-1]
+            for i in range(len(parts)):
+                found |= self._by_module.get(".".join(parts[i:]), set())
+        found.discard(rel)
+        return found
+
+    def count(self, file_path: Path) -> int:
+        """Number of references to file_path, as counted by find_references."""
+        return sum(self._weights.get(rel, 1) for rel in self.referencing_files(file_path))
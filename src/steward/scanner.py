@@ -3,11 +3,16 @@
 import csv
 import fnmatch
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime, timedelta
 import os
 
 from .config import HygieneConfig
+from .ignore import IgnoreMatcher, walk_files
+from .references import ReferenceIndex
+
+# Per-file reference tokens, reused while files are unchanged
+REFERENCE_INDEX_CACHE = Path(".claude") / "steward" / "reference_index.json"
 
 
 def is_whitelisted(file_path: Path, whitelist_globs: List[str]) -> bool:
@@ -19,68 +24,50 @@ def is_whitelisted(file_path: Path, whitelist_globs: List[str]) -> bool:
     return False
 
 
+# Directories never worth scanning, whether or not they are gitignored
+SKIP_DIRS = {"__pycache__", "node_modules", "venv", ".venv", "dist", "build"}
+
+# (root, ignore file name) -> matcher that re-checks every ignore file it loaded
+_MATCHERS: Dict[Tuple[str, str], IgnoreMatcher] = {}
+
+
+def _ignore_matcher(root: Path, filename: str) -> IgnoreMatcher:
+    """Compiled matcher for one ignore file name, re-reading ignore files that change."""
+    key = (str(root), filename)
+    matcher = _MATCHERS.get(key)
+    if matcher is None:
+        matcher = _MATCHERS[key] = IgnoreMatcher(root, (filename,), revalidate=True)
+    return matcher
+
+
 def is_gitignored(file_path: Path, root: Path) -> bool:
-    """Check if file is in .gitignore (simple check)."""
-    gitignore_path = root / ".gitignore"
-    if not gitignore_path.exists():
-        return False
-
-    with open(gitignore_path, "r") as f:
-        patterns = [
-            line.strip()
-            for line in f
-            if line.strip() and not line.startswith("#")
-        ]
-
-    rel_path = str(file_path.relative_to(root))
-    for pattern in patterns:
-        if fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(
-            rel_path, f"**/{pattern}"
-        ):
-            return True
-    return False
+    """Check if file is ignored by .gitignore files (including nested ones)."""
+    rel_path = file_path.relative_to(root).as_posix()
+    return _ignore_matcher(root, ".gitignore").is_ignored(rel_path, file_path.is_dir())
 
 
 def is_tidyignored(file_path: Path, root: Path) -> bool:
-    """Check if file is in .tidyignore."""
-    tidyignore_path = root / ".tidyignore"
-    if not tidyignore_path.exists():
-        return False
-
-    with open(tidyignore_path, "r") as f:
-        patterns = [
-            line.strip()
-            for line in f
-            if line.strip() and not line.startswith("#")
-        ]
-
-    rel_path = str(file_path.relative_to(root))
-    for pattern in patterns:
-        if fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(
-            rel_path, f"**/{pattern}"
-        ):
-            return True
-    return False
+    """Check if file is in .tidyignore (gitignore syntax, nested files allowed)."""
+    rel_path = file_path.relative_to(root).as_posix()
+    return _ignore_matcher(root, ".tidyignore").is_ignored(rel_path, file_path.is_dir())
 
 
-def find_references(file_path: Path, root: Path, search_exts: List[str]) -> int:
-    """Count references to file in codebase."""
-    filename = file_path.name
-    count = 0
-
-    for ext in search_exts:
-        for search_file in root.rglob(f"*{ext}"):
-            if search_file == file_path:
-                continue
-            try:
-                with open(search_file, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                    if filename in content or str(file_path.relative_to(root)) in content:
-                        count += 1
-            except Exception:
-                continue
+def find_references(
+    file_path: Path,
+    root: Path,
+    search_exts: List[str],
+    index: Optional[ReferenceIndex] = None,
+) -> int:
+    """Count references to file in codebase.
 
-    return count
+    A reference is a searchable file that mentions the file's name as a path
+    component, or imports it as a module (for .py files). Pass a prebuilt
+    index when querying many files; without one the codebase is indexed for
+    this single query.
+    """
+    if index is None:
+        index = ReferenceIndex(root, search_exts).build()
+    return index.count(file_path)
 
 
 def scan_large_files(
@@ -97,29 +84,28 @@ def scan_large_files(
     large_files = []
     threshold_bytes = config.large_file_mb * 1024 * 1024
 
-    # Walk repository
-    for file_path in root.rglob("*"):
-        if not file_path.is_file():
-            continue
+    tidyignore = IgnoreMatcher(root, (".tidyignore",))
 
-        # Skip .git directory
-        if ".git" in file_path.parts:
-            continue
+    # Walk repository, skipping .git and gitignored trees
+    for rel, entry in walk_files(
+        root, IgnoreMatcher(root, (".gitignore",)), prune=lambda name: name == ".git"
+    ):
+        file_path = Path(entry.path)
 
         # Check if binary
         if file_path.suffix.lower() not in config.binary_exts:
             continue
 
         # Check size
-        size_bytes = file_path.stat().st_size
+        size_bytes = entry.stat().st_size
         if size_bytes < threshold_bytes:
             continue
 
         # Check if whitelisted
-        rel_path = file_path.relative_to(root)
+        rel_path = Path(rel)
         whitelisted = (
             is_whitelisted(rel_path, config.whitelist_globs)
-            or is_tidyignored(file_path, root)
+            or tidyignore.is_ignored(rel)
         )
 
         large_files.append(
@@ -151,8 +137,13 @@ def scan_orphans(
     root: Path,
     config: HygieneConfig,
     output_path: Optional[Path] = None,
+    index_cache: Optional[Path] = None,
 ) -> List[Dict]:
-    """Scan for orphaned files (not referenced in codebase)."""
+    """Scan for orphaned files (not referenced in codebase).
+
+    References are answered from one ReferenceIndex built up front, cached
+    at index_cache (default: .claude/steward/reference_index.json).
+    """
     if output_path is None:
         output_path = root / "reports" / "orphans.csv"
 
@@ -165,37 +156,35 @@ def scan_orphans(
     # Get reference extensions
     ref_exts = config.get("orphan_detection.reference_extensions", [".py", ".md"])
 
-    # Walk repository
-    for file_path in root.rglob("*"):
-        if not file_path.is_file():
-            continue
-
-        # Skip .git, .claude, venv, etc.
-        if any(
-            part.startswith(".")
-            for part in file_path.parts
-            if part not in [".", ".."]
-        ):
-            continue
-
-        # Skip Python cache, build artifacts
-        if any(
-            part in ["__pycache__", "node_modules", "venv", ".venv", "dist", "build"]
-            for part in file_path.parts
-        ):
+    # Walk repository; hidden, build, gitignored and tidyignored trees are
+    # pruned rather than filtered file by file
+    gitignore = IgnoreMatcher(root, (".gitignore",))
+    matcher = IgnoreMatcher(root, (".gitignore", ".tidyignore"))
+    index = ReferenceIndex(
+        root,
+        ref_exts,
+        cache_path=index_cache or root / REFERENCE_INDEX_CACHE,
+        matcher=gitignore,
+    )
+    index_built = False
+
+    for rel, entry in walk_files(
+        root, matcher, prune=lambda name: name.startswith(".") or name in SKIP_DIRS
+    ):
+        # Skip dotfiles
+        if entry.name.startswith("."):
             continue
+        file_path = Path(entry.path)
 
         # Check age
-        mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
+        mtime = datetime.fromtimestamp(entry.stat().st_mtime)
         if now - mtime < min_age:
             continue
 
         # Check if whitelisted
-        rel_path = file_path.relative_to(root)
+        rel_path = Path(rel)
         if is_whitelisted(rel_path, config.whitelist_globs):
             continue
-        if is_tidyignored(file_path, root):
-            continue
 
         # Check if protected pattern
         protected_patterns = config.get(
@@ -205,7 +194,10 @@ def scan_orphans(
             continue
 
         # Find references
-        ref_count = find_references(file_path, root, ref_exts)
+        if not index_built:
+            index.build()
+            index_built = True
+        ref_count = find_references(file_path, root, ref_exts, index)
 
         if ref_count == 0:
             orphans.append(
@@ -0,0 +1,145 @@
+"""Tests for the artifact catalog."""
+
+import hashlib
+
+import pytest
+
+from src.data import artifact_catalog as catalog_module
+from src.data.artifact_catalog import ArtifactCatalog
+from src.orchestrator.packaging import package_phase_artifacts
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / "artifacts"
+    root.mkdir()
+    return root
+
+
+def write(root, run_id, name, content=b"x"):
+    path = root / run_id / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+class TestArtifactCatalog:
+    """Catalog entries, pagination and cached totals."""
+
+    def test_backfills_existing_tree_once(self, root, monkeypatch):
+        write(root, "run_a", "report.json", b"{}")
+        write(root, "run_b", "data.csv", b"a,b\n1,2\n")
+        (root / "run_empty").mkdir()
+
+        catalog = ArtifactCatalog(root)
+        assert catalog.totals()["runs"] == 0
+        catalog.ensure_indexed()
+
+        assert [r["run_id"] for r in catalog.list_runs()] == ["run_empty", "run_b", "run_a"]
+        assert catalog.totals() == {"runs": 3, "artifacts": 2, "total_bytes": 10}
+
+        # Later calls re-index only run directories that changed
+        indexed = []
+        monkeypatch.setattr(catalog, "index_run", lambda run_id: indexed.append(run_id))
+        catalog.ensure_indexed()
+        assert indexed == []
+
+    def test_reindexes_runs_written_outside_packaging(self, root):
+        write(root, "run_a", "report.json", b"{}")
+        write(root, "run_b", "data.csv", b"a,b\n")
+        catalog = ArtifactCatalog(root)
+        catalog.ensure_indexed()
+
+        write(root, "run_a", "extra.txt", b"more")
+        write(root, "run_c", "late.txt")
+        for path in (root / "run_b").iterdir():
+            path.unlink()
+        (root / "run_b").rmdir()
+        catalog.close()
+
+        reopened = ArtifactCatalog(root)
+        reopened.ensure_indexed()
+        assert [r["run_id"] for r in reopened.list_runs()] == ["run_c", "run_a"]
+        assert reopened.get_run("run_a")["artifact_count"] == 2
+        assert reopened.totals() == {"runs": 2, "artifacts": 3, "total_bytes": 7}
+
+    def test_record_upserts_and_maintains_run_totals(self, root):
+        catalog = ArtifactCatalog(root)
+        path = write(root, "run_1", "model.pkl", b"abc")
+
+        entry = catalog.record("run_1", path)
+        assert entry["sha256"] == hashlib.sha256(b"abc").hexdigest()
+        assert entry["artifact_type"] == "PKL"
+
+        path.write_bytes(b"abcdef")
+        catalog.record("run_1", path)
+        catalog.record("run_1", write(root, "run_1", "notes.md", b"hi"))
+
+        run = catalog.get_run("run_1")
+        assert run["artifact_count"] == 2
+        assert run["total_bytes"] == 8
+        assert catalog.totals()["total_bytes"] == 8
+
+        catalog.remove("run_1", "notes.md")
+        assert catalog.get_run("run_1")["artifact_count"] == 1
+        assert catalog.totals() == {"runs": 1, "artifacts": 1, "total_bytes": 6}
+
+    def test_pagination(self, root):
+        catalog = ArtifactCatalog(root)
+        for i in range(5):
+            catalog.record(f"run_{i}", write(root, f"run_{i}", "a.txt"))
+        for i in range(7):
+            catalog.record("run_0", write(root, "run_0", f"f{i}.txt"))
+
+        assert [r["run_id"] for r in catalog.list_runs(offset=1, limit=2)] == ["run_3", "run_2"]
+        page = catalog.list_artifacts("run_0", offset=5, limit=5)
+        assert [a["path"] for a in page] == ["f4.txt", "f5.txt", "f6.txt"]
+
+    def test_index_run_replaces_entries(self, root):
+        catalog = ArtifactCatalog(root)
+        stale = write(root, "run_1", "old.txt", b"old")
+        catalog.record("run_1", stale)
+        stale.unlink()
+        write(root, "run_1", "new.txt", b"new!")
+
+        assert catalog.index_run("run_1") == 1
+        assert [a["path"] for a in catalog.list_artifacts("run_1")] == ["new.txt"]
+        assert catalog.get_run("run_1")["total_bytes"] == 4
+
+    def test_index_run_hashes_only_changed_files(self, root, monkeypatch):
+        catalog = ArtifactCatalog(root)
+        write(root, "run_1", "same.txt", b"same")
+        changed = write(root, "run_1", "changed.txt", b"v1")
+        catalog.index_run("run_1")
+
+        changed.write_bytes(b"v2 longer")
+        hashed = []
+        original = catalog_module.hash_file
+        monkeypatch.setattr(catalog_module, "hash_file", lambda path: hashed.append(path.name) or original(path))
+
+        assert catalog.index_run("run_1") == 2
+        assert hashed == ["changed.txt"]
+        entries = {a["path"]: a for a in catalog.list_artifacts("run_1")}
+        assert entries["changed.txt"]["sha256"] == hashlib.sha256(b"v2 longer").hexdigest()
+        assert catalog.get_run("run_1")["total_bytes"] == 13
+
+    def test_totals_see_writes_from_other_connections(self, root):
+        reader = ArtifactCatalog(root)
+        writer = ArtifactCatalog(root)
+        assert reader.totals()["artifacts"] == 0
+
+        writer.record("run_1", write(root, "run_1", "a.txt"))
+        assert reader.totals()["artifacts"] == 1
+
+
+def test_packaging_records_bundle(tmp_path):
+    (tmp_path / "out.txt").write_text("content")
+
+    zip_path = package_phase_artifacts("planning", ["out.txt"], tmp_path, "run_42")
+
+    catalog = ArtifactCatalog(tmp_path / "artifacts")
+    # Recording the bundle does not backfill the rest of the tree
+    assert catalog._get_meta("indexed_at") is None
+    [entry] = catalog.list_artifacts("run_42")
+    assert entry["path"] == "planning.zip"
+    assert entry["size_bytes"] == zip_path.stat().st_size
@@ -0,0 +1,146 @@
+"""Tests for the incremental governance scorecard."""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.governance.runner import run_nightly
+from src.governance.scorecard import NdjsonTail, ScorecardTracker
+
+
+def append(path: Path, *entries) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def dataset_profile(null_pct: float, dup_pct: float, age: timedelta = timedelta()) -> dict:
+    return {
+        "timestamp": (datetime.utcnow() - age).isoformat(),
+        "kind": "dataset",
+        "name": "sales",
+        "stats": {"columns_detail": {"a": {"null_pct": null_pct}}, "duplicate_pct": dup_pct},
+    }
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return ScorecardTracker(
+        governance_dir=tmp_path / "governance",
+        cleanliness_file=tmp_path / "cleanliness.json",
+        ops_metrics_file=tmp_path / "ops.json",
+        ttl_seconds=0,
+    )
+
+
+def test_tail_reads_only_appended_lines(tmp_path):
+    path = tmp_path / "log.ndjson"
+    append(path, {"n": 1}, {"n": 2})
+    tail = NdjsonTail(path)
+
+    assert [e["n"] for e in tail.read_new()[0]] == [1, 2]
+    assert tail.read_new() == ([], False)
+
+    append(path, {"n": 3})
+    with open(path, "a") as f:
+        f.write('{"n": 4')  # partially written line
+
+    assert [e["n"] for e in tail.read_new()[0]] == [3]
+    with open(path, "a") as f:
+        f.write("}\n")
+    assert [e["n"] for e in tail.read_new()[0]] == [4]
+
+
+def test_tail_detects_truncation(tmp_path):
+    path = tmp_path / "log.ndjson"
+    append(path, {"n": 1}, {"n": 2})
+    tail = NdjsonTail(path)
+    tail.read_new()
+
+    path.write_text(json.dumps({"n": 9}) + "\n")
+    entries, reset = tail.read_new()
+    assert reset and [e["n"] for e in entries] == [9]
+
+
+def test_data_quality_uses_last_day_window(tracker):
+    datasets = tracker.governance_dir / "profiles" / "datasets.ndjson"
+    append(datasets, dataset_profile(50, 50, age=timedelta(days=3)))
+    append(datasets, dataset_profile(0, 0))
+
+    # Only the recent, perfect profile counts
+    assert tracker.compute()["data_quality_index"] == 100.0
+
+    append(datasets, dataset_profile(10, 0))
+    assert tracker.compute()["data_quality_index"] == 97.0
+
+
+def test_data_quality_falls_back_to_last_ten(tracker):
+    datasets = tracker.governance_dir / "profiles" / "datasets.ndjson"
+    append(datasets, *[dataset_profile(0, 100, age=timedelta(days=5))] * 12)
+
+    assert tracker.compute()["data_quality_index"] == 60.0
+
+
+def test_model_performance_last_ten(tracker):
+    models = tracker.governance_dir / "profiles" / "models.ndjson"
+    assert tracker.compute()["model_performance_index"] == 75.0
+
+    append(models, *[{"timestamp": datetime.utcnow().isoformat(), "stats": {"metrics": {"r2": 0.9}}}] * 3)
+    assert tracker.compute()["model_performance_index"] > 0
+
+
+def test_security_index_counts_recent_flag_changes(tracker):
+    flags = tracker.governance_dir / "audit" / "flags.ndjson"
+    now = datetime.utcnow()
+    append(flags, *[{"timestamp": (now - timedelta(days=30)).isoformat()}] * 50)
+    assert tracker.compute()["security_compliance_index"] == 95.0
+
+    append(flags, *[{"timestamp": now.isoformat()}] * 30)
+    assert tracker.compute()["security_compliance_index"] == 90.0
+
+
+def test_scorecard_cached_for_ttl(tmp_path):
+    tracker = ScorecardTracker(governance_dir=tmp_path / "governance", ttl_seconds=3600)
+    first = tracker.compute()
+
+    append(tracker.governance_dir / "profiles" / "datasets.ndjson", dataset_profile(0, 0))
+    assert tracker.compute() == first
+    assert tracker.compute(force=True)["data_quality_index"] == 100.0
+
+
+def test_trends_read_daily_rollup(tracker):
+    tracker.rollup_file.parent.mkdir(parents=True)
+    tracker.rollup_file.write_text(json.dumps({
+        f"2025-01-{day:02d}": {
+            "data_quality_index": float(day),
+            "model_performance_index": 75.0,
+            "platform_reliability_index": 85.0,
+            "security_compliance_index": 95.0,
+        }
+        for day in range(1, 11)
+    }))
+
+    trends = tracker.trends(7)
+    assert [p["date"] for p in trends["data_quality_index"]][0] == "2025-01-04"
+    assert len(trends["security_compliance_index"]) == 7
+
+    tracker.compute()
+    today = datetime.utcnow().strftime("%Y-%m-%d")
+    assert tracker.trends(7)["data_quality_index"][-1]["date"] == today
+
+
+def test_nightly_run_records_daily_rollup(tmp_path):
+    governance_dir = tmp_path / "governance"
+    run_nightly(
+        datasets_dir=tmp_path / "datasets",
+        models_dir=tmp_path / "models",
+        profiles_dir=governance_dir / "profiles",
+        snapshots_dir=governance_dir / "snapshots",
+    )
+
+    today = datetime.utcnow().strftime("%Y-%m-%d")
+    rollup = json.loads((governance_dir / "rollups" / "daily.json").read_text())
+    assert set(rollup) == {today}
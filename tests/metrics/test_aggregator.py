@@ -28,26 +28,6 @@ class TestMetricsAggregator:
         assert aggregator.output_dir == temp_metrics_dir / "aggregated"
         assert aggregator.output_dir.exists()
 
-    def test_load_json(self, temp_metrics_dir, sample_dora_deployments):
-        """Test JSON file loading"""
-        # Write sample file
-        test_file = temp_metrics_dir / "test.json"
-        with open(test_file, 'w') as f:
-            json.dump(sample_dora_deployments, f)
-
-        aggregator = MetricsAggregator(project_root=temp_metrics_dir.parent.parent)
-        data = aggregator._load_json(test_file)
-
-        assert data is not None
-        assert data["metric"] == "deployment_frequency"
-
-    def test_load_json_missing_file(self, temp_metrics_dir):
-        """Test loading non-existent file"""
-        aggregator = MetricsAggregator(project_root=temp_metrics_dir.parent.parent)
-        data = aggregator._load_json(temp_metrics_dir / "nonexistent.json")
-
-        assert data is None
-
     def test_calculate_trend(self, temp_metrics_dir):
         """Test trend calculation"""
         aggregator = MetricsAggregator(project_root=temp_metrics_dir.parent.parent)
@@ -213,7 +193,8 @@ class TestMetricsAggregator:
         week_start = datetime.now()
         week_end = week_start + timedelta(days=7)
 
-        dora_summary = aggregator._aggregate_dora_for_week(week_start, week_end)
+        aggregator.ingest_snapshots()
+        dora_summary = aggregator._rollup(week_start, week_end)["dora"]
 
         assert isinstance(dora_summary, dict)
         assert "deployment_frequency" in dora_summary
@@ -226,7 +207,8 @@ class TestMetricsAggregator:
         week_start = datetime.now()
         week_end = week_start + timedelta(days=7)
 
-        contrib_summary = aggregator._aggregate_contributions_for_week(week_start, week_end)
+        aggregator.ingest_snapshots()
+        contrib_summary = aggregator._rollup(week_start, week_end)["contributions"]
 
         assert isinstance(contrib_summary, dict)
         assert "human_percentage" in contrib_summary
@@ -274,14 +256,6 @@ class TestMetricsAggregator:
         trends = aggregator.analyze_trends(weeks_back=4)
         assert trends == {}
 
-        # Test with invalid JSON
-        invalid_file = temp_metrics_dir / "invalid.json"
-        with open(invalid_file, 'w') as f:
-            f.write("not valid json {")
-
-        data = aggregator._load_json(invalid_file)
-        assert data is None
-
     def test_metric_history_tracking(self, write_sample_metrics):
         """Test historical value tracking across weeks"""
         metrics_dir = write_sample_metrics
@@ -6,12 +6,15 @@ Tests deployment frequency, lead time, MTTR, and change failure rate calculation
 
 import pytest
 import json
+import os
+import subprocess
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
 from src.orchestrator.metrics.dora_metrics import (
     DORAMetricsCalculator,
+    GitHistoryIndex,
     DeploymentFrequencyMetrics,
     LeadTimeMetrics,
     MTTRMetrics,
@@ -236,3 +239,84 @@ class TestDORAMetricsCalculator:
         # Test with None values
         assert calculator._is_hotfix("v1.0.0", None, timedelta(hours=1)) is False
         assert calculator._is_hotfix(None, "v1.0.0", timedelta(hours=1)) is False
+
+
+def git(repo, *args, date=None):
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Dev", "GIT_AUTHOR_EMAIL": "dev@example.com",
+        "GIT_COMMITTER_NAME": "Dev", "GIT_COMMITTER_EMAIL": "dev@example.com",
+    }
+    if date:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = date.strftime("%Y-%m-%dT%H:%M:%S")
+    subprocess.run(["git", *args], cwd=repo, env=env, check=True, capture_output=True)
+
+
+@pytest.fixture
+def release_repo(tmp_path):
+    """Repository with three releases a day apart, two commits each"""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q")
+    start = datetime.now() - timedelta(days=10)
+    git(repo, "commit", "-q", "--allow-empty", "-m", "root", date=start)
+    for day in range(1, 4):
+        git(repo, "commit", "-q", "--allow-empty", "-m", "a", date=start + timedelta(days=day))
+        git(repo, "commit", "-q", "--allow-empty", "-m", "b", date=start + timedelta(days=day, hours=2))
+        git(repo, "tag", f"v1.{day}.0")
+    return repo
+
+
+class TestGitHistoryIndex:
+    """Test single-pass history indexing with the persistent cache"""
+
+    def test_metrics_share_one_history_scan(self, release_repo):
+        """Test all metrics come from one for-each-ref and one git log"""
+        calculator = DORAMetricsCalculator(project_root=release_repo, days_back=30)
+
+        with patch("src.orchestrator.metrics.dora_metrics.subprocess.Popen", wraps=subprocess.Popen) as popen:
+            result = calculator.collect_all()
+
+        assert [call.args[0][1] for call in popen.call_args_list] == ["for-each-ref", "log"]
+        assert result["deployment_frequency"]["summary"]["total_deployments"] == 3
+        # v1.3.0 and v1.2.0 each shipped two commits, 2h and 0h before the tag
+        lead_times = sorted(m["lead_time_hours"] for m in result["lead_time"]["measurements"])
+        assert lead_times == [0.0, 0.0, 2.0, 2.0]
+        assert {m["deployment_version"] for m in result["lead_time"]["measurements"]} == {"v1.3.0", "v1.2.0"}
+
+    def test_later_reports_scan_only_new_commits(self, release_repo, temp_metrics_dir):
+        """Test the cache is reused and only new history is logged"""
+        cache_file = temp_metrics_dir / "dora" / "history_cache.json"
+        first = GitHistoryIndex(release_repo, cache_file).refresh()
+        assert first.commits_scanned == 7
+
+        unchanged = GitHistoryIndex(release_repo, cache_file).refresh()
+        assert unchanged.commits_scanned == 0
+        assert unchanged.tag_commits == first.tag_commits
+
+        git(release_repo, "commit", "-q", "--allow-empty", "-m", "fix")
+        git(release_repo, "tag", "v1.3.1")
+        updated = GitHistoryIndex(release_repo, cache_file).refresh()
+
+        assert updated.commits_scanned == 1
+        assert len(updated.tag_commits["v1.3.1"]) == 1
+        assert updated.tag_commits["v1.3.0"] == first.tag_commits["v1.3.0"]
+
+    def test_moved_tag_rebuilds_index(self, release_repo, temp_metrics_dir):
+        """Test a deleted or moved tag invalidates cached assignments"""
+        cache_file = temp_metrics_dir / "dora" / "history_cache.json"
+        GitHistoryIndex(release_repo, cache_file).refresh()
+
+        git(release_repo, "tag", "-d", "v1.2.0")
+        index = GitHistoryIndex(release_repo, cache_file).refresh()
+
+        assert "v1.2.0" not in index.tags
+        # v1.3.0 now ships everything back to v1.1.0
+        assert len(index.tag_commits["v1.3.0"]) == 4
+
+    def test_non_semver_tags_ignored(self, release_repo, temp_metrics_dir):
+        """Test only semver tags count as deployments"""
+        git(release_repo, "tag", "nightly")
+        index = GitHistoryIndex(release_repo, temp_metrics_dir / "dora" / "cache.json").refresh()
+
+        assert set(index.tags) == {"v1.1.0", "v1.2.0", "v1.3.0"}
@@ -0,0 +1,232 @@
+"""
+Unit tests for the incremental GitHub metrics collector.
+
+Runs against recorded fixtures served by RecordedTransport.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from perf.metrics._github_fixtures import RecordedTransport, make_fixture, synthesize_fixtures
+from src.orchestrator.metrics.github_sync import IncrementalGitHubCollector, RateLimiter, SyncState
+
+REPO = "acme/widgets"
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def make_collector(temp_metrics_dir, transport, **kwargs):
+    return IncrementalGitHubCollector(
+        repo_name=REPO,
+        token="test-token",
+        project_root=temp_metrics_dir.parent.parent,
+        transport=transport,
+        **kwargs,
+    )
+
+
+def sync(collector):
+    return asyncio.run(collector.sync())
+
+
+class TestIncrementalGitHubCollector:
+    """Test IncrementalGitHubCollector against recorded fixtures"""
+
+    def test_first_sync_writes_metrics(self, temp_metrics_dir):
+        """Test a cold sync pages the listing and writes both metrics files"""
+        transport = RecordedTransport(synthesize_fixtures(REPO, 120, now=NOW))
+        collector = make_collector(temp_metrics_dir, transport)
+
+        result = sync(collector)
+
+        summary = result["pr_cycle_time"]["summary"]
+        assert summary["total_prs"] == 120
+        assert summary["merged_prs"] == 80
+        assert result["conflicts"]["summary"]["total_conflicts"] == 30
+        # Two listing pages plus detail and events per PR
+        assert collector.stats["requests"] == 2 + 2 * 120
+
+        with open(temp_metrics_dir / "github" / "pull_requests.json") as f:
+            pull_requests = json.load(f)
+        assert pull_requests["pull_requests"][0]["pr_number"] == 120
+        assert set(pull_requests["pull_requests"][0]) >= {"cycle_time_hours", "author", "state"}
+
+        with open(temp_metrics_dir / "github" / "conflicts.json") as f:
+            conflicts = json.load(f)
+        assert conflicts["conflicts"][0]["force_pushes"] == 1
+
+    def test_unchanged_repo_costs_one_conditional_request(self, temp_metrics_dir):
+        """Test a second sync revalidates the listing and stops on 304"""
+        transport = RecordedTransport(synthesize_fixtures(REPO, 20, now=NOW))
+        collector = make_collector(temp_metrics_dir, transport)
+        first = sync(collector)
+
+        second = sync(collector)
+
+        assert collector.stats == {"requests": 1, "not_modified": 1, "changed_prs": 0}
+        assert second["pr_cycle_time"]["pull_requests"] == first["pr_cycle_time"]["pull_requests"]
+
+    def test_only_prs_updated_since_cursor_are_fetched(self, temp_metrics_dir):
+        """Test PRs at or before the cursor are not refetched"""
+        transport = RecordedTransport(synthesize_fixtures(REPO, 20, now=NOW))
+        collector = make_collector(temp_metrics_dir, transport)
+        sync(collector)
+
+        # PR 21 is new, PRs 1-20 keep their updated_at
+        transport.fixtures = synthesize_fixtures(REPO, 21, now=NOW + timedelta(hours=1))
+        transport.requests.clear()
+        result = sync(collector)
+
+        assert collector.stats["changed_prs"] == 1
+        assert f"GET /repos/{REPO}/pulls/21" in transport.requests
+        assert not any(key.startswith(f"GET /repos/{REPO}/pulls/20") for key in transport.requests)
+        assert result["pr_cycle_time"]["summary"]["total_prs"] == 21
+
+    def test_stored_etags_turn_refetches_into_304s(self, temp_metrics_dir):
+        """Test per-PR ETags are sent and unchanged records reused"""
+        transport = RecordedTransport(synthesize_fixtures(REPO, 10, now=NOW))
+        collector = make_collector(temp_metrics_dir, transport)
+        first = sync(collector)
+
+        state = SyncState.load(collector.state_path, REPO)
+        state.cursor = None
+        state.list_etag = None
+        state.save(collector.state_path)
+        second = sync(collector)
+
+        assert collector.stats["changed_prs"] == 10
+        assert collector.stats["not_modified"] == 20
+        assert second["conflicts"]["conflicts"] == first["conflicts"]["conflicts"]
+
+    def test_events_added_after_first_page_are_seen(self, temp_metrics_dir):
+        """Test the conditional events request targets the last page"""
+        fixtures = synthesize_fixtures(REPO, 3, now=NOW)
+        events_url = f"/repos/{REPO}/issues/1/events"
+        page_two = f"https://api.github.com{events_url}?page=2&per_page=100"
+        labeled = {"event": "labeled", "created_at": "2024-01-01T00:00:00Z"}
+
+        def paged_events(second_page):
+            fixtures[f"GET {events_url}?per_page=100"] = make_fixture(
+                [labeled] * 100, {"Link": f'<{page_two}>; rel="next"'}
+            )
+            fixtures[f"GET {events_url}?page=2&per_page=100"] = make_fixture(second_page)
+
+        paged_events([labeled])
+        transport = RecordedTransport(fixtures)
+        collector = make_collector(temp_metrics_dir, transport)
+        assert sync(collector)["conflicts"]["summary"]["total_conflicts"] == 0
+
+        # A force push lands on page 2; page 1 (and its ETag) is unchanged
+        pushed = {"event": "head_ref_force_pushed", "created_at": "2024-01-01T02:00:00Z"}
+        paged_events([labeled, pushed])
+        state = SyncState.load(collector.state_path, REPO)
+        state.cursor = None
+        state.list_etag = None
+        state.save(collector.state_path)
+
+        result = sync(collector)
+
+        assert [c["pr_number"] for c in result["conflicts"]["conflicts"]] == [1]
+
+    def test_prs_outside_window_are_dropped(self, temp_metrics_dir):
+        """Test records older than days_back are pruned from state"""
+        transport = RecordedTransport(synthesize_fixtures(REPO, 72, now=NOW))
+        collector = make_collector(temp_metrics_dir, transport, days_back=1)
+
+        result = sync(collector)
+
+        # One PR updated per hour, so only the last day is kept
+        assert result["pr_cycle_time"]["summary"]["total_prs"] == 23
+        assert len(SyncState.load(collector.state_path, REPO).prs) == 23
+
+    def test_state_for_another_repo_is_ignored(self, temp_metrics_dir):
+        """Test sync state is reset when the repository changes"""
+        path = temp_metrics_dir / "github" / "sync_state.json"
+        SyncState(repo="other/repo", cursor=NOW.isoformat(), list_etag='"x"').save(path)
+
+        assert SyncState.load(path, REPO) == SyncState(repo=REPO)
+
+    def test_fan_out_is_bounded(self, temp_metrics_dir):
+        """Test no more than max_concurrency requests are in flight"""
+
+        class CountingTransport(RecordedTransport):
+            in_flight = 0
+            peak = 0
+
+            async def handle_async_request(self, request):
+                CountingTransport.in_flight += 1
+                CountingTransport.peak = max(CountingTransport.peak, CountingTransport.in_flight)
+                try:
+                    return await super().handle_async_request(request)
+                finally:
+                    CountingTransport.in_flight -= 1
+
+        transport = CountingTransport(synthesize_fixtures(REPO, 30, now=NOW), latency=0.005)
+        collector = make_collector(temp_metrics_dir, transport, max_concurrency=4)
+        sync(collector)
+
+        assert CountingTransport.peak == 4
+
+    def test_rate_limited_responses_are_retried(self, temp_metrics_dir, monkeypatch):
+        """Test 429 responses wait for Retry-After and retry"""
+        fixtures = synthesize_fixtures(REPO, 3, now=NOW)
+        inner = RecordedTransport(fixtures)
+        throttled = []
+
+        class ThrottlingTransport(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                if request.url.path.endswith("/pulls/2") and not throttled:
+                    throttled.append(request)
+                    return httpx.Response(429, headers={"Retry-After": "7"}, request=request)
+                return await inner.handle_async_request(request)
+
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr("src.orchestrator.metrics.github_sync.asyncio.sleep", fake_sleep)
+        collector = make_collector(temp_metrics_dir, ThrottlingTransport())
+
+        result = sync(collector)
+
+        assert sleeps == [7.0]
+        assert result["pr_cycle_time"]["summary"]["total_prs"] == 3
+
+
+class TestRateLimiter:
+    """Test RateLimiter header handling"""
+
+    def test_waits_until_reset_when_below_reserve(self, monkeypatch):
+        """Test requests pause until X-RateLimit-Reset once the reserve is hit"""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("src.orchestrator.metrics.github_sync.asyncio.sleep", fake_sleep)
+        monkeypatch.setattr("src.orchestrator.metrics.github_sync.time.time", lambda: 1000.0)
+
+        limiter = RateLimiter(reserve=10)
+        limiter.update(httpx.Response(200, headers={"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "1030"}))
+        asyncio.run(limiter.wait())
+        assert sleeps == []
+
+        limiter.update(httpx.Response(200, headers={"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1030"}))
+        asyncio.run(limiter.wait())
+        assert sleeps == [30.0]
+
+    def test_refuses_excessive_waits(self, monkeypatch):
+        """Test a reset beyond max_wait_seconds raises instead of hanging"""
+        monkeypatch.setattr("src.orchestrator.metrics.github_sync.time.time", lambda: 0.0)
+
+        limiter = RateLimiter(reserve=10, max_wait_seconds=60)
+        limiter.update(httpx.Response(200, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3600"}))
+
+        with pytest.raises(RuntimeError, match="rate limit exhausted"):
+            asyncio.run(limiter.wait())
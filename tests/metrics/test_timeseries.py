@@ -0,0 +1,170 @@
+"""
+Unit tests for the metrics time-series store.
+
+Tests daily partitioning, carry-forward windows and rollup caching.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.orchestrator.metrics.aggregator import MetricsAggregator
+from src.orchestrator.metrics.timeseries import MetricsTimeSeriesStore
+
+
+@pytest.fixture
+def store(temp_metrics_dir):
+    store = MetricsTimeSeriesStore(temp_metrics_dir / "timeseries.db")
+    yield store
+    store.close()
+
+
+def write_snapshot(path, collected_at, **summary):
+    with open(path, "w") as f:
+        json.dump({"collection_timestamp": collected_at.isoformat(), "summary": summary}, f)
+
+
+class TestMetricsTimeSeriesStore:
+    """Test MetricsTimeSeriesStore class"""
+
+    def test_window_mean_and_carry_forward(self, store):
+        """Test windows average their samples and carry the last value forward"""
+        store.append_many([
+            ("dora", "lead_time_hours", 10, datetime(2026, 1, 2, 9)),
+            ("dora", "lead_time_hours", 20, datetime(2026, 1, 2, 18)),
+            ("dora", "lead_time_hours", 30, datetime(2026, 1, 5)),
+            ("dora", "deployment_frequency", 3, datetime(2026, 1, 1)),
+        ])
+
+        assert store.window("dora", datetime(2026, 1, 1), datetime(2026, 1, 7)) == {
+            "lead_time_hours": 20.0,
+            "deployment_frequency": 3.0,
+        }
+        # No samples inside: last value before the window
+        assert store.window("dora", datetime(2026, 1, 8), datetime(2026, 1, 14)) == {
+            "lead_time_hours": 30.0,
+            "deployment_frequency": 3.0,
+        }
+        assert store.window("dora", datetime(2025, 12, 1), datetime(2025, 12, 31)) == {}
+        assert store.window("github", datetime(2026, 1, 1), datetime(2026, 1, 7)) == {}
+
+    def test_last_value_follows_timestamp_not_insert_order(self, store):
+        """Test a backfilled earlier sample does not replace the day's last value"""
+        store.append("dora", "mttr_hours", 5, datetime(2026, 1, 3, 18))
+        store.append("dora", "mttr_hours", 9, datetime(2026, 1, 3, 8))
+
+        assert store.window("dora", datetime(2026, 1, 4), datetime(2026, 1, 10)) == {"mttr_hours": 5.0}
+        assert store.series("dora", "mttr_hours") == [("2026-01-03", 7.0)]
+
+    def test_windows_recomputed_only_when_samples_land_inside(self, store):
+        """Test cached rollups survive samples after the window"""
+        store.append("github", "merge_rate", 80, datetime(2026, 1, 2))
+        january = (datetime(2026, 1, 1), datetime(2026, 1, 31))
+        february = (datetime(2026, 2, 1), datetime(2026, 2, 28))
+
+        store.window("github", *january)
+        store.window("github", *february)
+        assert store.stats == {"cached": 0, "computed": 2}
+
+        store.append("github", "merge_rate", 60, datetime(2026, 2, 10))
+        assert store.window("github", *january) == {"merge_rate": 80.0}
+        assert store.window("github", *february) == {"merge_rate": 60.0}
+        assert store.stats == {"cached": 1, "computed": 3}
+
+        store.append("github", "merge_rate", 70, datetime(2026, 1, 20))
+        assert store.window("github", *january) == {"merge_rate": 75.0}
+
+    def test_rollup_cache_persists(self, temp_metrics_dir):
+        """Test a new store instance reuses rollups computed earlier"""
+        first = MetricsTimeSeriesStore(temp_metrics_dir / "timeseries.db")
+        first.append("ai_review", "review_coverage", 90, datetime(2026, 3, 1))
+        first.window("ai_review", datetime(2026, 3, 1), datetime(2026, 3, 31))
+        first.close()
+
+        second = MetricsTimeSeriesStore(temp_metrics_dir / "timeseries.db")
+        assert second.window("ai_review", datetime(2026, 3, 1), datetime(2026, 3, 31)) == {"review_coverage": 90.0}
+        assert second.stats["cached"] == 1
+        second.close()
+
+    def test_ingest_snapshot_once_per_change(self, store, temp_metrics_dir):
+        """Test snapshot files are appended once per new collection"""
+        path = temp_metrics_dir / "dora" / "deployments.json"
+        fields = {"deploys_per_week": "deployment_frequency"}
+        write_snapshot(path, datetime(2026, 1, 5), deploys_per_week=2.0)
+
+        assert store.ingest_snapshot("dora", path, fields) == 1
+        assert store.ingest_snapshot("dora", path, fields) == 0
+
+        # Rewritten with the same collection: not duplicated
+        write_snapshot(path, datetime(2026, 1, 5), deploys_per_week=2.0)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert store.ingest_snapshot("dora", path, fields) == 0
+
+        write_snapshot(path, datetime(2026, 1, 12), deploys_per_week=4.0)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000))
+        assert store.ingest_snapshot("dora", path, fields) == 1
+        assert store.series("dora", "deployment_frequency") == [("2026-01-05", 2.0), ("2026-01-12", 4.0)]
+
+    def test_missing_snapshot_ignored(self, store, temp_metrics_dir):
+        """Test missing snapshot files append nothing"""
+        assert store.ingest_snapshot("github", temp_metrics_dir / "github" / "velocity.json", {"x": "x"}) == 0
+
+
+class TestAggregatorTimeSeries:
+    """Test MetricsAggregator rollups served from the store"""
+
+    def test_yearly_report_loads_each_snapshot_once(self, write_sample_metrics, monkeypatch):
+        """Test rollup buckets do not re-read snapshot files"""
+        loads = []
+        real_load = json.load
+        monkeypatch.setattr(
+            "src.orchestrator.metrics.timeseries.json.load",
+            lambda f: loads.append(f.name) or real_load(f),
+        )
+
+        aggregator = MetricsAggregator(project_root=write_sample_metrics.parent.parent)
+        aggregator.aggregate_weekly(weeks_back=52)
+        aggregator.aggregate_monthly(months_back=12)
+        aggregator.aggregate_quarterly(quarters_back=4)
+
+        assert len(loads) == 2
+        assert aggregator.store.stats["cached"] == 0
+
+        again = MetricsAggregator(project_root=write_sample_metrics.parent.parent)
+        again.aggregate_weekly(weeks_back=52)
+        assert len(loads) == 2
+        assert again.store.stats == {"cached": 52 * 4, "computed": 0}
+
+    def test_weekly_values_follow_collections(self, temp_metrics_dir):
+        """Test each week reports the collection made in it"""
+        aggregator = MetricsAggregator(project_root=temp_metrics_dir.parent.parent)
+        path = temp_metrics_dir / "github" / "pull_requests.json"
+        now = datetime.now()
+
+        write_snapshot(path, now - timedelta(days=8), median_cycle_time_hours=30, merge_rate=50)
+        aggregator.ingest_snapshots()
+        write_snapshot(path, now, median_cycle_time_hours=10, merge_rate=90)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        weekly = aggregator.aggregate_weekly(weeks_back=2)
+
+        assert weekly[0].metrics["github"] == {"pr_cycle_time_hours": 10.0, "merge_rate": 90.0}
+        assert weekly[1].metrics["github"] == {"pr_cycle_time_hours": 30.0, "merge_rate": 50.0}
+        assert weekly[1].trends["github.merge_rate"]["direction"] == "down"
+
+    def test_quarterly_summary(self, write_sample_metrics):
+        """Test quarterly rollups are written newest first"""
+        aggregator = MetricsAggregator(project_root=write_sample_metrics.parent.parent)
+        quarterly = aggregator.aggregate_quarterly(quarters_back=5)
+
+        assert len(quarterly) == 5
+        assert quarterly[0].quarter_end >= datetime.now().strftime("%Y-%m-%d")
+        starts = [q.quarter_start for q in quarterly]
+        assert starts == sorted(starts, reverse=True)
+        assert quarterly[0].metrics["dora"]["deployment_frequency"] > 0
+        assert (write_sample_metrics / "aggregated" / "quarterly_summary.json").exists()
@@ -9,6 +9,8 @@ Tests:
 - Dummy metrics when prometheus unavailable
 """
 
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -29,6 +31,8 @@ from src.ops.metrics import (
     registry_datasets_total,
     get_metrics,
     get_content_type,
+    histogram_quantile,
+    MetricsSampler,
 )
 
 
@@ -381,3 +385,63 @@ class TestMetricsIntegration:
         orchestrator_agent_retries_total.labels(agent="artifact", phase="build").inc()
 
         assert True
+
+
+class TestMetricsSampler:
+    """Test ring-buffer sampling of counters and histograms."""
+
+    def test_histogram_quantile_interpolates(self):
+        """p95 should be interpolated within the matching bucket."""
+        buckets = {0.1: 50.0, 0.5: 90.0, 1.0: 100.0, float("inf"): 100.0}
+        assert histogram_quantile(0.95, buckets) == pytest.approx(0.75)
+        assert histogram_quantile(0.5, buckets) == pytest.approx(0.1)
+        assert histogram_quantile(0.95, {float("inf"): 0.0}) == 0.0
+
+    def test_first_sample_is_baseline(self):
+        """The first sample only records a baseline."""
+        sampler = MetricsSampler(interval_seconds=1)
+        assert sampler.sample(now=100.0) is None
+        assert sampler.series("request_rate") == []
+
+    def test_rate_and_p95_cover_interval_only(self):
+        """Rates and p95 should reflect observations since the last sample."""
+        sampler = MetricsSampler(interval_seconds=10)
+        http_request_latency.labels(route="/sampler", method="GET").observe(9.0)
+        sampler.sample(now=100.0)
+
+        for _ in range(20):
+            http_requests_total.labels(route="/sampler", method="GET", status=200).inc()
+            http_request_latency.labels(route="/sampler", method="GET").observe(0.02)
+        entry = sampler.sample(now=110.0)
+
+        assert entry["request_rate"] == pytest.approx(2.0)
+        # The slow observation before the baseline is excluded
+        assert entry["p95_latency_seconds"] <= 0.05
+
+    def test_ring_buffer_is_bounded(self):
+        """Only the most recent samples should be kept."""
+        sampler = MetricsSampler(interval_seconds=1, size=3)
+        for i in range(6):
+            sampler.sample(now=float(i))
+
+        assert len(sampler.series("request_rate")) == 3
+        assert sampler.latest()["timestamp"] == 5.0
+
+    def test_start_stop(self):
+        """Background thread should take samples until stopped."""
+        sampler = MetricsSampler(interval_seconds=0.01)
+        sampler.start()
+        thread = sampler._thread
+        try:
+            deadline = time.time() + 2
+            while not sampler.series("request_rate") and time.time() < deadline:
+                time.sleep(0.01)
+            assert thread.is_alive()
+            assert sampler.series("request_rate")
+        finally:
+            sampler.stop()
+
+        assert not thread.is_alive()
+        taken = len(sampler.series("request_rate"))
+        time.sleep(0.05)
+        assert len(sampler.series("request_rate")) == taken
@@ -0,0 +1,66 @@
+"""Test prompt template compilation and interpolation."""
+
+import os
+
+import pytest
+
+from src.orchestrator import prompt_loader
+from src.orchestrator.prompt_loader import (
+    CompiledTemplate,
+    interpolate_prompt,
+    load_and_interpolate,
+    load_compiled_template,
+    load_prompt_template,
+)
+
+
+@pytest.fixture
+def project_root(tmp_path):
+    prompts = tmp_path / "subagent_prompts"
+    prompts.mkdir()
+    (prompts / "architect.md").write_text("# Architect\nPhase: {{phase}}\nProject: {{project_name}}\n")
+    return tmp_path
+
+
+def test_render_replaces_placeholders():
+    template = CompiledTemplate("{{a}} and {{b}}, again {{a}}")
+
+    assert template.placeholders == {"a", "b"}
+    assert template.render({"a": 1, "b": None}) == "1 and , again 1"
+
+
+def test_unknown_placeholders_are_left_in_place():
+    assert interpolate_prompt("Hi {{name}} {{missing}}", {"name": "Ann"}) == "Hi Ann {{missing}}"
+
+
+def test_values_are_inserted_verbatim():
+    rendered = interpolate_prompt("path={{path}} note={{note}}", {
+        "path": r"C:\new\1",
+        "note": "{{path}}",
+    })
+
+    # No backslash interpretation, and values are not re-expanded
+    assert rendered == r"path=C:\new\1 note={{path}}"
+
+
+def test_triple_braces_keep_outer_brace():
+    assert interpolate_prompt("{{{x}}}", {"x": "v"}) == "{v}"
+
+
+def test_compiled_template_cached_until_file_changes(project_root, monkeypatch):
+    first = load_compiled_template("architect", project_root)
+    assert load_compiled_template("architect", project_root) is first
+
+    path = project_root / "subagent_prompts" / "architect.md"
+    path.write_text("Updated {{phase}}")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_prompt_template("architect", project_root) == "Updated {{phase}}"
+    assert load_and_interpolate("architect", {"phase": "qa"}, project_root) == "Updated qa"
+
+
+def test_missing_template_raises(project_root):
+    with pytest.raises(FileNotFoundError):
+        load_compiled_template("nobody", project_root)
+    assert not any(p.name == "nobody.md" for p in prompt_loader._template_cache)
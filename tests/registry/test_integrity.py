@@ -1,10 +1,15 @@
 """Tests for registry integrity verification."""
 
+import asyncio
+import json
+import threading
 import pytest
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 
 from src.registry.manager import RegistryManager
+from src.server import registry_routes
 
 
 @pytest.fixture
@@ -156,3 +161,122 @@ class TestIntegrityVerification:
         assert len(results["errors"]) == 2
         assert any("model_a" in err for err in results["errors"])
         assert any("dataset_a" in err for err in results["errors"])
+
+
+class TestIncrementalVerification:
+    """Test cached, parallel verification and footer-only schema hashing."""
+
+    def publish(self, manager, temp_project, count=3):
+        for i in range(count):
+            path = temp_project / "models" / f"model_{i}.pkl"
+            path.write_bytes(b"weights" * (i + 1) * 1000)
+            manager.publish_model(name=f"model_{i}", version="1.0.0", artifacts=[f"models/model_{i}.pkl"])
+
+    def test_unchanged_artifacts_are_not_rehashed(self, temp_project):
+        """Should reuse hashes of artifacts with unchanged inode, size and mtime."""
+        manager = RegistryManager(temp_project)
+        self.publish(manager, temp_project)
+
+        results = manager.verify_integrity()
+
+        assert results["valid"] is True
+        assert results["artifacts_hashed"] == 0
+        assert results["artifacts_cached"] == 3
+
+    def test_changed_artifact_is_rehashed(self, temp_project):
+        """Should re-hash only the artifact whose metadata changed."""
+        manager = RegistryManager(temp_project)
+        self.publish(manager, temp_project)
+        (temp_project / "models" / "model_1.pkl").write_bytes(b"tampered")
+
+        results = manager.verify_integrity()
+
+        assert results["artifacts_hashed"] == 1
+        assert results["changed"] == ["Model model_1 v1.0.0: models/model_1.pkl"]
+        assert results["valid"] is False
+
+    def test_changed_only_mode(self, temp_project):
+        """Should check only entries changed since the last verification."""
+        manager = RegistryManager(temp_project)
+        self.publish(manager, temp_project)
+        (temp_project / "models" / "model_2.pkl").unlink()
+
+        results = manager.verify_integrity(changed_only=True)
+
+        assert results["models_checked"] == 1
+        assert results["errors"] == ["Model model_2 v1.0.0: Artifact not found: models/model_2.pkl"]
+
+    def test_rehash_reports_progress(self, temp_project):
+        """Should hash every artifact and report progress when the cache is bypassed."""
+        manager = RegistryManager(temp_project)
+        self.publish(manager, temp_project)
+        calls = []
+
+        results = manager.verify_integrity(use_cache=False, max_workers=2, progress=lambda *args: calls.append(args))
+
+        assert results["valid"] is True
+        assert results["artifacts_hashed"] == 3
+        assert len(calls) == 3
+        assert calls[-1][:2] == (3, 3)
+        assert calls[-1][2] == calls[-1][3] == results["bytes_hashed"]
+
+    def test_parquet_schema_hash_from_footer(self, temp_project):
+        """Should hash the parquet schema, independent of the data."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        manager = RegistryManager(temp_project)
+        first = temp_project / "datasets" / "first.parquet"
+        second = temp_project / "datasets" / "second.parquet"
+        pq.write_table(pa.table({"id": [1, 2], "name": ["a", "b"]}), first)
+        pq.write_table(pa.table({"id": [3], "name": ["c"]}), second)
+
+        assert manager._compute_schema_hash(first) == manager._compute_schema_hash(second)
+        assert manager._compute_file_hash(first) != manager._compute_file_hash(second)
+
+
+class TestVerifyProgressRoute:
+    """Test per-run progress of POST /verify."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_verifies_keep_separate_progress(self, monkeypatch):
+        """Should track each verify run under its own ID."""
+        release = threading.Event()
+
+        class FakeManager:
+            def __init__(self, root):
+                pass
+
+            def verify_integrity(self, changed_only, use_cache, progress):
+                total = 2 if changed_only else 5
+                progress(1, total, 10, 100)
+                release.wait(5)
+                return {"valid": True}
+
+        monkeypatch.setattr(registry_routes, "RegistryManager", FakeManager)
+        monkeypatch.setattr(registry_routes, "_verify_progress", OrderedDict())
+        key = registry_routes.REGISTRY_API_KEY
+
+        first = asyncio.create_task(
+            registry_routes.verify_integrity(
+                changed_only=True, rehash=False, verify_id="a", x_api_key=key, x_request_id=None
+            )
+        )
+        second = asyncio.create_task(
+            registry_routes.verify_integrity(
+                changed_only=False, rehash=False, verify_id=None, x_api_key=key, x_request_id="b"
+            )
+        )
+        while len(registry_routes._verify_progress) < 2 or any(
+            "artifacts_total" not in p for p in registry_routes._verify_progress.values()
+        ):
+            await asyncio.sleep(0.01)
+
+        assert (await registry_routes.get_verify_progress("a"))["artifacts_total"] == 2
+        assert (await registry_routes.get_verify_progress("b"))["artifacts_total"] == 5
+        assert all(run["running"] for run in (await registry_routes.get_verify_progress())["runs"])
+
+        release.set()
+        responses = await asyncio.gather(first, second)
+
+        assert [json.loads(r.body)["verify_id"] for r in responses] == ["a", "b"]
+        assert not (await registry_routes.get_verify_progress("a"))["running"]
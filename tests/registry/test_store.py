@@ -0,0 +1,148 @@
+"""Tests for the SQLite-backed registry store."""
+
+import json
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from src.registry.manager import RegistryManager
+from src.registry.store import version_key
+
+
+@pytest.fixture
+def temp_project():
+    """Create temporary project with a model artifact."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        temp_root = Path(tmpdir)
+        (temp_root / "models").mkdir()
+        (temp_root / "models" / "model.pkl").write_bytes(b"model data")
+        yield temp_root
+
+
+def publish(root: str, version: str) -> str:
+    """Publish one model version from a separate process."""
+    manager = RegistryManager(Path(root))
+    try:
+        manager.publish_model(name="shared", version=version, artifacts=["models/model.pkl"])
+        return "ok"
+    except ValueError:
+        return "duplicate"
+    finally:
+        manager.close()
+
+
+class TestRegistryStore:
+    """Test transactional storage, indexed lookups and JSON export."""
+
+    def test_latest_version_is_semver_ordered(self, temp_project):
+        """Should return the highest semantic version, not the highest string."""
+        manager = RegistryManager(temp_project)
+        for version in ["1.9.0", "1.10.0", "1.2.3"]:
+            manager.publish_model(name="forecast", version=version, artifacts=["models/model.pkl"])
+
+        assert manager.get_model("forecast").version == "1.10.0"
+        assert manager.get_model("forecast", "1.2.3").version == "1.2.3"
+        assert manager.get_model("forecast", "2.0.0") is None
+        assert version_key("1.10.0") > version_key("1.9.0")
+
+    def test_filters_and_stats(self, temp_project):
+        """Should filter by client and release tag and aggregate in the database."""
+        manager = RegistryManager(temp_project)
+        manager.publish_model(
+            name="a",
+            version="1.0.0",
+            artifacts=["models/model.pkl"],
+            client="acme",
+            cleanliness_score=90,
+        )
+        manager.publish_model(
+            name="b",
+            version="1.0.0",
+            artifacts=["models/model.pkl"],
+            client="acme",
+            release_tag="v1.0.0",
+        )
+        manager.publish_model(
+            name="c", version="1.0.0", artifacts=["models/model.pkl"], cleanliness_score=80
+        )
+
+        assert [m.name for m in manager.list_models()] == ["a", "b", "c"]
+        assert [m.name for m in manager.list_models(client="acme")] == ["a", "b"]
+        assert [m.name for m in manager.list_models(client="acme", release_tag="v1.0.0")] == ["b"]
+
+        stats = manager.get_stats()
+        assert stats["models_total"] == 3
+        assert stats["models_by_client"] == {"acme": 2}
+        assert stats["avg_model_cleanliness"] == 85
+        assert stats["avg_dataset_cleanliness"] is None
+
+    def test_concurrent_publishes_do_not_collide(self, temp_project):
+        """Should keep every version published by concurrent processes, once."""
+        versions = [f"1.0.{i}" for i in range(8)] + ["1.0.0"]
+        # Spawn, so workers do not inherit threads or connections from earlier tests
+        with ProcessPoolExecutor(
+            max_workers=4, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            outcomes = list(pool.map(publish, [str(temp_project)] * len(versions), versions))
+
+        assert outcomes.count("duplicate") == 1
+        assert len(RegistryManager(temp_project).list_models()) == 8
+
+    def test_imports_and_exports_json_manifests(self, temp_project):
+        """Should export the manifests on request and merge entries added to them on disk."""
+        legacy = RegistryManager(temp_project)
+        entry = legacy.publish_model(name="legacy", version="1.0.0", artifacts=["models/model.pkl"])
+        legacy.export_manifests()
+        legacy.close()
+        (temp_project / "models" / "registry" / "registry.db").unlink()
+
+        manager = RegistryManager(temp_project)
+        assert manager.get_model("legacy") == entry
+
+        manager.publish_model(name="new", version="1.0.0", artifacts=["models/model.pkl"])
+        releases = temp_project / "models" / "registry" / "releases.json"
+        # Publishing does not rewrite the manifest
+        assert [m["name"] for m in json.loads(releases.read_text())["models"]] == ["legacy"]
+
+        written = manager.export_manifests()
+        assert written["model"] == releases
+        assert json.loads(written["dataset"].read_text())["datasets"] == []
+        data = json.loads(releases.read_text())
+        assert data["$schema"] == "https://json-schema.org/draft-07/schema#"
+        assert [m["name"] for m in data["models"]] == ["legacy", "new"]
+
+        # An entry added to the manifest elsewhere (e.g. pulled by git) is merged
+        # on the next open; an unchanged manifest is not imported again
+        pulled = dict(data["models"][0], id="pulled-id", name="pulled")
+        data["models"].append(pulled)
+        releases.write_text(json.dumps(data))
+        manager.close()
+
+        reopened = RegistryManager(temp_project)
+        assert [m.name for m in reopened.list_models()] == ["legacy", "new", "pulled"]
+        assert reopened.store.import_manifest("model", releases) == 0
+
+    def test_unchanged_manifest_is_not_read(self, temp_project, monkeypatch):
+        """Should skip reading a manifest whose file state matches the last import or export."""
+        manager = RegistryManager(temp_project)
+        manager.publish_model(name="m", version="1.0.0", artifacts=["models/model.pkl"])
+        releases = manager.export_manifests()["model"]
+        manager.close()
+
+        def fail(self):
+            raise AssertionError(f"{self} was read")
+
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        reopened = RegistryManager(temp_project)
+        assert reopened.store.import_manifest("model", releases) == 0
+        monkeypatch.undo()
+
+        # Touched but unchanged: read and hashed once, then skipped again
+        releases.touch()
+        assert reopened.store.import_manifest("model", releases) == 0
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        assert reopened.store.import_manifest("model", releases) == 0
+        reopened.close()
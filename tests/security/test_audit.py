@@ -0,0 +1,108 @@
+"""Test audit log rotation, segment indexes and tail reads."""
+
+import csv
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.security.audit import AuditLogger, _reverse_lines
+from src.security.schemas import Identity
+
+
+@pytest.fixture
+def identity():
+    return Identity(id="auditor", type="user", roles=[], scopes=set(), tenants=[], source="test")
+
+
+@pytest.fixture
+def audit_log(tmp_path):
+    """Audit logger rotating every couple of kilobytes."""
+    return AuditLogger(log_path=str(tmp_path / "audit.log"), max_segment_bytes=2048, index_interval=4)
+
+
+def log_events(logger, identity, count, tenant="acme-corp", start=0):
+    for i in range(start, start + count):
+        logger.log(actor=identity, action="create", resource_type="theme", result="success",
+                   tenant=tenant, resource_id=f"theme-{i}")
+
+
+def segments(tmp_path):
+    return sorted(p.name for p in tmp_path.glob("audit.log.*") if not p.name.endswith(".idx"))
+
+
+class TestAuditSegments:
+    """Test segment rotation and indexed reads."""
+
+    def test_rotates_by_size(self, tmp_path, audit_log, identity):
+        """Should seal the active segment once it reaches the size limit."""
+        log_events(audit_log, identity, 40)
+
+        sealed = segments(tmp_path)
+        assert sealed[0] == "audit.log.000001"
+        assert len(sealed) >= 3
+        assert all((tmp_path / name).stat().st_size >= 2048 for name in sealed)
+        assert audit_log.log_path.stat().st_size < 2048
+
+    def test_rotates_by_age(self, tmp_path, identity):
+        """Should seal the active segment once its first entry is too old."""
+        logger = AuditLogger(log_path=str(tmp_path / "audit.log"), max_segment_age=3600)
+        log_events(logger, identity, 2)
+        assert segments(tmp_path) == []
+
+        # A restarted process finds an active segment started two hours ago
+        old = {"ts": (datetime.utcnow() - timedelta(hours=2)).isoformat(), "actor": "auditor"}
+        logger.log_path.write_text(json.dumps(old) + "\n")
+        restarted = AuditLogger(log_path=str(tmp_path / "audit.log"), max_segment_age=3600)
+        log_events(restarted, identity, 1)
+        assert segments(tmp_path) == ["audit.log.000001"]
+
+    def test_read_recent_spans_segments(self, audit_log, identity):
+        """Should return the newest entries across segment boundaries."""
+        log_events(audit_log, identity, 40)
+
+        recent = audit_log.read_recent(limit=25)
+
+        assert [e["resource_id"] for e in recent] == [f"theme-{i}" for i in range(39, 14, -1)]
+        assert len(audit_log.read_recent(limit=1000)) == 40
+
+    def test_read_recent_by_tenant(self, audit_log, identity):
+        """Should skip segments whose index lacks the tenant."""
+        log_events(audit_log, identity, 5, tenant="acme-corp")
+        log_events(audit_log, identity, 30, tenant="other-corp", start=5)
+
+        recent = audit_log.read_recent(limit=3, tenant="acme-corp")
+
+        assert [e["resource_id"] for e in recent] == ["theme-4", "theme-3", "theme-2"]
+
+    def test_export_filters_segments(self, tmp_path, audit_log, identity):
+        """Should export only matching entries and index the sealed segments."""
+        log_events(audit_log, identity, 10, tenant="acme-corp")
+        log_events(audit_log, identity, 30, tenant="other-corp", start=10)
+
+        # Age the first segment out of the export window
+        first = tmp_path / "audit.log.000001"
+        aged = [
+            json.dumps({**json.loads(line), "ts": (datetime.utcnow() - timedelta(days=30)).isoformat()})
+            for line in first.read_text().splitlines()
+        ]
+        first.write_text("\n".join(aged) + "\n")
+
+        csv_path = tmp_path / "audit.csv"
+        exported = audit_log.export_csv(str(csv_path), days=7)
+        with open(csv_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+
+        assert exported == len(rows) == 40 - len(aged)
+        assert audit_log.export_csv(str(csv_path), tenant="acme-corp") == 10
+        assert (tmp_path / "audit.log.000001.idx").exists()
+        index = json.loads((tmp_path / "audit.log.000002.idx").read_text())
+        assert index["tenants"] and index["sparse"][0][0] == 0
+
+
+def test_reverse_lines(tmp_path):
+    """Should yield lines last to first across block boundaries."""
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"first\nsecond\n\nlast")
+
+    assert list(_reverse_lines(path, block_size=3)) == [b"last", b"", b"second", b"first"]
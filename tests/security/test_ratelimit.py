@@ -0,0 +1,114 @@
+"""Test rate limit backends: bounded in-process buckets and shared SQLite buckets."""
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.security.ratelimit import MemoryBackend, RateLimiter, SqliteBackend
+from src.security.schemas import Identity
+
+
+@pytest.fixture
+def identity():
+    return Identity(id="test-user", type="user", roles=[], scopes=set(), tenants=[], source="test")
+
+
+def consume(db_path, attempts):
+    """Take tokens from one shared bucket in a separate worker process."""
+    backend = SqliteBackend(db_path=db_path)
+    try:
+        return sum(backend.take("acme-corp:test-user:/api/test", 10, 1 / 60.0)[0] for _ in range(attempts))
+    finally:
+        backend.close()
+
+
+class TestMemoryBackend:
+    """Test sharded LRU buckets."""
+
+    def test_bounded_by_max_buckets(self):
+        """Should evict least recently used buckets instead of growing."""
+        backend = MemoryBackend(max_buckets=64, shards=4)
+        for i in range(10_000):
+            backend.take(f"tenant:user-{i}:/api/test", 10, 1.0)
+
+        assert len(backend) == 64
+
+    def test_recently_used_bucket_survives(self):
+        """Should keep an active bucket while idle keys are evicted."""
+        backend = MemoryBackend(max_buckets=8, shards=1)
+        for _ in range(3):
+            backend.take("hot", 3, 1 / 60.0)
+        for round in range(3):
+            for i in range(6):
+                backend.take(f"cold-{round}-{i}", 3, 1 / 60.0)
+            assert not backend.take("hot", 3, 1 / 60.0)[0]
+
+        allowed, remaining, reset_in = backend.take("hot", 3, 1 / 60.0)
+        assert not allowed
+        assert remaining < 1
+        assert reset_in > 0
+
+    def test_flood_does_not_reset_throttled_bucket(self):
+        """Should evict the flood's fresh buckets rather than a depleted one."""
+        backend = MemoryBackend(max_buckets=8, shards=1)
+        for _ in range(4):
+            backend.take("attacker", 3, 1 / 60.0)
+        for i in range(1000):
+            backend.take(f"flood-{i}", 3, 1 / 60.0)
+
+        assert len(backend) == 8
+        assert not backend.take("attacker", 3, 1 / 60.0)[0]
+
+    def test_refilled_buckets_evicted_first(self, monkeypatch):
+        """Should drop buckets that have refilled before any holding state."""
+        clock = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: clock[0])
+        backend = MemoryBackend(max_buckets=4, shards=1)
+        backend.take("idle-0", 2, 1.0)
+        backend.take("idle-1", 2, 1.0)
+        backend.take("busy", 2, 1.0, tokens=2)
+        backend.take("busy-2", 2, 1.0)
+        clock[0] += 1.5  # idle buckets refilled, "busy" has not
+
+        backend.take("new", 2, 1.0)
+        assert len(backend) == 3
+        assert not backend.take("busy", 2, 1.0, tokens=2)[0]
+
+
+class TestSqliteBackend:
+    """Test buckets shared by worker processes."""
+
+    def test_limiter_semantics(self, tmp_path, identity):
+        """Should enforce burst and refill like the in-process limiter."""
+        limiter = RateLimiter(default_requests_per_minute=60, default_burst=2,
+                              backend=SqliteBackend(db_path=tmp_path / "ratelimit.db"))
+
+        assert [limiter.check_rate_limit(identity, "acme-corp", "/api/test")[0] for _ in range(3)] == [
+            True, True, False
+        ]
+        assert limiter.check_rate_limit(identity, "other-corp", "/api/test")[0]
+
+        time.sleep(1.1)
+        assert limiter.check_rate_limit(identity, "acme-corp", "/api/test")[0]
+
+        limiter.reset(identity, "acme-corp", "/api/test")
+        assert limiter.check_rate_limit(identity, "acme-corp", "/api/test")[1] == 1
+
+    def test_workers_share_one_limit(self, tmp_path):
+        """Should allow the burst once across all worker processes."""
+        db_path = tmp_path / "ratelimit.db"
+        with ProcessPoolExecutor(max_workers=4, mp_context=multiprocessing.get_context("spawn")) as pool:
+            allowed = sum(pool.map(consume, [db_path] * 4, [8] * 4))
+
+        assert allowed == 10
+
+    def test_prunes_refilled_buckets(self, tmp_path):
+        """Should delete buckets that have refilled."""
+        backend = SqliteBackend(db_path=tmp_path / "ratelimit.db", prune_interval=0)
+        backend.take("idle", 1, 1000.0)
+        time.sleep(0.01)
+        backend.take("busy", 5, 1 / 60.0)
+
+        assert len(backend) == 1
@@ -0,0 +1,55 @@
+"""Test the shared per-file cache and parallel map helpers."""
+
+import json
+import os
+
+from src.steward.cache import load_json_cache, map_maybe_parallel, save_json_cache
+
+
+def square(x):
+    return x * x
+
+
+class TestJsonCache:
+    def test_round_trip(self, tmp_path):
+        cache_path = tmp_path / "nested" / "cache.json"
+        save_json_cache(cache_path, 2, {"a.py": [1, 2, "x"]}, search_exts=[".py"])
+
+        assert load_json_cache(cache_path, 2, search_exts=[".py"]) == {"a.py": [1, 2, "x"]}
+        assert list(cache_path.parent.iterdir()) == [cache_path]
+
+    def test_discards_other_versions_and_params(self, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        save_json_cache(cache_path, 2, {"a.py": [1]}, search_exts=[".py"])
+
+        assert load_json_cache(cache_path, 3, search_exts=[".py"]) == {}
+        assert load_json_cache(cache_path, 2, search_exts=[".md"]) == {}
+
+    def test_missing_or_corrupt_cache_is_empty(self, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        assert load_json_cache(None, 1) == {}
+        assert load_json_cache(cache_path, 1) == {}
+
+        cache_path.write_text("{not json")
+        assert load_json_cache(cache_path, 1) == {}
+
+    def test_disabled_cache_is_not_written(self, tmp_path):
+        save_json_cache(None, 1, {"a.py": [1]})
+        assert os.listdir(tmp_path) == []
+
+    def test_written_format(self, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        save_json_cache(cache_path, 1, {})
+        assert json.loads(cache_path.read_text()) == {"version": 1, "files": {}}
+
+
+class TestMapMaybeParallel:
+    def test_inline_below_threshold(self):
+        assert map_maybe_parallel(lambda x: x + 1, [1, 2, 3], 4, None) == [2, 3, 4]
+
+    def test_single_worker_runs_inline(self):
+        assert map_maybe_parallel(lambda x: x + 1, [1, 2], 1, 1) == [2, 3]
+
+    def test_pool_keeps_item_order(self):
+        items = list(range(20))
+        assert map_maybe_parallel(square, items, 1, 2, chunksize=4) == [x * x for x in items]
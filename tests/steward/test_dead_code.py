@@ -0,0 +1,107 @@
+"""Test cached, repository-wide dead code analysis."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from src.steward import dead_code
+from src.steward.config import HygieneConfig
+from src.steward.dead_code import SymbolIndex, analyze_dead_code, module_name
+
+
+class TestDeadCode:
+    """Test symbol tables, cross-module usage and caching."""
+
+    def setup_method(self):
+        """Create temporary package with cross-module references."""
+        self.root = Path(tempfile.mkdtemp())
+        self.cache = self.root / ".claude" / "steward" / "dead_code_cache.json"
+        self.output = self.root / "reports" / "dead_code.md"
+        self.write("pkg/__init__.py", "")
+        self.write(
+            "pkg/core.py",
+            "import os\n"
+            "\n"
+            "\n"
+            "@staticmethod\n"
+            "def imported_elsewhere():\n"
+            "    return 1\n"
+            "\n"
+            "\n"
+            "def called_as_attribute():\n"
+            "    return 2\n"
+            "\n"
+            "\n"
+            "def never_used():\n"
+            "    return 3\n"
+            "\n"
+            "\n"
+            "class Unused:\n"
+            "    pass\n",
+        )
+        self.write("pkg/app.py", "from .core import imported_elsewhere\n\nimported_elsewhere()\n")
+        self.write("tools/run.py", "import pkg.core\n\npkg.core.called_as_attribute()\n")
+        self.write("broken.py", "def oops(:\n")
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.root)
+
+    def write(self, rel, content):
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def analyze(self, **kwargs):
+        return analyze_dead_code(self.root, HygieneConfig(), self.output, cache_path=self.cache, **kwargs)
+
+    def test_module_name(self):
+        """Test module names are derived from root-relative paths."""
+        assert module_name("src/steward/scanner.py") == "src.steward.scanner"
+        assert module_name("src/steward/__init__.py") == "src.steward"
+
+    def test_cross_module_usage_counts(self):
+        """Test definitions imported or accessed from other modules are not reported."""
+        results = self.analyze()
+
+        functions = {(f["name"], f["file"], f["line"]) for f in results["functions"]}
+        assert functions == {("never_used", str(Path("pkg/core.py")), 13)}
+        assert [c["name"] for c in results["classes"]] == ["Unused"]
+        assert [(i["name"], i["line"]) for i in results["imports"]] == [("os", 1)]
+
+    def test_decorated_definition_line(self):
+        """Test line numbers come from the def statement, not the decorator."""
+        index = SymbolIndex(self.root).build()
+        tables = dict(index.tables())
+
+        assert tables["pkg/core.py"]["functions"]["imported_elsewhere"] == 5
+        assert "broken.py" not in tables
+
+    def test_repeat_runs_parse_only_changed_files(self):
+        """Test symbol tables are reused by content hash."""
+        first = SymbolIndex(self.root, cache_path=self.cache).build()
+        assert first.files_parsed == 5
+
+        unchanged = SymbolIndex(self.root, cache_path=self.cache).build()
+        assert unchanged.files_parsed == 0
+
+        self.write("pkg/app.py", "from .core import imported_elsewhere, never_used\n")
+        changed = SymbolIndex(self.root, cache_path=self.cache).build()
+        assert changed.files_parsed == 1
+        assert changed.is_used("pkg/core.py", "never_used")
+
+    def test_parallel_parsing_matches_serial(self, monkeypatch):
+        """Test the process pool produces the same report."""
+        serial = self.analyze(max_workers=1)
+        self.cache.unlink()
+        monkeypatch.setattr(dead_code, "PARALLEL_MIN_FILES", 1)
+        parallel = self.analyze(max_workers=2)
+
+        assert parallel == serial
+
+    def test_star_import_usage(self):
+        """Test names loaded after a star import count as usage of that module."""
+        self.write("pkg/star.py", "from pkg.core import *\n\nnever_used()\n")
+        results = self.analyze()
+
+        assert "never_used" not in {f["name"] for f in results["functions"]}
@@ -0,0 +1,158 @@
+"""Test compiled hierarchical ignore matching and pruned tree walks."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from src.steward.ignore import IgnoreMatcher, IgnoreRule, walk_files
+from src.steward.scanner import is_gitignored, is_tidyignored
+
+
+class TestIgnoreRule:
+    """Test translation of single gitignore patterns."""
+
+    def test_unanchored_name_matches_at_any_depth(self):
+        """Test a pattern without a slash matches a name anywhere."""
+        rule = IgnoreRule("*.log")
+
+        assert rule.matches("debug.log")
+        assert rule.matches("a/b/debug.log")
+        assert not rule.matches("debug.log.txt")
+
+    def test_slash_anchors_pattern(self):
+        """Test a pattern containing a slash is relative to its directory."""
+        assert IgnoreRule("/top.txt").matches("top.txt")
+        assert not IgnoreRule("/top.txt").matches("sub/top.txt")
+        assert IgnoreRule("docs/*.md").matches("docs/a.md")
+        assert not IgnoreRule("docs/*.md").matches("docs/sub/a.md")
+
+    def test_double_star(self):
+        """Test '**/' spans zero or more directories and '/**' everything inside."""
+        rule = IgnoreRule("docs/**/*.png")
+        assert rule.matches("docs/a.png")
+        assert rule.matches("docs/x/y/a.png")
+
+        inside = IgnoreRule("reports/**")
+        assert inside.matches("reports/a/b.csv")
+        assert not inside.matches("reports")
+
+    def test_directory_only(self):
+        """Test a trailing slash matches directories only."""
+        rule = IgnoreRule("build/")
+
+        assert rule.matches("build", is_dir=True)
+        assert rule.matches("pkg/build", is_dir=True)
+        assert not rule.matches("build", is_dir=False)
+
+    def test_character_classes(self):
+        """Test bracket expressions and negated classes."""
+        assert IgnoreRule("*.py[cod]").matches("x.pyc")
+        assert IgnoreRule("file[!0-9].txt").matches("fileA.txt")
+        assert not IgnoreRule("file[!0-9].txt").matches("file1.txt")
+
+
+class TestIgnoreMatcher:
+    """Test nested ignore files, negation and pruned walks."""
+
+    def setup_method(self):
+        """Create temporary tree with nested ignore files."""
+        self.root = Path(tempfile.mkdtemp())
+        self.write(".gitignore", "*.log\n!keep.log\nbuild/\n/top.txt\n")
+        self.write("sub/.gitignore", "!local.log\nsecret\n")
+        for rel in [
+            "a.log",
+            "keep.log",
+            "top.txt",
+            "src/top.txt",
+            "src/main.py",
+            "sub/local.log",
+            "sub/other.log",
+            "sub/secret",
+            "secret",
+            "build/out.bin",
+            "pkg/build/out.bin",
+        ]:
+            self.write(rel, "x")
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.root)
+
+    def write(self, rel, content):
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def test_last_matching_rule_wins(self):
+        """Test negation re-includes files matched by earlier rules."""
+        matcher = IgnoreMatcher(self.root)
+
+        assert matcher.is_ignored("a.log")
+        assert not matcher.is_ignored("keep.log")
+        assert matcher.is_ignored("top.txt")
+        assert not matcher.is_ignored("src/top.txt")
+
+    def test_nested_ignore_file_takes_precedence(self):
+        """Test deeper ignore files override and extend the root file."""
+        matcher = IgnoreMatcher(self.root)
+
+        assert not matcher.is_ignored("sub/local.log")
+        assert matcher.is_ignored("sub/other.log")
+        assert matcher.is_ignored("sub/secret")
+        assert not matcher.is_ignored("secret")
+
+    def test_file_inside_ignored_directory_stays_ignored(self):
+        """Test negation cannot re-include a file below an ignored directory."""
+        self.write("build/.gitignore", "!out.bin\n")
+        matcher = IgnoreMatcher(self.root)
+
+        assert matcher.is_ignored("build/out.bin")
+        assert matcher.is_ignored("pkg/build/out.bin")
+
+    def test_walk_prunes_ignored_directories(self):
+        """Test the walker yields only non-ignored files and skips ignored trees."""
+        matcher = IgnoreMatcher(self.root)
+        walked = [rel for rel, _ in walk_files(self.root, matcher)]
+
+        assert walked == sorted(walked, key=lambda rel: rel.split("/"))
+        assert set(walked) == {
+            ".gitignore",
+            "keep.log",
+            "secret",
+            "src/main.py",
+            "src/top.txt",
+            "sub/.gitignore",
+            "sub/local.log",
+        }
+        # Ignore files of pruned directories are never read
+        assert "build" not in matcher._compiled
+
+    def test_walk_prune_callback(self):
+        """Test directories rejected by the prune callback are not entered."""
+        walked = {rel for rel, _ in walk_files(self.root, prune=lambda name: name == "sub")}
+
+        assert "sub/secret" not in walked
+        assert "pkg/build/out.bin" in walked
+
+    def test_scanner_helpers_reload_changed_ignore_file(self):
+        """Test is_gitignored/is_tidyignored reuse compiled rules until the file changes."""
+        assert is_gitignored(self.root / "sub" / "other.log", self.root)
+        assert not is_tidyignored(self.root / "src" / "main.py", self.root)
+
+        self.write(".tidyignore", "src/**\n")
+        assert is_tidyignored(self.root / "src" / "main.py", self.root)
+
+        # Nested ignore files are re-checked too, including new ones
+        self.write("sub/.gitignore", "!other.log\n")
+        assert not is_gitignored(self.root / "sub" / "other.log", self.root)
+        self.write("src/.gitignore", "main.py\n")
+        assert is_gitignored(self.root / "src" / "main.py", self.root)
+
+    def test_tidyignore_negation_cannot_reinclude_gitignored(self):
+        """Test .gitignore and .tidyignore are evaluated separately."""
+        self.write(".tidyignore", "!a.log\n*.tmp\n")
+        matcher = IgnoreMatcher(self.root, (".gitignore", ".tidyignore"))
+
+        assert matcher.is_ignored("a.log")
+        assert matcher.is_ignored("x.tmp")
+        assert not matcher.is_ignored("keep.log")
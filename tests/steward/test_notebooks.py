@@ -0,0 +1,129 @@
+"""Test streaming notebook checks and the unchanged-notebook cache."""
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.steward import notebooks
+from src.steward.config import HygieneConfig
+from src.steward.notebooks import check_notebooks, scan_notebook, scan_notebooks
+
+IMAGE = "iVBORw0KGgo" * 2000
+
+
+def notebook(*cells):
+    return {"cells": list(cells), "metadata": {"kernelspec": {"name": "python3"}}, "nbformat": 4}
+
+
+def code(execution_count=None, outputs=(), metadata=None):
+    return {
+        "cell_type": "code",
+        "execution_count": execution_count,
+        "metadata": metadata or {},
+        "outputs": list(outputs),
+        "source": ['print("a \\"quoted\\" string")\n'],
+    }
+
+
+def markdown(text="# Title"):
+    return {"cell_type": "markdown", "metadata": {}, "source": [text]}
+
+
+class TestNotebookScan:
+    """Test cell inspection without loading outputs."""
+
+    def setup_method(self):
+        """Create temporary repository."""
+        self.root = Path(tempfile.mkdtemp())
+        self.cache = self.root / ".claude" / "steward" / "notebook_cache.json"
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.root)
+
+    def write(self, rel, nb):
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(nb, indent=1))
+        return path
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+    def test_counts_match_full_parse(self, chunk_size):
+        """Test counts are independent of where chunks split the file."""
+        output = {"output_type": "display_data", "data": {"image/png": IMAGE}, "metadata": {}}
+        path = self.write(
+            "nb.ipynb",
+            notebook(
+                markdown('Escaped \\ backslash and " quote'),
+                code(execution_count=1, outputs=[output], metadata={"scrolled": True}),
+                code(execution_count=2),
+                code(),
+            ),
+        )
+
+        stats = scan_notebook(path, chunk_size=chunk_size)
+
+        assert stats["cells_with_outputs"] == 2
+        assert stats["executed_cells"] == 2
+        assert stats["cells_with_metadata"] == 1
+        assert stats["output_bytes"] > len(IMAGE)
+
+    def test_invalid_notebook_raises(self):
+        """Test truncated JSON is reported as invalid."""
+        path = self.root / "broken.ipynb"
+        path.write_text('{"cells": [{"cell_type": "code", "outputs": ["unterminated')
+
+        with pytest.raises(ValueError):
+            scan_notebook(path)
+
+    def test_unchanged_notebooks_are_not_reread(self):
+        """Test size and mtime unchanged since the last scan skip the file."""
+        self.write("a.ipynb", notebook(code(execution_count=1)))
+        self.write("b.ipynb", notebook(markdown()))
+
+        _, read = scan_notebooks(self.root, self.cache)
+        assert read == 2
+
+        results, read = scan_notebooks(self.root, self.cache)
+        assert read == 0
+        assert results["a.ipynb"]["cells_with_outputs"] == 1
+
+        self.write("b.ipynb", notebook(code(execution_count=5), markdown()))
+        results, read = scan_notebooks(self.root, self.cache)
+        assert read == 1
+        assert results["b.ipynb"]["cells_with_outputs"] == 1
+
+    def test_parallel_scan_matches_serial(self, monkeypatch):
+        """Test the process pool produces the same statistics."""
+        for i in range(3):
+            self.write(f"nb{i}.ipynb", notebook(code(execution_count=i)))
+        serial, _ = scan_notebooks(self.root, max_workers=1)
+        monkeypatch.setattr(notebooks, "PARALLEL_MIN_FILES", 1)
+        parallel, _ = scan_notebooks(self.root, max_workers=2)
+
+        assert parallel == serial
+
+    def test_check_notebooks_clears_and_reports(self):
+        """Test the report lists output sizes and cleared notebooks are clean next run."""
+        config = HygieneConfig()
+        config.config["whitelist_globs"] = ["keep/*.ipynb"]
+        output = {"output_type": "stream", "name": "stdout", "text": ["hello\n"]}
+        self.write("dirty.ipynb", notebook(code(execution_count=1, outputs=[output])))
+        self.write("keep/kept.ipynb", notebook(code(execution_count=1)))
+        self.write(".ipynb_checkpoints/dirty-checkpoint.ipynb", notebook(code(execution_count=1)))
+        report = self.root / "reports" / "notebook_sanitizer.md"
+
+        found = check_notebooks(self.root, config, report, clear_outputs=True, cache_path=self.cache)
+
+        assert {nb["path"]: nb["recommendation"] for nb in found} == {
+            "dirty.ipynb": "CLEAR_OUTPUTS",
+            str(Path("keep/kept.ipynb")): "KEEP",
+        }
+        assert "- **Output size**:" in report.read_text()
+        assert json.loads((self.root / "dirty.ipynb").read_text())["cells"][0]["outputs"] == []
+
+        again = check_notebooks(self.root, config, report, cache_path=self.cache)
+        assert [nb["path"] for nb in again] == [str(Path("keep/kept.ipynb"))]
@@ -0,0 +1,140 @@
+"""Test the inverted reference index used for orphan detection."""
+
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from src.steward import references
+from src.steward.config import HygieneConfig
+from src.steward.references import ReferenceIndex, tokenize
+from src.steward.scanner import find_references, scan_orphans
+
+SEARCH_EXTS = [".py", ".md", ".json"]
+
+
+class TestReferenceIndex:
+    """Test reference tokenizing, querying and caching."""
+
+    def setup_method(self):
+        """Create temporary test repository."""
+        self.root = Path(tempfile.mkdtemp())
+        self.cache = self.root / ".claude" / "steward" / "reference_index.json"
+        self.write("pkg/loader.py", "import json\nfrom .parser import parse, Token\n")
+        self.write("pkg/parser.py", "def parse(): ...\n")
+        self.write("pkg/unused.py", "x = 1\n")
+        self.write("docs/guide.md", "See `data/lookup.csv` and ./run.sh. Also my_unused.py\n")
+        self.write("data/lookup.csv", "a,b\n")
+        self.write("run.sh", "echo hi\n")
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.root)
+
+    def write(self, rel, content, age_days=60):
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        stamp = time.time() - age_days * 86400
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def test_tokenize_names_and_import_modules(self):
+        """Test basenames and imported module paths are extracted."""
+        names, modules = tokenize("from src.steward.scanner import scan_orphans\nsee reports/orphans.csv.\n")
+
+        assert "orphans.csv" in names
+        assert "reports" in names
+        assert modules == {
+            "src",
+            "src.steward",
+            "src.steward.scanner",
+            "src.steward.scanner.scan_orphans",
+        }
+
+    def test_tokenize_quoted_and_unusual_names(self):
+        """Test names with spaces, '+' or parentheses are extracted."""
+        names, _ = tokenize('Open "data/Q1 report (final).xlsx" or `notes+draft.md`; see c++.txt\n')
+
+        assert {"Q1 report (final).xlsx", "notes+draft.md", "c++.txt"} <= names
+
+    def test_unusual_file_names_are_referenced(self):
+        """Test files whose names break the plain token pattern are found."""
+        self.write("data/Q1 report (final).xlsx", "x")
+        self.write("docs/report.md", 'Source: "data/Q1 report (final).xlsx"\n')
+        index = ReferenceIndex(self.root, SEARCH_EXTS).build()
+
+        assert index.count(self.root / "data" / "Q1 report (final).xlsx") == 1
+
+    def test_imported_names_are_not_module_references(self):
+        """Test 'from .parser import parse' does not reference a parse.py module."""
+        self.write("pkg/parse.py", "x = 2\n")
+        index = ReferenceIndex(self.root, SEARCH_EXTS).build()
+
+        assert index.count(self.root / "pkg" / "parse.py") == 0
+        assert index.referencing_files(self.root / "pkg" / "parser.py") == {"pkg/loader.py"}
+
+    def test_references_by_name_and_import(self):
+        """Test files are referenced by path component or module import."""
+        index = ReferenceIndex(self.root, SEARCH_EXTS).build()
+
+        assert index.count(self.root / "data" / "lookup.csv") == 1
+        assert index.count(self.root / "run.sh") == 1
+        assert index.referencing_files(self.root / "pkg" / "parser.py") == {"pkg/loader.py"}
+        # 'my_unused.py' is a different name, not a substring match
+        assert index.count(self.root / "pkg" / "unused.py") == 0
+
+    def test_find_references_without_index(self):
+        """Test the single-query form builds its own index."""
+        assert find_references(self.root / "data" / "lookup.csv", self.root, SEARCH_EXTS) == 1
+
+    def test_cache_rereads_only_changed_files(self):
+        """Test repeat builds read only files whose mtime changed."""
+        first = ReferenceIndex(self.root, SEARCH_EXTS, cache_path=self.cache).build()
+        assert first.files_read == 4
+
+        unchanged = ReferenceIndex(self.root, SEARCH_EXTS, cache_path=self.cache).build()
+        assert unchanged.files_read == 0
+        assert unchanged.count(self.root / "run.sh") == 1
+
+        self.write("docs/guide.md", "Nothing here\n", age_days=0)
+        (self.root / "pkg" / "loader.py").unlink()
+        changed = ReferenceIndex(self.root, SEARCH_EXTS, cache_path=self.cache).build()
+
+        assert changed.files_read == 1
+        assert changed.count(self.root / "run.sh") == 0
+        assert changed.count(self.root / "pkg" / "parser.py") == 0
+
+    def test_cache_file_is_not_a_reference(self):
+        """Test the JSON cache does not count as a referencing file."""
+        ReferenceIndex(self.root, SEARCH_EXTS, cache_path=self.cache).build()
+        index = ReferenceIndex(self.root, SEARCH_EXTS, cache_path=self.cache).build()
+
+        assert index.count(self.root / "pkg" / "unused.py") == 0
+
+    def test_git_directory_is_not_searched(self):
+        """Test files under .git never count as references."""
+        self.write(".git/logs/notes.md", "pkg/unused.py\n")
+        index = ReferenceIndex(self.root, SEARCH_EXTS).build()
+
+        assert index.count(self.root / "pkg" / "unused.py") == 0
+
+    def test_parallel_tokenizing_matches_serial(self, monkeypatch):
+        """Test the process pool produces the same index."""
+        serial = ReferenceIndex(self.root, SEARCH_EXTS, max_workers=1).build()
+        monkeypatch.setattr(references, "PARALLEL_MIN_FILES", 1)
+        parallel = ReferenceIndex(self.root, SEARCH_EXTS, max_workers=2).build()
+
+        assert parallel._by_name == serial._by_name
+        assert parallel._by_module == serial._by_module
+
+    def test_scan_orphans_uses_index(self):
+        """Test orphan scan reports only unreferenced files."""
+        output = self.root / "reports" / "orphans.csv"
+        orphans = scan_orphans(self.root, HygieneConfig(), output, index_cache=self.cache)
+
+        paths = {o["path"] for o in orphans}
+        assert {"pkg/unused.py", "pkg/loader.py"} <= paths
+        assert not paths & {"pkg/parser.py", "data/lookup.csv", "run.sh"}
+        assert self.cache.exists()
@@ -0,0 +1,141 @@
+"""
+Tests for BudgetEnforcer and the write-behind usage ledger.
+"""
+
+import json
+
+import pytest
+
+from orchestrator_v2.telemetry.budget_enforcer import BudgetEnforcer, BudgetExceededError
+from orchestrator_v2.telemetry.usage_ledger import UsageLedger, UsageRecord
+from orchestrator_v2.user.models import UserProfileCreate
+from orchestrator_v2.user.repository import FileSystemUserRepository
+
+
+@pytest.fixture
+def user_repo(tmp_path):
+    return FileSystemUserRepository(base_path=tmp_path / "users")
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return UsageLedger(base_path=tmp_path / "usage", flush_batch_size=3)
+
+
+@pytest.fixture
+def enforcer(user_repo, ledger):
+    return BudgetEnforcer(user_repo, ledger=ledger)
+
+
+async def _user(user_repo, **limits):
+    user = await user_repo.create(UserProfileCreate(user_id="u1", email="u1@x.com"))
+    user.token_limits = limits
+    return await user_repo.save(user)
+
+
+class TestBudgetEnforcer:
+    """Reservation and daily limit semantics."""
+
+    @pytest.mark.asyncio
+    async def test_reservations_count_against_daily_limit(self, enforcer, user_repo):
+        user = await _user(user_repo, daily=1000)
+
+        await enforcer.check_and_reserve(user, "p1", 600)
+        with pytest.raises(BudgetExceededError) as exc:
+            await enforcer.check_and_reserve(user, "p1", 600)
+        assert exc.value.limit_type == "daily"
+        assert exc.value.current == 600
+
+    @pytest.mark.asyncio
+    async def test_record_converts_reservation_to_actual(self, enforcer, user_repo):
+        user = await _user(user_repo, daily=1000)
+
+        reservation = await enforcer.check_and_reserve(user, "p1", 800)
+        await enforcer.record_usage(user, "p1", "architect", "m", 100, 50, reservation=reservation)
+
+        assert await enforcer.get_remaining_budget(user) == {"daily": 850}
+        await enforcer.check_and_reserve(user, "p1", 800)
+
+    @pytest.mark.asyncio
+    async def test_release_frees_reservation(self, enforcer, user_repo):
+        user = await _user(user_repo, project=500)
+
+        reservation = await enforcer.check_and_reserve(user, "p1", 500)
+        enforcer.release(reservation)
+        await enforcer.check_and_reserve(user, "p1", 500)
+
+    @pytest.mark.asyncio
+    async def test_profile_synced_in_batches(self, enforcer, user_repo, tmp_path):
+        user = await _user(user_repo)
+
+        await enforcer.record_usage(user, "p1", "qa", "m", 10, 5)
+        await enforcer.record_usage(user, "p1", "qa", "m", 10, 5)
+        stored = await user_repo.get_by_id("u1")
+        assert stored.token_usage.total_requests == 0
+        assert not list((tmp_path / "usage").rglob("*.jsonl"))
+
+        await enforcer.record_usage(user, "p2", "qa", "m", 10, 5)
+        stored = await user_repo.get_by_id("u1")
+        assert stored.token_usage.total_requests == 3
+        assert stored.token_usage.total_input_tokens == 30
+
+
+class TestUsageLedger:
+    """Persistence and crash recovery of the ledger."""
+
+    @pytest.mark.asyncio
+    async def test_rollups_survive_restart(self, enforcer, user_repo, ledger, tmp_path):
+        user = await _user(user_repo)
+        await enforcer.record_usage(user, "p1", "qa", "model-a", 100, 0)
+        await enforcer.record_usage(user, "p2", "qa", "model-b", 200, 0)
+        await enforcer.flush()
+
+        reloaded = UsageLedger(base_path=tmp_path / "usage")
+        summary = reloaded.get_summary("u1")
+        assert summary["by_project"] == {"p1": 100, "p2": 200}
+        assert summary["by_model"] == {"model-a": 100, "model-b": 200}
+        assert sum(summary["by_day"].values()) == 300
+
+    def test_replays_records_not_in_rollup(self, tmp_path):
+        user_dir = tmp_path / "usage" / "u1"
+        user_dir.mkdir(parents=True)
+        record = {
+            "ts": "2026-01-02T03:04:05",
+            "project_id": "p1",
+            "agent_role": "qa",
+            "model": "m",
+            "input_tokens": 7,
+            "output_tokens": 3,
+        }
+        # Second line is a torn write and must be ignored
+        (user_dir / "2026-01-02.jsonl").write_text(json.dumps(record) + "\n" + '{"ts": "2026')
+
+        ledger = UsageLedger(base_path=tmp_path / "usage")
+        assert ledger.get_summary("u1")["by_day"] == {"2026-01-02": 10}
+
+    def test_flush_keeps_records_appended_by_other_processes(self, tmp_path):
+        first = UsageLedger(base_path=tmp_path / "usage")
+        second = UsageLedger(base_path=tmp_path / "usage")
+        first.record(UsageRecord("u1", "p1", "qa", "m", 10, 0))
+        second.record(UsageRecord("u1", "p2", "qa", "m", 20, 0))
+        second.flush()
+        first.flush()
+
+        # The first ledger took in the record the second appended before it
+        assert first.get_summary("u1")["by_project"] == {"p1": 10, "p2": 20}
+        reloaded = UsageLedger(base_path=tmp_path / "usage")
+        assert reloaded.get_summary("u1")["by_project"] == {"p1": 10, "p2": 20}
+
+    def test_failed_flush_keeps_records(self, tmp_path, monkeypatch):
+        ledger = UsageLedger(base_path=tmp_path / "usage")
+        ledger.record(UsageRecord("u1", "p1", "qa", "m", 10, 0))
+
+        def disk_full(day_file, payload):
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(ledger, "_append", disk_full)
+        assert ledger.flush() == {}
+
+        monkeypatch.undo()
+        assert ledger.flush() == {"u1": {"input_tokens": 10, "output_tokens": 0, "requests": 1}}
+        assert UsageLedger(base_path=tmp_path / "usage").get_summary("u1")["requests"] == 1
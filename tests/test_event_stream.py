@@ -0,0 +1,113 @@
+"""
+Tests for the live event bus and the event streaming endpoints.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from orchestrator_v2.api import server
+from orchestrator_v2.telemetry import event_bus as event_bus_module
+from orchestrator_v2.telemetry.event_bus import EventBus
+from orchestrator_v2.telemetry.events import EventType, OrchestratorEvent
+
+
+def make_event(project_id: str = "p1", message: str = "hello") -> OrchestratorEvent:
+    return OrchestratorEvent(event_type=EventType.INFO, project_id=project_id, message=message)
+
+
+class TestEventBus:
+    """Pub/sub delivery, resume, and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_subscriber_receives_published_events(self):
+        bus = EventBus()
+        subscription = bus.subscribe("p1")
+
+        bus.publish(make_event(message="one"))
+        bus.publish(make_event(project_id="other"))
+
+        event = await subscription.get(timeout=1)
+        assert event.message == "one"
+        with pytest.raises(asyncio.TimeoutError):
+            await subscription.get(timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_resume_from_last_event_id(self):
+        bus = EventBus()
+        events = [make_event(message=str(i)) for i in range(5)]
+        for event in events:
+            bus.publish(event)
+
+        subscription = bus.subscribe("p1", last_event_id=events[2].id)
+        received = [await subscription.get(timeout=1) for _ in range(2)]
+        assert [e.message for e in received] == ["3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_replay_buffer_is_bounded(self):
+        bus = EventBus(replay_size=3)
+        for i in range(10):
+            bus.publish(make_event(message=str(i)))
+        assert [e.message for e in bus.recent("p1")] == ["7", "8", "9"]
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_is_disconnected(self):
+        bus = EventBus(max_queue_size=2)
+        subscription = bus.subscribe("p1")
+        for i in range(5):
+            bus.publish(make_event(message=str(i)))
+
+        assert subscription.overflowed
+        assert bus.subscriber_count("p1") == 0
+        assert [e.message async for e in subscription] == ["0", "1"]
+
+    @pytest.mark.asyncio
+    async def test_publish_from_worker_thread(self):
+        bus = EventBus()
+        subscription = bus.subscribe("p1")
+
+        await asyncio.to_thread(bus.publish, make_event(message="threaded"))
+
+        event = await subscription.get(timeout=1)
+        assert event.message == "threaded"
+
+
+class TestEventWebSocket:
+    """The WebSocket endpoint streams bus events."""
+
+    @pytest.fixture
+    def bus(self, monkeypatch):
+        bus = EventBus()
+        monkeypatch.setattr(event_bus_module, "_event_bus", bus)
+
+        async def exists(project_id: str) -> bool:
+            return project_id == "p1"
+
+        monkeypatch.setattr(server.project_repo, "exists", exists)
+        return bus
+
+    def test_resume_and_heartbeat(self, bus, monkeypatch):
+        monkeypatch.setattr(server, "EVENT_STREAM_HEARTBEAT_SECONDS", 0.05)
+        first, second = make_event(message="first"), make_event(message="second")
+        bus.publish(first)
+        bus.publish(second)
+
+        client = TestClient(server.app)
+        with client.websocket_connect(f"/projects/p1/events/ws?last_event_id={first.id}") as ws:
+            message = ws.receive_json()
+            assert message["type"] == "event"
+            assert message["event"]["message"] == "second"
+            assert ws.receive_json() == {"type": "heartbeat"}
+
+            bus.publish(make_event(message="live"))
+            while (message := ws.receive_json())["type"] == "heartbeat":
+                pass
+            assert message["event"]["message"] == "live"
+
+    def test_unknown_project_rejected(self, bus):
+        client = TestClient(server.app)
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/projects/missing/events/ws") as ws:
+                ws.receive_json()
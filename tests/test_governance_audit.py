@@ -0,0 +1,88 @@
+"""
+Tests for the governance audit store and GovernanceEngine audit logging.
+"""
+
+import json
+
+import pytest
+
+from orchestrator_v2.config.env import get_settings
+from orchestrator_v2.engine.state_models import PhaseType, ProjectState
+from orchestrator_v2.governance.audit_store import GovernanceAuditStore
+from orchestrator_v2.governance.governance_engine import GovernanceEngine
+
+
+@pytest.fixture
+def store(tmp_path):
+    return GovernanceAuditStore(base_dir=tmp_path / "audit", max_records_per_phase=5)
+
+
+@pytest.fixture
+def state():
+    return ProjectState(project_id="run-1", run_id="run-1", project_name="Test")
+
+
+class TestGovernanceAudit:
+    """Audit records are stored outside ProjectState."""
+
+    @pytest.mark.asyncio
+    async def test_state_size_constant_across_evaluations(self, store, state):
+        engine = GovernanceEngine(audit_store=store)
+
+        await engine.evaluate_phase_transition(state, PhaseType.QA)
+        size_after_one = len(json.dumps(state.model_dump(mode="json"), default=str))
+        for _ in range(20):
+            await engine.evaluate_phase_transition(state, PhaseType.QA)
+        size_after_many = len(json.dumps(state.model_dump(mode="json"), default=str))
+
+        # Only the evaluation counter's digits may grow
+        assert size_after_many - size_after_one <= 2
+        assert state.metadata["governance_audit"]["evaluations"] == 21
+        assert state.metadata["governance_audit"]["last"]["phase"] == "qa"
+
+    @pytest.mark.asyncio
+    async def test_audit_trail_indexed_by_phase(self, store, state):
+        engine = GovernanceEngine(audit_store=store)
+        await engine.evaluate_phase_transition(state, PhaseType.DEVELOPMENT)
+        await engine.evaluate_phase_transition(state, PhaseType.QA)
+
+        qa_entries = engine.get_audit_trail("run-1", phase="qa")
+        assert qa_entries and all(e.phase == "qa" for e in qa_entries)
+        assert len(engine.get_audit_trail("run-1")) > len(qa_entries)
+
+    def test_retention_is_bounded(self, store):
+        for i in range(23):
+            store.append("p1", "qa", {"kind": "evaluation", "timestamp": f"{i:04d}"})
+
+        records = store.read("p1", phase="qa")
+        assert len(records) <= 2 * store.max_records_per_phase
+        assert records[-1]["timestamp"] == "0022"
+        assert store.read("p1", phase="qa", limit=5)[0]["timestamp"] == "0018"
+
+    @pytest.mark.asyncio
+    async def test_legacy_audit_list_migrated(self, store, state):
+        state.metadata["governance_audit"] = [
+            {"timestamp": "2025-01-01T00:00:00", "phase": "planning", "passed": True},
+        ]
+        engine = GovernanceEngine(audit_store=store)
+        await engine.evaluate_phase_transition(state, PhaseType.QA)
+
+        assert state.metadata["governance_audit"]["evaluations"] == 2
+        assert store.read("run-1", phase="planning", kind="evaluation")[0]["passed"] is True
+
+    @pytest.mark.asyncio
+    async def test_audit_trail_filtered_by_workflow(self, store, state):
+        engine = GovernanceEngine(audit_store=store)
+        await engine.evaluate_phase_transition(state, PhaseType.QA)
+        rerun = state.model_copy(update={"run_id": "run-2"})
+        await engine.evaluate_phase_transition(rerun, PhaseType.QA)
+
+        first = engine.get_audit_trail("run-1", project_id="run-1")
+        second = engine.get_audit_trail("run-2", project_id="run-1")
+        assert first and all(e.workflow_id == "run-1" for e in first)
+        assert second and all(e.workflow_id == "run-2" for e in second)
+        assert len(store.read("run-1", kind="gate")) == len(first) + len(second)
+
+    def test_default_dir_under_data_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(get_settings(), "data_dir", str(tmp_path / "data"))
+        assert GovernanceAuditStore().base_dir == tmp_path / "data" / "governance_audit"
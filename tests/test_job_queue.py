@@ -0,0 +1,177 @@
+"""
+Tests for the background job queue.
+"""
+
+import asyncio
+
+import pytest
+
+from orchestrator_v2.services.job_queue import (
+    JobQueue,
+    JobStatus,
+    QueueFullError,
+    RunBusyError,
+    SQLiteJobStore,
+)
+
+
+async def wait_for_status(queue: JobQueue, job_id: str, *statuses: JobStatus):
+    for _ in range(200):
+        job = queue.get(job_id)
+        if job.status in statuses:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} stuck in {queue.get(job_id).status}")
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    yield store
+    store.close()
+
+
+class TestJobQueue:
+    """Queue execution, exclusion, limits and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_in_background(self, store):
+        async def handler(job):
+            return {"echo": job.params["value"]}
+
+        queue = JobQueue(store, handlers={"echo": handler})
+        job = await queue.submit("run-1", "echo", "user-1", {"value": 42})
+        assert job.status == JobStatus.QUEUED
+
+        done = await wait_for_status(queue, job.job_id, JobStatus.SUCCEEDED)
+        assert done.result == {"echo": 42}
+        assert done.started_at and done.finished_at
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_job_records_error(self, store):
+        async def handler(job):
+            raise RuntimeError("phase exploded")
+
+        queue = JobQueue(store, handlers={"boom": handler})
+        job = await queue.submit("run-1", "boom", "user-1")
+
+        done = await wait_for_status(queue, job.job_id, JobStatus.FAILED)
+        assert done.error == "phase exploded"
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_one_active_job_per_run(self, store):
+        release = asyncio.Event()
+
+        async def handler(job):
+            await release.wait()
+
+        queue = JobQueue(store, handlers={"wait": handler})
+        first = await queue.submit("run-1", "wait", "user-1")
+
+        with pytest.raises(RunBusyError) as exc:
+            await queue.submit("run-1", "wait", "user-1")
+        assert exc.value.job.job_id == first.job_id
+
+        # Other runs are unaffected
+        await queue.submit("run-2", "wait", "user-1")
+
+        release.set()
+        await wait_for_status(queue, first.job_id, JobStatus.SUCCEEDED)
+        await queue.submit("run-1", "wait", "user-1")
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_limit(self, store):
+        release = asyncio.Event()
+
+        async def handler(job):
+            await release.wait()
+
+        queue = JobQueue(store, handlers={"wait": handler}, workers=1, max_queue_depth=2)
+        running = await queue.submit("run-0", "wait", "user-1")
+        await wait_for_status(queue, running.job_id, JobStatus.RUNNING)
+
+        await queue.submit("run-1", "wait", "user-1")
+        await queue.submit("run-2", "wait", "user-1")
+        with pytest.raises(QueueFullError):
+            await queue.submit("run-3", "wait", "user-1")
+
+        release.set()
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_and_running(self, store):
+        started = asyncio.Event()
+
+        async def handler(job):
+            started.set()
+            await asyncio.sleep(60)
+
+        queue = JobQueue(store, handlers={"slow": handler}, workers=1)
+        running = await queue.submit("run-1", "slow", "user-1")
+        queued = await queue.submit("run-2", "slow", "user-1")
+        await started.wait()
+
+        assert (await queue.cancel(queued.job_id)).status == JobStatus.CANCELLED
+        assert (await queue.cancel(running.job_id)).status == JobStatus.CANCELLED
+
+        # The worker survives cancellation and picks up new work
+        started.clear()
+        again = await queue.submit("run-1", "slow", "user-1")
+        await started.wait()
+        assert queue.get(again.job_id).status == JobStatus.RUNNING
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_jobs_survive_restart(self, tmp_path):
+        db_path = tmp_path / "jobs.db"
+        blocked = asyncio.Event()
+
+        async def block(job):
+            await blocked.wait()
+
+        first = JobQueue(SQLiteJobStore(db_path), handlers={"step": block}, workers=1)
+        interrupted = await first.submit("run-1", "step", "user-1")
+        waiting = await first.submit("run-2", "step", "user-1")
+        await wait_for_status(first, interrupted.job_id, JobStatus.RUNNING)
+        await first.stop()
+
+        async def succeed(job):
+            return {"ok": True}
+
+        second = JobQueue(SQLiteJobStore(db_path), handlers={"step": succeed})
+        await second.start()
+
+        for job_id in (interrupted.job_id, waiting.job_id):
+            done = await wait_for_status(second, job_id, JobStatus.SUCCEEDED)
+            assert done.result == {"ok": True}
+        await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_unknown_kind_fails_job(self, tmp_path):
+        db_path = tmp_path / "jobs.db"
+        blocked = asyncio.Event()
+
+        async def block(job):
+            await blocked.wait()
+
+        first = JobQueue(SQLiteJobStore(db_path), handlers={"legacy": block}, workers=1)
+        orphan = await first.submit("run-1", "legacy", "user-1")
+        await wait_for_status(first, orphan.job_id, JobStatus.RUNNING)
+        await first.stop()
+
+        async def succeed(job):
+            return {"ok": True}
+
+        # The restarted queue no longer handles "legacy" jobs
+        second = JobQueue(SQLiteJobStore(db_path), handlers={"step": succeed}, workers=1)
+        await second.start()
+
+        failed = await wait_for_status(second, orphan.job_id, JobStatus.FAILED)
+        assert "legacy" in failed.error
+        # The worker survives and the run is free again
+        job = await second.submit("run-1", "step", "user-1")
+        await wait_for_status(second, job.job_id, JobStatus.SUCCEEDED)
+        await second.stop()
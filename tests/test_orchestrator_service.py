@@ -0,0 +1,156 @@
+"""
+Tests for the shared OrchestratorService and project state caching.
+"""
+
+import asyncio
+
+import pytest
+
+from orchestrator_v2.api.routes import runs
+from orchestrator_v2.engine.state_models import PhaseType, ProjectState
+from orchestrator_v2.persistence.fs_repository import FileSystemProjectRepository
+from orchestrator_v2.services.orchestrator_service import OrchestratorService
+from orchestrator_v2.telemetry.token_store import SQLiteTokenStore
+from orchestrator_v2.user.models import UserProfile
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return FileSystemProjectRepository(tmp_path / "projects")
+
+
+@pytest.fixture
+def service(repo):
+    return OrchestratorService(project_repo=repo, token_store=SQLiteTokenStore(":memory:"))
+
+
+def make_state(run_id: str = "run-1") -> ProjectState:
+    return ProjectState(
+        project_id=run_id,
+        run_id=run_id,
+        project_name="Test",
+        project_type="analytics_forecast_app",
+        current_phase=PhaseType.PLANNING,
+    )
+
+
+class TestProjectRepositoryCache:
+    """Unchanged project files are not re-parsed."""
+
+    @pytest.mark.asyncio
+    async def test_load_returns_independent_copies(self, repo):
+        await repo.save(make_state())
+
+        first = await repo.load("run-1")
+        first.metadata["scratch"] = True
+        second = await repo.load("run-1")
+
+        assert "scratch" not in second.metadata
+
+    @pytest.mark.asyncio
+    async def test_external_write_invalidates_cache(self, repo):
+        await repo.save(make_state())
+        await repo.load("run-1")
+
+        other_process = FileSystemProjectRepository(repo.base_dir)
+        state = make_state()
+        state.project_name = "Renamed elsewhere"
+        await other_process.save(state)
+
+        assert (await repo.load("run-1")).project_name == "Renamed elsewhere"
+
+    @pytest.mark.asyncio
+    async def test_missing_project_raises(self, repo):
+        with pytest.raises(KeyError):
+            await repo.load("missing")
+
+
+class TestOrchestratorService:
+    """Run details are cached and advancement is serialized per run."""
+
+    @pytest.mark.asyncio
+    async def test_get_run_reuses_detail_until_saved(self, service, repo):
+        await repo.save(make_state())
+
+        assert (await service.get_run("run-1")).current_phase == "planning"
+
+        loads = 0
+        original_load = repo.load
+
+        async def counting_load(run_id):
+            nonlocal loads
+            loads += 1
+            return await original_load(run_id)
+
+        repo.load = counting_load
+        assert (await service.get_run("run-1")).current_phase == "planning"
+        assert loads == 0
+
+        state = await repo.load("run-1")
+        state.current_phase = PhaseType.ARCHITECTURE
+        await repo.save(state)
+
+        assert (await service.get_run("run-1")).current_phase == "architecture"
+
+    @pytest.mark.asyncio
+    async def test_advance_run_serialized_per_run(self, service, repo, monkeypatch):
+        await repo.save(make_state())
+        active = 0
+        peak = 0
+
+        async def run_phase(engine, phase, user=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        monkeypatch.setattr("orchestrator_v2.engine.engine.WorkflowEngine.run_phase", run_phase)
+        user = UserProfile(user_id="u1", email="u1@example.com", name="U1")
+
+        await asyncio.gather(*(service.advance_run("run-1", user) for _ in range(3)))
+
+        assert peak == 1
+        # Each advance saw the previous one's state
+        assert (await service.get_run("run-1")).current_phase == PhaseType.DEVELOPMENT.value
+        assert len(service._engines) == 1
+        # The lock goes away once no advance holds or waits on it
+        assert len(service._run_locks) == 0
+
+    @pytest.mark.asyncio
+    async def test_cached_detail_is_not_shared(self, service, repo):
+        await repo.save(make_state())
+
+        first = await service.get_run("run-1")
+        first.metadata["scratch"] = True
+        second = await service.get_run("run-1")
+        second.metadata["other"] = True
+
+        assert "scratch" not in second.metadata
+        assert (await service.get_run("run-1")).metadata == {}
+
+    @pytest.mark.asyncio
+    async def test_list_artifacts_rescans_only_changed_phase_dirs(self, service, repo, tmp_path):
+        state = make_state()
+        state.workspace_path = str(tmp_path / "ws")
+        planning = tmp_path / "ws" / "artifacts" / "planning"
+        planning.mkdir(parents=True)
+        (planning / "PRD.md").write_text("# PRD")
+        await repo.save(state)
+
+        first = await service.list_artifacts("run-1")
+        assert first.total_count == 1
+
+        # Unchanged tree: served from cache, callers get independent copies
+        first.artifacts_by_phase.clear()
+        assert (await service.list_artifacts("run-1")).total_count == 1
+
+        (planning / "requirements.md").write_text("# Reqs")
+        listing = await service.list_artifacts("run-1")
+        assert sorted(a.name for a in listing.artifacts_by_phase["planning"]) == [
+            "PRD.md", "requirements.md",
+        ]
+
+
+def test_service_is_application_scoped():
+    assert runs.get_orchestrator_service() is runs.get_orchestrator_service()
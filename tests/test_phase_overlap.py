@@ -0,0 +1,130 @@
+"""
+Tests for overlapping phase artifact generation with agent execution.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from orchestrator_v2.checkpoints.checkpoint_manager import CheckpointManager
+from orchestrator_v2.engine import engine as engine_module
+from orchestrator_v2.engine.engine import WorkflowEngine
+from orchestrator_v2.engine.exceptions import PhaseError
+from orchestrator_v2.engine.state_models import AgentState, AgentStatus, PhaseType, TokenUsage
+from orchestrator_v2.governance.audit_store import GovernanceAuditStore
+from orchestrator_v2.governance.governance_engine import GovernanceEngine
+from orchestrator_v2.telemetry.token_store import SQLiteTokenStore
+from orchestrator_v2.telemetry.token_tracking import TokenTracker
+from orchestrator_v2.user.models import UserProfile
+from orchestrator_v2.user.repository import FileSystemUserRepository
+
+AGENT_SECONDS = {"fast": 0.05, "slow": 0.4, "broken": 0.4}
+EXECUTOR_SECONDS = 0.3
+
+
+class FakeExecutionService:
+    """Phase executor that records when it ran."""
+
+    def __init__(self, artifacts_dir):
+        self.artifacts_dir = artifacts_dir
+        self.started_at = None
+
+    async def execute_phase(self, phase, project_state, user, write_after=None):
+        self.started_at = asyncio.get_running_loop().time()
+        await asyncio.sleep(EXECUTOR_SECONDS)
+        if write_after is not None:
+            await write_after.wait()
+        prd = self.artifacts_dir / phase.value / "PRD.md"
+        prd.parent.mkdir(parents=True)
+        prd.write_text("# PRD")
+        return {"artifacts": [str(prd)]}
+
+
+@pytest.fixture
+def events(monkeypatch):
+    emitted = []
+    monkeypatch.setattr(engine_module, "emit_event", lambda event_type, **kwargs: emitted.append((event_type, kwargs)))
+    return emitted
+
+
+@pytest.fixture
+def engine(tmp_path, events):
+    engine = WorkflowEngine(
+        checkpoint_manager=CheckpointManager(checkpoint_dir=tmp_path / "checkpoints"),
+        token_tracker=TokenTracker(SQLiteTokenStore(":memory:")),
+        user_repository=FileSystemUserRepository(base_path=tmp_path / "users"),
+        governance_engine=GovernanceEngine(audit_store=GovernanceAuditStore(base_dir=tmp_path / "audit")),
+        use_real_agents=False,
+    )
+    engine._phase_execution_service = FakeExecutionService(tmp_path / "artifacts")
+    finished = {}
+
+    async def fake_agent(agent_id, phase, user=None):
+        await asyncio.sleep(AGENT_SECONDS[agent_id])
+        if agent_id == "broken":
+            raise RuntimeError("agent crashed")
+        finished[agent_id] = asyncio.get_running_loop().time()
+        return AgentState(
+            agent_id=agent_id,
+            status=AgentStatus.COMPLETE,
+            completed_at=datetime.utcnow(),
+            token_usage=TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15),
+        )
+
+    engine._execute_agent_with_budget = fake_agent
+    engine.finished = finished
+    phase_def = engine.phase_manager.get_phase_definition(PhaseType.PLANNING)
+    phase_def.responsible_agents = ["fast", "slow"]
+    phase_def.quality_gates = []
+    return engine
+
+
+@pytest.fixture
+def user():
+    return UserProfile(user_id="u1", email="u1@example.com")
+
+
+class TestPhaseOverlap:
+    """The phase executor runs alongside agents it does not depend on."""
+
+    @pytest.mark.asyncio
+    async def test_executor_overlaps_independent_agents(self, engine, user, events):
+        await engine.start_project(project_name="Overlap")
+        phase_state = await engine.run_phase(PhaseType.PLANNING, user=user)
+
+        timings = phase_state.timings
+        [artifact] = phase_state.artifacts.values()
+        assert artifact.path.endswith("planning/PRD.md")
+        assert artifact.size_bytes == 5
+        assert timings["phase_executor_start"] < AGENT_SECONDS["fast"]
+        # Wall time is the longest chain, not slowest agent + executor
+        assert timings["wall"] < AGENT_SECONDS["slow"] + EXECUTOR_SECONDS
+        assert timings["critical_path"] == pytest.approx(timings["wall"], abs=0.1)
+        completed = [data for event_type, data in events if event_type.value == "phase_completed"]
+        assert completed[0]["timings"] == timings
+
+    @pytest.mark.asyncio
+    async def test_executor_waits_for_declared_inputs(self, engine, user):
+        await engine.start_project(project_name="Overlap")
+        engine.phase_manager.get_phase_definition(PhaseType.PLANNING).executor_inputs = ["slow"]
+
+        phase_state = await engine.run_phase(PhaseType.PLANNING, user=user)
+
+        assert engine._phase_execution_service.started_at >= engine.finished["slow"]
+        assert phase_state.timings["critical_path"] >= AGENT_SECONDS["slow"] + EXECUTOR_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_agent_failure_discards_executor_output(self, engine, user, tmp_path):
+        await engine.start_project(project_name="Overlap")
+        phase_def = engine.phase_manager.get_phase_definition(PhaseType.PLANNING)
+        phase_def.responsible_agents = ["broken", "fast"]
+
+        # The executor finishes generating before the agent fails
+        with pytest.raises(PhaseError):
+            await engine.run_phase(PhaseType.PLANNING, user=user)
+        await asyncio.sleep(0)
+
+        assert engine.state.phase_states["planning"].status == "failed"
+        assert engine.state.phase_states["planning"].artifacts == {}
+        assert not (tmp_path / "artifacts" / "planning").exists()
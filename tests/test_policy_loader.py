@@ -0,0 +1,139 @@
+"""
+Tests for governance policy composition and compiled-policy caching.
+"""
+
+import os
+
+import pytest
+import yaml
+
+from orchestrator_v2.engine.state_models import GateStatus, PhaseType, ProjectState
+from orchestrator_v2.governance.audit_store import GovernanceAuditStore
+from orchestrator_v2.governance.governance_engine import GovernanceEngine
+from orchestrator_v2.governance.policy_loader import PolicyLoader
+
+
+def write_policy(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data))
+
+
+@pytest.fixture
+def base(tmp_path):
+    write_policy(tmp_path / "clients" / "kearney-default" / "governance.yaml", {
+        "quality_gates": {"min_test_coverage": 70, "require_security_scan": False},
+        "compliance": {"frameworks": ["SOC2"], "pii_handling": "standard"},
+        "brand_constraints": {"forbid_terms": ["synergy"]},
+        "custom_rules": [
+            {"rule_id": "no-secrets", "severity": "error", "check_type": "code_pattern"},
+        ],
+    })
+    write_policy(tmp_path / "clients" / "acme" / "governance.yaml", {
+        "quality_gates": {"min_test_coverage": 85, "require_security_scan": True},
+        "compliance": {"frameworks": ["GDPR"]},
+    })
+    return tmp_path
+
+
+class TestPolicyComposition:
+    """Policies deep-merge across the hierarchy."""
+
+    def test_client_overrides_organization(self, base):
+        policy = PolicyLoader(base).load_policies("acme")
+
+        assert policy.quality_gates.min_test_coverage == 85
+        assert policy.quality_gates.security_scan_required is True
+        # Lists replace rather than merge
+        assert policy.compliance.gdpr == {"pii_handling": "standard"}
+        assert policy.compliance.soc2 is None
+        # Untouched sections are inherited
+        assert policy.brand_constraints.forbidden_terms == ["synergy"]
+        assert policy.custom_gates[0].config.id == "no-secrets"
+        assert policy.custom_gates[0].config.on_failure_action == "block"
+
+    def test_project_overrides_client(self, base):
+        write_policy(base / "clients" / "acme" / "projects" / "p1" / "governance.yaml", {
+            "quality_gates": {"min_test_coverage": 60},
+        })
+        policy = PolicyLoader(base).load_policies("acme", "p1")
+
+        assert policy.quality_gates.min_test_coverage == 60
+        assert policy.quality_gates.security_scan_required is True
+
+    def test_unknown_client_uses_organization_defaults(self, base):
+        policy = PolicyLoader(base).load_policies("nobody")
+        assert policy.quality_gates.min_test_coverage == 70
+
+    def test_invalid_policy_rejected(self, base):
+        write_policy(base / "clients" / "bad" / "governance.yaml", {
+            "quality_gates": {"min_test_coverage": 150},
+        })
+        with pytest.raises(ValueError):
+            PolicyLoader(base).load_policies("bad")
+
+
+class TestCompiledPolicyCache:
+    """Compiled policies are reused until a source file changes."""
+
+    def test_cached_until_source_changes(self, base):
+        loader = PolicyLoader(base, check_interval=0)
+        first = loader.compile("acme")
+        assert loader.compile("acme") is first
+
+        path = base / "clients" / "acme" / "governance.yaml"
+        write_policy(path, {"quality_gates": {"min_test_coverage": 90}})
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = loader.compile("acme")
+        assert second is not first
+        assert second.policy.quality_gates.min_test_coverage == 90
+
+    def test_new_project_override_detected(self, base):
+        loader = PolicyLoader(base, check_interval=0)
+        loader.compile("acme", "p1")
+
+        write_policy(base / "clients" / "acme" / "projects" / "p1" / "governance.yaml", {
+            "quality_gates": {"min_test_coverage": 50},
+        })
+        assert loader.compile("acme", "p1").policy.quality_gates.min_test_coverage == 50
+
+    def test_check_interval_skips_stat(self, base):
+        loader = PolicyLoader(base, check_interval=3600)
+        first = loader.compile("acme")
+        write_policy(base / "clients" / "acme" / "governance.yaml", {})
+        assert loader.compile("acme") is first
+
+        loader.invalidate("acme")
+        assert loader.compile("acme") is not first
+
+    def test_gate_checks_bound_per_phase(self, base):
+        compiled = PolicyLoader(base).compile("acme")
+
+        assert [c.__name__ for c in compiled.checks_for(PhaseType.QA)] == [
+            "test_coverage", "security_scan",
+        ]
+        assert compiled.checks_for(PhaseType.PLANNING) == ()
+
+
+class TestGovernanceEngineCompiled:
+    """GovernanceEngine evaluates the compiled checks."""
+
+    @pytest.mark.asyncio
+    async def test_evaluation_uses_client_thresholds(self, base, tmp_path):
+        engine = GovernanceEngine(
+            policy_loader=PolicyLoader(base),
+            audit_store=GovernanceAuditStore(base_dir=tmp_path / "audit"),
+        )
+        state = ProjectState(
+            project_id="p1", run_id="p1", project_name="Test", client="acme",
+            metadata={"test_coverage": 80, "pii_in_repo": True},
+        )
+
+        results = await engine.evaluate_phase_transition(state, PhaseType.QA)
+
+        coverage = next(g for g in results.quality_gates if g.gate_id == "test_coverage")
+        assert coverage.status == GateStatus.BLOCKED
+        assert coverage.threshold == 85
+        assert results.failed_rules == ["test_coverage"]
+        assert results.compliance_checks[0]["check"] == "gdpr_pii"
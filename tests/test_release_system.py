@@ -215,3 +215,125 @@ class TestReleaseGates:
 
         assert report.all_passed is True
         assert "✅" in report.summary
+
+
+class TestGateRunner:
+    """Test concurrent, cached gate execution."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create a git repository with one commit."""
+        import subprocess
+
+        def git(*args):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+        git("init", "-q")
+        git("config", "user.email", "dev@example.com")
+        git("config", "user.name", "Dev")
+        (tmp_path / "app.py").write_text("print('hi')\n")
+        git("add", "app.py")
+        git("commit", "-q", "-m", "init")
+        return tmp_path
+
+    @pytest.fixture
+    def fake_gates(self, monkeypatch):
+        """Replace gate implementations with fast fakes that count calls."""
+        import time
+        from src.orchestrator import release_gates
+
+        calls = {}
+
+        def make(name, status=GateStatus.PASS, delay=0.0):
+            def gate(project_root, *args):
+                calls[name] = calls.get(name, 0) + 1
+                time.sleep(delay)
+                return GateResult(name, status, f"{name} done", blocking=True)
+            monkeypatch.setattr(release_gates, f"run_{name}_gate", gate)
+
+        for name in ("git_status", "tests", "hygiene", "security", "build"):
+            make(name)
+        return make, calls
+
+    def test_gates_run_concurrently_and_stream(self, repo, fake_gates):
+        """Independent gates overlap and results arrive as they finish."""
+        import time
+        from src.orchestrator.release_gates import run_all_gates
+
+        make, _ = fake_gates
+        make("tests", delay=0.3)
+        make("security", delay=0.3)
+        make("build", delay=0.3)
+
+        finished = []
+        start = time.monotonic()
+        report = run_all_gates(repo, use_cache=False, on_result=lambda g: finished.append(g.gate_name))
+
+        assert time.monotonic() - start < 0.8
+        assert finished.index("hygiene") < finished.index("tests")
+        assert [g.gate_name for g in report.gates] == ["git_status", "tests", "hygiene", "security", "build"]
+        assert report.all_passed
+
+    def test_passing_results_cached_per_tree(self, repo, fake_gates):
+        """Re-running on an unchanged tree reuses results; edits invalidate them."""
+        from src.orchestrator.release_gates import run_all_gates
+
+        _, calls = fake_gates
+        run_all_gates(repo)
+        report = run_all_gates(repo)
+
+        assert calls["tests"] == 1
+        assert calls["git_status"] == 2  # always re-checked
+        assert {g.gate_name for g in report.gates if g.cached} == {"tests", "security", "build"}
+
+        (repo / "app.py").write_text("print('changed')\n")
+        run_all_gates(repo)
+        assert calls["tests"] == 2
+
+    def test_failures_not_cached(self, repo, fake_gates):
+        """Failed gates are re-run on the next attempt."""
+        from src.orchestrator.release_gates import run_all_gates
+
+        make, calls = fake_gates
+        make("tests", status=GateStatus.FAIL)
+        run_all_gates(repo)
+        report = run_all_gates(repo)
+
+        assert calls["tests"] == 2
+        assert not report.all_passed
+
+    def test_warnings_not_cached(self, repo, fake_gates):
+        """Warnings (e.g. a tool missing from the environment) are re-run."""
+        from src.orchestrator.release_gates import run_all_gates
+
+        make, calls = fake_gates
+        make("tests", status=GateStatus.WARN)
+        run_all_gates(repo)
+        report = run_all_gates(repo)
+
+        assert calls["tests"] == 2
+        assert not next(g for g in report.gates if g.gate_name == "tests").cached
+
+    def test_fail_fast_cancels_remaining_gates(self, repo, fake_gates, monkeypatch):
+        """A blocking failure kills still-running gates when fail_fast is set."""
+        import sys
+        import time
+        from src.orchestrator import release_gates
+        from src.orchestrator.release_gates import _run_command, run_all_gates
+
+        make, _ = fake_gates
+        make("tests", status=GateStatus.FAIL)
+
+        def slow_build(project_root, cancel_event=None):
+            _run_command([sys.executable, "-c", "import time; time.sleep(30)"], project_root, 60, cancel_event)
+            return GateResult("build", GateStatus.PASS, "built")
+
+        monkeypatch.setattr(release_gates, "run_build_gate", slow_build)
+
+        start = time.monotonic()
+        report = run_all_gates(repo, use_cache=False, fail_fast=True, max_workers=5)
+
+        assert time.monotonic() - start < 10
+        build = next(g for g in report.gates if g.gate_name == "build")
+        assert build.status == GateStatus.SKIP
+        assert build.message == "Cancelled after tests failed"
@@ -13,6 +13,7 @@ import pytest
 from fastapi.testclient import TestClient
 from pathlib import Path
 import tempfile
+import time
 import shutil
 from datetime import datetime
 from unittest.mock import Mock, patch, AsyncMock
@@ -27,6 +28,7 @@ from orchestrator_v2.api.dto.runs import (
     MetricsSummary,
 )
 from orchestrator_v2.engine.state_models import ProjectState, PhaseType, PhaseState
+from orchestrator_v2.services.job_queue import Job
 from orchestrator_v2.user.models import UserProfile
 
 
@@ -267,6 +269,7 @@ class TestAdvanceRun:
 
         response = client.post(
             "/runs/run-abc123/next",
+            params={"wait": True},
             headers=auth_headers(mock_user),
         )
 
@@ -320,6 +323,7 @@ class TestAdvanceRun:
 
         response = client.post(
             "/runs/run-abc123/next",
+            params={"wait": True},
             json=request_data,
             headers=auth_headers(mock_user),
         )
@@ -327,6 +331,109 @@ class TestAdvanceRun:
         assert response.status_code == 200
 
 
+class TestAdvanceRunJobs:
+    """POST /runs/{run_id}/next queues a background job."""
+
+    @pytest.fixture
+    def job_queue(self, tmp_path):
+        from orchestrator_v2.api.routes.runs import (
+            ADVANCE_JOB,
+            _run_advance_job,
+            get_run_job_queue,
+        )
+        from orchestrator_v2.services.job_queue import JobQueue, SQLiteJobStore
+
+        queue = JobQueue(SQLiteJobStore(tmp_path / "jobs.db"), handlers={ADVANCE_JOB: _run_advance_job})
+        app.dependency_overrides[get_run_job_queue] = lambda: queue
+        yield queue
+        app.dependency_overrides.pop(get_run_job_queue, None)
+
+    @patch("orchestrator_v2.user.repository.FileSystemUserRepository.get_by_id")
+    @patch("orchestrator_v2.services.orchestrator_service.OrchestratorService.get_run_owner")
+    @patch("orchestrator_v2.services.orchestrator_service.OrchestratorService.get_run")
+    @patch("orchestrator_v2.services.orchestrator_service.OrchestratorService.advance_run")
+    def test_advance_returns_job(
+        self, mock_advance, mock_get, mock_get_owner, mock_get_user, job_queue, mock_user
+    ):
+        """Should return 202 with a job that completes in the background."""
+        detail = dict(
+            run_id="run-abc123",
+            profile="analytics_forecast_app",
+            project_name="Test Project",
+            status="running",
+            phases=[],
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        mock_get.return_value = RunDetail(current_phase="planning", **detail)
+        mock_advance.return_value = RunDetail(current_phase="architecture", **detail)
+        mock_get_owner.return_value = mock_user.user_id
+        mock_get_user.return_value = mock_user
+
+        with TestClient(app) as client:
+            response = client.post("/runs/run-abc123/next", headers=auth_headers(mock_user))
+            assert response.status_code == 202
+            job = response.json()
+            assert job["status"] == "queued"
+
+            busy = client.post("/runs/run-abc123/next", headers=auth_headers(mock_user))
+            assert busy.status_code in (202, 409)
+
+            for _ in range(100):
+                job = client.get(
+                    f"/runs/run-abc123/jobs/{job['job_id']}", headers=auth_headers(mock_user)
+                ).json()
+                if job["status"] == "succeeded":
+                    break
+                time.sleep(0.01)
+            assert job["status"] == "succeeded"
+            assert job["result"]["current_phase"] == "architecture"
+
+            jobs = client.get("/runs/run-abc123/jobs", headers=auth_headers(mock_user)).json()
+            assert job["job_id"] in [j["job_id"] for j in jobs]
+
+    @patch("orchestrator_v2.user.repository.FileSystemUserRepository.get_by_id")
+    def test_unknown_job_returns_404(self, mock_get_user, job_queue, mock_user):
+        mock_get_user.return_value = mock_user
+        with TestClient(app) as client:
+            response = client.get(
+                "/runs/run-abc123/jobs/job-missing", headers=auth_headers(mock_user)
+            )
+        assert response.status_code == 404
+
+    def test_job_routes_require_auth(self, job_queue):
+        with TestClient(app) as client:
+            assert client.get("/runs/run-abc123/jobs").status_code == 401
+            assert client.get("/runs/run-abc123/jobs/job-1").status_code == 401
+            assert client.delete("/runs/run-abc123/jobs/job-1").status_code == 401
+
+    @patch("orchestrator_v2.user.repository.FileSystemUserRepository.get_by_id")
+    @patch("orchestrator_v2.services.orchestrator_service.OrchestratorService.get_run_owner")
+    def test_other_user_cannot_touch_jobs(
+        self, mock_get_owner, mock_get_user, job_queue, mock_user
+    ):
+        """Only the job's submitter or a user with access to the run may see or cancel it."""
+        other = UserProfile(user_id="other-user", email="other@example.com", name="Other")
+        mock_get_owner.return_value = mock_user.user_id
+        users = {mock_user.user_id: mock_user, other.user_id: other}
+        mock_get_user.side_effect = users.get
+        job = Job(run_id="run-abc123", kind="advance", user_id=mock_user.user_id)
+        job_queue.store.save(job)
+
+        with TestClient(app) as client:
+            url = f"/runs/run-abc123/jobs/{job.job_id}"
+
+            listing = client.get("/runs/run-abc123/jobs", headers=auth_headers(other))
+            assert listing.status_code == 403
+            assert client.get(url, headers=auth_headers(other)).status_code == 403
+            assert client.delete(url, headers=auth_headers(other)).status_code == 403
+            assert job_queue.get(job.job_id).status.value == "queued"
+
+            response = client.delete(url, headers=auth_headers(mock_user))
+            assert response.status_code == 200
+            assert response.json()["status"] == "cancelled"
+
+
 # -------------------------------------------------------------------------
 # Test: GET /runs/{run_id} - Get run status and phases
 # -------------------------------------------------------------------------
@@ -689,6 +796,7 @@ class TestFullWorkflow:
 
         advance_response = client.post(
             f"/runs/{run_id}/next",
+            params={"wait": True},
             headers=auth_headers(mock_user),
         )
         assert advance_response.status_code == 200
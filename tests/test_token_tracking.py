@@ -0,0 +1,70 @@
+"""
+Tests for TokenTracker persistence and rollups.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from orchestrator_v2.telemetry.pricing import calculate_cost
+from orchestrator_v2.telemetry.token_store import SQLiteTokenStore
+from orchestrator_v2.telemetry.token_tracking import TokenTracker
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "tokens.db"
+
+
+class TestTokenTracker:
+    """Durable tracking and aggregate queries."""
+
+    def test_usage_survives_restart(self, db_path):
+        tracker = TokenTracker(store=SQLiteTokenStore(db_path))
+        tracker.track_llm_call("wf1", "planning", "architect", 1000, 500, "claude-haiku-4-5")
+        tracker.track_llm_call("wf1", "development", "developer", 2000, 1000)
+
+        reloaded = TokenTracker(store=SQLiteTokenStore(db_path))
+        usage = reloaded.get_usage("wf1")
+        assert usage.input_tokens == 3000
+        assert usage.output_tokens == 1500
+        assert usage.cost_usd == (
+            calculate_cost(1000, 500, "claude-haiku-4-5") + calculate_cost(2000, 1000)
+        )
+
+    def test_report_breakdowns(self, db_path):
+        tracker = TokenTracker(store=SQLiteTokenStore(db_path))
+        tracker.track_llm_call("wf1", "planning", "architect", 100, 10, "claude-sonnet-4-5")
+        tracker.track_llm_call("wf1", "planning", "architect", 100, 10, "claude-sonnet-4-5")
+        tracker.track_llm_call("wf1", "qa", "qa", 50, 5, "claude-haiku-4-5")
+        tracker.track_llm_call("wf2", "qa", "qa", 999, 999)
+
+        report = tracker.generate_report("wf1")
+        assert report["total_tokens"] == 275
+        assert report["by_phase"]["planning"]["requests"] == 2
+        assert report["by_phase"]["planning"]["total_tokens"] == 220
+        assert set(report["by_agent"]) == {"architect", "qa"}
+        assert set(report["by_model"]) == {"claude-sonnet-4-5", "claude-haiku-4-5"}
+
+    def test_rebuild_rollups_matches_incremental(self, db_path):
+        store = SQLiteTokenStore(db_path)
+        tracker = TokenTracker(store=store)
+        for i in range(5):
+            tracker.track_llm_call("wf1", "qa", f"agent{i % 2}", 10, 1)
+
+        before = store.aggregate(group_by=["agent"])
+        store.rebuild_rollups()
+        assert store.aggregate(group_by=["agent"]) == before
+
+    def test_daily_costs(self, db_path):
+        tracker = TokenTracker(store=SQLiteTokenStore(db_path))
+        tracker.track_llm_call("wf1", "qa", "qa", 1000, 0, "claude-haiku-4-5")
+
+        rows = tracker.get_daily_costs()
+        assert len(rows) == 1
+        assert rows[0]["model"] == "claude-haiku-4-5"
+        assert Decimal(str(rows[0]["cost_usd"])) == Decimal("0.001")
+
+    def test_unknown_group_by_rejected(self):
+        with pytest.raises(ValueError):
+            SQLiteTokenStore(":memory:").aggregate(group_by=["user"])
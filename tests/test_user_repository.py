@@ -0,0 +1,158 @@
+"""
+Tests for the file-backed user repository and its email/tenant index.
+"""
+
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from orchestrator_v2.user.index import INDEX_FILENAME, UserIndex
+from orchestrator_v2.user.models import UserProfileCreate
+from orchestrator_v2.user.repository import FileSystemUserRepository
+
+
+def _upsert_users(base_path, prefix, count):
+    """Write profiles and index entries from a separate process."""
+    index = UserIndex(base_path)
+    for i in range(count):
+        user_id = f"{prefix}{i}"
+        path = base_path / f"{user_id}.json"
+        path.write_text(json.dumps({"user_id": user_id, "email": f"{user_id}@x.com"}))
+        index.upsert(user_id, f"{user_id}@x.com", None, path)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a repository in a temporary directory."""
+    return FileSystemUserRepository(base_path=tmp_path)
+
+
+class TestUserIndex:
+    """Email and tenant lookups via the maintained index."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_email_uses_index(self, repo, tmp_path):
+        await repo.create(UserProfileCreate(user_id="u1", email="a@x.com", tenant_id="acme"))
+        await repo.create(UserProfileCreate(user_id="u2", email="b@x.com"))
+
+        user = await repo.get_by_email("b@x.com")
+        assert user is not None and user.user_id == "u2"
+        assert await repo.get_by_email("missing@x.com") is None
+
+        index = json.loads((tmp_path / INDEX_FILENAME).read_text())
+        assert index["by_email"] == {"a@x.com": "u1", "b@x.com": "u2"}
+
+    @pytest.mark.asyncio
+    async def test_email_change_moves_index_entry(self, repo):
+        user = await repo.create(UserProfileCreate(user_id="u1", email="old@x.com"))
+        user.email = "new@x.com"
+        await repo.save(user)
+
+        assert await repo.get_by_email("old@x.com") is None
+        assert (await repo.get_by_email("new@x.com")).user_id == "u1"
+
+    @pytest.mark.asyncio
+    async def test_list_users_by_tenant(self, repo):
+        await repo.create(UserProfileCreate(user_id="u1", email="a@x.com", tenant_id="acme"))
+        await repo.create(UserProfileCreate(user_id="u2", email="b@x.com", tenant_id="acme"))
+        await repo.create(UserProfileCreate(user_id="u3", email="c@x.com", tenant_id="other"))
+
+        acme = await repo.list_users(tenant_id="acme")
+        assert sorted(u.user_id for u in acme) == ["u1", "u2"]
+        assert len(await repo.list_users()) == 3
+
+        await repo.delete("u1")
+        assert [u.user_id for u in await repo.list_users(tenant_id="acme")] == ["u2"]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_when_index_missing_or_stale(self, repo, tmp_path):
+        await repo.create(UserProfileCreate(user_id="u1", email="a@x.com", tenant_id="acme"))
+        (tmp_path / INDEX_FILENAME).unlink()
+
+        # Simulate a crash after a profile write but before the index update
+        profile = json.loads((tmp_path / "u1.json").read_text())
+        profile["user_id"] = "u2"
+        profile["email"] = "b@x.com"
+        (tmp_path / "u2.json").write_text(json.dumps(profile))
+
+        fresh = FileSystemUserRepository(base_path=tmp_path)
+        assert (await fresh.get_by_email("a@x.com")).user_id == "u1"
+        assert (await fresh.get_by_email("b@x.com")).user_id == "u2"
+        assert len(await fresh.list_users(tenant_id="acme")) == 2
+
+    @pytest.mark.asyncio
+    async def test_profile_written_in_same_tick_as_index(self, repo, tmp_path):
+        await repo.create(UserProfileCreate(user_id="u1", email="a@x.com"))
+        assert await repo.get_by_email("a@x.com") is not None
+
+        # A profile written after the index but within the same mtime tick
+        profile = json.loads((tmp_path / "u1.json").read_text())
+        profile["user_id"] = "u2"
+        profile["email"] = "b@x.com"
+        (tmp_path / "u2.json").write_text(json.dumps(profile))
+        index_mtime = (tmp_path / INDEX_FILENAME).stat().st_mtime_ns
+        os.utime(tmp_path / "u2.json", ns=(index_mtime, index_mtime))
+
+        assert (await repo.get_by_email("b@x.com")).user_id == "u2"
+
+    def test_sees_other_writer_with_same_mtime(self, tmp_path):
+        first = UserIndex(tmp_path)
+        second = UserIndex(tmp_path)
+        path = tmp_path / "u1.json"
+        path.write_text(json.dumps({"user_id": "u1", "email": "a@x.com"}))
+        first.upsert("u1", "a@x.com", None, path)
+        assert second.user_id_for_email("a@x.com") == "u1"
+
+        index_mtime = first.path.stat().st_mtime_ns
+        path.write_text(json.dumps({"user_id": "u1", "email": "b@x.com"}))
+        first.upsert("u1", "b@x.com", None, path)
+        os.utime(first.path, ns=(index_mtime, index_mtime))
+
+        assert second.user_id_for_email("b@x.com") == "u1"
+        assert second.user_id_for_email("a@x.com") is None
+
+    def test_non_profile_json_does_not_force_rebuilds(self, tmp_path, monkeypatch):
+        (tmp_path / "notes.json").write_text(json.dumps({"title": "not a user"}))
+        (tmp_path / "broken.json").write_text("{")
+        index = UserIndex(tmp_path)
+        assert index.rebuild() == 0
+        assert not index._is_stale()
+
+        rebuilds = []
+        monkeypatch.setattr(index, "_rebuild", lambda: rebuilds.append(1))
+        path = tmp_path / "u1.json"
+        path.write_text(json.dumps({"user_id": "u1", "email": "a@x.com"}))
+        index.upsert("u1", "a@x.com", None, path)
+
+        assert rebuilds == []
+        fresh = UserIndex(tmp_path)
+        assert fresh.user_id_for_email("a@x.com") == "u1"
+        assert not fresh._is_stale()
+
+    def test_concurrent_processes_keep_all_entries(self, tmp_path):
+        ctx = multiprocessing.get_context("spawn")
+        workers = [
+            ctx.Process(target=_upsert_users, args=(tmp_path, prefix, 25))
+            for prefix in ("p", "q")
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+
+        index = json.loads((tmp_path / INDEX_FILENAME).read_text())
+        assert len(index["users"]) == 50
+        assert len(UserIndex(tmp_path).all_user_ids()) == 50
+
+    @pytest.mark.asyncio
+    async def test_cached_profile_is_not_shared(self, repo):
+        await repo.create(UserProfileCreate(user_id="u1", email="a@x.com"))
+
+        first = await repo.get_by_id("u1")
+        first.projects.append("unsaved")
+
+        second = await repo.get_by_id("u1")
+        assert second.projects == []